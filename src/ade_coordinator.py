@@ -8,7 +8,7 @@ from typing import Any
 from uuid import UUID
 
 from kortana.core.autonomous_development_engine import create_ade
-from kortana.core.goals import Goal, GoalManager, GoalStatus, GoalType
+from kortana.core.goals import Goal, GoalManager, GoalStatus, GoalStore, GoalType
 
 
 class ADECoordinator:
@@ -28,9 +28,11 @@ class ADECoordinator:
             chat_engine.memory_manager,
         )
 
-        # Initialize goal management
+        # Initialize goal management; goals persist across restarts
         self.goal_manager = GoalManager(
-            chat_engine.memory_manager, chat_engine.covenant_enforcer
+            chat_engine.memory_manager,
+            chat_engine.covenant_enforcer,
+            store=GoalStore(chat_engine.settings.paths.goal_store_path),
         )
 
         # Existing agents
@@ -96,6 +98,9 @@ class ADECoordinator:
                         goal.add_blocker(f"Tests failed: {test_result.get('error')}")
                         goal.update_status(GoalStatus.BLOCKED)
 
+                # Re-index and persist the changes made above
+                await self.goal_manager.update_goal(goal)
+
         return {
             "success": True,
             "goals": [str(g.id) for g in goal_objects],
@@ -2,87 +2,112 @@
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from kortana.modules.conversation_history import models, schemas, services
-from kortana.services.database import get_db_sync
+from kortana.services.database import get_async_db
 
 router = APIRouter(
     prefix="/conversations",
     tags=["Conversation History"],
 )
 
+# ConversationHistoryService is synchronous, so each handler runs it through
+# AsyncSession.run_sync and serializes the ORM objects inside that call, where
+# lazy loads are still allowed.
+
 
 @router.post("/", response_model=schemas.ConversationResponse, status_code=201)
-def create_conversation(
+async def create_conversation(
     conversation: schemas.ConversationCreate,
-    db: Session = Depends(get_db_sync)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new conversation."""
-    service = services.ConversationHistoryService(db)
-    db_conversation = service.create_conversation(conversation)
-    
-    # Add message count
-    response_data = schemas.ConversationResponse.model_validate(db_conversation)
-    response_data.message_count = 0
-    return response_data
+    def create(session):
+        service = services.ConversationHistoryService(session)
+        db_conversation = service.create_conversation(conversation)
+        return schemas.ConversationResponse.model_validate(db_conversation)
+
+    return await db.run_sync(create)
 
 
 @router.post("/{conversation_id}/messages", response_model=schemas.ConversationMessageResponse, status_code=201)
-def add_message(
+async def add_message(
     conversation_id: int,
     message: schemas.ConversationMessageCreate,
-    db: Session = Depends(get_db_sync)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Add a message to a conversation."""
-    service = services.ConversationHistoryService(db)
-    try:
+    def add(session):
+        service = services.ConversationHistoryService(session)
         db_message = service.add_message(conversation_id, message)
-        return db_message
+        return schemas.ConversationMessageResponse.model_validate(db_message)
+
+    try:
+        return await db.run_sync(add)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.get("/stats", response_model=dict[str, Any])
+async def get_conversations_stats(
+    conversation_id: list[int] | None = Query(None, description="Conversation IDs to include"),
+    user_id: str | None = Query(None, description="Include all of a user's conversations"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get stats for many conversations at once, with totals, for dashboards."""
+    if conversation_id is None and user_id is None:
+        raise HTTPException(
+            status_code=400, detail="Provide conversation_id and/or user_id"
+        )
+    return await db.run_sync(
+        lambda session: services.ConversationHistoryService(session).get_conversations_stats(
+            conversation_ids=conversation_id, user_id=user_id
+        )
+    )
+
+
 @router.get("/{conversation_id}", response_model=schemas.ConversationWithMessages)
-def get_conversation(
+async def get_conversation(
     conversation_id: int,
-    db: Session = Depends(get_db_sync)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a conversation by ID with all messages."""
-    service = services.ConversationHistoryService(db)
-    conversation = service.get_conversation_by_id(conversation_id, include_messages=True)
+    def get(session):
+        service = services.ConversationHistoryService(session)
+        conversation = service.get_conversation_by_id(conversation_id, include_messages=True)
+        if not conversation:
+            return None
+        return schemas.ConversationWithMessages.model_validate(conversation)
+
+    conversation = await db.run_sync(get)
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
     return conversation
 
 
 @router.get("/", response_model=list[schemas.ConversationResponse])
-def list_conversations(
+async def list_conversations(
     user_id: str = Query(..., description="User identifier"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db_sync)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List conversations for a user."""
-    service = services.ConversationHistoryService(db)
-    conversations = service.get_user_conversations(user_id, skip=skip, limit=limit)
-    
-    # Add message counts
-    results = []
-    for conv in conversations:
-        conv_data = schemas.ConversationResponse.model_validate(conv)
-        conv_data.message_count = len(conv.messages) if conv.messages else 0
-        results.append(conv_data)
-    
-    return results
+    def list_for_user(session):
+        service = services.ConversationHistoryService(session)
+        conversations = service.get_user_conversations(user_id, skip=skip, limit=limit)
+        return [schemas.ConversationResponse.model_validate(conv) for conv in conversations]
+
+    return await db.run_sync(list_for_user)
 
 
 @router.post("/search", response_model=list[schemas.ConversationResponse])
-def search_conversations(
+async def search_conversations(
     filters: schemas.ConversationSearchFilters,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db_sync)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Advanced search for conversations with multiple filters.
@@ -94,56 +119,75 @@ def search_conversations(
     - Conversation length (min_length, max_length in message count)
     - Status
     """
-    service = services.ConversationHistoryService(db)
-    conversations = service.search_conversations(filters, skip=skip, limit=limit)
-    
-    # Add message counts
-    results = []
-    for conv in conversations:
-        conv_data = schemas.ConversationResponse.model_validate(conv)
-        conv_data.message_count = len(conv.messages) if conv.messages else 0
-        results.append(conv_data)
-    
-    return results
+    def search(session):
+        service = services.ConversationHistoryService(session)
+        conversations = service.search_conversations(filters, skip=skip, limit=limit)
+        return [schemas.ConversationResponse.model_validate(conv) for conv in conversations]
+
+    return await db.run_sync(search)
+
+
+@router.get("/search/messages", response_model=list[schemas.ConversationSearchHit])
+async def search_messages(
+    q: str = Query(..., min_length=1, description="Keywords to search for"),
+    user_id: str | None = Query(None, description="Restrict to a user's conversations"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Full-text search over messages, ranked by relevance with highlighted snippets."""
+    return await db.run_sync(
+        lambda session: services.ConversationHistoryService(session).search_messages(
+            q, user_id=user_id, limit=limit
+        )
+    )
 
 
 @router.post("/{conversation_id}/archive", response_model=schemas.ConversationResponse)
-def archive_conversation(
+async def archive_conversation(
     conversation_id: int,
-    db: Session = Depends(get_db_sync)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Archive a conversation for long-term storage with compression."""
-    service = services.ConversationHistoryService(db)
-    conversation = service.archive_conversation(conversation_id)
+    def archive(session):
+        service = services.ConversationHistoryService(session)
+        conversation = service.archive_conversation(conversation_id)
+        if not conversation:
+            return None
+        return schemas.ConversationResponse.model_validate(conversation)
+
+    conversation = await db.run_sync(archive)
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
-    
-    conv_data = schemas.ConversationResponse.model_validate(conversation)
-    conv_data.message_count = len(conversation.messages) if conversation.messages else 0
-    return conv_data
+    return conversation
 
 
 @router.delete("/{conversation_id}", status_code=204)
-def delete_conversation(
+async def delete_conversation(
     conversation_id: int,
-    db: Session = Depends(get_db_sync)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a conversation (soft delete)."""
-    service = services.ConversationHistoryService(db)
-    success = service.delete_conversation(conversation_id)
+    success = await db.run_sync(
+        lambda session: services.ConversationHistoryService(session).delete_conversation(
+            conversation_id
+        )
+    )
     if not success:
         raise HTTPException(status_code=404, detail="Conversation not found")
     return None
 
 
 @router.get("/{conversation_id}/stats", response_model=dict[str, Any])
-def get_conversation_stats(
+async def get_conversation_stats(
     conversation_id: int,
-    db: Session = Depends(get_db_sync)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get statistics for a conversation including message counts and performance metrics."""
-    service = services.ConversationHistoryService(db)
-    stats = service.get_conversation_stats(conversation_id)
+    stats = await db.run_sync(
+        lambda session: services.ConversationHistoryService(session).get_conversation_stats(
+            conversation_id
+        )
+    )
     if not stats:
         raise HTTPException(status_code=404, detail="Conversation not found")
     return stats
@@ -1,14 +1,11 @@
 import traceback  # Import the traceback module to get detailed error info
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Assuming your models and schemas are in the core directory now
-from kortana.core import (
-    models,
-    schemas,  # Corrected import path for schemas
-)
-from kortana.services.database import get_db_sync
+from kortana.core import schemas  # Corrected import path for schemas
+from kortana.services.database import get_async_db
 
 from ..services.goal_service import GoalService
 
@@ -20,23 +17,16 @@ router = APIRouter(prefix="/goals", tags=["Goal Management"])
     response_model=schemas.GoalDisplay,
     status_code=status.HTTP_201_CREATED,
 )
-def create_new_goal(goal_in: schemas.GoalCreate, db: Session = Depends(get_db_sync)):
+async def create_new_goal(
+    goal_in: schemas.GoalCreate, db: AsyncSession = Depends(get_async_db)
+):
     """
     Create a new high-level goal for Kor'tana to pursue.
     This endpoint now includes enhanced error handling to diagnose 500 errors.
     """
     try:
-        # Create the SQLAlchemy model instance from the Pydantic schema
-        db_goal = models.Goal(**goal_in.model_dump())
-
-        # Add to the session and commit to the database
-        db.add(db_goal)
-        db.commit()
-
-        # Refresh the instance to get the data back from the DB (like created_at, id)
-        db.refresh(db_goal)
-
-        return db_goal
+        # Add to the session, commit, and refresh to get DB defaults (id, created_at)
+        return await GoalService(db).create_goal(goal_in.model_dump())
 
     except Exception as e:
         # This is our diagnostic block. It will catch ANY exception.
@@ -53,7 +43,9 @@ def create_new_goal(goal_in: schemas.GoalCreate, db: Session = Depends(get_db_sy
 
 
 @router.get("/", response_model=list[schemas.GoalDisplay])
-def list_all_goals(skip: int = 0, limit: int = 20, db: Session = Depends(get_db_sync)):
+async def list_all_goals(
+    skip: int = 0, limit: int = 20, db: AsyncSession = Depends(get_async_db)
+):
     """
     List all goals, most recent first.
 
@@ -62,21 +54,7 @@ def list_all_goals(skip: int = 0, limit: int = 20, db: Session = Depends(get_db_
     """
     try:
         # AUTONOMOUS REFACTORING: Use the new service layer instead of direct database queries
-        goal_service = GoalService(db)
-
-        # For now, get goals directly but through service pattern (async would be added later)
-        goals = (
-            db.query(models.Goal)
-            .order_by(models.Goal.id.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
-
-        # TODO: Fully implement service layer method call
-        # goals = goal_service.list_all_goals()
-
-        return goals
+        return await GoalService(db).list_all_goals(skip=skip, limit=limit)
     except Exception as e:
         print(f"ERROR in list_all_goals endpoint: {e}")
         raise HTTPException(
@@ -90,9 +68,9 @@ def list_all_goals(skip: int = 0, limit: int = 20, db: Session = Depends(get_db_
 
 
 @router.get("/{goal_id}", response_model=schemas.GoalDisplay)
-def get_goal_details(goal_id: int, db: Session = Depends(get_db_sync)):
+async def get_goal_details(goal_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get detailed status and plan steps for a specific goal."""
-    goal = db.query(models.Goal).filter(models.Goal.id == goal_id).first()
+    goal = await GoalService(db).get_goal_by_id(goal_id)
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
     return goal
@@ -2,10 +2,11 @@
 import traceback  # Import the traceback module
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from kortana.modules.memory_core import schemas, services
-from kortana.services.database import get_db_sync
+from kortana.services.database import get_async_db
 
 router = APIRouter(
     prefix="/memories",
@@ -17,17 +18,27 @@ router = APIRouter(
 @router.post(
     "/", response_model=schemas.CoreMemoryDisplay, status_code=status.HTTP_201_CREATED
 )
-def create_new_memory(
-    memory_in: schemas.CoreMemoryCreate, db: Session = Depends(get_db_sync)
+async def create_new_memory(
+    memory_in: schemas.CoreMemoryCreate, db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new core memory for Kor'tana.
     Includes enhanced error handling to diagnose 500 errors.
     """
     try:
-        service = services.MemoryCoreService(db)
-        db_memory = service.create_memory(memory_create=memory_in)
-        return db_memory
+        # Embed off the event loop, then run the sync service on the async session
+        embedding = await run_in_threadpool(
+            services.MemoryCoreService.embed_memory, memory_in
+        )
+
+        def create(session):
+            service = services.MemoryCoreService(session)
+            db_memory = service.create_memory(
+                memory_create=memory_in, embedding=embedding
+            )
+            return schemas.CoreMemoryDisplay.model_validate(db_memory)
+
+        return await db.run_sync(create)
     except Exception as e:
         # This is our diagnostic block.
         # It will catch ANY exception that occurs inside the endpoint logic.
@@ -44,13 +55,21 @@ def create_new_memory(
 
 
 @router.get("/{memory_id}", response_model=schemas.CoreMemoryDisplay)
-def read_memory(memory_id: int, db: Session = Depends(get_db_sync)):
+async def read_memory(memory_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Retrieve a specific memory by its ID.
     """
+
+    def read(session):
+        db_memory = services.MemoryCoreService(session).get_memory_by_id(
+            memory_id=memory_id
+        )
+        if db_memory is None:
+            return None
+        return schemas.CoreMemoryDisplay.model_validate(db_memory)
+
     try:
-        service = services.MemoryCoreService(db)
-        db_memory = service.get_memory_by_id(memory_id=memory_id)
+        db_memory = await db.run_sync(read)
         if db_memory is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Memory not found"
@@ -69,16 +88,21 @@ def read_memory(memory_id: int, db: Session = Depends(get_db_sync)):
 
 
 @router.get("/", response_model=list[schemas.CoreMemoryDisplay])
-def read_all_memories(
-    skip: int = 0, limit: int = 20, db: Session = Depends(get_db_sync)
+async def read_all_memories(
+    skip: int = 0, limit: int = 20, db: AsyncSession = Depends(get_async_db)
 ):
     """
     Retrieve a list of all memories with pagination.
     """
+
+    def read(session):
+        memories = services.MemoryCoreService(session).get_all_memories(
+            skip=skip, limit=limit
+        )
+        return [schemas.CoreMemoryDisplay.model_validate(m) for m in memories]
+
     try:
-        service = services.MemoryCoreService(db)
-        memories = service.get_all_memories(skip=skip, limit=limit)
-        return memories
+        return await db.run_sync(read)
     except Exception as e:
         print(f"ERROR in read_all_memories: {e}")
         raise HTTPException(
@@ -95,16 +119,18 @@ def read_all_memories(
 
 
 @router.put("/{memory_id}", response_model=schemas.CoreMemoryDisplay)
-def update_existing_memory(
+async def update_existing_memory(
     memory_id: int,
     memory_in: schemas.CoreMemoryUpdate,
-    db: Session = Depends(get_db_sync),
+    db: AsyncSession = Depends(get_async_db),
 ):
     # ... (implementation)
     pass
 
 
 @router.delete("/{memory_id}", response_model=schemas.CoreMemoryDisplay)
-def delete_existing_memory(memory_id: int, db: Session = Depends(get_db_sync)):
+async def delete_existing_memory(
+    memory_id: int, db: AsyncSession = Depends(get_async_db)
+):
     # ... (implementation)
     pass
@@ -5,7 +5,8 @@ This file demonstrates Kor'tana's autonomous engineering capabilities.
 Goal Service Layer - Created autonomously as part of refactoring assignment.
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from kortana.core.models import Goal
 
@@ -13,45 +14,47 @@ from kortana.core.models import Goal
 class GoalService:
     """Service layer for goal operations - separates business logic from API routing."""
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: AsyncSession):
         self.db = db_session
 
-    async def list_all_goals(self) -> list[Goal]:
+    async def list_all_goals(self, skip: int = 0, limit: int | None = None) -> list[Goal]:
         """
-        Retrieve all goals from the database.
+        Retrieve goals from the database, most recent first.
 
         This function was refactored from the router layer to create proper
         separation of concerns and improve modularity.
         """
-        return self.db.query(Goal).all()
+        query = select(Goal).order_by(Goal.id.desc()).offset(skip).limit(limit)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
 
     async def get_goal_by_id(self, goal_id: int) -> Goal | None:
         """Get a specific goal by ID."""
-        return self.db.query(Goal).filter(Goal.id == goal_id).first()
+        return await self.db.get(Goal, goal_id)
 
     async def create_goal(self, goal_data: dict) -> Goal:
         """Create a new goal."""
         goal = Goal(**goal_data)
         self.db.add(goal)
-        self.db.commit()
-        self.db.refresh(goal)
+        await self.db.commit()
+        await self.db.refresh(goal)
         return goal
 
     async def update_goal(self, goal_id: int, goal_data: dict) -> Goal | None:
         """Update an existing goal."""
-        goal = self.db.query(Goal).filter(Goal.id == goal_id).first()
+        goal = await self.db.get(Goal, goal_id)
         if goal:
             for key, value in goal_data.items():
                 setattr(goal, key, value)
-            self.db.commit()
-            self.db.refresh(goal)
+            await self.db.commit()
+            await self.db.refresh(goal)
         return goal
 
     async def delete_goal(self, goal_id: int) -> bool:
         """Delete a goal by ID."""
-        goal = self.db.query(Goal).filter(Goal.id == goal_id).first()
+        goal = await self.db.get(Goal, goal_id)
         if goal:
-            self.db.delete(goal)
-            self.db.commit()
+            await self.db.delete(goal)
+            await self.db.commit()
             return True
         return False
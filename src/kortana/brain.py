@@ -40,6 +40,7 @@ from kortana.utils import (
     ModelError,
     TTLCache,
 )
+from kortana.utils.structured_logging import log_context
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -424,22 +425,35 @@ class ChatEngine:
         Returns:
             Kor'tana's response.
         """
-        logger.info(
-            f"Processing message from {user_name or 'unknown'} via {channel}: {user_message[:50]}..."
-        )
+        with log_context(
+            session_id=self.session_id,
+            channel=channel,
+            model=self.settings.default_llm_id,
+        ):
+            logger.info(
+                "Processing message from %s via %s: %.50s...",
+                user_name or "unknown",
+                channel,
+                user_message,
+            )
+            started = time.perf_counter()
 
-        # Step 1: Add the user's message to history
-        self._add_message_to_history(user_message)
+            # Step 1: Add the user's message to history
+            self._add_message_to_history(user_message)
 
-        # Step 2: Retrieve relevant memory context
-        memory_context = await self._retrieve_memory_context(user_message)
+            # Step 2: Retrieve relevant memory context
+            memory_context = await self._retrieve_memory_context(user_message)
 
-        # Step 3: Generate response from LLM
-        response_text = await self._generate_llm_response(
-            user_message, memory_context, user_id, user_name, channel
-        )
+            # Step 3: Generate response from LLM
+            response_text = await self._generate_llm_response(
+                user_message, memory_context, user_id, user_name, channel
+            )
 
-        return response_text
+            logger.info(
+                "Message processed",
+                extra={"latency_ms": round((time.perf_counter() - started) * 1000, 1)},
+            )
+            return response_text
 
     def _add_message_to_history(self, message: str) -> None:
         """Add user message to history and memory."""
@@ -14,6 +14,8 @@ from datetime import UTC, datetime
 from functools import lru_cache
 from typing import Any
 
+from kortana.config.registry import config_registry
+
 # Module-level logger
 logger = logging.getLogger(__name__)
 
@@ -57,12 +59,12 @@ def load_json_config(path: str) -> dict[str, Any]:
         Dictionary containing loaded configuration, empty dict on error
     """
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
+        # Parsed once per file version and shared (read-only) across callers
+        return config_registry.load_json(path)
     except FileNotFoundError:
         logger.warning(f"Config file not found: {path}")
         return {}
-    except json.JSONDecodeError:
+    except ValueError:
         logger.error(f"Invalid JSON in config file: {path}")
         return {}
     except Exception as e:
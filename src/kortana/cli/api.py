@@ -51,14 +51,12 @@ def main():
     debug = args.debug or getattr(settings, "debug", False)
 
     # Initialize logging
-    log_level = "DEBUG" if debug else getattr(settings.logging, "level", "INFO")
-    logging.basicConfig(
-        level=getattr(logging, log_level),
-        format=getattr(
-            settings.logging,
-            "format",
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        ),
+    # Records are queued and written by a background listener thread
+    from kortana.utils.structured_logging import configure_logging_from_config
+
+    log_level = "DEBUG" if debug else settings.logging.level
+    configure_logging_from_config(
+        settings.logging, logs_dir=settings.paths.logs_dir, level=log_level
     )
 
     # Import here to avoid circular imports
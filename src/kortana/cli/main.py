@@ -12,8 +12,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from kortana.config import get_config, load_config
-from kortana.core.autonomous_development_engine import AutonomousDevelopmentEngine
-from kortana.core.brain import Brain
+
+# The engine and brain modules pull in openai, agents and the scheduler; each
+# command imports what it needs so `kortana --help` and `status` start fast.
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -96,6 +97,10 @@ def cmd_start(args) -> int:
             print(f"Environment: {config.app.environment}")
             print(f"Debug mode: {config.app.debug}")
 
+        from kortana.core.autonomous_development_engine import (
+            AutonomousDevelopmentEngine,
+        )
+
         # Initialize the development engine
         engine = AutonomousDevelopmentEngine(config=config)
 
@@ -153,6 +158,8 @@ def cmd_status(args) -> int:
             print(f"  - Max Concurrent Agents: {config.agents.max_concurrent}")
 
         # Check system health
+        from kortana.core.brain import Brain
+
         brain = Brain(config=config)
         health = brain.check_health()
 
@@ -172,6 +179,8 @@ def cmd_interactive(args) -> int:
         print("=== Project Kor'tana Interactive Mode ===")
         print("Type 'help' for commands, 'exit' to quit")
 
+        from kortana.core.brain import Brain
+
         brain = Brain(config=config)
 
         while True:
@@ -10,6 +10,7 @@ from typing import Any
 
 import yaml
 
+from .registry import ConfigRegistry, config_registry, get_config_registry
 from .schema import (
     AgentsConfig,
     AgentTypeConfig,
@@ -43,14 +44,17 @@ def load_config(config_path: str | None = None) -> KortanaConfig:
     config_data = {}
     try:
         if os.path.exists(config_path):
-            with open(config_path, encoding="utf-8") as f:
-                loaded_yaml = yaml.safe_load(f)
-                if loaded_yaml is not None:
-                    config_data = loaded_yaml
-                else:
-                    print(
-                        f"Warning: Config file at {config_path} is empty or invalid YAML. Using defaults."
-                    )
+            # Parsed once via the registry; re-read only when the file changes
+            try:
+                loaded_yaml = config_registry.load_yaml(config_path)
+            except ValueError as e:
+                raise yaml.YAMLError(str(e)) from e
+            if loaded_yaml is not None:
+                config_data = loaded_yaml
+            else:
+                print(
+                    f"Warning: Config file at {config_path} is empty or invalid YAML. Using defaults."
+                )
         else:
             print(
                 f"Config file not found at {config_path}, using default KortanaConfig values."
@@ -123,6 +127,9 @@ def get_api_key(service: str) -> str | None:
 __all__ = [
     "AgentsConfig",
     "AgentTypeConfig",
+    "ConfigRegistry",
+    "config_registry",
+    "get_config_registry",
     "MemoryConfig",
     "PersonaConfig",
     "PathsConfig",
@@ -0,0 +1,261 @@
+"""
+Configuration File Registry
+
+Parses each configuration file (persona.json, identity.json, covenant.yaml,
+models_config.json, config.yaml, ...) once and shares the result between
+services as read-only data. Files are re-parsed when their modification time
+or size changes, either on access or from an optional polling thread, and
+subscribers are notified so they can rebuild anything derived from them.
+"""
+
+import json
+import logging
+import os
+import threading
+import weakref
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+ConfigCallback = Callable[[str, Any], None]
+
+
+class FrozenDict(dict):
+    """A dict that rejects mutation; still JSON- and pydantic-compatible."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Configuration data is read-only; copy it to modify")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """A list that rejects mutation; still JSON- and pydantic-compatible."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Configuration data is read-only; copy it to modify")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into their read-only counterparts."""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list | tuple):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+def _parse_json(text: str) -> Any:
+    return json.loads(text)
+
+
+def _parse_yaml(text: str) -> Any:
+    return yaml.safe_load(text)
+
+
+PARSERS: dict[str, Callable[[str], Any]] = {"json": _parse_json, "yaml": _parse_yaml}
+
+
+class ConfigRegistry:
+    """Cache of parsed configuration files with change notification."""
+
+    def __init__(self):
+        self._entries: dict[tuple[str, str], tuple[tuple[int, int], Any]] = {}
+        self._subscribers: dict[str, list[Callable[[], ConfigCallback | None]]] = {}
+        self._lock = threading.RLock()
+        self._watcher: threading.Thread | None = None
+        self._stop_watching = threading.Event()
+
+    def load(self, path: str | Path, kind: str = "json") -> Any:
+        """
+        Return the parsed, read-only contents of a configuration file.
+
+        Args:
+            path: File to load
+            kind: Parser to use ("json" or "yaml")
+
+        Returns:
+            Parsed data (FrozenDict/FrozenList for containers)
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file cannot be parsed
+        """
+        key = (self._normalize(path), kind)
+        signature = self._signature(key[0])
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+        if cached is None:
+            return self._parse(key, signature)
+
+        try:
+            value = self._parse(key, signature)
+        except (OSError, ValueError) as e:
+            # Likely caught mid-save; keep serving the last good copy
+            logger.error(f"Keeping previous config for {key[0]}: {e}")
+            return cached[1]
+        self._notify(key[0], value)
+        return value
+
+    def load_json(self, path: str | Path) -> Any:
+        """Load a JSON configuration file; see ``load``."""
+        return self.load(path, "json")
+
+    def load_yaml(self, path: str | Path) -> Any:
+        """Load a YAML configuration file; see ``load``."""
+        return self.load(path, "yaml")
+
+    def subscribe(self, path: str | Path, callback: ConfigCallback) -> Callable[[], None]:
+        """
+        Call ``callback(path, new_value)`` whenever ``path`` is re-parsed.
+
+        Bound methods are held weakly so subscribing does not keep the owning
+        service alive.
+
+        Returns:
+            Function that removes the subscription
+        """
+        normalized = self._normalize(path)
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            ref: Callable[[], ConfigCallback | None] = weakref.WeakMethod(callback)
+        else:
+
+            def ref():
+                return callback
+
+        with self._lock:
+            self._subscribers.setdefault(normalized, []).append(ref)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                refs = self._subscribers.get(normalized, [])
+                if ref in refs:
+                    refs.remove(ref)
+
+        return unsubscribe
+
+    def check_for_changes(self) -> list[str]:
+        """
+        Re-parse every cached file whose modification time or size changed.
+
+        Returns:
+            Paths that were reloaded
+        """
+        with self._lock:
+            entries = list(self._entries.items())
+
+        reloaded = []
+        for key, (signature, _) in entries:
+            try:
+                current = self._signature(key[0])
+            except OSError:
+                # Deleted or being replaced; keep serving the last good copy
+                continue
+            if current == signature:
+                continue
+            try:
+                value = self._parse(key, current)
+            except (OSError, ValueError) as e:
+                logger.error(f"Keeping previous config for {key[0]}: {e}")
+                continue
+            logger.info(f"Reloaded configuration file {key[0]}")
+            reloaded.append(key[0])
+            self._notify(key[0], value)
+        return reloaded
+
+    def invalidate(self, path: str | Path | None = None) -> None:
+        """Drop cached data for one file, or for all files."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            normalized = self._normalize(path)
+            for key in [k for k in self._entries if k[0] == normalized]:
+                del self._entries[key]
+
+    def start_watching(self, interval_seconds: float = 2.0) -> None:
+        """Poll cached files for changes from a daemon thread."""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop_watching.clear()
+        self._watcher = threading.Thread(
+            target=self._watch,
+            args=(interval_seconds,),
+            name="config-registry-watcher",
+            daemon=True,
+        )
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """Stop the polling thread, if running."""
+        self._stop_watching.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=1)
+            self._watcher = None
+
+    def _watch(self, interval: float) -> None:
+        while not self._stop_watching.wait(interval):
+            try:
+                self.check_for_changes()
+            except Exception as e:
+                logger.error(f"Config watcher error: {e}")
+
+    def _parse(self, key: tuple[str, str], signature: tuple[int, int]) -> Any:
+        path, kind = key
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        try:
+            value = freeze(PARSERS[kind](text))
+        except (json.JSONDecodeError, yaml.YAMLError) as e:
+            raise ValueError(f"Invalid {kind} in {path}: {e}") from e
+        with self._lock:
+            self._entries[key] = (signature, value)
+        return value
+
+    def _notify(self, path: str, value: Any) -> None:
+        with self._lock:
+            refs = list(self._subscribers.get(path, []))
+        for ref in refs:
+            callback = ref()
+            if callback is None:
+                with self._lock:
+                    if ref in self._subscribers.get(path, []):
+                        self._subscribers[path].remove(ref)
+                continue
+            try:
+                callback(path, value)
+            except Exception as e:
+                logger.error(f"Config subscriber for {path} failed: {e}")
+
+    @staticmethod
+    def _normalize(path: str | Path) -> str:
+        return os.path.abspath(os.fspath(path))
+
+    @staticmethod
+    def _signature(path: str) -> tuple[int, int]:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+
+config_registry = ConfigRegistry()
+
+
+def get_config_registry() -> ConfigRegistry:
+    """Return the process-wide configuration registry."""
+    return config_registry
@@ -31,6 +31,9 @@ class LoggingConfig(BaseModel):
     console_enabled: bool = True
     max_file_size: str = "10MB"
     backup_count: int = Field(default=5, ge=1, le=20)
+    structured: bool = False  # JSON lines instead of plain text
+    # Fraction of DEBUG records kept per call site on high-volume paths
+    debug_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
 
 
 class APIConfig(BaseModel):
@@ -41,6 +44,9 @@ class APIConfig(BaseModel):
     timeout: int = Field(default=30, ge=1, le=300)
     max_retries: int = Field(default=3, ge=0, le=10)
     rate_limit: int = Field(default=100, ge=1)
+    # Build lazily constructed services (chat engine, embeddings) at startup
+    # instead of on the first request that needs them
+    warm_up_on_startup: bool = False
 
 
 class VoiceConfig(BaseModel):
@@ -112,6 +118,24 @@ class MemoryConfig(BaseModel):
     local_memory_path: str = Field(
         default="data/project_memory.jsonl", description="Local memory file path"
     )
+    upsert_batch_size: int = Field(
+        default=100, ge=1, le=1000, description="Vectors per Pinecone upsert request"
+    )
+    upsert_max_parallel: int = Field(
+        default=4, ge=1, le=32, description="Concurrent Pinecone upsert requests"
+    )
+    upsert_max_retries: int = Field(
+        default=3, ge=0, description="Retries for a failed Pinecone upsert request"
+    )
+    cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024, ge=0, description="Byte budget of the memory cache"
+    )
+    cache_ttl_seconds: int = Field(
+        default=300, ge=1, description="Lifetime of a memory cache entry"
+    )
+    cache_sweep_interval: int = Field(
+        default=60, ge=0, description="Seconds between expiry sweeps (0 disables)"
+    )
 
 
 class AgentTypeConfig(BaseModel):
@@ -168,6 +192,8 @@ class DevelopmentConfig(BaseModel):
     """Development settings"""
 
     auto_reload: bool = True
+    # Seconds between config file change checks when auto_reload is on (0 = off)
+    config_reload_interval: float = Field(default=2.0, ge=0)
     debug_mode: bool = True
     test_mode: bool = False
     mock_apis: bool = False
@@ -227,6 +253,8 @@ class PathsConfig(BaseModel):
     heart_log_path: str = "data/memory/{user}/heart_log.jsonl"
     soul_index_path: str = "data/memory/{user}/soul_index.jsonl"
     lit_log_path: str = "data/memory/{user}/lit_log.jsonl"
+    # Goal framework state, replayed on start
+    goal_store_path: str = "data/goals.jsonl"
 
     def get_user_paths(self, user_name: str) -> dict[str, str]:
         """Get all templated paths with user name substituted."""
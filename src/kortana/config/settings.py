@@ -12,6 +12,13 @@ class AppSettings(BaseSettings):
     MEMORY_DB_URL: str = Field(
         "sqlite:///./kortana_memory_dev.db", validation_alias="MEMORY_DB_URL"
     )
+    # Database engine tuning (pool sizing is ignored for SQLite)
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: int = 30
+    DB_SLOW_QUERY_MS: float = 250.0
     OPENAI_API_KEY: str | None = Field(None, validation_alias="OPENAI_API_KEY")
     ANTHROPIC_API_KEY: str | None = Field(None, validation_alias="ANTHROPIC_API_KEY")
     DEFAULT_GREETING: str = "hello from kor'tana"
@@ -51,6 +58,19 @@ class AppSettings(BaseSettings):
         # Example: return self.MEMORY_DB_URL.replace("postgresql+asyncpg", "postgresql")
         return self.MEMORY_DB_URL
 
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        # Same database as MEMORY_DB_URL, through an asyncio driver
+        url = self.MEMORY_DB_URL
+        for sync_prefix, async_prefix in (
+            ("sqlite://", "sqlite+aiosqlite://"),
+            ("postgresql+psycopg2://", "postgresql+asyncpg://"),
+            ("postgresql://", "postgresql+asyncpg://"),
+        ):
+            if url.startswith(sync_prefix):
+                return async_prefix + url[len(sync_prefix) :]
+        return url
+
 
 settings = AppSettings()
 
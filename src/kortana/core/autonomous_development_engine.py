@@ -9,9 +9,11 @@ import logging
 import os
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from openai import AsyncClient
+if TYPE_CHECKING:
+    # openai is only needed by callers that construct the engine
+    from openai import AsyncClient
 
 
 @dataclass
@@ -37,7 +39,7 @@ class AutonomousDevelopmentEngine:
     Uses OpenAI's agent primitives for intelligent code development.
     """
 
-    def __init__(self, openai_client: AsyncClient, covenant_enforcer, memory_manager):
+    def __init__(self, openai_client: "AsyncClient", covenant_enforcer, memory_manager):
         self.client = openai_client
         self.covenant = covenant_enforcer
         self.memory = memory_manager
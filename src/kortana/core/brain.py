@@ -5,28 +5,18 @@ This module contains the core ChatEngine that powers Kor'tana's conversational a
 """
 
 # Standard library imports
-import json
 import logging
 import sys
 import time
 import uuid
 from datetime import UTC, datetime
+from functools import cached_property
 from typing import Any
 
-import psutil
-import yaml
-
-# Third-party imports
-from apscheduler.triggers.interval import IntervalTrigger
-
-# Local application imports
-from kortana.agents.autonomous_agents import (
-    CodingAgent,
-    MonitoringAgent,
-    PlanningAgent,
-    TestingAgent,
-)
+# Local application imports; third-party (psutil, yaml, apscheduler) and agent
+# imports are deferred to first use to keep ChatEngine construction cheap.
 from kortana.config import load_config
+from kortana.config.registry import config_registry
 from kortana.config.schema import KortanaConfig
 from kortana.services import (
     get_ade_llm_client,
@@ -41,6 +31,7 @@ from kortana.services import (
 )
 from kortana.services.database import get_db_sync
 from kortana.utils import text_analysis
+from kortana.utils.structured_logging import log_context
 
 # Configure logging
 logging.basicConfig(
@@ -78,15 +69,6 @@ class ChatEngine:
 
         logger.info(f"Initializing ChatEngine with session ID {self.session_id}")
 
-        # Load configurations using paths from settings
-        self.persona_data = self._load_json_config(
-            self.settings.paths.persona_file_path
-        )
-        self.identity_data = self._load_json_config(
-            self.settings.paths.identity_file_path
-        )
-        self.covenant = self._load_covenant(self.settings.paths.covenant_file_path)
-
         # Get initialized services from the central services module
         self.llm_client_factory = get_llm_client_factory()
         self.default_llm_client = get_default_llm_client()
@@ -112,29 +94,63 @@ class ChatEngine:
         # Initialize development agent stub (placeholder) - Commented out until implemented
         # self.dev_agent_instance = DevAgentStub(settings=self.settings)
 
-        # Initialize autonomous agents
-        # Agents now receive dependencies via getters from the central services module
-        self.ade_coder = CodingAgent(
+        # Persona/covenant configs and the autonomous agents are built on first
+        # access; monitoring and the scheduler start in warm_up()
+        self._background_started = False
+
+        logger.info("ChatEngine initialization complete")
+
+    # Served from the config registry, so edits to the files are picked up
+    @property
+    def persona_data(self) -> dict[str, Any]:
+        return self._load_json_config(self.settings.paths.persona_file_path)
+
+    @property
+    def identity_data(self) -> dict[str, Any]:
+        return self._load_json_config(self.settings.paths.identity_file_path)
+
+    @property
+    def covenant(self) -> dict[str, Any]:
+        return self._load_covenant(self.settings.paths.covenant_file_path)
+
+    # Agents now receive dependencies via getters from the central services module
+    @cached_property
+    def ade_coder(self):
+        from kortana.agents.autonomous_agents import CodingAgent
+
+        return CodingAgent(
             memory_accessor=get_memory_manager(),  # Use getter
             # dev_agent_instance=self.dev_agent_instance,
             settings=self.settings,
             llm_client=get_ade_llm_client(),  # Use getter
         )
 
-        self.ade_planner = PlanningAgent(
+    @cached_property
+    def ade_planner(self):
+        from kortana.agents.autonomous_agents import PlanningAgent
+
+        return PlanningAgent(
             chat_engine_instance=self,  # Keep for now, may need refactoring later
             llm_client=get_ade_llm_client(),  # Use getter
             covenant_enforcer=get_covenant_enforcer(),  # Use getter
             settings=self.settings,
         )
 
-        self.ade_tester = TestingAgent(
+    @cached_property
+    def ade_tester(self):
+        from kortana.agents.autonomous_agents import TestingAgent
+
+        return TestingAgent(
             chat_engine_instance=self,  # Keep for now, may need refactoring later
             llm_client=get_ade_llm_client(),  # Use getter
             covenant_enforcer=get_covenant_enforcer(),  # Use getter
             settings=self.settings,
         )
 
+    @cached_property
+    def ade_monitor(self):
+        from kortana.agents.autonomous_agents import MonitoringAgent
+
         # Handle agent types configuration for both dict and object
         agent_types = {}
         if hasattr(self.settings.agents, "types"):
@@ -152,7 +168,7 @@ class ChatEngine:
         # Get monitoring config
         monitoring_config = agent_types.get("monitoring", {})
 
-        self.ade_monitor = MonitoringAgent(
+        return MonitoringAgent(
             chat_engine_instance=self,  # Keep for now, may need refactoring later
             llm_client=get_ade_llm_client(),  # Use getter
             covenant_enforcer=get_covenant_enforcer(),  # Use getter
@@ -160,17 +176,31 @@ class ChatEngine:
             settings=self.settings,
         )
 
+    def warm_up(self) -> None:
+        """
+        Construct the autonomous agents and start monitoring and the scheduler.
+
+        Chat-only use never needs these, so they are deferred from __init__;
+        the autonomous entry points call this, and callers may call it up front.
+        """
+        if self._background_started:
+            return
+
+        # Touch the agents so construction errors surface here, not mid-cycle
+        _ = (self.ade_coder, self.ade_planner, self.ade_tester)
+
         # Start monitoring
         self.ade_monitor.start_monitoring()
-        self.scheduler.start()
+        if not self.scheduler.running:
+            self.scheduler.start()
 
         # Initialize autonomous capabilities
         self._setup_autonomous_operations()
-
-        logger.info("ChatEngine initialization complete")
+        self._background_started = True
 
     def _setup_autonomous_operations(self):
         """Set up autonomous operation capabilities."""
+        from apscheduler.triggers.interval import IntervalTrigger
 
         # Schedule autonomous planning cycles
         self.scheduler.add_job(
@@ -210,6 +240,7 @@ class ChatEngine:
 
     def start_autonomous_mode(self):
         """Start continuous autonomous operation."""
+        self.warm_up()
         self.autonomous_mode = True
         self.autonomous_running = True
         self.autonomous_cycle_count = 0
@@ -233,6 +264,7 @@ class ChatEngine:
         Runs a single autonomous cycle: scan, generate, prioritize, plan, execute.
         """
         logger.debug("Brain.run_single_cycle() started")
+        self.warm_up()
         logger.info("Starting single autonomous cycle...")
 
         # Perform autonomous operations
@@ -473,6 +505,8 @@ class ChatEngine:
 
     def _perform_monitoring_task(self, task):
         """Perform a monitoring task."""
+        import psutil
+
         return {
             "status": "completed",
             "cpu_usage": psutil.cpu_percent(interval=1),
@@ -517,6 +551,8 @@ class ChatEngine:
     def _check_system_health(self):
         """Check overall system health."""
         try:
+            import psutil
+
             cpu = psutil.cpu_percent(interval=0.1)
             memory = psutil.virtual_memory().percent
 
@@ -549,6 +585,8 @@ class ChatEngine:
         opportunities = []
 
         try:
+            import psutil
+
             disk_usage = (
                 psutil.disk_usage("/").percent
                 if hasattr(psutil.disk_usage("/"), "percent")
@@ -569,10 +607,7 @@ class ChatEngine:
     def _load_json_config(self, file_path: str) -> dict[str, Any]:
         """Load configuration from JSON file."""
         try:
-            with open(file_path) as f:
-                config = json.load(f)
-            logger.info(f"Loaded configuration from {file_path}")
-            return config
+            return config_registry.load_json(file_path)
         except Exception as e:
             logger.error(f"Failed to load configuration from {file_path}: {e}")
             return {}
@@ -580,10 +615,7 @@ class ChatEngine:
     def _load_covenant(self, file_path: str) -> dict[str, Any]:
         """Load covenant from YAML file."""
         try:
-            with open(file_path) as f:
-                covenant = yaml.safe_load(f)
-            logger.info(f"Loaded covenant from {file_path}")
-            return covenant
+            return config_registry.load_yaml(file_path)
         except Exception as e:
             logger.error(f"Failed to load covenant from {file_path}: {e}")
             return {}
@@ -598,51 +630,60 @@ class ChatEngine:
         Returns:
             Kor'tana's response.
         """
-        logger.info(f"Processing message: {user_message[:50]}...")
-
-        is_important = text_analysis.identify_important_message_for_context(
-            user_message
-        )
-        sentiment = text_analysis.analyze_sentiment(user_message)
-        emphasis = text_analysis.detect_emphasis_all_caps(user_message)
-        keywords = text_analysis.detect_keywords(user_message)
-
-        conversation_context = {
-            "user_message": user_message,
-            "timestamp": datetime.now(UTC).isoformat(),
-            "sentiment": sentiment,
-            "is_important": is_important,
-            "emphasis": emphasis,
-            "keywords": keywords,
-            "session_id": self.session_id,
-            "mode": self.mode,
-        }
+        with log_context(
+            session_id=self.session_id, mode=self.mode
+        ) as request_context:
+            logger.info("Processing message: %.50s...", user_message)
+            started = time.perf_counter()
+
+            is_important = text_analysis.identify_important_message_for_context(
+                user_message
+            )
+            sentiment = text_analysis.analyze_sentiment(user_message)
+            emphasis = text_analysis.detect_emphasis_all_caps(user_message)
+            keywords = text_analysis.detect_keywords(user_message)
+
+            conversation_context = {
+                "user_message": user_message,
+                "timestamp": datetime.now(UTC).isoformat(),
+                "sentiment": sentiment,
+                "is_important": is_important,
+                "emphasis": emphasis,
+                "keywords": keywords,
+                "session_id": self.session_id,
+                "mode": self.mode,
+            }
 
-        model_id, voice_style, model_params = self.router.route(
-            user_message, conversation_context
-        )
+            model_id, voice_style, model_params = self.router.route(
+                user_message, conversation_context
+            )
+            request_context["model"] = model_id
 
-        prompt = self._build_prompt(
-            user_message, conversation_context, voice_style, model_params
-        )
+            prompt = self._build_prompt(
+                user_message, conversation_context, voice_style, model_params
+            )
 
-        llm_client = self.llm_client_factory.get_client(model_id)
-        response = await llm_client.complete(prompt)
+            llm_client = self.llm_client_factory.get_client(model_id)
+            response = await llm_client.complete(prompt)
 
-        response_text = response.get(
-            "content", "I'm sorry, I couldn't generate a proper response."
-        )
+            response_text = response.get(
+                "content", "I'm sorry, I couldn't generate a proper response."
+            )
 
-        is_compliant, explanation = self.covenant_enforcer.enforce(response_text)
-        if not is_compliant:
-            logger.warning(f"Response does not comply with covenant: {explanation}")
-            response_text = "I need to reflect on my response to ensure it aligns with our values. Let me try again."
+            is_compliant, explanation = self.covenant_enforcer.enforce(response_text)
+            if not is_compliant:
+                logger.warning(f"Response does not comply with covenant: {explanation}")
+                response_text = "I need to reflect on my response to ensure it aligns with our values. Let me try again."
 
-        self._update_memory(user_message, response_text, conversation_context)
+            self._update_memory(user_message, response_text, conversation_context)
 
-        response_text = response_text.lower()
+            response_text = response_text.lower()
+            logger.info(
+                "Message processed",
+                extra={"latency_ms": round((time.perf_counter() - started) * 1000, 1)},
+            )
 
-        return response_text
+            return response_text
 
     def _build_prompt(
         self,
@@ -694,9 +735,9 @@ Keep your response concise and focused on addressing the user's needs.
         """Perform cleanup and shutdown operations."""
         logger.info("Shutting down ChatEngine...")
 
-        self.scheduler.shutdown()
-
-        self.ade_monitor.stop_monitoring()
+        if self._background_started:
+            self.scheduler.shutdown()
+            self.ade_monitor.stop_monitoring()
 
         self.pinecone_memory.save_project_memory(self.project_memory)
 
@@ -0,0 +1,229 @@
+"""
+Incremental Code-Health Linting
+
+Keeps the Ruff findings of every tracked file between cycles and re-lints only
+files whose mtime or size changed, so a cycle with no edits costs one stat per
+file and no subprocess at all. Each ``check`` reports the delta against the
+previous cycle (new and resolved findings) alongside the running total.
+
+Ruff is invoked directly on the changed files, without a shell or ``poetry
+run``. Editing the Ruff configuration invalidates every stored finding.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CONFIG_FILES = ("pyproject.toml", "ruff.toml", ".ruff.toml")
+
+# Directory names never linted; dot-directories are skipped as well
+SKIP_DIRS = frozenset({"__pycache__", "node_modules", "venv"})
+
+
+def find_ruff_command() -> list[str] | None:
+    """Return the command that runs Ruff, or None if it is not installed."""
+    executable = shutil.which("ruff")
+    if executable:
+        return [executable]
+    if find_spec("ruff") is not None:
+        return [sys.executable, "-m", "ruff"]
+    return None
+
+
+def _finding_key(finding: dict[str, Any]) -> tuple[str | None, str]:
+    # Locations shift whenever lines above change; code and message do not
+    return finding.get("code"), finding.get("message", "")
+
+
+@dataclass
+class LintDelta:
+    """Changes in code-health findings since the previous check."""
+
+    new: list[dict[str, Any]] = field(default_factory=list)
+    resolved: list[dict[str, Any]] = field(default_factory=list)
+    total: int = 0
+    files_linted: int = 0
+
+
+class IncrementalLinter:
+    """Ruff findings per file, refreshed only for files that changed."""
+
+    def __init__(
+        self,
+        project_root: str,
+        targets: list[str] | None = None,
+        command: list[str] | None = None,
+        batch_size: int = 200,
+        timeout: float = 120.0,
+    ):
+        """
+        Initialize the linter.
+
+        Args:
+            project_root: Directory Ruff runs in and resolves its config from
+            targets: Directories to lint, relative to the root (default ``src``)
+            command: Ruff command prefix (default: found on PATH or as a module)
+            batch_size: Maximum files passed to a single Ruff invocation
+            timeout: Seconds to wait for one Ruff invocation
+        """
+        self.project_root = os.path.abspath(project_root)
+        self.targets = [
+            os.path.join(self.project_root, t) for t in (targets or ["src"])
+        ]
+        self.command = command or find_ruff_command()
+        self.batch_size = batch_size
+        self.timeout = timeout
+        # path -> (mtime_ns, size) of the linted version, and its findings
+        self._versions: dict[str, tuple[int, int]] = {}
+        self._findings: dict[str, list[dict[str, Any]]] = {}
+        self._config_version: tuple | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def available(self) -> bool:
+        """Whether a Ruff executable was found."""
+        return self.command is not None
+
+    @property
+    def findings(self) -> list[dict[str, Any]]:
+        """Every current finding, as reported by Ruff's JSON output."""
+        return [f for findings in self._findings.values() for f in findings]
+
+    async def check(self) -> LintDelta:
+        """
+        Re-lint files changed since the last check and report the delta.
+
+        Raises:
+            RuntimeError: If Ruff is not installed or fails
+        """
+        if self.command is None:
+            raise RuntimeError("Ruff is not installed")
+
+        async with self._lock:
+            files, config_version = await asyncio.to_thread(self._stat_files)
+            if config_version != self._config_version:
+                # Rules may have changed; no stored finding can be trusted
+                self._versions.clear()
+                self._config_version = config_version
+
+            changed = [p for p, v in files.items() if self._versions.get(p) != v]
+            removed = [p for p in self._findings if p not in files]
+
+            linted = await self._lint(changed)
+            delta = LintDelta(files_linted=len(changed))
+            for path in changed:
+                self._diff(self._findings.get(path, []), linted.get(path, []), delta)
+                self._versions[path] = files[path]
+                if linted.get(path):
+                    self._findings[path] = linted[path]
+                else:
+                    self._findings.pop(path, None)
+            for path in removed:
+                delta.resolved.extend(self._findings.pop(path))
+            for path in [p for p in self._versions if p not in files]:
+                del self._versions[path]
+
+            delta.total = sum(len(f) for f in self._findings.values())
+            return delta
+
+    def _stat_files(self) -> tuple[dict[str, tuple[int, int]], tuple]:
+        """Return the version of every Python file under the targets, and of the config."""
+        files: dict[str, tuple[int, int]] = {}
+        for target in self.targets:
+            for directory, dirnames, filenames in os.walk(target):
+                dirnames[:] = [
+                    d for d in dirnames if not d.startswith(".") and d not in SKIP_DIRS
+                ]
+                for name in filenames:
+                    if not name.endswith(".py"):
+                        continue
+                    path = os.path.join(directory, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    files[path] = (stat.st_mtime_ns, stat.st_size)
+
+        config_version = []
+        for name in CONFIG_FILES:
+            try:
+                stat = os.stat(os.path.join(self.project_root, name))
+            except OSError:
+                continue
+            config_version.append((name, stat.st_mtime_ns, stat.st_size))
+        return files, tuple(config_version)
+
+    async def _lint(self, paths: list[str]) -> dict[str, list[dict[str, Any]]]:
+        """Run Ruff over ``paths`` in batches and group its findings by file."""
+        results: dict[str, list[dict[str, Any]]] = {}
+        for i in range(0, len(paths), self.batch_size):
+            batch = paths[i : i + self.batch_size]
+            process = await asyncio.create_subprocess_exec(
+                *self.command,
+                "check",
+                "--output-format=json",
+                "--exit-zero",
+                "--force-exclude",
+                *batch,
+                cwd=self.project_root,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(), timeout=self.timeout
+                )
+            except TimeoutError:
+                process.kill()
+                await process.wait()
+                raise RuntimeError(f"Ruff timed out after {self.timeout}s") from None
+            if process.returncode != 0:
+                raise RuntimeError(
+                    f"Ruff exited with {process.returncode}: "
+                    f"{stderr.decode(errors='replace').strip()[:500]}"
+                )
+            for finding in json.loads(stdout or b"[]"):
+                path = os.path.abspath(finding.get("filename", ""))
+                results.setdefault(path, []).append(finding)
+        return results
+
+    @staticmethod
+    def _diff(
+        before: list[dict[str, Any]], after: list[dict[str, Any]], delta: LintDelta
+    ) -> None:
+        """Add findings that appeared or disappeared in one file to ``delta``."""
+        remaining = Counter(_finding_key(f) for f in before)
+        for finding in after:
+            key = _finding_key(finding)
+            if remaining[key] > 0:
+                remaining[key] -= 1
+            else:
+                delta.new.append(finding)
+        still_present = Counter(_finding_key(f) for f in after)
+        for finding in before:
+            key = _finding_key(finding)
+            if still_present[key] > 0:
+                still_present[key] -= 1
+            else:
+                delta.resolved.append(finding)
+
+
+_linters: dict[str, IncrementalLinter] = {}
+
+
+def get_incremental_linter(project_root: str) -> IncrementalLinter:
+    """Return the shared linter for a project, so findings survive between cycles."""
+    key = os.path.abspath(project_root)
+    linter = _linters.get(key)
+    if linter is None:
+        linter = _linters[key] = IncrementalLinter(key)
+    return linter
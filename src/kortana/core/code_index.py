@@ -0,0 +1,440 @@
+"""
+Persistent Trigram Index for Codebase Search
+
+Maps every three-character sequence of a file's lower-cased text to the ids
+of the files containing it. A literal query can only match files holding all
+of its trigrams, so a search reads just the candidate files instead of the
+whole tree; regex queries are narrowed by the literal runs every match must
+contain (``required_literals``) and fall back to a full scan when there are
+none.
+
+The index is kept fresh incrementally: ``refresh`` stats the tree and
+re-indexes only files whose mtime or size changed, and ``update_file`` lets
+writers report an edit directly. Re-indexed files get a new id and their old
+postings are dropped lazily, so an update never rewrites the lists of other
+files.
+
+On disk the index is a single file: a JSON header line (file table and
+trigram offsets) followed by every posting list as packed uint32s. Loading
+decodes the header only; posting lists are sliced out of the packed array when
+a query needs them.
+"""
+
+import fnmatch
+import json
+import logging
+import os
+import re
+import threading
+import time
+from array import array
+from collections.abc import Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+INDEX_FILENAME = "trigrams.idx"
+
+# Directories never worth indexing; dot-directories are skipped as well
+DEFAULT_SKIP_DIRS = frozenset({"__pycache__", "node_modules", "venv", "site-packages"})
+
+# Larger files are not indexed and are read on every query instead
+DEFAULT_MAX_FILE_SIZE = 4 * 1024 * 1024
+
+# File table ids for files without postings
+_UNINDEXED = -1  # too large: always a candidate
+_UNREADABLE = -2  # binary or not UTF-8: never a candidate
+
+# Persist incremental changes once this many files were re-indexed, or once
+# the oldest unsaved change is this many seconds old
+_SAVE_AFTER_FILES = 64
+_SAVE_AFTER_SECONDS = 60.0
+
+# Drop stale ids from the posting lists once they exceed this share of files
+_COMPACT_RATIO = 0.25
+
+
+def trigrams(text: str) -> set[str]:
+    """Return the distinct trigrams of ``text``."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def required_literals(pattern: str, flags: int = 0) -> list[str]:
+    """
+    Return lower-cased strings that every match of ``pattern`` contains.
+
+    Only literal runs that are unconditionally part of a match are returned;
+    alternations, optional parts and character classes end a run. An empty
+    list means the pattern cannot be narrowed and every file is a candidate.
+
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    compiled = re.compile(pattern, flags)
+    try:
+        from re import _constants as c
+        from re import _parser
+
+        parsed = _parser.parse(pattern, flags)
+    except Exception:
+        # The parser is internal to ``re``; without it, scan everything
+        return []
+    runs: list[str] = []
+
+    def flush(current: list[str]) -> list[str]:
+        if current:
+            runs.append("".join(current))
+        return []
+
+    def walk(items, current: list[str], ignore_case: bool) -> list[str]:
+        for op, value in items:
+            if op is c.LITERAL:
+                char = chr(value)
+                # Case-insensitive "i", "s" and non-ASCII literals also match
+                # characters that lower-case to something else ("İ", "ſ")
+                if ignore_case and (not char.isascii() or char in "iIsS"):
+                    current = flush(current)
+                else:
+                    current.append(char.lower())
+            elif op is c.SUBPATTERN:
+                _, add_flags, del_flags, sub = value
+                scoped = (ignore_case or bool(add_flags & re.IGNORECASE)) and not (
+                    del_flags & re.IGNORECASE
+                )
+                current = walk(sub, current, scoped)
+            elif op in (c.MAX_REPEAT, c.MIN_REPEAT) and value[0] >= 1:
+                current = flush(current)
+                flush(walk(value[2], [], ignore_case))
+            elif op is c.AT:
+                continue  # zero-width, keeps neighbours adjacent
+            else:
+                current = flush(current)
+        return current
+
+    flush(walk(parsed, [], bool(compiled.flags & re.IGNORECASE)))
+    return [run for run in runs if len(run) >= 3]
+
+
+class TrigramIndex:
+    """Incrementally maintained trigram index over one or more directory trees."""
+
+    def __init__(
+        self,
+        roots: list[str],
+        index_dir: str | None = None,
+        max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+        skip_dirs: Iterable[str] = DEFAULT_SKIP_DIRS,
+    ):
+        """
+        Initialize the index, loading it from ``index_dir`` if present.
+
+        Args:
+            roots: Directories to index
+            index_dir: Directory holding the persisted index; None keeps the
+                index in memory only
+            max_file_size: Files larger than this are read on every query
+                instead of being indexed
+            skip_dirs: Directory names never descended into
+        """
+        self.roots = [os.path.abspath(r) for r in roots]
+        self.index_dir = index_dir
+        self.max_file_size = max_file_size
+        self.skip_dirs = frozenset(skip_dirs)
+        self._lock = threading.RLock()
+
+        # path -> (id, mtime_ns, size); ids below zero have no postings
+        self._files: dict[str, tuple[int, int, int]] = {}
+        self._paths: dict[int, str] = {}
+        self._next_id = 0
+        self._stale_ids = 0
+
+        # Persisted postings: one packed array sliced by (start, count)
+        self._packed = array("I")
+        self._offsets: dict[str, tuple[int, int]] = {}
+        # Postings added since the packed array was written
+        self._added: dict[str, array] = {}
+
+        self._unsaved_files = 0
+        self._unsaved_since: float | None = None
+
+        if index_dir:
+            self._load()
+
+    @property
+    def path(self) -> str | None:
+        """The index file, if the index is persisted."""
+        return os.path.join(self.index_dir, INDEX_FILENAME) if self.index_dir else None
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def refresh(self, patterns: list[str]) -> int:
+        """
+        Bring the index up to date for files matching ``patterns``.
+
+        Only files are read whose mtime or size differ from the indexed
+        version; deleted files are dropped.
+
+        Args:
+            patterns: Filename globs, e.g. ``["*.py", "*.md"]``
+
+        Returns:
+            The number of files (re)indexed or removed
+        """
+        matcher = _glob_matcher(patterns)
+        changed = 0
+        with self._lock:
+            seen: set[str] = set()
+            for path, stat in self._walk(matcher):
+                seen.add(path)
+                known = self._files.get(path)
+                if known is None or known[1:] != (stat.st_mtime_ns, stat.st_size):
+                    self._index_file(path, stat)
+                    changed += 1
+            for path in [p for p in self._files if p not in seen]:
+                if matcher(os.path.basename(path)) and self._under_roots(path):
+                    self._drop(path)
+                    changed += 1
+            if changed:
+                self._mark_dirty(changed)
+        return changed
+
+    def update_file(self, path: str) -> None:
+        """
+        Re-index a single file after it was written, or drop it if deleted.
+
+        Unlike ``refresh`` this does not rely on the mtime changing, so edits
+        made within the filesystem's timestamp granularity are not missed.
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                if self._drop(path):
+                    self._mark_dirty(1)
+                return
+            self._index_file(path, stat)
+            self._mark_dirty(1)
+
+    def candidates(self, literals: list[str], patterns: list[str]) -> list[str]:
+        """
+        Return the files that can contain every string in ``literals``.
+
+        Matching is case-insensitive. Call ``refresh`` first for up-to-date
+        results.
+
+        Args:
+            literals: Strings that must all occur in a matching file
+            patterns: Filename globs restricting the candidates
+
+        Returns:
+            Candidate paths, ordered by root and then path
+        """
+        matcher = _glob_matcher(patterns)
+        required = set()
+        for literal in literals:
+            required |= trigrams(literal.lower())
+
+        with self._lock:
+            ids: set[int] | None = None
+            for trigram in sorted(required, key=self._posting_size):
+                postings = self._postings(trigram)
+                ids = set(postings) if ids is None else ids.intersection(postings)
+                if not ids:
+                    break
+            if ids is None:
+                paths = [p for p, (i, _, _) in self._files.items() if i >= 0]
+            else:
+                paths = [self._paths[i] for i in ids if i in self._paths]
+            paths.extend(p for p, (i, _, _) in self._files.items() if i == _UNINDEXED)
+            return sorted(
+                (p for p in set(paths) if matcher(os.path.basename(p))),
+                key=self._sort_key,
+            )
+
+    def root_for(self, path: str) -> str | None:
+        """Return the first root containing ``path``."""
+        for root in self.roots:
+            if path == root or path.startswith(root + os.sep):
+                return root
+        return None
+
+    def maybe_save(self) -> None:
+        """Persist unsaved changes once enough have accumulated."""
+        with self._lock:
+            if self._unsaved_since is None:
+                return
+            if (
+                self._unsaved_files >= _SAVE_AFTER_FILES
+                or time.monotonic() - self._unsaved_since >= _SAVE_AFTER_SECONDS
+            ):
+                self.save()
+
+    def save(self) -> None:
+        """Write the index to disk, merging postings added since the last save."""
+        with self._lock:
+            self._merge()
+            self._unsaved_files = 0
+            self._unsaved_since = None
+            if not self.path:
+                return
+            header = {
+                "version": INDEX_VERSION,
+                "roots": self.roots,
+                "next_id": self._next_id,
+                "stale_ids": self._stale_ids,
+                "files": {p: list(entry) for p, entry in self._files.items()},
+                "trigrams": [[t, n] for t, (_, n) in self._offsets.items()],
+            }
+            os.makedirs(self.index_dir, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(json.dumps(header, ensure_ascii=False).encode("utf-8"))
+                f.write(b"\n")
+                self._packed.tofile(f)
+            os.replace(tmp_path, self.path)
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "rb") as f:
+                header = json.loads(f.readline())
+                packed = array("I")
+                packed.frombytes(f.read())
+            if header.get("version") != INDEX_VERSION:
+                logger.info(f"Ignoring search index {self.path} from another version")
+                return
+            offsets = {}
+            start = 0
+            for trigram, count in header["trigrams"]:
+                offsets[trigram] = (start, count)
+                start += count
+            if start != len(packed):
+                raise ValueError("posting data does not match header")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # A damaged index is rebuilt by the next refresh
+            logger.warning(f"Discarding unreadable search index {self.path}: {e}")
+            return
+
+        self._packed, self._offsets = packed, offsets
+        self._next_id = header["next_id"]
+        self._stale_ids = header.get("stale_ids", 0)
+        for path, (file_id, mtime_ns, size) in header["files"].items():
+            self._files[path] = (file_id, mtime_ns, size)
+            if file_id >= 0:
+                self._paths[file_id] = path
+        logger.info(
+            f"Loaded search index for {len(self._files)} files from {self.path}"
+        )
+
+    def _walk(self, matcher) -> Iterator[tuple[str, os.stat_result]]:
+        """Yield ``(path, stat)`` for matching files under every root."""
+        visited: set[str] = set()
+        for root in self.roots:
+            stack = [root]
+            while stack:
+                directory = stack.pop()
+                if directory in visited:
+                    continue
+                visited.add(directory)
+                try:
+                    entries = list(os.scandir(directory))
+                except OSError:
+                    continue
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if (
+                                not entry.name.startswith(".")
+                                and entry.name not in self.skip_dirs
+                            ):
+                                stack.append(entry.path)
+                        elif entry.is_file() and matcher(entry.name):
+                            yield entry.path, entry.stat()
+                    except OSError:
+                        continue
+
+    def _index_file(self, path: str, stat: os.stat_result) -> None:
+        self._drop(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        if stat.st_size > self.max_file_size:
+            self._files[path] = (_UNINDEXED, *key)
+            return
+        try:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+        except (UnicodeDecodeError, OSError):
+            self._files[path] = (_UNREADABLE, *key)
+            return
+
+        file_id = self._next_id
+        self._next_id += 1
+        self._files[path] = (file_id, *key)
+        self._paths[file_id] = path
+        added = self._added
+        for trigram in trigrams(text.lower()):
+            postings = added.get(trigram)
+            if postings is None:
+                postings = added[trigram] = array("I")
+            postings.append(file_id)
+
+    def _drop(self, path: str) -> bool:
+        entry = self._files.pop(path, None)
+        if entry is None:
+            return False
+        if entry[0] >= 0:
+            del self._paths[entry[0]]
+            self._stale_ids += 1
+        return True
+
+    def _mark_dirty(self, files: int) -> None:
+        self._unsaved_files += files
+        if self._unsaved_since is None:
+            self._unsaved_since = time.monotonic()
+
+    def _postings(self, trigram: str) -> Iterable[int]:
+        span = self._offsets.get(trigram)
+        base = self._packed[span[0] : span[0] + span[1]] if span else ()
+        added = self._added.get(trigram)
+        if added is None:
+            return base
+        return base + added if base else added
+
+    def _posting_size(self, trigram: str) -> int:
+        span = self._offsets.get(trigram)
+        added = self._added.get(trigram)
+        return (span[1] if span else 0) + (len(added) if added else 0)
+
+    def _merge(self) -> None:
+        """Fold added postings into the packed array, dropping stale ids if many."""
+        compact = self._stale_ids > _COMPACT_RATIO * max(len(self._paths), 1)
+        if not self._added and not compact:
+            return
+        live = self._paths
+        packed = array("I")
+        offsets: dict[str, tuple[int, int]] = {}
+        for trigram in self._offsets.keys() | self._added.keys():
+            postings = self._postings(trigram)
+            if compact:
+                postings = array("I", (i for i in postings if i in live))
+            if postings:
+                offsets[trigram] = (len(packed), len(postings))
+                packed.extend(postings)
+        self._packed, self._offsets, self._added = packed, offsets, {}
+        if compact:
+            self._stale_ids = 0
+
+    def _under_roots(self, path: str) -> bool:
+        return self.root_for(path) is not None
+
+    def _sort_key(self, path: str) -> tuple[int, str]:
+        root = self.root_for(path)
+        return (self.roots.index(root) if root else len(self.roots), path)
+
+
+def _glob_matcher(patterns: list[str]):
+    """Return a predicate matching file names against any of ``patterns``."""
+    regex = re.compile("|".join(fnmatch.translate(p) for p in patterns) or "(?!)")
+    return lambda name: regex.match(name) is not None
@@ -0,0 +1,213 @@
+"""
+Incremental AST Scanning
+
+Analyzes Python files for the code-health rules used by the execution engine
+without re-parsing files that have not changed:
+
+- Findings are cached per file content hash (and rule set), so a repeat scan
+  only parses files whose bytes differ from a previous scan; files whose
+  mtime and size are unchanged are not even re-read.
+- Files that do need parsing are fanned out across a process pool once there
+  are enough of them to outweigh the worker start-up cost; smaller batches
+  are parsed on the calling thread.
+
+``IncrementalAstScanner.scan`` blocks, so async callers run it with
+``asyncio.to_thread`` to keep the event loop free.
+"""
+
+import ast
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Rules understood by analyze_source
+#   missing_docstring:  any sync function without a docstring
+#   missing_docstrings: public sync or async functions without a non-empty one
+SUPPORTED_RULES = frozenset({"missing_docstring", "missing_docstrings"})
+
+# Below this many files to parse, a process pool costs more than it saves
+DEFAULT_MIN_PARALLEL = 16
+
+DEFAULT_CACHE_SIZE = 20000
+
+
+def analyze_source(source: bytes, filename: str, rules: tuple[str, ...]) -> dict:
+    """
+    Parse one file and collect the findings for ``rules``.
+
+    Runs in worker processes, so it only takes and returns picklable data.
+
+    Args:
+        source: Raw file content, decoded as UTF-8
+        filename: Path used in syntax error messages
+        rules: Rules to check; the file is parsed even if empty
+
+    Returns:
+        ``{"read_error": msg}``, ``{"syntax_error": (line, msg)}`` or
+        ``{"parse_error": msg}`` if the file could not be analyzed, otherwise
+        a list of ``(function_name, line_number)`` per rule
+    """
+    try:
+        text = source.decode("utf-8")
+    except UnicodeDecodeError as e:
+        return {"read_error": str(e)}
+    try:
+        tree = ast.parse(text, filename=filename)
+    except SyntaxError as e:
+        return {"syntax_error": (e.lineno, e.msg)}
+    except Exception as e:
+        return {"parse_error": str(e)}
+
+    findings: dict[str, list[tuple[str, int]]] = {rule: [] for rule in rules}
+    any_missing = findings.get("missing_docstring")
+    public_missing = findings.get("missing_docstrings")
+    if any_missing is None and public_missing is None:
+        return findings
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            continue
+        if (
+            any_missing is not None
+            and isinstance(node, ast.FunctionDef)
+            and ast.get_docstring(node, clean=False) is None
+        ):
+            any_missing.append((node.name, node.lineno))
+        if (
+            public_missing is not None
+            and not node.name.startswith("_")
+            and not ast.get_docstring(node)
+        ):
+            public_missing.append((node.name, node.lineno))
+    return findings
+
+
+def _analyze_job(job: tuple[str, bytes, tuple[str, ...]]) -> dict:
+    return analyze_source(job[1], job[0], job[2])
+
+
+class IncrementalAstScanner:
+    """Content-hash cached, process-parallel AST analysis of Python files."""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        min_parallel: int = DEFAULT_MIN_PARALLEL,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """
+        Initialize the scanner.
+
+        Args:
+            max_workers: Worker processes for large batches (default: CPU count)
+            min_parallel: Smallest batch of files worth a process pool
+            cache_size: Maximum cached per-file results
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_parallel = min_parallel
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        # path -> (mtime_ns, size, content hash)
+        self._hashes: dict[str, tuple[int, int, str]] = {}
+        # (content hash, rules) -> findings, least recently used first
+        self._results: OrderedDict[tuple[str, tuple[str, ...]], dict] = OrderedDict()
+        self.last_scan: dict[str, int] = {"files": 0, "analyzed": 0}
+
+    def scan(self, paths: list[str], rules: list[str] | tuple[str, ...]) -> dict:
+        """
+        Analyze ``paths``, re-parsing only files whose content changed.
+
+        Args:
+            paths: Python files to analyze
+            rules: Rules to check; unsupported names are ignored
+
+        Returns:
+            Findings per path, as returned by ``analyze_source``, in input order
+        """
+        rule_key = tuple(sorted(SUPPORTED_RULES.intersection(rules)))
+        results: dict[str, dict] = {}
+        pending: dict[tuple[str, tuple[str, ...]], tuple[str, bytes]] = {}
+        keys: dict[str, tuple[str, tuple[str, ...]]] = {}
+
+        for path in paths:
+            try:
+                digest, source = self._digest(path)
+            except OSError as e:
+                results[path] = {"read_error": str(e)}
+                continue
+            key = (digest, rule_key)
+            keys[path] = key
+            with self._lock:
+                cached = self._results.get(key)
+                if cached is not None:
+                    self._results.move_to_end(key)
+            if cached is not None:
+                results[path] = cached
+            elif key not in pending:
+                if source is None:
+                    try:
+                        with open(path, "rb") as f:
+                            source = f.read()
+                    except OSError as e:
+                        results[path] = {"read_error": str(e)}
+                        continue
+                pending[key] = (path, source)
+
+        analyzed = self._analyze(
+            [(path, source, rule_key) for path, source in pending.values()]
+        )
+        with self._lock:
+            for key, findings in zip(pending, analyzed, strict=True):
+                self._results[key] = findings
+            while len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+        fresh = dict(zip(pending, analyzed, strict=True))
+        for path, key in keys.items():
+            if path not in results:
+                results[path] = fresh[key]
+
+        self.last_scan = {"files": len(paths), "analyzed": len(pending)}
+        return {path: results[path] for path in paths if path in results}
+
+    def _digest(self, path: str) -> tuple[str, bytes | None]:
+        """Return the content hash of a file, reading it only if it changed."""
+        stat = os.stat(path)
+        with self._lock:
+            known = self._hashes.get(path)
+        if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+            return known[2], None
+        with open(path, "rb") as f:
+            source = f.read()
+        digest = hashlib.blake2b(source, digest_size=16).hexdigest()
+        with self._lock:
+            self._hashes[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest, source
+
+    def _analyze(self, jobs: list[tuple[str, bytes, tuple[str, ...]]]) -> list[dict]:
+        """Run analyze_source over jobs, in a process pool for large batches."""
+        workers = min(self.max_workers, len(jobs))
+        if len(jobs) < self.min_parallel or workers < 2:
+            return [_analyze_job(job) for job in jobs]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunksize = max(1, len(jobs) // (workers * 4))
+                return list(executor.map(_analyze_job, jobs, chunksize=chunksize))
+        except Exception as e:
+            # A broken pool must not lose the scan; parse in-process instead
+            logger.warning(f"AST scan pool failed, scanning in-process: {e}")
+            return [_analyze_job(job) for job in jobs]
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics."""
+        with self._lock:
+            return {
+                "cached_results": len(self._results),
+                "tracked_files": len(self._hashes),
+                **self.last_scan,
+            }
@@ -7,10 +7,11 @@ operational principles, ethics, and behavioral constraints.
 import json
 import logging  # Added import for logging
 import os
-import re
 from datetime import datetime
 from typing import Any
 
+from .covenant_rules import CompiledCovenantRules, CovenantStreamGuard
+
 # Avoid circular import
 # from kortana.config import load_config
 
@@ -64,6 +65,27 @@ class CovenantEnforcer:
 
         self._load_core_values()
 
+    @property
+    def rules(self) -> dict:
+        """Covenant rules; assigning new rules recompiles the matchers."""
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: dict) -> None:
+        self._rules = rules
+        patterns = [str(p) for p in rules.get("forbidden_content", [])]
+        boundaries = [str(b) for b in rules.get("boundaries", {}).get("do_not", [])]
+        # Forbidden content alone (goal and output checks) and together with
+        # the "do not" boundaries (enforce), each compiled into one regex
+        self._forbidden = CompiledCovenantRules(patterns=patterns)
+        self._message_rules = CompiledCovenantRules(
+            boundaries=boundaries, patterns=patterns
+        )
+
+    def stream(self) -> CovenantStreamGuard:
+        """Start an incremental ``enforce`` over a streamed response."""
+        return self._message_rules.stream()
+
     def _load_core_values(self):
         """Load core Soulprint values and memory principles"""
         try:
@@ -96,9 +118,8 @@ class CovenantEnforcer:
     def check_output(self, response: str) -> bool:
         """Validate outbound responses against Sacred Covenant"""
         violations = [
-            f"Harmful content detected: {pattern}"
-            for pattern in self.rules.get("forbidden_content", [])
-            if re.search(pattern, response, re.IGNORECASE)
+            f"Harmful content detected: {rule.source}"
+            for rule in self._forbidden.violations(response)
         ]
 
         if not self._check_soulprint_alignment(response):
@@ -609,13 +630,12 @@ class CovenantEnforcer:
 
         # For goal creation, check description against forbidden content
         if action_type == "create_goal" and "description" in context:
-            description = context["description"]
-            for pattern in self.rules.get("forbidden_content", []):
-                if re.search(pattern, description, re.IGNORECASE):
-                    return (
-                        False,
-                        f"Goal description contains forbidden content matching pattern: {pattern}",
-                    )
+            violation = self._forbidden.first_violation(context["description"])
+            if violation is not None:
+                return (
+                    False,
+                    f"Goal description contains forbidden content matching pattern: {violation.source}",
+                )
 
         # More validation logic can be added here
 
@@ -673,15 +693,11 @@ class CovenantEnforcer:
         if not message:
             return False, "Empty message"
 
-        # Check against forbidden content patterns in rules
-        for pattern in self.rules.get("forbidden_content", []):
-            if re.search(pattern, message, re.IGNORECASE):
-                return False, f"Message violates covenant rule: {pattern}"
-
-        # Check against "do not" boundaries for compatibility with simpler enforcers
-        boundaries = self.rules.get("boundaries", {}).get("do_not", [])
-        for boundary in boundaries:
-            if boundary.lower() in message.lower():
-                return False, f"Message violates boundary: {boundary}"
+        # Forbidden content patterns and "do not" boundaries, in one pass
+        violation = self._message_rules.first_violation(message)
+        if violation is not None and violation.kind == "pattern":
+            return False, f"Message violates covenant rule: {violation.source}"
+        if violation is not None:
+            return False, f"Message violates boundary: {violation.source}"
 
         return True, "Message is compliant with covenant"
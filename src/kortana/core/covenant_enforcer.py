@@ -8,10 +8,11 @@ adhere to the established covenant/guidelines.
 import logging
 from typing import Any
 
-import yaml
-
+from kortana.config.registry import config_registry
 from kortana.config.schema import KortanaConfig
 
+from .covenant_rules import CompiledCovenantRules, CovenantStreamGuard
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +33,10 @@ class CovenantEnforcer:
         """
         self.settings = settings
         self.covenant = self._load_covenant(settings.paths.covenant_file_path)
+        self._rules = self._compile_rules(self.covenant)
+        config_registry.subscribe(
+            settings.paths.covenant_file_path, self._on_covenant_changed
+        )
 
     def _load_covenant(self, covenant_file_path: str) -> dict[str, Any]:
         """
@@ -44,8 +49,8 @@ class CovenantEnforcer:
             The covenant as a dictionary.
         """
         try:
-            with open(covenant_file_path) as f:
-                covenant = yaml.safe_load(f)
+            # Parsed once and shared with the other covenant readers
+            covenant = config_registry.load_yaml(covenant_file_path)
 
             logger.info(f"Loaded covenant from {covenant_file_path}")
             return covenant
@@ -73,6 +78,19 @@ class CovenantEnforcer:
                 },
             }
 
+    def _on_covenant_changed(self, path: str, covenant: dict[str, Any]) -> None:
+        """Apply an edited covenant without restarting."""
+        if isinstance(covenant, dict):
+            self._rules = self._compile_rules(covenant)
+            self.covenant = covenant
+            logger.info(f"Reloaded covenant from {path}")
+
+    @staticmethod
+    def _compile_rules(covenant: dict[str, Any]) -> CompiledCovenantRules:
+        """Compile the covenant's "do not" boundaries into a single matcher."""
+        boundaries = covenant.get("boundaries", {}).get("do_not", [])
+        return CompiledCovenantRules(boundaries=[str(b) for b in boundaries])
+
     def enforce(self, message: str) -> tuple[bool, str]:
         """
         Check if a message adheres to the covenant.
@@ -89,15 +107,23 @@ class CovenantEnforcer:
         if not message:
             return False, "Empty message"
 
-        # Check against "do not" boundaries
-        for boundary in self.covenant.get("boundaries", {}).get("do_not", []):
-            boundary_lower = boundary.lower()
-            if boundary_lower in message.lower():
-                return False, f"Message violates boundary: {boundary}"
+        # Check against "do not" boundaries in one pass over the message
+        violation = self._rules.first_violation(message)
+        if violation is not None:
+            return False, f"Message violates boundary: {violation.source}"
 
         # For now, assume message is compliant if it doesn't trigger any boundary
         return True, "Message is compliant with covenant"
 
+    def stream(self) -> CovenantStreamGuard:
+        """
+        Start checking a streamed response.
+
+        Feed each chunk to the returned guard and send on what it releases;
+        check ``guard.compliant`` before sending the final ``guard.close()``.
+        """
+        return self._rules.stream()
+
     def get_covenant_summary(self) -> str:
         """Get a summary of the covenant for reference."""
         principles = "\n".join([f"- {p}" for p in self.covenant.get("principles", [])])
@@ -0,0 +1,272 @@
+"""
+Compiled Covenant Rules
+
+Compiles covenant rules once, when they are loaded, so checking a response is
+a single pass over its text however many rules there are:
+
+- "do not" boundaries (literal phrases) become one trie-shaped regex that is
+  run over the lower-cased text, so each position tries one branch per
+  character instead of every phrase;
+- forbidden content patterns (regular expressions) are joined into one
+  case-insensitive alternation.
+
+Neither regex uses named groups, which make large alternations an order of
+magnitude slower in ``re``; the rule that matched is identified afterwards,
+which only happens for non-compliant text.
+
+``CovenantStreamGuard`` applies the same matchers to streamed chunks and holds
+back only the tail that could still be the start of a violation, so tokens can
+be released as they arrive instead of after the full completion.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Patterns that cannot share a combined regex: numbered backreferences (group
+# numbers shift once joined), named groups (names may collide) and global
+# inline flags left in place by ``_scope_inline_flags``
+_STANDALONE_RE = re.compile(r"\\[1-9]|\(\?P[<=]|^\(\?[aiLmsux]+\)")
+_GLOBAL_FLAGS_RE = re.compile(r"\(\?([aiLmsu]+)\)")
+
+# Held-back characters for regex rules, whose match length is unbounded
+DEFAULT_PATTERN_WINDOW = 256
+
+
+@dataclass(frozen=True)
+class CovenantRule:
+    """A single compiled covenant rule."""
+
+    kind: str  # "boundary" (literal phrase) or "pattern" (regex)
+    source: str
+
+
+def _scope_inline_flags(pattern: str) -> str:
+    """Rewrite leading global inline flags so the pattern can be joined.
+
+    ``(?i)`` is dropped, since every pattern is compiled case-insensitively;
+    other flags become a scoped ``(?flags:...)`` group. Verbose mode is left
+    alone, as a trailing comment would swallow the group's closing paren.
+    """
+    match = _GLOBAL_FLAGS_RE.match(pattern)
+    if match is None:
+        return pattern
+    flags = match.group(1).replace("i", "")
+    rest = pattern[match.end() :]
+    return f"(?{flags}:{rest})" if flags else rest
+
+
+def _trie_regex(phrases: list[str]) -> str:
+    """Build a regex matching any of ``phrases``, shaped as a prefix trie."""
+    trie: dict = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [
+            re.escape(char) + build(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A phrase may end here; the longer continuations are tried first
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class CompiledCovenantRules:
+    """Covenant boundaries and forbidden patterns compiled into single-pass matchers."""
+
+    def __init__(
+        self,
+        boundaries: list[str] | None = None,
+        patterns: list[str] | None = None,
+    ):
+        """
+        Compile the rules.
+
+        Invalid patterns are logged and skipped.
+
+        Args:
+            boundaries: Literal phrases, matched case-insensitively
+            patterns: Regular expressions, matched case-insensitively
+        """
+        self.rules: list[CovenantRule] = []
+        self._joined: list[tuple[CovenantRule, re.Pattern]] = []
+        self._joinable: list[str] = []
+        self._standalone: list[tuple[CovenantRule, re.Pattern]] = []
+        self._boundaries: dict[str, CovenantRule] = {}
+
+        for pattern in patterns or []:
+            try:
+                compiled = re.compile(pattern, re.IGNORECASE)
+            except re.error as e:
+                logger.error(f"Skipping invalid covenant pattern {pattern!r}: {e}")
+                continue
+            rule = CovenantRule("pattern", pattern)
+            self.rules.append(rule)
+            joinable = _scope_inline_flags(pattern)
+            if _STANDALONE_RE.search(joinable):
+                self._standalone.append((rule, compiled))
+            else:
+                self._joined.append((rule, compiled))
+                self._joinable.append(joinable)
+        for boundary in boundaries or []:
+            if boundary and boundary.lower() not in self._boundaries:
+                rule = CovenantRule("boundary", boundary)
+                self.rules.append(rule)
+                self._boundaries[boundary.lower()] = rule
+
+        self._pattern_re = (
+            re.compile(
+                "|".join(f"(?:{source})" for source in self._joinable),
+                re.IGNORECASE,
+            )
+            if self._joined
+            else None
+        )
+        self._boundary_re = (
+            re.compile(_trie_regex(list(self._boundaries)))
+            if self._boundaries
+            else None
+        )
+        self.max_literal_length = max(map(len, self._boundaries), default=0)
+        self.has_patterns = bool(self._joined or self._standalone)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def first_violation(self, text: str, pos: int = 0) -> CovenantRule | None:
+        """
+        Return a rule the text violates, or None.
+
+        If several rules match, the one whose match starts earliest in the
+        text is reported; patterns win ties with boundaries.
+
+        Args:
+            text: Text to check
+            pos: Only report matches starting at or after this index; the
+                text before it is still seen by anchors and lookbehinds
+        """
+        best: tuple[int, CovenantRule] | None = None
+        if self._pattern_re is not None:
+            match = self._pattern_re.search(text, pos)
+            if match is not None:
+                start = match.start()
+                # The alternation takes the first pattern matching at start
+                rule = next(
+                    (r for r, c in self._joined if c.match(text, start)),
+                    self._joined[0][0],
+                )
+                best = (start, rule)
+        for rule, compiled in self._standalone:
+            match = compiled.search(text, pos)
+            if match is not None and (best is None or match.start() < best[0]):
+                best = (match.start(), rule)
+        if self._boundary_re is not None:
+            match = self._boundary_re.search(text.lower(), len(text[:pos].lower()))
+            if match is not None and (best is None or match.start() < best[0]):
+                best = (match.start(), self._boundaries[match.group()])
+        return best[1] if best is not None else None
+
+    def violations(self, text: str) -> list[CovenantRule]:
+        """
+        Return every rule the text violates, in rule order.
+
+        Compliant text, the common case, costs one pass; rules are only
+        checked one by one once the combined matcher has found something.
+        """
+        if self.first_violation(text) is None:
+            return []
+        lowered = text.lower()
+        return [
+            rule
+            for rule in self.rules
+            if (
+                rule.source.lower() in lowered
+                if rule.kind == "boundary"
+                else re.search(rule.source, text, re.IGNORECASE)
+            )
+        ]
+
+    def stream(
+        self, pattern_window: int = DEFAULT_PATTERN_WINDOW
+    ) -> "CovenantStreamGuard":
+        """Return a guard that checks a response chunk by chunk."""
+        return CovenantStreamGuard(self, pattern_window)
+
+
+class CovenantStreamGuard:
+    """
+    Incremental covenant check over a streamed response.
+
+    ``feed`` returns the text that is safe to release. Everything but a short
+    tail is released as soon as it has been scanned; the tail is kept because
+    a violation could begin there and end in the next chunk. For literal
+    boundaries the tail is one character shorter than the longest boundary,
+    which makes the check exact. Regex rules keep ``pattern_window``
+    characters, so a forbidden-content match longer than that which spans a
+    chunk boundary can be missed.
+
+    The last ``pattern_window`` released characters are kept as context, so
+    ``\\b``, ``^`` and lookbehinds see the text to the left of the tail.
+
+    After a violation ``feed`` and ``close`` return nothing further and
+    ``violation`` names the rule.
+    """
+
+    def __init__(self, rules: CompiledCovenantRules, pattern_window: int):
+        self.rules = rules
+        self.violation: CovenantRule | None = None
+        self._holdback = max(
+            rules.max_literal_length - 1, pattern_window if rules.has_patterns else 0
+        )
+        self._context_size = pattern_window if rules.has_patterns else 0
+        self._context = ""
+        self._pending = ""
+
+    @property
+    def compliant(self) -> bool:
+        """Whether no violation has been found so far."""
+        return self.violation is None
+
+    def feed(self, chunk: str) -> str:
+        """
+        Scan a chunk and return the text that can be released.
+
+        Args:
+            chunk: The next piece of the response
+
+        Returns:
+            Text cleared for release, possibly empty
+        """
+        if self.violation is not None or not chunk:
+            return ""
+        self._pending += chunk
+        self.violation = self.rules.first_violation(
+            self._context + self._pending, len(self._context)
+        )
+        if self.violation is not None:
+            self._pending = ""
+            return ""
+
+        release = len(self._pending) - self._holdback
+        if release <= 0:
+            return ""
+        released, self._pending = self._pending[:release], self._pending[release:]
+        if self._context_size:
+            self._context = (self._context + released)[-self._context_size :]
+        return released
+
+    def close(self) -> str:
+        """Finish the stream and return whatever is left, if compliant."""
+        remaining, self._pending = self._pending, ""
+        return remaining if self.violation is None else ""
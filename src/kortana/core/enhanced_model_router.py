@@ -9,7 +9,6 @@ This module provides intelligent model selection and routing based on:
 - Performance characteristics
 """
 
-import json
 import logging
 import re
 from dataclasses import dataclass
@@ -17,6 +16,7 @@ from enum import Enum
 from pathlib import Path  # Added import
 from typing import Any
 
+from kortana.config.registry import config_registry
 from kortana.config.schema import KortanaConfig
 
 # from ..config import get_project_root # May be needed for path resolution
@@ -94,17 +94,17 @@ class EnhancedModelRouter:
 
         if absolute_config_path.exists():
             try:
-                with open(absolute_config_path, encoding="utf-8") as f:
-                    loaded_json = json.load(f)
-                    # Assuming the loaded JSON directly contains the models configuration
-                    # e.g., {"models": {...}, "routing_rules": [...]} or just {"model_id": {...}}
-                    # The original code used self._load_models_config() which might have specific logic
-                    # For now, let's assume the JSON file IS the models_config
-                    self.models_config = loaded_json
+                # Assuming the loaded JSON directly contains the models configuration
+                # e.g., {"models": {...}, "routing_rules": [...]} or just {"model_id": {...}}
+                # Shared with the other services via the config registry
+                self.models_config = config_registry.load_json(absolute_config_path)
+                config_registry.subscribe(
+                    absolute_config_path, self._on_models_config_changed
+                )
                 logger.info(
                     f"Successfully loaded models configuration for EnhancedModelRouter from {absolute_config_path}"
                 )
-            except json.JSONDecodeError as e:
+            except ValueError as e:
                 logger.error(
                     f"Failed to decode JSON for EnhancedModelRouter from {absolute_config_path}: {e}"
                 )
@@ -148,6 +148,20 @@ class EnhancedModelRouter:
             },
         }
 
+    def _on_models_config_changed(self, path: str, models_config: dict[str, Any]) -> None:
+        """Rebuild the model metadata table after models_config.json changes."""
+        previous = self.models_config, self.model_metadata
+        self.models_config = models_config
+        try:
+            self.model_metadata = self._build_model_metadata() if models_config else {}
+        except Exception as e:
+            logger.error(f"Keeping previous models configuration; rebuild failed: {e}")
+            self.models_config, self.model_metadata = previous
+            return
+        logger.info(
+            f"EnhancedModelRouter reloaded {len(self.model_metadata)} models from {path}"
+        )
+
     def _load_models_config(self) -> dict[str, Any]:
         """Load models configuration from file."""
         try:
@@ -161,8 +175,7 @@ class EnhancedModelRouter:
 
             for config_path in config_paths:
                 if config_path and Path(config_path).exists():
-                    with open(config_path) as f:
-                        return json.load(f)
+                    return config_registry.load_json(config_path)
 
             logger.warning("No models configuration file found, using default config")
             return self._get_default_config()
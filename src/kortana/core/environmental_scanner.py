@@ -8,6 +8,7 @@ import json
 import logging
 import os
 
+from kortana.core.code_health import get_incremental_linter
 from kortana.core.execution_engine import ExecutionEngine
 from kortana.core.goal_framework import GoalStatus, GoalType
 from kortana.core.goal_manager import GoalManager
@@ -37,6 +38,8 @@ class EnvironmentalScanner:
             allowed_dirs=allowed_dirs_absolute,
             blocked_commands=DEFAULT_BLOCKED_COMMANDS,
         )
+        # Shared per project, so a new scanner each cycle keeps the findings
+        self.linter = get_incremental_linter(self.project_root)
 
     async def scan_for_opportunities(self):
         """
@@ -81,88 +84,73 @@ class EnvironmentalScanner:
         """
         Scans the codebase for health issues (e.g., linting errors)
         and generates a goal if new issues are found and no similar goal exists.
+
+        Only files changed since the previous cycle are re-linted; findings
+        for the rest are carried over by the shared IncrementalLinter.
         """
         logger.info("[EnvironmentalScanner] Scanning code health using Ruff...")
         try:
-            ruff_command = "poetry run ruff check src/ --output-format=json --exit-zero"
+            if not self.linter.available:
+                logger.warning(
+                    "[EnvironmentalScanner] Could not perform code health scan: Ruff is not installed."
+                )
+                return
 
             try:
-                result = await self.execution_engine.execute_shell_command(
-                    command=ruff_command,
-                    working_dir=self.project_root,
+                delta = await self.linter.check()
+            except RuntimeError as e:
+                logger.error(
+                    f"[EnvironmentalScanner] Code health check (Ruff) command failed: {e}"
                 )
-            except AttributeError:
-                logger.warning(
-                    "[EnvironmentalScanner] Could not perform code health scan. The method 'execute_shell_command' (or similar) was not found on the ExecutionEngine instance. "
-                    "Please update environmental_scanner.py with the correct method name for shell execution."
+                return
+
+            issue_count = delta.total
+            if not issue_count:
+                logger.info(
+                    f"[EnvironmentalScanner] Code health check (Ruff) found no issues "
+                    f"({delta.files_linted} files re-linted)."
                 )
                 return
 
-            if result.success and result.data:
-                stdout_trimmed = result.data.strip()
-                issues_found = []
-                if stdout_trimmed:
-                    try:
-                        issues_found = json.loads(stdout_trimmed)
-                    except json.JSONDecodeError:
-                        logger.warning(
-                            f"[EnvironmentalScanner] Ruff output was not empty but failed to parse as JSON. Output: {stdout_trimmed[:200]}..."
-                        )
-                        return
-
-                if (
-                    issues_found
-                    and isinstance(issues_found, list)
-                    and len(issues_found) > 0
-                ):
-                    issue_count = len(issues_found)
-                    logger.info(
-                        f"[EnvironmentalScanner] Code health check (Ruff) found {issue_count} issues."
-                    )
-
-                    goal_title = "Autonomously address code health issues (Ruff)"
-                    goal_description = f"Ruff detected {issue_count} code quality issues that need to be reviewed and addressed."
-
-                    if self._does_similar_goal_exist(
-                        "Ruff code health issues"
-                    ) or self._does_similar_goal_exist(goal_title):
-                        logger.info(
-                            "[EnvironmentalScanner] Skipping Ruff goal creation as a similar one already exists."
-                        )
-                        return
-
-                    new_goal = self.goal_manager.create_goal_from_template(
-                        goal_type=GoalType.MAINTENANCE,
-                        template_name="code_health",
-                        title=goal_title,
-                        description=goal_description,
-                        context={
-                            "ruff_issues_count": issue_count,
-                            "raw_ruff_output_preview": stdout_trimmed[:500],
-                        },
-                    )
-
-                    if new_goal:
-                        logger.info(
-                            f"[EnvironmentalScanner] Created new goal: '{new_goal.title}' (ID: {new_goal.goal_id})"
-                        )
-                    else:
-                        logger.warning(
-                            "[EnvironmentalScanner] Failed to create new goal for Ruff code health issues."
-                        )
-                else:
-                    logger.info(
-                        "[EnvironmentalScanner] Code health check (Ruff) found no new issues (empty or invalid JSON)."
-                        if stdout_trimmed
-                        else "[EnvironmentalScanner] Code health check (Ruff) found no issues (empty stdout)."
-                    )
-            elif not result.success:
-                logger.error(
-                    f"[EnvironmentalScanner] Code health check (Ruff) command failed: {result.error}"
+            logger.info(
+                f"[EnvironmentalScanner] Code health check (Ruff) found {issue_count} issues "
+                f"({len(delta.new)} new, {len(delta.resolved)} resolved, "
+                f"{delta.files_linted} files re-linted)."
+            )
+
+            goal_title = "Autonomously address code health issues (Ruff)"
+            goal_description = f"Ruff detected {issue_count} code quality issues that need to be reviewed and addressed."
+
+            if self._does_similar_goal_exist(
+                "Ruff code health issues"
+            ) or self._does_similar_goal_exist(goal_title):
+                logger.info(
+                    "[EnvironmentalScanner] Skipping Ruff goal creation as a similar one already exists."
                 )
-            else:
+                return
+
+            new_goal = self.goal_manager.create_goal_from_template(
+                goal_type=GoalType.MAINTENANCE,
+                template_name="code_health",
+                title=goal_title,
+                description=goal_description,
+                context={
+                    "ruff_issues_count": issue_count,
+                    "ruff_new_issues_count": len(delta.new),
+                    "ruff_resolved_issues_count": len(delta.resolved),
+                    "raw_ruff_output_preview": json.dumps(
+                        delta.new or self.linter.findings[:10]
+                    )[:500],
+                },
+            )
+
+            if new_goal:
                 logger.info(
-                    "[EnvironmentalScanner] Code health check (Ruff) ran successfully with no output, indicating no issues."
+                    f"[EnvironmentalScanner] Created new goal: '{new_goal.title}' (ID: {new_goal.goal_id})"
+                )
+            else:
+                logger.warning(
+                    "[EnvironmentalScanner] Failed to create new goal for Ruff code health issues."
                 )
 
         except Exception as e:
@@ -4,19 +4,73 @@ Provides safe, controlled interaction with the file system and shell commands.
 This is the bridge between Kor'tana's intelligence and the real world.
 """
 
-import ast
 import asyncio
+import hashlib
 import logging
 import os
-import subprocess
+import re
+import threading
 import time
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from .code_index import TrigramIndex, required_literals
+from .code_scan import SUPPORTED_RULES, IncrementalAstScanner
+from .subprocess_pool import SubprocessPool, get_default_subprocess_pool
+
 logger = logging.getLogger(__name__)
 
 
+# Default for ``search_index_dir``; an explicit None means no persistence
+_DEFAULT_INDEX_DIR = object()
+
+
+def _default_search_index_dir(allowed_dirs: list[str]) -> str:
+    """Return the cache folder for the search index of ``allowed_dirs``."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    key = hashlib.sha1("\0".join(allowed_dirs).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_home, "kortana", "search_index", key)
+
+
+def _matching_line_numbers(
+    content: str, anchor: str | None, line_matches: Callable[[str], bool]
+) -> Iterator[int]:
+    """
+    Yield the zero-based numbers of the lines of ``content`` that match.
+
+    Args:
+        content: File text
+        anchor: Lower-case string every matching line contains once
+            lower-cased; only lines holding it are tested, so a file without
+            it is dismissed with a single ``find``
+        line_matches: Predicate deciding whether a line matches
+    """
+    if anchor is None:
+        for i, line in enumerate(content.split("\n")):
+            if line_matches(line):
+                yield i
+        return
+    # Lower-casing keeps every newline, so line numbers carry over
+    lowered = content.lower()
+    lines = None
+    line, scanned = 0, 0
+    pos = lowered.find(anchor)
+    while pos != -1:
+        line += lowered.count("\n", scanned, pos)
+        if lines is None:
+            lines = content.split("\n")
+        if line_matches(lines[line]):
+            yield line
+        scanned = lowered.find("\n", pos)
+        if scanned == -1:
+            return
+        pos = lowered.find(anchor, scanned)
+
+
 @dataclass
 class OperationResult:
     """Result of an execution engine operation"""
@@ -34,17 +88,35 @@ class ExecutionEngine:
     Enables Kor'tana to interact with her environment while maintaining safety.
     """
 
-    def __init__(self, allowed_dirs: list[str], blocked_commands: list[str]):
+    def __init__(
+        self,
+        allowed_dirs: list[str],
+        blocked_commands: list[str],
+        search_index_dir: str | None | object = _DEFAULT_INDEX_DIR,
+        subprocess_pool: SubprocessPool | None = None,
+    ):
         """Initialize the execution engine with safety controls
 
         Args:
             allowed_dirs: List of directory paths that the engine can access
             blocked_commands: List of shell commands that are forbidden
+            search_index_dir: Where the codebase search index is persisted;
+                defaults to a per-directory-set folder under the user cache.
+                None keeps the index in memory only.
+            subprocess_pool: Pool that runs shell commands; defaults to the
+                process-wide pool, so the concurrency caps span all engines
         """
         self.allowed_dirs = [os.path.abspath(d) for d in allowed_dirs]
         self.blocked_commands = blocked_commands
         self._command_history: list[dict] = []
         self._start_time = time.time()
+        if search_index_dir is _DEFAULT_INDEX_DIR:
+            search_index_dir = _default_search_index_dir(self.allowed_dirs)
+        self.search_index_dir: str | None = search_index_dir
+        self._search_index: TrigramIndex | None = None
+        self._search_index_lock = threading.Lock()
+        self.ast_scanner = IncrementalAstScanner()
+        self.subprocess_pool = subprocess_pool or get_default_subprocess_pool()
 
     def _validate_path_access(self, filepath: str | Path) -> bool:
         """Check if a file path is within allowed directories"""
@@ -120,6 +192,7 @@ class ExecutionEngine:
                 with open(filepath, "w", encoding="utf-8") as f:
                     f.write(content)
 
+            self._reindex(filepath)
             self._log_operation("write_file", {"file": filepath, "size": len(content)})
 
             return OperationResult(
@@ -136,14 +209,24 @@ class ExecutionEngine:
             )
 
     async def execute_shell_command(
-        self, command: str, working_dir: str = "", timeout: int = 300
+        self,
+        command: str,
+        working_dir: str = "",
+        timeout: int = 300,
+        agent_id: str = "default",
     ) -> OperationResult:
         """Safely execute a shell command, blocking dangerous commands.
 
+        Commands run through ``subprocess_pool``, which caps how many run at
+        once overall and per agent, keeps only the head and tail of large
+        outputs and kills the whole process group on timeout.
+
         Args:
             command: The shell command to execute
             working_dir: Optional working directory
-            timeout: Maximum execution time in seconds
+            timeout: Maximum execution time in seconds, not counting time
+                spent waiting for a free slot
+            agent_id: Agent issuing the command, for the per-agent cap
 
         Returns:
             OperationResult containing command output or error
@@ -169,55 +252,59 @@ class ExecutionEngine:
             work_dir = working_dir if working_dir else os.getcwd()
 
             # Run command with timeout
-            process = await asyncio.create_subprocess_shell(
-                command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=work_dir
+            outcome = await self.subprocess_pool.run(
+                command, cwd=work_dir, timeout=timeout, agent_id=agent_id
             )
-
-            try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(), timeout=timeout
-                )
-            except TimeoutError:
-                try:
-                    process.kill()
-                except Exception:
-                    pass
-                return OperationResult(
-                    success=False,
-                    error=f"Command timed out after {timeout} seconds",
-                    duration=time.time() - start,
-                    operation_type="shell_command",
-                )
+            metrics = outcome.metrics
+            data = {
+                "stdout": outcome.stdout,
+                "stderr": outcome.stderr,
+                "return_code": outcome.return_code,
+                "stdout_truncated": outcome.stdout_truncated,
+                "stderr_truncated": outcome.stderr_truncated,
+                "metrics": {
+                    "wall_time": metrics.wall_time,
+                    "queue_time": metrics.queue_time,
+                    "cpu_user": metrics.cpu_user,
+                    "cpu_system": metrics.cpu_system,
+                    "max_rss_kb": metrics.max_rss_kb,
+                },
+            }
 
             self._log_operation(
                 "shell_command",
                 {
                     "command": command,
                     "working_dir": work_dir,
-                    "return_code": process.returncode,
+                    "agent_id": agent_id,
+                    "return_code": outcome.return_code,
+                    "timed_out": outcome.timed_out,
+                    "duration": metrics.wall_time,
+                    "cpu_time": metrics.cpu_time,
                 },
             )
 
-            if process.returncode != 0:
+            if outcome.timed_out:
                 return OperationResult(
                     success=False,
-                    error=f"Command failed: {stderr.decode()}",
-                    data={
-                        "stdout": stdout.decode(),
-                        "stderr": stderr.decode(),
-                        "return_code": process.returncode,
-                    },
+                    error=f"Command timed out after {timeout} seconds",
+                    data=data,
+                    duration=time.time() - start,
+                    operation_type="shell_command",
+                )
+
+            if outcome.return_code != 0:
+                return OperationResult(
+                    success=False,
+                    error=f"Command failed: {outcome.stderr}",
+                    data=data,
                     duration=time.time() - start,
                     operation_type="shell_command",
                 )
 
             return OperationResult(
                 success=True,
-                data={
-                    "stdout": stdout.decode(),
-                    "stderr": stderr.decode(),
-                    "return_code": process.returncode,
-                },
+                data=data,
                 duration=time.time() - start,
                 operation_type="shell_command",
             )
@@ -233,74 +320,38 @@ class ExecutionEngine:
 
     # ========== GENESIS PROTOCOL: ADVANCED DEVELOPMENT TOOLS ==========
     async def search_codebase(
-        self, query: str, file_patterns: list[str] | None = None, max_results: int = 50
+        self,
+        query: str,
+        file_patterns: list[str] | None = None,
+        max_results: int = 50,
+        regex: bool = False,
     ) -> OperationResult:
         """
         SEARCH_CODEBASE: Find relevant code snippets or files using semantic and pattern search.
 
+        Uses the trigram index (``search_index``), so only files that can
+        contain the query are read.
+
         Args:
             query: Search query (can be function names, patterns, or semantic descriptions)
             file_patterns: List of file patterns to search (e.g., ['*.py', '*.md'])
             max_results: Maximum number of results to return
+            regex: Treat the query as a regular expression (case-sensitive
+                unless it sets ``(?i)``) instead of a case-insensitive literal
 
         Returns:
             OperationResult with search results
         """
         start = time.time()
         try:
-            search_results = []
-
             # Default patterns if none provided
             if file_patterns is None:
                 file_patterns = ["*.py", "*.md", "*.yaml", "*.json"]
 
-            # Search through allowed directories
-            for allowed_dir in self.allowed_dirs:
-                for pattern in file_patterns:
-                    for filepath in Path(allowed_dir).rglob(pattern):
-                        if not self._validate_path_access(filepath):
-                            continue
-
-                        try:
-                            with open(filepath, encoding="utf-8") as f:
-                                content = f.read()
-
-                            # Simple text search (can be enhanced with semantic search later)
-                            if query.lower() in content.lower():
-                                # Find relevant lines with context
-                                lines = content.split("\n")
-                                for i, line in enumerate(lines):
-                                    if query.lower() in line.lower():
-                                        # Get context (3 lines before and after)
-                                        start_line = max(0, i - 3)
-                                        end_line = min(len(lines), i + 4)
-                                        context = "\n".join(lines[start_line:end_line])
-
-                                        search_results.append(
-                                            {
-                                                "file": str(filepath),
-                                                "line_number": i + 1,
-                                                "matched_line": line.strip(),
-                                                "context": context,
-                                                "relative_path": str(
-                                                    filepath.relative_to(allowed_dir)
-                                                ),
-                                            }
-                                        )
-
-                                        if len(search_results) >= max_results:
-                                            break
-
-                        except (UnicodeDecodeError, PermissionError):
-                            # Skip files that can't be read
-                            continue
-
-                        if len(search_results) >= max_results:
-                            break
-                    if len(search_results) >= max_results:
-                        break
-                if len(search_results) >= max_results:
-                    break
+            # Indexing and reading candidates is blocking file I/O
+            search_results = await asyncio.to_thread(
+                self._search_indexed, query, file_patterns, max_results, regex
+            )
 
             self._log_operation(
                 "search_codebase",
@@ -331,14 +382,111 @@ class ExecutionEngine:
                 operation_type="search_codebase",
             )
 
+    def _reindex(self, filepath: str) -> None:
+        """Keep an already loaded search index in step with a file we wrote."""
+        if self._search_index is not None:
+            self._search_index.update_file(filepath)
+
+    @property
+    def search_index(self) -> TrigramIndex:
+        """The trigram index over ``allowed_dirs``, loaded on first use."""
+        if self._search_index is None:
+            # Searches run in worker threads; build the index only once
+            with self._search_index_lock:
+                if self._search_index is None:
+                    self._search_index = TrigramIndex(
+                        self.allowed_dirs, index_dir=self.search_index_dir
+                    )
+        return self._search_index
+
+    def _search_indexed(
+        self, query: str, file_patterns: list[str], max_results: int, regex: bool
+    ) -> list[dict]:
+        """Refresh the index, then match the query against candidate files only."""
+        if regex:
+            pattern = re.compile(query)
+            literals = required_literals(query)
+
+            def line_matches(line: str) -> bool:
+                return pattern.search(line) is not None
+
+        else:
+            needle = query.lower()
+            literals = [needle]
+
+            def line_matches(line: str) -> bool:
+                return needle in line.lower()
+
+        anchor = max(literals, key=len) if literals and literals[0] else None
+        if anchor is not None and "\n" in anchor:
+            return []  # no single line can match
+
+        index = self.search_index
+        index.refresh(file_patterns)
+        search_results = []
+        for filepath in index.candidates(literals, file_patterns):
+            if not self._validate_path_access(filepath):
+                continue
+
+            try:
+                with open(filepath, encoding="utf-8") as f:
+                    content = f.read()
+            except (OSError, UnicodeDecodeError):
+                # Skip files that can't be read
+                continue
+
+            lines = None
+            # Find relevant lines with context
+            for i in _matching_line_numbers(content, anchor, line_matches):
+                if lines is None:
+                    lines = content.split("\n")
+                # Get context (3 lines before and after)
+                start_line = max(0, i - 3)
+                end_line = min(len(lines), i + 4)
+                context = "\n".join(lines[start_line:end_line])
+
+                search_results.append(
+                    {
+                        "file": filepath,
+                        "line_number": i + 1,
+                        "matched_line": lines[i].strip(),
+                        "context": context,
+                        "relative_path": os.path.relpath(
+                            filepath, index.root_for(filepath)
+                        ),
+                    }
+                )
+
+                if len(search_results) >= max_results:
+                    break
+
+            if len(search_results) >= max_results:
+                break
+
+        index.maybe_save()
+        return search_results
+
     async def scan_codebase_for_issues(
         self,
         directory_to_scan: str,
         rules: list[str],
         file_patterns: list[str] | None = None,
     ) -> OperationResult:
+        """
+        SCAN_CODEBASE_FOR_ISSUES: Check files under a directory against rules.
+
+        Files are analyzed by ``ast_scanner``: unchanged files reuse cached
+        findings and the rest are parsed in a process pool.
+
+        Args:
+            directory_to_scan: Directory to scan recursively
+            rules: Rules to apply (currently ``"missing_docstring"``)
+            file_patterns: File patterns to scan (default ``["*.py"]``)
+
+        Returns:
+            OperationResult with the list of issues found
+        """
         start_time = time.time()
-        issues_found: list[dict] = []
 
         if not self._validate_path_access(directory_to_scan):
             return OperationResult(
@@ -375,63 +523,14 @@ class ExecutionEngine:
                 operation_type="scan_codebase_for_issues",
             )
 
-        for pattern in file_patterns:
-            for filepath_obj in absolute_scan_dir.rglob(pattern):
-                filepath_str = str(filepath_obj)
-                if not filepath_obj.is_file() or not self._validate_path_access(
-                    filepath_str
-                ):
-                    continue
-
-                try:
-                    with open(filepath_obj, encoding="utf-8") as file:
-                        content = file.read()
-
-                    if "missing_docstring" in rules:
-                        try:
-                            tree = ast.parse(content, filename=filepath_str)
-                            for node in ast.walk(tree):
-                                if isinstance(node, ast.FunctionDef):
-                                    # ast.get_docstring is preferred for robustness (Python 3.8+)
-                                    docstring = ast.get_docstring(node, clean=False)
-                                    if docstring is None:
-                                        issues_found.append(
-                                            {
-                                                "file_path": filepath_str,
-                                                "relative_path": str(
-                                                    filepath_obj.relative_to(
-                                                        project_base_path
-                                                    )
-                                                ),
-                                                "function_name": node.name,
-                                                "line_number": node.lineno,
-                                                "issue_type": "missing_docstring",
-                                                "message": f"Function '{node.name}' is missing a docstring.",
-                                            }
-                                        )
-                        except SyntaxError as e:
-                            logger.warning(f"SyntaxError parsing {filepath_str}: {e}")
-                            issues_found.append(
-                                {
-                                    "file_path": filepath_str,
-                                    "relative_path": str(
-                                        filepath_obj.relative_to(project_base_path)
-                                    ),
-                                    "function_name": None,  # No function context if syntax error at file level
-                                    "line_number": e.lineno,
-                                    "issue_type": "syntax_error",
-                                    "message": f"Syntax error: {e.msg}",
-                                }
-                            )
-                        except Exception as e:  # Catch other AST processing errors
-                            logger.error(
-                                f"Error processing {filepath_str} for missing docstrings: {e}"
-                            )
-                except (UnicodeDecodeError, PermissionError, OSError) as e:
-                    logger.warning(
-                        f"Could not read or process file {filepath_str}: {e}"
-                    )
-                    continue
+        # Discovery, hashing and parsing block; keep them off the event loop
+        issues_found = await asyncio.to_thread(
+            self._collect_scan_issues,
+            absolute_scan_dir,
+            project_base_path,
+            file_patterns,
+            rules,
+        )
 
         self._log_operation(
             "scan_codebase_for_issues",
@@ -449,6 +548,70 @@ class ExecutionEngine:
             operation_type="scan_codebase_for_issues",
         )
 
+    def _collect_scan_issues(
+        self,
+        scan_dir: Path,
+        project_base_path: Path,
+        file_patterns: list[str],
+        rules: list[str],
+    ) -> list[dict]:
+        """Find files to scan and turn their cached or fresh findings into issues."""
+        if "missing_docstring" not in rules:
+            return []
+
+        paths: dict[str, Path] = {}
+        for pattern in file_patterns:
+            for filepath_obj in scan_dir.rglob(pattern):
+                filepath_str = str(filepath_obj)
+                if filepath_obj.is_file() and self._validate_path_access(filepath_str):
+                    paths.setdefault(filepath_str, filepath_obj)
+
+        issues_found: list[dict] = []
+        scanned = self.ast_scanner.scan(list(paths), ("missing_docstring",))
+        for filepath_str, findings in scanned.items():
+            try:
+                relative_path = str(paths[filepath_str].relative_to(project_base_path))
+            except ValueError:
+                relative_path = filepath_str
+
+            if "read_error" in findings:
+                logger.warning(
+                    f"Could not read or process file {filepath_str}: {findings['read_error']}"
+                )
+            elif "parse_error" in findings:
+                logger.error(
+                    f"Error processing {filepath_str} for missing docstrings: {findings['parse_error']}"
+                )
+            elif "syntax_error" in findings:
+                line_number, msg = findings["syntax_error"]
+                logger.warning(
+                    f"SyntaxError parsing {filepath_str}: "
+                    f"{msg} ({paths[filepath_str].name}, line {line_number})"
+                )
+                issues_found.append(
+                    {
+                        "file_path": filepath_str,
+                        "relative_path": relative_path,
+                        "function_name": None,  # No function context if syntax error at file level
+                        "line_number": line_number,
+                        "issue_type": "syntax_error",
+                        "message": f"Syntax error: {msg}",
+                    }
+                )
+            else:
+                for function_name, line_number in findings["missing_docstring"]:
+                    issues_found.append(
+                        {
+                            "file_path": filepath_str,
+                            "relative_path": relative_path,
+                            "function_name": function_name,
+                            "line_number": line_number,
+                            "issue_type": "missing_docstring",
+                            "message": f"Function '{function_name}' is missing a docstring.",
+                        }
+                    )
+        return issues_found
+
     async def apply_patch(
         self, filepath: str, patch_content: str, target_commit: str = "HEAD"
     ) -> OperationResult:
@@ -475,6 +638,7 @@ class ExecutionEngine:
             # Write the patch to a temporary file
             with open(filepath, "a", encoding="utf-8") as f:
                 f.write(patch_content)
+            self._reindex(filepath)
 
             # Commit the change
             commit_message = f"Apply patch to {os.path.basename(filepath)}"
@@ -516,6 +680,7 @@ class ExecutionEngine:
         file_paths: list[str] | None = None,
         specific_test: str | None = None,
         verbose: bool = False,
+        agent_id: str = "default",
     ) -> OperationResult:
         """Run tests using the specified test command.
 
@@ -539,13 +704,13 @@ class ExecutionEngine:
                 cmd_parts.append("--verbose")
 
             result = await self.execute_shell_command(
-                " ".join(cmd_parts)
+                " ".join(cmd_parts), agent_id=agent_id
             )  # Log test results
             self._log_operation(
                 "run_tests",
                 {
                     "command": " ".join(cmd_parts),
-                    "return_code": result.returncode,
+                    "return_code": (result.data or {}).get("return_code"),
                 },
             )
 
@@ -573,57 +738,70 @@ class ExecutionEngine:
     ) -> None:
         """Scan a single Python file for specific issues."""
         try:
-            content = await self.read_file(str(filepath))
-            if not content.success:
+            if not self._validate_path_access(filepath):
                 findings.append(
                     {
                         "file": str(filepath),
-                        "error": f"Could not read file: {content.error}",
+                        "error": "Could not read file: Access denied: outside allowed directories.",
                         "issue_type": "read_error",
                     }
                 )
                 return
 
-            tree = ast.parse(content.data)
-
-            if issue_type == "missing_docstrings":
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-                        # Skip private functions (start with _)
-                        if node.name.startswith("_"):
-                            continue
-
-                        if not ast.get_docstring(node):
-                            # Calculate relative path for cleaner reporting
-                            try:
-                                relative_path = filepath.relative_to(
-                                    self.allowed_dirs[0]
-                                )
-                            except (ValueError, IndexError):
-                                relative_path = filepath
-
-                            findings.append(
-                                {
-                                    "file": str(filepath),
-                                    "relative_path": str(relative_path),
-                                    "function_name": node.name,
-                                    "line_number": node.lineno,
-                                    "issue_type": "missing_docstring",
-                                    "severity": "medium",
-                                    "description": f"Function '{node.name}' at line {node.lineno} is missing a docstring",
-                                    "suggested_fix": f"Add a comprehensive docstring to the '{node.name}' function explaining its purpose, parameters, and return value",
-                                }
-                            )
-
-        except SyntaxError as e:
-            findings.append(
-                {
-                    "file": str(filepath),
-                    "error": f"Syntax error: {e.msg}",
-                    "line_number": e.lineno if e.lineno else 0,
-                    "issue_type": "syntax_error",
-                }
+            rules = (issue_type,) if issue_type in SUPPORTED_RULES else ()
+            scanned = await asyncio.to_thread(
+                self.ast_scanner.scan, [str(filepath)], rules
             )
+            result = scanned[str(filepath)]
+
+            if "read_error" in result:
+                findings.append(
+                    {
+                        "file": str(filepath),
+                        "error": f"Could not read file: {result['read_error']}",
+                        "issue_type": "read_error",
+                    }
+                )
+            elif "syntax_error" in result:
+                line_number, msg = result["syntax_error"]
+                findings.append(
+                    {
+                        "file": str(filepath),
+                        "error": f"Syntax error: {msg}",
+                        "line_number": line_number if line_number else 0,
+                        "issue_type": "syntax_error",
+                    }
+                )
+            elif "parse_error" in result:
+                findings.append(
+                    {
+                        "file": str(filepath),
+                        "error": f"Error parsing file: {result['parse_error']}",
+                        "issue_type": "parse_error",
+                    }
+                )
+                logger.error(f"Error scanning file {filepath}: {result['parse_error']}")
+            elif issue_type == "missing_docstrings":
+                # Calculate relative path for cleaner reporting
+                try:
+                    relative_path = filepath.relative_to(self.allowed_dirs[0])
+                except (ValueError, IndexError):
+                    relative_path = filepath
+
+                for function_name, line_number in result["missing_docstrings"]:
+                    findings.append(
+                        {
+                            "file": str(filepath),
+                            "relative_path": str(relative_path),
+                            "function_name": function_name,
+                            "line_number": line_number,
+                            "issue_type": "missing_docstring",
+                            "severity": "medium",
+                            "description": f"Function '{function_name}' at line {line_number} is missing a docstring",
+                            "suggested_fix": f"Add a comprehensive docstring to the '{function_name}' function explaining its purpose, parameters, and return value",
+                        }
+                    )
+
         except Exception as e:
             findings.append(
                 {
@@ -677,7 +855,8 @@ class ExecutionEngine:
             query = parameters.get("query", "")
             file_patterns = parameters.get("file_patterns", None)
             max_results = parameters.get("max_results", 50)
-            return await self.search_codebase(query, file_patterns, max_results)
+            regex = parameters.get("regex", False)
+            return await self.search_codebase(query, file_patterns, max_results, regex)
         elif action_type == "SCAN_CODEBASE_FOR_ISSUES":
             directory = parameters.get("directory", ".")
             rules = parameters.get("rules", [])
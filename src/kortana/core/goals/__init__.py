@@ -9,6 +9,7 @@ from .goal import Goal, GoalStatus, GoalType
 from .manager import GoalManager
 from .prioritizer import GoalPrioritizer
 from .scanner import EnvironmentalScanner
+from .store import GoalStore
 
 __all__ = [
     "Goal",
@@ -18,6 +19,7 @@ __all__ = [
     "EnvironmentalScanner",
     "GoalGenerator",
     "GoalPrioritizer",
+    "GoalStore",
     "GoalEngine",
     "GoalCovenantValidator",
 ]
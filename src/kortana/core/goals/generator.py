@@ -5,6 +5,7 @@ This component is responsible for taking potential goal descriptions
 identified by the EnvironmentalScanner and generating structured Goal objects.
 """
 
+import asyncio
 import logging
 import re
 
@@ -20,78 +21,114 @@ class GoalGenerator:
     Generates structured Goal objects from potential goal descriptions.
     """
 
-    def __init__(self, goal_manager: GoalManager) -> None:
+    def __init__(self, goal_manager: GoalManager, *, max_concurrency: int = 8) -> None:
         """
         Initialize the GoalGenerator.
 
         Args:
             goal_manager: The GoalManager instance to create goals.
+            max_concurrency: Maximum descriptions analysed and validated at once.
         """
         self.goal_manager = goal_manager
+        self.max_concurrency = max_concurrency
 
     async def generate_goals(self, descriptions: list[str]) -> list[Goal]:
         """
         Generate structured Goal objects from a list of potential descriptions.
 
+        Details are extracted concurrently and the resulting candidates are
+        validated as one batch, so a cycle takes roughly as long as its
+        slowest description rather than the sum of all of them.
+
         Args:
             descriptions: A list of strings, each a potential goal description.
 
         Returns:
             A list of generated Goal objects.
         """
-        created_goals = []
         logger.info(
             f"Attempting to generate goals from {len(descriptions)} descriptions."
         )
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def extract(description: str) -> dict | None:
+            async with semaphore:
+                return await self._extract_goal_details(description)
+
+        details = await asyncio.gather(*(extract(d) for d in descriptions))
+        candidates = [
+            {
+                "type": goal_details["type"],
+                "description": description,
+                "priority": goal_details["priority"],
+                "success_criteria": goal_details.get(
+                    "success_criteria", ["Goal successfully implemented"]
+                ),
+            }
+            for description, goal_details in zip(descriptions, details, strict=True)
+            if goal_details
+        ]
+        if not candidates:
+            logger.info("Successfully generated 0 goals.")
+            return []
 
-        for description in descriptions:
-            logger.debug(f"Processing description: '{description}'")
-            try:
-                # First, try to extract details using the LLM
-                goal_details = await self._extract_goal_details_with_llm(description)
-
-                # If LLM extraction fails or returns incomplete data, fallback to rule-based
-                if (
-                    not goal_details
-                    or not goal_details.get("type")
-                    or not goal_details.get("priority")
-                ):
-                    logger.warning(
-                        f"LLM extraction failed or incomplete for '{description}'. Falling back to rule-based."
-                    )
-                    goal_details = self._extract_goal_details_rule_based(description)
-
-                # Ensure goal_details has required keys after fallback
-                if (
-                    not goal_details
-                    or not goal_details.get("type")
-                    or not goal_details.get("priority")
-                ):
-                    logger.error(
-                        f"Failed to extract sufficient goal details for '{description}' even with fallback."
-                    )
-                    continue  # Skip this description if details are still missing
-
-                # Create the Goal object
-                goal = await self.goal_manager.create_goal(
-                    type=goal_details["type"],
-                    description=description,
-                    priority=goal_details["priority"],
-                    success_criteria=goal_details.get(
-                        "success_criteria", ["Goal successfully implemented"]
-                    ),
-                )
-                created_goals.append(goal)
-                logger.debug(f"Generated goal: {goal.id} - {description}")
-            except Exception as e:
-                logger.error(
-                    f"Error generating goal from description '{description}': {str(e)}",
-                    exc_info=True,
-                )
+        try:
+            created_goals = await self.goal_manager.create_goals(
+                candidates, max_concurrency=self.max_concurrency
+            )
+        except Exception as e:
+            logger.error(f"Error creating generated goals: {str(e)}", exc_info=True)
+            return []
 
+        for goal in created_goals:
+            logger.debug("Generated goal: %s - %s", goal.id, goal.description)
         logger.info(f"Successfully generated {len(created_goals)} goals.")
         return created_goals
 
+    async def _extract_goal_details(self, description: str) -> dict | None:
+        """
+        Extract goal details for one description, LLM first then rule-based.
+
+        Args:
+            description: A potential goal description.
+
+        Returns:
+            A dictionary of goal attributes, or None if extraction failed.
+        """
+        logger.debug(f"Processing description: '{description}'")
+        try:
+            # First, try to extract details using the LLM
+            goal_details = await self._extract_goal_details_with_llm(description)
+
+            # If LLM extraction fails or returns incomplete data, fallback to rule-based
+            if (
+                not goal_details
+                or not goal_details.get("type")
+                or not goal_details.get("priority")
+            ):
+                logger.warning(
+                    f"LLM extraction failed or incomplete for '{description}'. Falling back to rule-based."
+                )
+                goal_details = self._extract_goal_details_rule_based(description)
+
+            # Ensure goal_details has required keys after fallback
+            if (
+                not goal_details
+                or not goal_details.get("type")
+                or not goal_details.get("priority")
+            ):
+                logger.error(
+                    f"Failed to extract sufficient goal details for '{description}' even with fallback."
+                )
+                return None  # Skip this description if details are still missing
+            return goal_details
+        except Exception as e:
+            logger.error(
+                f"Error generating goal from description '{description}': {str(e)}",
+                exc_info=True,
+            )
+            return None
+
     async def _extract_goal_details_with_llm(self, description: str) -> dict:
         """
         Extract goal details using an LLM.
@@ -3,13 +3,27 @@ GoalManager for Kor'tana's Goal Framework.
 Handles goal lifecycle, storage, and Sacred Covenant validation.
 """
 
+import asyncio
 import logging
+import re
+from collections import OrderedDict
+from collections.abc import Mapping
 from datetime import UTC, datetime
+from typing import Any
 from uuid import UUID
 
 from ..covenant import CovenantEnforcer
 from ..memory import MemoryManager
 from .goal import Goal, GoalStatus, GoalType
+from .prioritizer import GoalPrioritizer
+from .store import GoalStore
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_description(description: str) -> str:
+    """Reduce a goal description to lower-case words for cache lookups."""
+    return " ".join(_WORD_RE.findall(description.lower()))
 
 
 class GoalManager:
@@ -19,12 +33,45 @@ class GoalManager:
     """
 
     def __init__(
-        self, memory_manager: MemoryManager, covenant_enforcer: CovenantEnforcer
+        self,
+        memory_manager: MemoryManager,
+        covenant_enforcer: CovenantEnforcer,
+        store: GoalStore | None = None,
+        prioritizer: GoalPrioritizer | None = None,
+        validation_concurrency: int = 8,
+        alignment_cache_size: int = 1024,
     ) -> None:
+        """
+        Initialize the GoalManager.
+
+        Args:
+            memory_manager: Memory system that receives goal state entries
+            covenant_enforcer: Validator for new goals
+            store: Indexed goal store; pass one with a path to keep goals
+                across restarts. Defaults to an in-memory store.
+            prioritizer: Prioritizer whose heap is kept in step with the store
+            validation_concurrency: Maximum covenant validations in flight
+                during ``create_goals``
+            alignment_cache_size: Number of Sacred Trinity alignment results
+                kept, keyed by normalized description
+        """
         self.logger = logging.getLogger(__name__)
         self.memory = memory_manager
         self.covenant = covenant_enforcer
-        self.active_goals: dict[UUID, Goal] = {}
+        self.store = store if store is not None else GoalStore()
+        self.prioritizer = prioritizer if prioritizer is not None else GoalPrioritizer()
+        for goal in self.store.all():
+            self.prioritizer.update_goal(goal)
+
+        self.validation_concurrency = validation_concurrency
+        self.alignment_cache_size = alignment_cache_size
+        self._alignment_cache: OrderedDict[str, dict[str, float]] = OrderedDict()
+        self._alignment_inflight: dict[str, asyncio.Future] = {}
+
+    @property
+    def active_goals(self) -> Mapping[UUID, Goal]:
+        """Read-only view of the stored goals, keyed by id."""
+        return self.store.goals
 
     async def create_goal(
         self,
@@ -47,7 +94,62 @@ class GoalManager:
 
         # Validate through Sacred Covenant
         approved, feedback = await self._validate_with_covenant(goal)
+        return await self._finish_creation(goal, approved, feedback)
+
+    async def create_goals(
+        self,
+        candidates: list[dict[str, Any]],
+        max_concurrency: int | None = None,
+    ) -> list[Goal]:
+        """
+        Create several goals, validating them through Sacred Covenant concurrently.
+
+        Args:
+            candidates: One dict of ``create_goal`` keyword arguments per goal
+            max_concurrency: Maximum validations in flight; defaults to
+                ``validation_concurrency``
+
+        Returns:
+            The goals in candidate order; rejected goals have FAILED status
+        """
+        goals = [
+            Goal(
+                type=candidate["type"],
+                description=candidate["description"],
+                priority=candidate.get("priority", 1),
+                parent_goal_id=candidate.get("parent_id"),
+                created_by=candidate.get("created_by", "kor_tana"),
+                success_criteria=candidate.get("success_criteria") or [],
+            )
+            for candidate in candidates
+        ]
+        semaphore = asyncio.Semaphore(max_concurrency or self.validation_concurrency)
+
+        async def validate(goal: Goal) -> tuple[bool, str]:
+            async with semaphore:
+                return await self._validate_with_covenant(goal)
+
+        results = await asyncio.gather(
+            *(validate(goal) for goal in goals), return_exceptions=True
+        )
+
+        # Store sequentially so parents created earlier in the batch are found
+        created = []
+        for goal, result in zip(goals, results, strict=True):
+            if isinstance(result, BaseException):
+                self.logger.error(f"Covenant validation error for {goal.id}: {result}")
+                approved, feedback = False, f"Covenant validation error: {result}"
+            else:
+                approved, feedback = result
+            created.append(await self._finish_creation(goal, approved, feedback))
+        return created
+
+    async def _finish_creation(
+        self, goal: Goal, approved: bool, feedback: str | None
+    ) -> Goal:
+        """Record the covenant decision and store an approved goal"""
         goal.set_covenant_approval(approved, feedback)
+        parent_id = goal.parent_goal_id
 
         if not approved:
             self.logger.warning(f"Goal rejected by Sacred Covenant: {feedback}")
@@ -55,12 +157,12 @@ class GoalManager:
             return goal
 
         # Add to active goals and memory
-        self.active_goals[goal.id] = goal
+        self._track(goal)
         await self._persist_to_memory(goal)
 
         # Update parent-child relationships
         if parent_id:
-            parent = self.active_goals.get(parent_id)
+            parent = self.store.get(parent_id)
             if parent:
                 parent.add_child_goal(goal.id)
                 await self.update_goal(parent)
@@ -70,10 +172,10 @@ class GoalManager:
 
     async def update_goal(self, goal: Goal) -> Goal:
         """Update an existing goal's state"""
-        if goal.id not in self.active_goals:
+        if goal.id not in self.store:
             raise ValueError(f"Goal {goal.id} not found in active goals")
 
-        self.active_goals[goal.id] = goal
+        self._track(goal)
         await self._persist_to_memory(goal)
 
         self.logger.info(
@@ -84,26 +186,26 @@ class GoalManager:
 
     async def get_goal(self, goal_id: UUID) -> Goal | None:
         """Retrieve a goal by ID"""
-        # Check active goals first
-        if goal_id in self.active_goals:
-            return self.active_goals[goal_id]
+        # Check the indexed store first
+        goal = self.store.get(goal_id)
+        if goal is not None:
+            return goal
 
-        # If not active, try to load from memory
+        # If not stored, try to load from memory
         goal_data = await self._load_from_memory(goal_id)
         if goal_data:
             goal = Goal(**goal_data)
-            self.active_goals[goal_id] = goal
+            self._track(goal)
             return goal
 
         return None
 
     async def delete_goal(self, goal_id: UUID) -> bool:
         """Delete a goal and its memory entries"""
-        if goal_id not in self.active_goals:
+        goal = self.store.get(goal_id)
+        if goal is None:
             return False
 
-        goal = self.active_goals[goal_id]
-
         # Update parent if needed
         if goal.parent_goal_id:
             parent = await self.get_goal(goal.parent_goal_id)
@@ -120,7 +222,8 @@ class GoalManager:
                 await self.update_goal(dep_goal)
 
         # Remove from active goals and memory
-        del self.active_goals[goal_id]
+        self.store.remove(goal_id)
+        self.prioritizer.remove_goal(goal_id)
         await self._remove_from_memory(goal_id)
 
         self.logger.info(f"Deleted goal {goal_id}")
@@ -133,17 +236,13 @@ class GoalManager:
         parent_id: UUID | None = None,
     ) -> list[Goal]:
         """List goals with optional filtering"""
-        goals = list(self.active_goals.values())
-
-        if status:
-            goals = [g for g in goals if g.status == status]
-        if type:
-            goals = [g for g in goals if g.type == type]
-        if parent_id:
-            goals = [g for g in goals if g.parent_goal_id == parent_id]
-
+        goals = self.store.query(status=status, type=type, parent_id=parent_id)
         return sorted(goals, key=lambda g: (-g.priority, g.created_at))
 
+    async def get_top_goals(self, n: int = 1) -> list[Goal]:
+        """Get the ``n`` highest-scoring goals that are not finished"""
+        return self.prioritizer.top_goals(n)
+
     async def get_blocked_goals(self) -> list[Goal]:
         """Get all goals currently in BLOCKED status"""
         return await self.list_goals(status=GoalStatus.BLOCKED)
@@ -152,6 +251,11 @@ class GoalManager:
         """Get all child goals for a given parent goal"""
         return await self.list_goals(parent_id=parent_id)
 
+    def _track(self, goal: Goal) -> None:
+        """Store or re-index a goal and re-rank it if its scoring inputs changed"""
+        self.store.put(goal)
+        self.prioritizer.update_goal(goal)
+
     async def _validate_with_covenant(self, goal: Goal) -> tuple[bool, str]:
         """Submit goal for Sacred Covenant validation"""
         # Prepare validation context
@@ -168,7 +272,7 @@ class GoalManager:
 
         if is_valid:
             # Get Sacred Trinity alignment scores
-            scores = await self.covenant.evaluate_sacred_alignment(goal.description)
+            scores = await self._sacred_alignment(goal.description)
             goal.update_sacred_scores(
                 wisdom=scores.get("wisdom", 0.0),
                 compassion=scores.get("compassion", 0.0),
@@ -177,6 +281,39 @@ class GoalManager:
 
         return is_valid, feedback
 
+    async def _sacred_alignment(self, description: str) -> dict[str, float]:
+        """
+        Evaluate Sacred Trinity alignment, cached by normalized description.
+
+        Concurrent requests for the same description share one evaluation.
+        """
+        key = normalize_description(description)
+        cached = self._alignment_cache.get(key)
+        if cached is not None:
+            self._alignment_cache.move_to_end(key)
+            return dict(cached)
+
+        pending = self._alignment_inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                self.covenant.evaluate_sacred_alignment(description)
+            )
+            self._alignment_inflight[key] = pending
+            pending.add_done_callback(
+                lambda future: self._cache_alignment(key, future)
+            )
+        # Shielded so one cancelled caller does not fail the others
+        return dict(await asyncio.shield(pending))
+
+    def _cache_alignment(self, key: str, future: asyncio.Future) -> None:
+        """Move a finished alignment evaluation into the LRU cache"""
+        self._alignment_inflight.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+        self._alignment_cache[key] = dict(future.result())
+        while len(self._alignment_cache) > self.alignment_cache_size:
+            self._alignment_cache.popitem(last=False)
+
     async def _persist_to_memory(self, goal: Goal) -> None:
         """Store goal state in memory system"""
         memory_entry = {
@@ -3,24 +3,64 @@ Goal Prioritizer for Kor'tana's Goal Framework.
 
 This component is responsible for evaluating generated goals and assigning
 them a priority based on various factors, including Sacred Trinity alignment.
+
+Scores are cached per goal and only recomputed when one of the goal's scoring
+inputs changes. Goals registered with ``update_goal`` are also kept in a
+max-heap, so ``top_goals`` does not rescore or sort the whole backlog.
 """
 
+import heapq
+import itertools
 import logging
-from datetime import UTC, datetime
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
 
 from .goal import Goal, GoalStatus, GoalType
 
 logger = logging.getLogger(__name__)
 
+# Goals in these states are never scheduled again
+_FINISHED_STATUSES = (GoalStatus.COMPLETED, GoalStatus.FAILED, GoalStatus.ABANDONED)
+
+# Rebuild the heap once stale entries outnumber live ones by this factor
+_HEAP_SLACK = 2
+
 
 class GoalPrioritizer:
     """
     Prioritizes a list of goals based on multiple factors and weighting systems.
     """
 
-    def __init__(self) -> None:
-        """Initialize the GoalPrioritizer."""
+    def __init__(
+        self,
+        staleness_refresh: timedelta = timedelta(hours=1),
+        score_cache_size: int = 4096,
+    ) -> None:
+        """
+        Initialize the GoalPrioritizer.
+
+        Args:
+            staleness_refresh: How often staleness is re-evaluated. Staleness
+                is measured in days, so scores are computed against a shared
+                reference time that only advances this often.
+            score_cache_size: Number of goal scores kept, least recently
+                used first out
+        """
         logger.info("GoalPrioritizer initialized.")
+        self.staleness_refresh = staleness_refresh
+        self.score_cache_size = score_cache_size
+        self._as_of = datetime.now(UTC)
+
+        # goal id -> (scoring inputs, score) for cache hits on unchanged goals
+        self._score_cache: OrderedDict[UUID, tuple[tuple, float]] = OrderedDict()
+
+        # Max-heap of (-score, sequence, goal id) with lazy deletion; an entry
+        # is live only while its sequence matches _heap_sequence[goal id]
+        self._heap: list[tuple[float, int, UUID]] = []
+        self._heap_sequence: dict[UUID, int] = {}
+        self._tracked: dict[UUID, Goal] = {}
+        self._sequence = itertools.count()
 
         # Define priority weights for different factors
         # These could be made configurable in the future
@@ -71,21 +111,19 @@ class GoalPrioritizer:
 
         # Calculate a composite score for each goal
         scored_goals: list[tuple[Goal, float]] = []
+        self._refresh_reference_time()
 
         for goal in goals:
             # Skip goals that are completed, failed, or abandoned
-            if goal.status in [
-                GoalStatus.COMPLETED,
-                GoalStatus.FAILED,
-                GoalStatus.ABANDONED,
-            ]:
+            if goal.status in _FINISHED_STATUSES:
+                self._score_cache.pop(goal.id, None)
                 continue
 
             # Calculate composite score based on weighted factors
-            score = self._calculate_goal_score(goal, goals)
+            score = self.score_goal(goal)
             scored_goals.append((goal, score))
 
-            logger.debug(f"Goal '{goal.description[:30]}...' score: {score:.2f}")
+            logger.debug("Goal '%.30s...' score: %.2f", goal.description, score)
 
         # Sort by computed score (descending)
         prioritized_goals = [
@@ -94,7 +132,107 @@ class GoalPrioritizer:
         logger.info(f"Finished prioritizing {len(prioritized_goals)} goals.")
         return prioritized_goals
 
-    def _calculate_goal_score(self, goal: Goal, all_goals: list[Goal]) -> float:
+    def score_goal(self, goal: Goal) -> float:
+        """Return a goal's score, reusing the cached value if its inputs are unchanged."""
+        inputs = self._scoring_inputs(goal)
+        cached = self._score_cache.get(goal.id)
+        if cached is not None and cached[0] == inputs:
+            self._score_cache.move_to_end(goal.id)
+            return cached[1]
+        score = self._calculate_goal_score(goal, self._as_of)
+        self._score_cache[goal.id] = (inputs, score)
+        self._score_cache.move_to_end(goal.id)
+        if len(self._score_cache) > self.score_cache_size:
+            self._score_cache.popitem(last=False)
+        return score
+
+    def update_goal(self, goal: Goal) -> None:
+        """
+        Track a goal in the priority heap, or re-rank it after it changed.
+
+        Finished goals are dropped. Goals whose scoring inputs did not change
+        keep their existing heap entry.
+        """
+        if goal.status in _FINISHED_STATUSES:
+            self.remove_goal(goal.id)
+            return
+
+        self._tracked[goal.id] = goal
+        cached = self._score_cache.get(goal.id)
+        if (
+            cached is not None
+            and cached[0] == self._scoring_inputs(goal)
+            and goal.id in self._heap_sequence
+        ):
+            return
+        self._push(goal, self.score_goal(goal))
+
+    def remove_goal(self, goal_id: UUID) -> None:
+        """Stop tracking a goal."""
+        self._tracked.pop(goal_id, None)
+        self._heap_sequence.pop(goal_id, None)
+        self._score_cache.pop(goal_id, None)
+
+    def top_goals(self, n: int = 1) -> list[Goal]:
+        """
+        Return the ``n`` highest-scoring tracked goals, highest first.
+
+        Costs O(n log N) plus the removal of stale heap entries.
+        """
+        if self._refresh_reference_time():
+            self._rebuild_heap()
+
+        top: list[tuple[float, int, UUID]] = []
+        while self._heap and len(top) < n:
+            entry = heapq.heappop(self._heap)
+            if self._heap_sequence.get(entry[2]) == entry[1]:
+                top.append(entry)
+        for entry in top:
+            heapq.heappush(self._heap, entry)
+        return [self._tracked[entry[2]] for entry in top]
+
+    def _push(self, goal: Goal, score: float) -> None:
+        sequence = next(self._sequence)
+        self._heap_sequence[goal.id] = sequence
+        heapq.heappush(self._heap, (-score, sequence, goal.id))
+        if len(self._heap) > _HEAP_SLACK * len(self._heap_sequence) + 64:
+            self._rebuild_heap()
+
+    def _rebuild_heap(self) -> None:
+        """Drop stale entries and re-score every tracked goal."""
+        self._heap = []
+        self._heap_sequence = {}
+        for goal in self._tracked.values():
+            sequence = next(self._sequence)
+            self._heap_sequence[goal.id] = sequence
+            self._heap.append((-self.score_goal(goal), sequence, goal.id))
+        heapq.heapify(self._heap)
+
+    def _refresh_reference_time(self) -> bool:
+        """Advance the staleness reference time; returns True if it moved."""
+        now = datetime.now(UTC)
+        if now - self._as_of < self.staleness_refresh:
+            return False
+        self._as_of = now
+        return True
+
+    def _scoring_inputs(self, goal: Goal) -> tuple:
+        """Everything ``_calculate_goal_score`` reads, for cache validation."""
+        return (
+            self._as_of,
+            goal.priority,
+            goal.wisdom_score,
+            goal.compassion_score,
+            goal.truth_score,
+            goal.type,
+            len(goal.dependent_goal_ids),
+            len(goal.blockers),
+            goal.updated_at,
+            goal.progress,
+            goal.status,
+        )
+
+    def _calculate_goal_score(self, goal: Goal, now: datetime | None = None) -> float:
         """Calculate a composite priority score for a single goal."""
         scores: dict[str, float] = {}
 
@@ -121,7 +259,7 @@ class GoalPrioritizer:
         scores["blockers"] = blocker_penalty
 
         # 6. Staleness (older goals get boost if not worked on)
-        days_since_update = (datetime.now(UTC) - goal.updated_at).days
+        days_since_update = ((now or datetime.now(UTC)) - goal.updated_at).days
         staleness_score = min(1.0, days_since_update / 14.0)  # 2 weeks = max staleness
         scores["staleness"] = staleness_score
 
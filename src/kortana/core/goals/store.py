@@ -0,0 +1,261 @@
+"""
+Indexed Goal Store for Kor'tana's Goal Framework.
+
+Keeps goals in memory keyed by id with secondary indexes on status, type and
+parent, so filtered listings touch only matching goals.
+
+When given a path the store is also durable: every put or delete is appended
+to a JSONL operation log (``goals.jsonl``), which is replayed on open and
+compacted into one line per live goal once dead lines outnumber live ones.
+Reloading after a restart is therefore a single sequential read instead of
+one memory search per goal.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import fields
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any
+from uuid import UUID
+
+from .goal import Goal, GoalStatus, GoalType
+
+logger = logging.getLogger(__name__)
+
+_UUID_FIELDS = frozenset({"id", "parent_goal_id"})
+_UUID_LIST_FIELDS = frozenset(
+    {"child_goal_ids", "dependent_goal_ids", "blocks_goal_ids"}
+)
+_DATETIME_FIELDS = frozenset({"created_at", "updated_at", "completed_at"})
+_GOAL_FIELDS = tuple(f.name for f in fields(Goal))
+
+# Compact once the log holds this many more lines than there are live goals
+_COMPACT_SLACK = 1000
+
+
+def goal_to_record(goal: Goal) -> dict[str, Any]:
+    """Convert a goal into a JSON-serializable dict."""
+    record: dict[str, Any] = {}
+    for name in _GOAL_FIELDS:
+        value = getattr(goal, name)
+        if value is None:
+            record[name] = None
+        elif name in _UUID_FIELDS:
+            record[name] = str(value)
+        elif name in _UUID_LIST_FIELDS:
+            record[name] = [str(v) for v in value]
+        elif name in _DATETIME_FIELDS:
+            record[name] = value.isoformat()
+        elif name in ("type", "status"):
+            record[name] = value.value
+        else:
+            record[name] = value
+    return record
+
+
+def goal_from_record(record: dict[str, Any]) -> Goal:
+    """Rebuild a goal from a dict produced by ``goal_to_record``."""
+    values: dict[str, Any] = {}
+    for name, value in record.items():
+        if name not in _GOAL_FIELDS:
+            continue
+        if value is None:
+            values[name] = None
+        elif name in _UUID_FIELDS:
+            values[name] = UUID(value)
+        elif name in _UUID_LIST_FIELDS:
+            values[name] = [UUID(v) for v in value]
+        elif name in _DATETIME_FIELDS:
+            values[name] = datetime.fromisoformat(value)
+        elif name == "type":
+            values[name] = GoalType(value)
+        elif name == "status":
+            values[name] = GoalStatus(value)
+        else:
+            values[name] = value
+    return Goal(**values)
+
+
+class GoalStore:
+    """
+    Goals keyed by id, with status, type and parent indexes.
+
+    The indexes and the log are only updated by ``put``; a goal changed in
+    place must be put again (``GoalManager.update_goal``) to be found under
+    its new status, type or parent and to survive a restart.
+    """
+
+    def __init__(self, path: str | None = None):
+        """
+        Initialize the store.
+
+        Args:
+            path: Optional JSONL file for durable storage; loaded if it exists.
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._goals: dict[UUID, Goal] = {}
+        self._keys: dict[UUID, tuple[GoalStatus, GoalType, UUID | None]] = {}
+        self._by_status: dict[GoalStatus, dict[UUID, None]] = {}
+        self._by_type: dict[GoalType, dict[UUID, None]] = {}
+        self._by_parent: dict[UUID | None, dict[UUID, None]] = {}
+        self._log_lines = 0
+
+        if path and os.path.exists(path):
+            self._replay()
+
+    def __contains__(self, goal_id: object) -> bool:
+        return goal_id in self._goals
+
+    def __len__(self) -> int:
+        return len(self._goals)
+
+    @property
+    def goals(self) -> Mapping[UUID, Goal]:
+        """Read-only view of the stored goals, keyed by id."""
+        return MappingProxyType(self._goals)
+
+    def get(self, goal_id: UUID) -> Goal | None:
+        """Return a goal by id."""
+        return self._goals.get(goal_id)
+
+    def all(self) -> list[Goal]:
+        """Return every stored goal."""
+        return list(self._goals.values())
+
+    def put(self, goal: Goal) -> None:
+        """Insert or update a goal and re-index it under its current keys."""
+        with self._lock:
+            self._index(goal)
+            self._append([{"op": "put", "goal": goal_to_record(goal)}])
+
+    def put_many(self, goals: Iterable[Goal]) -> None:
+        """Insert or update several goals with a single log write."""
+        with self._lock:
+            records = []
+            for goal in goals:
+                self._index(goal)
+                records.append({"op": "put", "goal": goal_to_record(goal)})
+            self._append(records)
+
+    def remove(self, goal_id: UUID) -> bool:
+        """Remove a goal; returns False if it was not stored."""
+        with self._lock:
+            if not self._unindex(goal_id):
+                return False
+            self._append([{"op": "delete", "id": str(goal_id)}])
+            return True
+
+    def query(
+        self,
+        status: GoalStatus | None = None,
+        type: GoalType | None = None,
+        parent_id: UUID | None = None,
+    ) -> list[Goal]:
+        """
+        Return goals matching every given filter.
+
+        Starts from the smallest matching index and checks every filter
+        against each candidate's current fields, so cost follows the result
+        size and a goal changed in place since its last put is not returned
+        under its old keys.
+        """
+        with self._lock:
+            candidates = []
+            if status is not None:
+                candidates.append(self._by_status.get(status, {}))
+            if type is not None:
+                candidates.append(self._by_type.get(type, {}))
+            if parent_id is not None:
+                candidates.append(self._by_parent.get(parent_id, {}))
+            if not candidates:
+                return list(self._goals.values())
+
+            return [
+                goal
+                for goal_id in min(candidates, key=len)
+                if (goal := self._goals[goal_id])
+                and (status is None or goal.status == status)
+                and (type is None or goal.type == type)
+                and (parent_id is None or goal.parent_goal_id == parent_id)
+            ]
+
+    def compact(self) -> None:
+        """Rewrite the log with one line per live goal."""
+        if not self.path:
+            return
+        with self._lock:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for goal in self._goals.values():
+                    f.write(
+                        json.dumps(
+                            {"op": "put", "goal": goal_to_record(goal)}, default=str
+                        )
+                        + "\n"
+                    )
+            os.replace(tmp_path, self.path)
+            self._log_lines = len(self._goals)
+
+    def _index(self, goal: Goal) -> None:
+        keys = (goal.status, goal.type, goal.parent_goal_id)
+        previous = self._keys.get(goal.id)
+        self._goals[goal.id] = goal
+        if previous == keys:
+            return
+        if previous is not None:
+            self._drop_keys(goal.id, previous)
+        self._keys[goal.id] = keys
+        self._by_status.setdefault(keys[0], {})[goal.id] = None
+        self._by_type.setdefault(keys[1], {})[goal.id] = None
+        self._by_parent.setdefault(keys[2], {})[goal.id] = None
+
+    def _unindex(self, goal_id: UUID) -> bool:
+        if self._goals.pop(goal_id, None) is None:
+            return False
+        self._drop_keys(goal_id, self._keys.pop(goal_id))
+        return True
+
+    def _drop_keys(
+        self, goal_id: UUID, keys: tuple[GoalStatus, GoalType, UUID | None]
+    ) -> None:
+        for index, key in zip(
+            (self._by_status, self._by_type, self._by_parent), keys, strict=True
+        ):
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(goal_id, None)
+                if not bucket:
+                    del index[key]
+
+    def _append(self, operations: list[dict[str, Any]]) -> None:
+        if not self.path or not operations:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(op, default=str) + "\n" for op in operations))
+        self._log_lines += len(operations)
+        if self._log_lines > 2 * len(self._goals) + _COMPACT_SLACK:
+            self.compact()
+
+    def _replay(self) -> None:
+        with open(self.path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                self._log_lines += 1
+                try:
+                    operation = json.loads(line)
+                    if operation["op"] == "put":
+                        self._index(goal_from_record(operation["goal"]))
+                    elif operation["op"] == "delete":
+                        self._unindex(UUID(operation["id"]))
+                except (KeyError, TypeError, ValueError) as e:
+                    # A torn final write must not make every other goal unreadable
+                    logger.error(f"Skipping bad goal log line {line_number}: {e}")
+        logger.info(f"Loaded {len(self._goals)} goals from {self.path}")
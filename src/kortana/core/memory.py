@@ -9,9 +9,14 @@ import json
 import logging
 import os
 import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from typing import Any
 
+from kortana.memory.log_index import IndexedJsonlLog
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -29,46 +34,194 @@ PROJECT_MEMORY_PATH = os.path.join(
 )
 
 
-def load_memory() -> list[dict[str, Any]]:
-    """Loads memory entries from the project memory file."""
-    memory_entries: list[dict[str, Any]] = []
-    # Construct the absolute path to the memory file
-    abs_memory_path = os.path.abspath(PROJECT_MEMORY_PATH)
+# Bytes before a cached file size that must be unchanged for growth to count
+# as an append
+_PREFIX_CHECK_BYTES = 256
+
+# (inode, mtime_ns, size) of the memory file
+_Signature = tuple[int, int, int]
+
 
-    logger.debug(f"Attempting to load memory from: {abs_memory_path}")
+def _memory_type(entry: dict[str, Any]) -> list[str]:
+    """Index project memory entries by their ``type``."""
+    memory_type = entry.get("type")
+    return [memory_type] if isinstance(memory_type, str) else []
 
-    if not os.path.exists(abs_memory_path):  # pragma: no cover
-        logger.debug(
-            f"Memory file not found at {abs_memory_path}. Returning empty list."
+
+class ProjectMemoryStore:
+    """
+    Type-indexed project memory file with an mtime-validated read cache.
+
+    Entries stay in a single append-only JSONL file; an ``IndexedJsonlLog``
+    keeps per-type offset lists beside it, so reading one type or the most
+    recent entries of a type only decodes those lines. Results are cached
+    against the file's (inode, mtime, size): repeated reads cost one
+    ``stat``, and after an append only the new entries are decoded. Growth
+    only counts as an append when the bytes just before the cached size are
+    unchanged; a file rewritten to a larger size is read from the start.
+    """
+
+    def __init__(self, path: str, recent_cache_size: int = 64):
+        """
+        Initialize the store.
+
+        Args:
+            path: Path of the project memory JSONL file.
+            recent_cache_size: Maximum number of (type, limit) results kept
+                by ``recent``.
+        """
+        self.path = path
+        self.log = IndexedJsonlLog(path, tags_of=_memory_type)
+        self.recent_cache_size = recent_cache_size
+        self._lock = threading.RLock()
+        # key (memory type, or None for all entries) -> (signature, tail, entries),
+        # where tail is the file's last bytes when the entries were read
+        self._cache: dict[
+            str | None, tuple[_Signature, bytes, list[dict[str, Any]]]
+        ] = {}
+        self._recent: OrderedDict[
+            tuple[str, int], tuple[_Signature, list[dict[str, Any]]]
+        ] = OrderedDict()
+
+    def append(self, entries: list[dict[str, Any]]) -> None:
+        """Append entries to the memory file and its type index."""
+        with self._lock:
+            self.log.append_many(entries)
+
+    def entries(self, memory_type: str | None = None) -> list[dict[str, Any]]:
+        """
+        Return all entries, or all entries of one type, oldest first.
+
+        Args:
+            memory_type: Only return entries of this type.
+
+        Returns:
+            List of memory entries.
+        """
+        with self._lock:
+            signature = self._signature()
+            if signature is None:
+                return []
+            cached = self._cache.get(memory_type)
+            if cached is not None and cached[0] == signature:
+                return [dict(entry) for entry in cached[2]]
+
+            entries: list[dict[str, Any]] = []
+            if cached is not None and self._appended_to(cached[0], cached[1], signature):
+                # The file only grew: decode the entries appended since
+                entries = cached[2]
+            for batch in self.log.iter_batches(memory_type, start=len(entries)):
+                entries.extend(batch)
+            self._cache[memory_type] = (signature, self._tail(signature[2]), entries)
+            return [dict(entry) for entry in entries]
+
+    def recent(self, memory_type: str, limit: int = 5) -> list[dict[str, Any]]:
+        """
+        Return the last ``limit`` entries of a type, oldest first.
+
+        Args:
+            memory_type: Memory type to read.
+            limit: Maximum number of entries to return.
+
+        Returns:
+            List of memory entries.
+        """
+        if limit <= 0:
+            return []
+        with self._lock:
+            signature = self._signature()
+            if signature is None:
+                return []
+            cached = self._cache.get(memory_type)
+            if cached is not None and cached[0] == signature:
+                return [dict(entry) for entry in cached[2][-limit:]]
+            key = (memory_type, limit)
+            recent = self._recent.get(key)
+            if recent is None or recent[0] != signature:
+                recent = (signature, self.log.latest(limit, tag=memory_type)[::-1])
+                self._recent[key] = recent
+                if len(self._recent) > self.recent_cache_size:
+                    self._recent.popitem(last=False)
+            else:
+                self._recent.move_to_end(key)
+            return [dict(entry) for entry in recent[1]]
+
+    def iter_batches(
+        self, memory_type: str | None = None, batch_size: int = 1000
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Stream entries oldest first without building the full list in memory.
+
+        Intended for analytics jobs over large memory files; bypasses the cache.
+
+        Args:
+            memory_type: Only yield entries of this type.
+            batch_size: Maximum number of entries per yielded list.
+
+        Yields:
+            Lists of memory entries.
+        """
+        yield from self.log.iter_batches(memory_type, batch_size=batch_size)
+
+    def type_counts(self) -> dict[str, int]:
+        """Return the number of entries per memory type."""
+        return self.log.tags()
+
+    def _signature(self) -> _Signature | None:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _tail(self, size: int) -> bytes:
+        """Return up to ``_PREFIX_CHECK_BYTES`` of the file ending at ``size``."""
+        start = max(size - _PREFIX_CHECK_BYTES, 0)
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(start)
+                return f.read(size - start)
+        except FileNotFoundError:
+            return b""
+
+    def _appended_to(self, old: _Signature, tail: bytes, new: _Signature) -> bool:
+        """Whether the file at ``new`` is the file at ``old`` with lines appended."""
+        return (
+            new[0] == old[0]
+            and new[2] > old[2]
+            and len(tail) == min(old[2], _PREFIX_CHECK_BYTES)
+            and self._tail(old[2]) == tail
         )
-        return memory_entries
 
-    logger.debug(f"Memory file found at {abs_memory_path}. Attempting to read.")
 
+_stores: dict[str, ProjectMemoryStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_project_memory_store() -> ProjectMemoryStore:
+    """Return the store for the current ``PROJECT_MEMORY_PATH``."""
+    abs_memory_path = os.path.abspath(PROJECT_MEMORY_PATH)
+    with _stores_lock:
+        store = _stores.get(abs_memory_path)
+        if store is None:
+            store = _stores[abs_memory_path] = ProjectMemoryStore(abs_memory_path)
+        return store
+
+
+def load_memory() -> list[dict[str, Any]]:
+    """Loads memory entries from the project memory file."""
     try:
-        with open(abs_memory_path, encoding="utf-8") as f:
-            logger.debug("File opened successfully. Reading line by line...")
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:  # Skip empty lines
-                    continue
-                logger.debug(f"Reading line {line_num}: {line[:50]}...")
-                try:
-                    entry = json.loads(line)
-                    memory_entries.append(entry)
-                    logger.debug(f"Successfully parsed line {line_num}.")
-                except json.JSONDecodeError as e:
-                    logger.error(
-                        f"JSON decoding error in {abs_memory_path} at line {line_num}: {e} - Line: {line[:100]}..."
-                    )
-                    pass  # For now, just skip the problematic line # pragma: no cover
-            logger.debug("Finished reading file.")
+        return get_project_memory_store().entries()
     except OSError as e:  # pragma: no cover
-        logger.error(f"IO Error reading project memory file {abs_memory_path}: {e}")
-        logger.debug("Returning empty list due to IO Error.")
+        logger.error(f"IO Error reading project memory file {PROJECT_MEMORY_PATH}: {e}")
+        return []
 
-    logger.debug(f"load_memory finished. Loaded {len(memory_entries)} entries.")
-    return memory_entries
+
+def iter_memory_batches(
+    memory_type: str | None = None, batch_size: int = 1000
+) -> Iterator[list[dict[str, Any]]]:
+    """Streams project memory entries, optionally of one type, in batches."""
+    return get_project_memory_store().iter_batches(memory_type, batch_size)
 
 
 def save_memory(entry: dict) -> bool:
@@ -78,6 +231,7 @@ def save_memory(entry: dict) -> bool:
     try:
         # Ensure the directory exists before writing
         os.makedirs(os.path.dirname(abs_memory_path), exist_ok=True)
+        # Plain append; the type index picks the line up on the next read
         with open(abs_memory_path, "a", encoding="utf-8") as f:
             json.dump(entry, f)
             f.write("\n")
@@ -137,18 +291,23 @@ def save_project_insight(content: str) -> None:
 
 def get_memory_by_type(memory_type: str) -> list[dict[str, Any]]:
     """Retrieves all memory entries of a specific type."""
-    all_memories = load_memory()
-    # Filter by type and return a new list
-    return [entry for entry in all_memories if entry.get("type") == memory_type]
+    try:
+        return get_project_memory_store().entries(memory_type)
+    except OSError as e:  # pragma: no cover
+        logger.error(f"IO Error reading project memory file {PROJECT_MEMORY_PATH}: {e}")
+        return []
 
 
 def get_recent_memories_by_type(
     memory_type: str, limit: int = 5
 ) -> list[dict[str, Any]]:
     """Retrieves the most recent memory entries of a specific type."""
-    memories_of_type = get_memory_by_type(memory_type)
-    # Return the last 'limit' entries (most recent)
-    return memories_of_type[-limit:]
+    try:
+        # Oldest first, i.e. the last 'limit' entries in file order
+        return get_project_memory_store().recent(memory_type, limit)
+    except OSError as e:  # pragma: no cover
+        logger.error(f"IO Error reading project memory file {PROJECT_MEMORY_PATH}: {e}")
+        return []
 
 
 # Example usage (for testing):
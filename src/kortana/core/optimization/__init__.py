@@ -6,19 +6,30 @@ and performance enhancements for Kortana.
 """
 
 from .memory_optimizer import CacheStrategy, MemoryOptimizer
-from .performance_metrics import MetricsCollector, PerformanceMetrics
-from .priority_queue import DecisionQueue, Priority, PriorityQueue, TaskProcessor
-from .resource_manager import ResourceManager, ResourcePool
+from .performance_metrics import LogHistogram, MetricsCollector, PerformanceMetrics
+from .priority_queue import (
+    DecisionQueue,
+    Priority,
+    PriorityQueue,
+    SchedulerBusyError,
+    TaskProcessor,
+    WorkStealingScheduler,
+)
+from .resource_manager import PoolExhaustedError, ResourceManager, ResourcePool
 
 __all__ = [
     "MemoryOptimizer",
     "CacheStrategy",
     "ResourceManager",
     "ResourcePool",
+    "PoolExhaustedError",
     "PerformanceMetrics",
+    "LogHistogram",
     "MetricsCollector",
     "PriorityQueue",
     "Priority",
     "DecisionQueue",
     "TaskProcessor",
+    "WorkStealingScheduler",
+    "SchedulerBusyError",
 ]
@@ -5,16 +5,179 @@ This module provides:
 - Performance measurement and tracking
 - Metrics collection for analysis
 - Real-time monitoring capabilities
+
+Timers are recorded into log-bucketed histograms (in the style of DDSketch /
+HdrHistogram), so memory is bounded by the bucket count rather than the number
+of measurements, and percentiles carry a fixed relative error.
 """
 
+import itertools
 import logging
+import math
 import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import Callable
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Percentiles reported by get_timer_stats, keyed by their stats name
+PERCENTILES = {"p50": 0.50, "p90": 0.90, "p99": 0.99, "p999": 0.999}
+
+
+class LogHistogram:
+    """
+    Histogram with logarithmically sized buckets.
+
+    A value ``v`` lands in bucket ``ceil(log_gamma(v))`` where
+    ``gamma = (1 + relative_error) / (1 - relative_error)``; reporting the
+    bucket's midpoint keeps every quantile within ``relative_error`` of a real
+    sample. Values are clamped to ``[min_value, max_value]`` for bucketing, so
+    at most ``log_gamma(max_value / min_value)`` buckets ever exist. Exact
+    count, sum, min and max are tracked alongside.
+    """
+
+    __slots__ = (
+        "_gamma",
+        "_log_gamma",
+        "_min_index",
+        "_max_index",
+        "buckets",
+        "zero_count",
+        "count",
+        "total",
+        "min",
+        "max",
+    )
+
+    def __init__(
+        self,
+        relative_error: float = 0.01,
+        min_value: float = 1e-6,
+        max_value: float = 86_400.0,
+    ):
+        """
+        Initialize the histogram.
+
+        Args:
+            relative_error: Maximum relative error of reported quantiles
+            min_value: Smallest distinguishable positive value
+            max_value: Largest distinguishable value
+        """
+        if not 0 < relative_error < 1:
+            raise ValueError("relative_error must be between 0 and 1")
+        self._gamma = (1 + relative_error) / (1 - relative_error)
+        self._log_gamma = math.log(self._gamma)
+        self._min_index = math.ceil(math.log(min_value) / self._log_gamma)
+        self._max_index = math.ceil(math.log(max_value) / self._log_gamma)
+        self.buckets: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def record(self, value: float) -> None:
+        """Add one measurement in constant time."""
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value <= 0:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        if index < self._min_index:
+            index = self._min_index
+        elif index > self._max_index:
+            index = self._max_index
+        buckets = self.buckets
+        buckets[index] = buckets.get(index, 0) + 1
+
+    def merge(self, other: "LogHistogram") -> None:
+        """Add another histogram with the same bucket layout into this one."""
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the value at quantile ``q`` (0-1).
+
+        Returns:
+            Estimated value, or 0.0 for an empty histogram
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return max(self.min, 0.0)
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                estimate = 2 * self._gamma**index / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def stats(self) -> dict[str, float]:
+        """Summarize as count, min, max, avg and the standard percentiles."""
+        if self.count == 0:
+            return {"count": 0, "min": 0.0, "max": 0.0, "avg": 0.0} | dict.fromkeys(
+                PERCENTILES, 0.0
+            )
+        return {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "avg": self.total / self.count,
+        } | {name: self.quantile(q) for name, q in PERCENTILES.items()}
+
+
+class _TimerShard:
+    """
+    One stripe's share of a timer.
+
+    Measurements go into the histogram for the current time slot only. When
+    the slot advances, the finished histogram joins ``recent``; slots that fall
+    out of the window are folded into ``retired``, so all-time stats are
+    ``retired + recent + current`` and memory stays bounded by the window.
+    """
+
+    __slots__ = ("lock", "slot_number", "current", "recent", "retired")
+
+    def __init__(self, num_slots: int):
+        self.lock = threading.Lock()
+        self.slot_number = -1
+        self.current = LogHistogram()
+        self.recent: deque[tuple[int, LogHistogram]] = deque()
+        self.retired = LogHistogram()
+
+    def advance(self, slot_number: int, num_slots: int) -> None:
+        """Start a new time slot, retiring slots older than the window."""
+        if self.current.count:
+            self.recent.append((self.slot_number, self.current))
+            self.current = LogHistogram()
+        self.slot_number = slot_number
+        while self.recent and self.recent[0][0] <= slot_number - num_slots:
+            self.retired.merge(self.recent.popleft()[1])
+
+    def histograms(self, oldest_slot: int | None = None) -> list[LogHistogram]:
+        """Histograms for slots at or after ``oldest_slot`` (None for all time)."""
+        if oldest_slot is None:
+            return [self.retired, self.current, *(h for _, h in self.recent)]
+        selected = [h for number, h in self.recent if number >= oldest_slot]
+        if self.slot_number >= oldest_slot:
+            selected.append(self.current)
+        return selected
+
 
 class PerformanceMetrics:
     """
@@ -23,18 +186,38 @@ class PerformanceMetrics:
     Inspired by Chromium's telemetry and tracing capabilities.
     """
 
-    def __init__(self, name: str):
+    def __init__(
+        self,
+        name: str,
+        window_seconds: float = 300.0,
+        slot_seconds: float = 10.0,
+        stripes: int = 8,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
         Initialize performance metrics.
 
+        Timer recordings from different threads go to different lock stripes
+        and are merged when read, so concurrent recorders rarely contend.
+
         Args:
             name: Metrics namespace name
+            window_seconds: Longest window available to windowed timer stats
+            slot_seconds: Granularity of windowed timer stats
+            stripes: Number of independently locked timer shards
+            clock: Monotonic time source for windowing
         """
         self.name = name
         self._lock = threading.RLock()
         self._counters: dict[str, int] = defaultdict(int)
-        self._timers: dict[str, list[float]] = defaultdict(list)
+        self._timers: dict[str, list[_TimerShard]] = {}
         self._gauges: dict[str, float] = {}
+        self._slot_seconds = slot_seconds
+        self._num_slots = max(1, math.ceil(window_seconds / slot_seconds))
+        self._stripes = max(1, stripes)
+        self._clock = clock
+        self._stripe_ids = itertools.count()
+        self._thread_stripe = threading.local()
 
     def increment(self, counter: str, value: int = 1) -> None:
         """
@@ -51,12 +234,25 @@ class PerformanceMetrics:
         """
         Record a timing measurement.
 
+        Constant time and memory: the duration is added to a histogram bucket
+        rather than stored.
+
         Args:
             timer: Timer name
             duration: Duration in seconds
         """
-        with self._lock:
-            self._timers[timer].append(duration)
+        shards = self._timers.get(timer)
+        if shards is None:
+            with self._lock:
+                shards = self._timers.setdefault(
+                    timer, [_TimerShard(self._num_slots) for _ in range(self._stripes)]
+                )
+        shard = shards[self._stripe()]
+        slot_number = int(self._clock() // self._slot_seconds)
+        with shard.lock:
+            if shard.slot_number != slot_number:
+                shard.advance(slot_number, self._num_slots)
+            shard.current.record(duration)
 
     def set_gauge(self, gauge: str, value: float) -> None:
         """
@@ -82,27 +278,37 @@ class PerformanceMetrics:
         with self._lock:
             return self._counters.get(counter, 0)
 
-    def get_timer_stats(self, timer: str) -> dict[str, float]:
+    def get_timer_stats(
+        self, timer: str, window_seconds: float | None = None
+    ) -> dict[str, float]:
         """
         Get statistics for a timer.
 
         Args:
             timer: Timer name
+            window_seconds: Only include recent measurements (e.g. 60 for the
+                last minute, rounded to whole slots); None for all time
 
         Returns:
-            Dictionary with min, max, avg, count
+            Dictionary with count, min, max, avg, p50, p90, p99 and p999
         """
-        with self._lock:
-            times = self._timers.get(timer, [])
-            if not times:
-                return {"count": 0, "min": 0.0, "max": 0.0, "avg": 0.0}
+        return self._merged_histogram(timer, window_seconds).stats()
 
-            return {
-                "count": len(times),
-                "min": min(times),
-                "max": max(times),
-                "avg": sum(times) / len(times),
-            }
+    def get_timer_windows(self, timer: str) -> dict[str, dict[str, float]]:
+        """
+        Get timer statistics for the last minute, last five minutes and all time.
+
+        Args:
+            timer: Timer name
+
+        Returns:
+            Dictionary mapping "1m", "5m" and "all" to timer stats
+        """
+        return {
+            "1m": self.get_timer_stats(timer, 60),
+            "5m": self.get_timer_stats(timer, 300),
+            "all": self.get_timer_stats(timer),
+        }
 
     def get_gauge(self, gauge: str) -> float:
         """
@@ -125,13 +331,13 @@ class PerformanceMetrics:
             Dictionary with all counters, timers, and gauges
         """
         with self._lock:
-            return {
-                "counters": dict(self._counters),
-                "timers": {
-                    name: self.get_timer_stats(name) for name in self._timers.keys()
-                },
-                "gauges": dict(self._gauges),
-            }
+            counters, gauges = dict(self._counters), dict(self._gauges)
+            timer_names = list(self._timers)
+        return {
+            "counters": counters,
+            "timers": {name: self.get_timer_stats(name) for name in timer_names},
+            "gauges": gauges,
+        }
 
     def reset(self) -> None:
         """Reset all metrics."""
@@ -140,6 +346,34 @@ class PerformanceMetrics:
             self._timers.clear()
             self._gauges.clear()
 
+    def _stripe(self) -> int:
+        """Return the calling thread's shard index, assigned round-robin."""
+        stripe = getattr(self._thread_stripe, "index", None)
+        if stripe is None:
+            stripe = next(self._stripe_ids) % self._stripes
+            self._thread_stripe.index = stripe
+        return stripe
+
+    def _merged_histogram(
+        self, timer: str, window_seconds: float | None
+    ) -> LogHistogram:
+        """Merge every stripe's histogram for ``timer``, optionally windowed."""
+        merged = LogHistogram()
+        shards = self._timers.get(timer)
+        if not shards:
+            return merged
+        oldest = None
+        if window_seconds is not None:
+            span = min(
+                self._num_slots, max(1, math.ceil(window_seconds / self._slot_seconds))
+            )
+            oldest = int(self._clock() // self._slot_seconds) - span + 1
+        for shard in shards:
+            with shard.lock:
+                for histogram in shard.histograms(oldest):
+                    merged.merge(histogram)
+        return merged
+
 
 class MetricsCollector:
     """
@@ -214,10 +448,10 @@ class Timer:
 
     def __enter__(self) -> "Timer":
         """Start timing."""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Stop timing and record duration."""
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
         self.metrics.record_time(self.name, duration)
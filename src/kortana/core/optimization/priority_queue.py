@@ -5,12 +5,17 @@ This module provides:
 - Priority-based task queuing
 - Adaptive scheduling based on priority
 - Efficient task processing and throughput optimization
+- An asyncio work-stealing scheduler with bounded backpressure
 """
 
+import asyncio
 import heapq
+import inspect
+import itertools
 import logging
 import threading
 import time
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import IntEnum
@@ -162,11 +167,310 @@ class PriorityQueue:
             }
 
 
+class SchedulerBusyError(RuntimeError):
+    """Raised when a scheduler already holds its maximum number of pending tasks."""
+
+
+class _Worker:
+    """Per-worker state: one FIFO deque per priority level plus a wake-up event."""
+
+    __slots__ = ("index", "queues", "wakeup")
+
+    def __init__(self, index: int):
+        self.index = index
+        self.queues: list[deque[PriorityTask]] = [deque() for _ in Priority]
+        self.wakeup = asyncio.Event()
+
+
+class WorkStealingScheduler:
+    """
+    Asyncio task scheduler with per-worker deques and work stealing.
+
+    New tasks go to an idle worker when there is one, otherwise round-robin.
+    A worker runs its own highest-priority task unless another worker holds
+    work more than ``priority_tolerance`` levels more urgent, in which case it
+    steals that instead; a worker that runs dry steals before going idle.
+    Idle workers sleep on an event, so an idle scheduler does no work at all.
+
+    ``submit`` is thread-safe and fails fast with ``SchedulerBusyError`` once
+    ``max_pending`` tasks are queued or running, instead of growing without
+    bound. Coroutine functions are awaited; plain callables run inline on the
+    event loop, or in a worker thread when ``blocking_callbacks`` is set.
+    """
+
+    def __init__(
+        self,
+        num_workers: int = 4,
+        max_pending: int = 1000,
+        priority_tolerance: int = 0,
+        blocking_callbacks: bool = False,
+        name: str = "default",
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            num_workers: Number of concurrent worker coroutines
+            max_pending: Maximum queued plus running tasks before rejecting
+            priority_tolerance: Priority levels a worker may favor its own
+                queue over more urgent work elsewhere (0 = strict priority)
+            blocking_callbacks: Run plain callables via ``asyncio.to_thread``
+            name: Scheduler name
+        """
+        self.name = name
+        self.num_workers = num_workers
+        self.max_pending = max_pending
+        self.priority_tolerance = priority_tolerance
+        self.blocking_callbacks = blocking_callbacks
+        self._workers = [_Worker(i) for i in range(num_workers)]
+        self._idle: deque[_Worker] = deque()
+        self._round_robin = itertools.cycle(self._workers)
+        self._level_counts = [0] * len(Priority)
+        self._worker_tasks: list[asyncio.Task] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._drained = asyncio.Event()
+        self._stopping = False
+
+        # Shared with submitting threads
+        self._count_lock = threading.Lock()
+        self._pending = 0
+        self._submitted = 0
+        self._rejected = 0
+        self._completed = 0
+        self._failed = 0
+        self._steals = 0
+        logger.info(
+            f"WorkStealingScheduler '{name}' initialized with {num_workers} workers"
+        )
+
+    @property
+    def running(self) -> bool:
+        """Whether worker coroutines are active."""
+        return bool(self._worker_tasks) and not self._stopping
+
+    async def start(self) -> None:
+        """Start the worker coroutines on the running event loop."""
+        if self._worker_tasks:
+            logger.warning(f"WorkStealingScheduler '{self.name}' already running")
+            return
+        loop = asyncio.get_running_loop()
+        if self._loop is not None and self._loop is not loop:
+            # Joiners from before the first start share the event; a restart
+            # on another loop needs a fresh one
+            self._drained = asyncio.Event()
+        self._loop = loop
+        for worker in self._workers:
+            # Events bind to the loop they are first used on
+            worker.wakeup = asyncio.Event()
+            if any(worker.queues):
+                worker.wakeup.set()
+        self._stopping = False
+        self._worker_tasks = [
+            asyncio.create_task(
+                self._run_worker(worker), name=f"Worker-{self.name}-{worker.index}"
+            )
+            for worker in self._workers
+        ]
+        logger.info(f"Started {self.num_workers} workers for scheduler '{self.name}'")
+
+    async def stop(self, drain: bool = True) -> None:
+        """
+        Stop the workers.
+
+        Args:
+            drain: Finish queued tasks first; otherwise drop them
+        """
+        self._stopping = True
+        if not drain:
+            dropped = 0
+            for worker in self._workers:
+                for queue in worker.queues:
+                    dropped += len(queue)
+                    queue.clear()
+            self._level_counts = [0] * len(Priority)
+            with self._count_lock:
+                self._pending -= dropped
+            if dropped:
+                logger.info(f"Dropped {dropped} queued tasks from '{self.name}'")
+            # Wake joiners; they return once running tasks finish too
+            self._drained.set()
+        for worker in self._workers:
+            worker.wakeup.set()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._idle.clear()
+        logger.info(f"Stopped scheduler '{self.name}'")
+
+    def submit(
+        self,
+        callback: Callable,
+        priority: Priority = Priority.NORMAL,
+        task_id: str | None = None,
+        *args,
+        **kwargs,
+    ) -> str:
+        """
+        Queue a task; safe to call from any thread.
+
+        Args:
+            callback: Function or coroutine function to run
+            priority: Task priority
+            task_id: Optional task ID (auto-generated if None)
+            *args: Positional arguments for callback
+            **kwargs: Keyword arguments for callback
+
+        Returns:
+            Task ID
+
+        Raises:
+            SchedulerBusyError: If ``max_pending`` tasks are already pending
+        """
+        with self._count_lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise SchedulerBusyError(
+                    f"Scheduler '{self.name}' is at capacity ({self.max_pending})"
+                )
+            self._pending += 1
+            self._submitted += 1
+            sequence = self._submitted
+
+        task = PriorityTask(
+            priority=priority.value,
+            timestamp=time.time(),
+            task_id=task_id or f"task_{sequence}",
+            callback=callback,
+            args=args,
+            kwargs=kwargs,
+        )
+        loop = self._loop
+        if loop is None or _on_loop(loop):
+            self._push(task)
+        else:
+            loop.call_soon_threadsafe(self._push, task)
+        return task.task_id
+
+    async def join(self) -> None:
+        """Wait until every submitted task has finished."""
+        while self._pending:
+            self._drained.clear()
+            await self._drained.wait()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dictionary with scheduler stats
+        """
+        with self._count_lock:
+            return {
+                "name": self.name,
+                "workers": self.num_workers,
+                "pending": self._pending,
+                "total_enqueued": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "steals": self._steals,
+                "idle_workers": len(self._idle),
+            }
+
+    def _push(self, task: PriorityTask) -> None:
+        """Place a task on a worker's deque (event loop thread only)."""
+        worker = self._idle.popleft() if self._idle else next(self._round_robin)
+        worker.queues[task.priority].append(task)
+        self._level_counts[task.priority] += 1
+        worker.wakeup.set()
+
+    def _next_task(self, worker: _Worker) -> PriorityTask | None:
+        """Pick the worker's next task, stealing when its own work is too stale."""
+        counts = self._level_counts
+        for level, count in enumerate(counts):
+            if count:
+                best = level
+                break
+        else:
+            return None
+
+        # Only levels within the tolerance of the most urgent work may run locally
+        limit = min(best + self.priority_tolerance + 1, len(counts))
+        for level in range(best, limit):
+            queue = worker.queues[level]
+            if queue:
+                task = queue.popleft()
+                break
+        else:
+            task = self._steal(worker, best)
+        counts[task.priority] -= 1
+        return task
+
+    def _steal(self, thief: _Worker, priority: int) -> PriorityTask:
+        """Take the oldest task at ``priority`` from another worker."""
+        count = len(self._workers)
+        for offset in range(1, count + 1):
+            victim = self._workers[(thief.index + offset) % count]
+            if victim.queues[priority]:
+                if victim is not thief:
+                    self._steals += 1
+                return victim.queues[priority].popleft()
+        raise RuntimeError(f"Level count for priority {priority} is out of sync")
+
+    async def _run_worker(self, worker: _Worker) -> None:
+        while True:
+            task = self._next_task(worker)
+            if task is None:
+                if self._stopping:
+                    return
+                worker.wakeup.clear()
+                self._idle.append(worker)
+                await worker.wakeup.wait()
+                if worker in self._idle:
+                    self._idle.remove(worker)
+                continue
+            await self._execute(task)
+
+    async def _execute(self, task: PriorityTask) -> None:
+        try:
+            if inspect.iscoroutinefunction(task.callback):
+                await task.callback(*task.args, **task.kwargs)
+            elif self.blocking_callbacks:
+                await asyncio.to_thread(task.callback, *task.args, **task.kwargs)
+            else:
+                result = task.callback(*task.args, **task.kwargs)
+                if inspect.isawaitable(result):
+                    await result
+            succeeded = True
+            logger.debug(f"Completed task '{task.task_id}'")
+        except Exception as e:
+            succeeded = False
+            logger.error(f"Error executing task '{task.task_id}': {e}", exc_info=True)
+
+        with self._count_lock:
+            self._pending -= 1
+            if succeeded:
+                self._completed += 1
+            else:
+                self._failed += 1
+            drained = self._pending == 0
+        if drained:
+            self._drained.set()
+
+
+def _on_loop(loop: asyncio.AbstractEventLoop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
 class TaskProcessor:
     """
     Task processor with worker threads for parallel execution.
 
     Provides efficient task processing with priority-based scheduling.
+    Consumes a shared, thread-blocking PriorityQueue; prefer
+    WorkStealingScheduler for new code.
     """
 
     def __init__(
@@ -250,29 +554,65 @@ class DecisionQueue:
     """
     High-level decision queue for managing AI decision-making tasks.
 
-    Provides a convenient interface for Kortana's decision processing.
+    Provides a convenient interface for Kortana's decision processing. Runs a
+    WorkStealingScheduler on a dedicated event loop thread, so it can be used
+    from synchronous code; plain callbacks run in worker threads.
     """
 
-    def __init__(self, num_workers: int = 4):
+    def __init__(self, num_workers: int = 4, max_pending: int = 1000):
         """
         Initialize decision queue.
 
         Args:
-            num_workers: Number of worker threads
+            num_workers: Number of concurrent decisions
+            max_pending: Pending decisions accepted before submissions fail
         """
-        self.queue = PriorityQueue(name="decisions")
-        self.processor = TaskProcessor(
-            self.queue, num_workers=num_workers, name="decisions"
+        self.scheduler = WorkStealingScheduler(
+            num_workers=num_workers,
+            max_pending=max_pending,
+            blocking_callbacks=True,
+            name="decisions",
         )
+        self._thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
         logger.info(f"DecisionQueue initialized with {num_workers} workers")
 
     def start(self) -> None:
         """Start processing decisions."""
-        self.processor.start()
+        if self._thread is not None:
+            logger.warning("DecisionQueue already running")
+            return
+        self._loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run() -> None:
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self.scheduler.start())
+            started.set()
+            self._loop.run_forever()
+            self._loop.close()
 
-    def stop(self) -> None:
-        """Stop processing decisions."""
-        self.processor.stop()
+        self._thread = threading.Thread(target=run, daemon=True, name="decisions-loop")
+        self._thread.start()
+        started.wait()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop processing decisions, finishing any already queued.
+
+        Args:
+            timeout: Maximum time to wait for queued decisions
+        """
+        if self._thread is None:
+            return
+        future = asyncio.run_coroutine_threadsafe(self.scheduler.stop(), self._loop)
+        try:
+            future.result(timeout=timeout)
+        except TimeoutError:
+            logger.warning("DecisionQueue did not drain before timeout")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=timeout)
+        self._thread = None
 
     def submit_decision(
         self,
@@ -294,10 +634,11 @@ class DecisionQueue:
 
         Returns:
             Task ID
+
+        Raises:
+            SchedulerBusyError: If too many decisions are already pending
         """
-        return self.queue.enqueue(
-            callback, priority, task_id, *args, **kwargs
-        )
+        return self.scheduler.submit(callback, priority, task_id, *args, **kwargs)
 
     def get_stats(self) -> dict[str, Any]:
         """
@@ -306,4 +647,4 @@ class DecisionQueue:
         Returns:
             Dictionary with statistics
         """
-        return self.queue.get_stats()
+        return self.scheduler.get_stats()
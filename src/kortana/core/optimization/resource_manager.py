@@ -7,22 +7,55 @@ This module provides:
 - Efficient resource allocation and cleanup
 """
 
+import asyncio
 import logging
 import threading
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from typing import Any, Generic, TypeVar
 
+from .performance_metrics import PerformanceMetrics
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
 
+class PoolExhaustedError(TimeoutError):
+    """Raised when no pooled resource becomes available within the timeout."""
+
+
+# Handed to a waiter instead of a resource: a slot is reserved, create one
+_CREATE = object()
+
+
+class _Waiter:
+    """A blocked acquirer; woken with a resource or a reserved slot."""
+
+    __slots__ = ("event", "future", "loop", "item")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None):
+        self.loop = loop
+        self.future: asyncio.Future | None = loop.create_future() if loop else None
+        self.event = None if loop else threading.Event()
+        self.item: Any = None
+
+
 class ResourcePool(Generic[T]):
     """
     Thread-safe resource pool for managing reusable resources.
 
     Inspired by Chromium's process/tab management for efficient resource use.
+
+    At most ``max_size`` resources exist at once: when all are in use,
+    ``acquire`` (or ``await acquire_async``) waits up to ``acquire_timeout``
+    for one to be released and then raises ``PoolExhaustedError``. Idle
+    resources sit in a deque and are reused most-recently-released first, so
+    the oldest ones age out. Nothing is created until first use (or
+    ``warm_up``); ``cleanup_idle`` runs health checks and evicts resources idle
+    longer than ``timeout`` down to ``min_size``.
     """
 
     def __init__(
@@ -33,6 +66,8 @@ class ResourcePool(Generic[T]):
         min_size: int = 5,
         max_size: int = 50,
         timeout: float = 60.0,
+        acquire_timeout: float = 30.0,
+        health_check: Callable[[T], bool] | None = None,
     ):
         """
         Initialize resource pool.
@@ -41,76 +76,136 @@ class ResourcePool(Generic[T]):
             name: Pool name for identification
             factory: Function to create new resources
             cleanup: Optional cleanup function for resources
-            min_size: Minimum pool size
-            max_size: Maximum pool size
+            min_size: Minimum pool size kept warm once the pool is used
+            max_size: Maximum number of live resources
             timeout: Resource idle timeout in seconds
+            acquire_timeout: Default seconds to wait for a free resource
+            health_check: Optional predicate; resources failing it are discarded
         """
+        if max_size < 1 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size >= 1")
         self.name = name
         self.factory = factory
         self.cleanup = cleanup
         self.min_size = min_size
         self.max_size = max_size
         self.timeout = timeout
+        self.acquire_timeout = acquire_timeout
+        self.health_check = health_check
 
-        self._pool: list[tuple[T, float]] = []
+        self._idle: deque[tuple[T, float]] = deque()
+        self._waiters: deque[_Waiter] = deque()
         self._lock = threading.RLock()
         self._active_resources: set[int] = set()
+        self._size = 0  # idle + active + being created or checked
+        self._used = False
+        self._closed = False
         self._created_count = 0
+        self._destroyed_count = 0
         self._acquired_count = 0
         self._released_count = 0
-
-        # Pre-populate pool with minimum resources
-        for _ in range(min_size):
-            self._pool.append((self.factory(), time.time()))
-            self._created_count += 1
+        self._timeout_count = 0
+        self.metrics = PerformanceMetrics(f"pool.{name}")
 
         logger.info(
             f"ResourcePool '{name}' initialized: min={min_size}, max={max_size}"
         )
 
-    def acquire(self) -> T:
+    def acquire(self, timeout: float | None = None) -> T:
         """
-        Acquire a resource from the pool.
+        Acquire a resource from the pool, waiting for one if all are in use.
+
+        Args:
+            timeout: Seconds to wait (defaults to ``acquire_timeout``)
 
         Returns:
             Resource instance
+
+        Raises:
+            PoolExhaustedError: If no resource became available in time
         """
+        started = time.monotonic()
         with self._lock:
-            # Try to get from pool
-            while self._pool:
-                resource, timestamp = self._pool.pop(0)
-
-                # Check if resource is still valid (not timed out)
-                if time.time() - timestamp < self.timeout:
-                    self._active_resources.add(id(resource))
-                    self._acquired_count += 1
-                    return resource
-
-                # Resource timed out, clean up
-                if self.cleanup:
-                    try:
-                        self.cleanup(resource)
-                    except Exception as e:
-                        logger.warning(
-                            f"Error cleaning up timed-out resource in pool '{self.name}': {e}"
-                        )
-
-            # No available resources, create new one
-            if self._created_count < self.max_size:
-                resource = self.factory()
-                self._created_count += 1
-                self._active_resources.add(id(resource))
-                self._acquired_count += 1
-                logger.debug(
-                    f"Created new resource for pool '{self.name}' (total: {self._created_count})"
-                )
-                return resource
+            item = self._take()
+            waiter = None
+            if item is None:
+                waiter = _Waiter()
+                self._waiters.append(waiter)
+
+        if waiter is not None:
+            wait = self.acquire_timeout if timeout is None else timeout
+            waiter.event.wait(wait)
+            with self._lock:
+                item = waiter.item
+                if item is None:
+                    self._waiters.remove(waiter)
+                    self._timed_out(wait)
+        return self._checkout(item, started)
+
+    async def acquire_async(self, timeout: float | None = None) -> T:
+        """
+        Acquire a resource without blocking the event loop.
+
+        Args:
+            timeout: Seconds to wait (defaults to ``acquire_timeout``)
+
+        Returns:
+            Resource instance
 
-            # Max size reached, create temporary resource
-            logger.warning(
-                f"ResourcePool '{self.name}' at max capacity, creating temporary resource"
+        Raises:
+            PoolExhaustedError: If no resource became available in time
+        """
+        started = time.monotonic()
+        with self._lock:
+            item = self._take()
+            waiter = None
+            if item is None:
+                waiter = _Waiter(asyncio.get_running_loop())
+                self._waiters.append(waiter)
+
+        if waiter is not None:
+            wait = self.acquire_timeout if timeout is None else timeout
+            try:
+                item = await asyncio.wait_for(asyncio.shield(waiter.future), wait)
+            except TimeoutError:
+                with self._lock:
+                    item = waiter.item
+                    if item is None:
+                        self._waiters.remove(waiter)
+                        self._timed_out(wait)
+            except asyncio.CancelledError:
+                self._abandon(waiter)
+                raise
+        if item is _CREATE:
+            # The factory may block; keep it off the event loop
+            checkout = asyncio.ensure_future(
+                asyncio.to_thread(self._checkout, item, started)
             )
-            return self.factory()
+            try:
+                return await asyncio.shield(checkout)
+            except asyncio.CancelledError:
+                # The thread keeps going; give back what it creates
+                checkout.add_done_callback(self._release_checkout)
+                raise
+        return self._checkout(item, started)
+
+    @contextmanager
+    def borrow(self, timeout: float | None = None) -> Iterator[T]:
+        """Acquire a resource for the duration of a ``with`` block."""
+        resource = self.acquire(timeout)
+        try:
+            yield resource
+        finally:
+            self.release(resource)
+
+    @asynccontextmanager
+    async def borrow_async(self, timeout: float | None = None) -> AsyncIterator[T]:
+        """Acquire a resource for the duration of an ``async with`` block."""
+        resource = await self.acquire_async(timeout)
+        try:
+            yield resource
+        finally:
+            self.release(resource)
 
     def release(self, resource: T) -> None:
         """
@@ -121,82 +216,233 @@ class ResourcePool(Generic[T]):
         """
         with self._lock:
             resource_id = id(resource)
+            if resource_id not in self._active_resources:
+                logger.warning(
+                    f"Resource released to pool '{self.name}' was not acquired from it"
+                )
+                self._destroy(resource, counted=False)
+                return
 
-            if resource_id in self._active_resources:
-                self._active_resources.remove(resource_id)
+            self._active_resources.remove(resource_id)
+            self._released_count += 1
+            self._return(resource)
 
-            # Return to pool if under max size
-            if len(self._pool) < self.max_size:
-                self._pool.append((resource, time.time()))
-                self._released_count += 1
-            else:
-                # Pool full, cleanup resource
-                if self.cleanup:
-                    try:
-                        self.cleanup(resource)
-                    except Exception as e:
-                        logger.warning(
-                            f"Error cleaning up excess resource in pool '{self.name}': {e}"
-                        )
+    def warm_up(self) -> int:
+        """
+        Create idle resources until the pool holds ``min_size``.
+
+        Returns:
+            Number of resources created
+        """
+        created = 0
+        while True:
+            with self._lock:
+                self._used = True
+                if self._size >= self.min_size:
+                    return created
+                self._size += 1
+            try:
+                resource = self._create()
+            except Exception:
+                self._free_slot()
+                raise
+            with self._lock:
+                if not self._handoff(resource):
+                    self._idle.append((resource, time.monotonic()))
+            created += 1
 
     def cleanup_idle(self) -> int:
         """
-        Clean up idle resources that have exceeded timeout.
+        Run health checks and evict resources idle longer than ``timeout``.
+
+        Idle resources are kept down to ``min_size``; after eviction the pool
+        is topped back up to ``min_size`` once it has been used.
 
         Returns:
             Number of resources cleaned up
         """
+        now = time.monotonic()
         with self._lock:
-            current_time = time.time()
-            cleaned = 0
-            new_pool = []
-
-            for resource, timestamp in self._pool:
-                # Calculate total resources if we keep this one
-                total_if_kept = len(new_pool) + 1 + len(self._active_resources)
-
-                # Keep resource if it hasn't timed out OR if removing it would go below min_size
-                should_keep = (
-                    current_time - timestamp < self.timeout or
-                    total_if_kept <= self.min_size
-                )
+            candidates = list(self._idle)
+            self._idle.clear()
+
+        healthy, cleaned = [], 0
+        for resource, last_used in candidates:
+            if self.health_check is not None and not self._is_healthy(resource):
+                self._destroy(resource)
+                cleaned += 1
+            else:
+                healthy.append((resource, last_used))
 
-                if should_keep:
-                    # Keep resource
-                    new_pool.append((resource, timestamp))
-                else:
-                    # Clean up resource
-                    if self.cleanup:
-                        try:
-                            self.cleanup(resource)
-                            cleaned += 1
-                        except Exception as e:
-                            logger.warning(
-                                f"Error cleaning up idle resource in pool '{self.name}': {e}"
-                            )
-
-            self._pool = new_pool
-            return cleaned
+        with self._lock:
+            # Resources released during the checks are newer; keep them on the
+            # right. Acquirers that queued up meanwhile are served first.
+            for resource, last_used in reversed(healthy):
+                if not self._handoff(resource):
+                    self._idle.appendleft((resource, last_used))
+            while (
+                self._idle
+                and now - self._idle[0][1] >= self.timeout
+                and self._size > self.min_size
+            ):
+                resource, _ = self._idle.popleft()
+                self._destroy(resource)
+                cleaned += 1
+            needs_warm_up = self._used and self._size < self.min_size
+
+        if needs_warm_up:
+            try:
+                self.warm_up()
+            except Exception as e:
+                logger.warning(f"Could not refill pool '{self.name}': {e}")
+        return cleaned
+
+    def close(self) -> None:
+        """Clean up all idle resources; in-use ones are cleaned when released."""
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+            self.min_size = 0
+            self._closed = True
+        for resource, _ in idle:
+            self._destroy(resource)
 
     def get_stats(self) -> dict[str, Any]:
         """
         Get pool statistics.
 
         Returns:
-            Dictionary with pool statistics
+            Dictionary with pool statistics, including acquire wait times
         """
         with self._lock:
             return {
                 "name": self.name,
-                "available": len(self._pool),
+                "available": len(self._idle),
                 "active": len(self._active_resources),
+                "size": self._size,
+                "waiting": len(self._waiters),
                 "total_created": self._created_count,
+                "destroyed": self._destroyed_count,
                 "acquired": self._acquired_count,
                 "released": self._released_count,
+                "timeouts": self._timeout_count,
                 "min_size": self.min_size,
                 "max_size": self.max_size,
+                "wait_time": self.metrics.get_timer_stats("acquire_wait"),
             }
 
+    def _take(self) -> Any:
+        """Return an idle resource, ``_CREATE`` for a reserved slot, or None."""
+        self._used = True
+        if self._idle:
+            return self._idle.pop()[0]
+        if self._size < self.max_size:
+            self._size += 1
+            return _CREATE
+        return None
+
+    def _checkout(self, item: Any, started: float) -> T:
+        """Turn a taken item into an active resource and record the wait."""
+        if item is _CREATE:
+            try:
+                item = self._create()
+            except Exception:
+                self._free_slot()
+                raise
+        with self._lock:
+            self._active_resources.add(id(item))
+            self._acquired_count += 1
+        self.metrics.record_time("acquire_wait", time.monotonic() - started)
+        return item
+
+    def _handoff(self, item: Any) -> bool:
+        """Give a resource or reserved slot to the oldest waiter (lock held)."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            waiter.item = item
+            if waiter.event is not None:
+                waiter.event.set()
+                return True
+            if not waiter.loop.is_closed():
+                waiter.loop.call_soon_threadsafe(_resolve, waiter.future, item)
+                return True
+        return False
+
+    def _return(self, resource: T) -> None:
+        """Pass a released resource to a waiter or back to idle (lock held).
+
+        After ``close`` the resource is cleaned up instead of kept idle.
+        """
+        if self._handoff(resource):
+            return
+        if self._closed:
+            self._destroy(resource)
+        else:
+            self._idle.append((resource, time.monotonic()))
+
+    def _release_checkout(self, checkout: asyncio.Future) -> None:
+        """Release a resource checked out for an acquirer that was cancelled."""
+        if not checkout.cancelled() and checkout.exception() is None:
+            self.release(checkout.result())
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """Withdraw a cancelled waiter, returning anything already handed to it."""
+        with self._lock:
+            item = waiter.item
+            if item is None:
+                self._waiters.remove(waiter)
+            elif item is _CREATE:
+                self._free_slot()
+            else:
+                self._return(item)
+
+    def _free_slot(self) -> None:
+        """Give up a slot, passing it to a waiter if there is one."""
+        with self._lock:
+            if not self._handoff(_CREATE):
+                self._size -= 1
+
+    def _create(self) -> T:
+        resource = self.factory()
+        with self._lock:
+            self._created_count += 1
+        logger.debug(f"Created new resource for pool '{self.name}' (size: {self._size})")
+        return resource
+
+    def _destroy(self, resource: T, counted: bool = True) -> None:
+        """Clean up a resource; ``counted`` resources free their pool slot."""
+        if self.cleanup:
+            try:
+                self.cleanup(resource)
+            except Exception as e:
+                logger.warning(f"Error cleaning up resource in pool '{self.name}': {e}")
+        if counted:
+            with self._lock:
+                self._destroyed_count += 1
+            self._free_slot()
+
+    def _is_healthy(self, resource: T) -> bool:
+        try:
+            return bool(self.health_check(resource))
+        except Exception as e:
+            logger.warning(f"Health check failed in pool '{self.name}': {e}")
+            return False
+
+    def _timed_out(self, waited: float) -> None:
+        """Record an acquire timeout and raise (lock held)."""
+        self._timeout_count += 1
+        self.metrics.increment("timeouts")
+        raise PoolExhaustedError(
+            f"No resource available in pool '{self.name}' after {waited:.1f}s "
+            f"({self.max_size} in use)"
+        )
+
+
+def _resolve(future: asyncio.Future, item: Any) -> None:
+    """Complete an async waiter on its loop."""
+    if not future.done():
+        future.set_result(item)
+
 
 class ResourceManager:
     """
@@ -211,6 +457,7 @@ class ResourceManager:
         self._lock = threading.RLock()
         self._cleanup_thread: threading.Thread | None = None
         self._running = False
+        self._stop_cleanup = threading.Event()
         logger.info("ResourceManager initialized")
 
     def create_pool(
@@ -221,6 +468,8 @@ class ResourceManager:
         min_size: int = 5,
         max_size: int = 50,
         timeout: float = 60.0,
+        acquire_timeout: float = 30.0,
+        health_check: Callable[[T], bool] | None = None,
     ) -> ResourcePool[T]:
         """
         Create a new resource pool.
@@ -232,6 +481,8 @@ class ResourceManager:
             min_size: Minimum pool size
             max_size: Maximum pool size
             timeout: Resource timeout in seconds
+            acquire_timeout: Seconds acquirers wait for a free resource
+            health_check: Optional predicate run on idle resources
 
         Returns:
             Resource pool instance
@@ -248,6 +499,8 @@ class ResourceManager:
                 min_size=min_size,
                 max_size=max_size,
                 timeout=timeout,
+                acquire_timeout=acquire_timeout,
+                health_check=health_check,
             )
             self.pools[name] = pool
             return pool
@@ -266,7 +519,7 @@ class ResourceManager:
 
     def start_cleanup_thread(self, interval: float = 30.0) -> None:
         """
-        Start background thread to clean up idle resources.
+        Start background thread for health checks and idle eviction.
 
         Args:
             interval: Cleanup interval in seconds
@@ -276,10 +529,10 @@ class ResourceManager:
             return
 
         self._running = True
+        self._stop_cleanup.clear()
 
         def cleanup_worker():
-            while self._running:
-                time.sleep(interval)
+            while not self._stop_cleanup.wait(interval):
                 self.cleanup_all_pools()
 
         self._cleanup_thread = threading.Thread(
@@ -291,6 +544,7 @@ class ResourceManager:
     def stop_cleanup_thread(self) -> None:
         """Stop background cleanup thread."""
         self._running = False
+        self._stop_cleanup.set()
         if self._cleanup_thread:
             self._cleanup_thread.join(timeout=5.0)
             self._cleanup_thread = None
@@ -330,4 +584,5 @@ class ResourceManager:
         """Shutdown resource manager and cleanup all resources."""
         logger.info("Shutting down ResourceManager")
         self.stop_cleanup_thread()
-        # Additional cleanup can be added here
+        for pool in self.pools.values():
+            pool.close()
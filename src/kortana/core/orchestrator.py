@@ -1,4 +1,5 @@
 import json
+import logging
 import time
 from pathlib import Path
 from typing import Any
@@ -13,6 +14,9 @@ from kortana.modules.ethical_discernment_module.evaluators import (
     UncertaintyHandler,
 )
 from kortana.modules.memory_core.services import MemoryCoreService
+from kortana.utils.structured_logging import log_context
+
+logger = logging.getLogger(__name__)
 
 
 class KorOrchestrator:
@@ -70,6 +74,10 @@ class KorOrchestrator:
         """
         The main thinking loop for Kor'tana, now with performance tracking and enhanced metadata.
         """
+        with log_context(model=self.default_model_id):
+            return await self._process_query(query)
+
+    async def _process_query(self, query: str) -> dict[str, Any]:
         # Track overall performance
         process_start = time.time()
         performance_metrics = {}
@@ -83,16 +91,15 @@ class KorOrchestrator:
         prompt_for_llm = prompts.build_core_query_prompt(query, relevant_memories)
 
         # 3. Get the appropriate LLM client and call it
-        print(
-            f"--- Sending Prompt to LLM ---\n{prompt_for_llm}\n-------------------------------"
-        )  # Log the prompt
+        # Prompts and responses are large; lazy args keep them free unless DEBUG is on
+        logger.debug("Sending prompt to LLM:\n%s", prompt_for_llm)
 
         llm_client = self.llm_factory.get_client(self.default_model_id)
         if not llm_client:
             error_message = (
                 f"Failed to initialize LLM client for model {self.default_model_id}"
             )
-            print(f"--- LLM Client Error ---\n{error_message}")
+            logger.error("LLM client error: %s", error_message)
             return {
                 "original_query": query,
                 "prompt_sent_to_llm": prompt_for_llm,
@@ -120,7 +127,7 @@ class KorOrchestrator:
         # Handle case where LLM call fails
         if not llm_response_content:
             error_message = llm_result.get("error", "Unknown error from LLM service.")
-            print(f"--- LLM Service Error ---\n{error_message}")  # Log the error
+            logger.error("LLM service error: %s", error_message)
             return {
                 "original_query": query,
                 "prompt_sent_to_llm": prompt_for_llm,
@@ -130,9 +137,11 @@ class KorOrchestrator:
                 "performance_metrics": performance_metrics,
             }
 
-        print(
-            f"--- Raw LLM Response ---\nContent: {llm_response_content}\nMetadata: {llm_response_metadata}"
-        )  # Log the raw response
+        logger.debug(
+            "Raw LLM response:\n%s\nMetadata: %s",
+            llm_response_content,
+            llm_response_metadata,
+        )
 
         # 4. Evaluate the LLM response for ethical alignment
         eval_start = time.time()
@@ -142,7 +151,7 @@ class KorOrchestrator:
             original_query_context=query,
         )
         performance_metrics["ethical_eval_ms"] = int((time.time() - eval_start) * 1000)
-        print(f"--- Ethical Evaluation ---\n{evaluation}")  # Log evaluation
+        logger.debug("Ethical evaluation: %s", evaluation)
 
         # 5. Form Kor'tana's final response
         uncertainty_start = time.time()
@@ -152,12 +161,14 @@ class KorOrchestrator:
             evaluation_results=evaluation,
         )
         performance_metrics["uncertainty_handling_ms"] = int((time.time() - uncertainty_start) * 1000)
-        print(
-            f"--- Final Kor'tana Response ---\n{final_response}"
-        )  # Log final response
+        logger.debug("Final Kor'tana response:\n%s", final_response)
 
         # Calculate total time
         performance_metrics["total_ms"] = int((time.time() - process_start) * 1000)
+        logger.info(
+            "Query processed",
+            extra={"latency_ms": performance_metrics["total_ms"], **performance_metrics},
+        )
 
         # Return the structured response for debugging and visibility with enhanced metadata
         return {
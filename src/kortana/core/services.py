@@ -8,17 +8,22 @@ All services are lazily initialized to avoid import-time circular dependencies.
 """
 
 import logging
+import threading
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any
 
-# Import only LOW-LEVEL dependencies (no brain.py, goal_engine.py, etc.)
-from apscheduler.schedulers.background import BackgroundScheduler
+# Heavy third-party dependencies (apscheduler, openai, ...) are imported inside
+# the factories so importing this module stays cheap.
 
 logger = logging.getLogger(__name__)
 
 # Global service registry
 _services: dict[str, Any] = {}
+_factories: dict[str, Callable[[], Any]] = {}
 _config: Any | None = None
+# Re-entrant: factories may resolve the services they depend on
+_services_lock = threading.RLock()
 
 
 def initialize_services(config) -> None:
@@ -45,7 +50,15 @@ def get_service(service_name: str, factory_func=None, *args, **kwargs) -> Any:
     Returns:
         The requested service instance
     """
-    if service_name not in _services:
+    service = _services.get(service_name)
+    if service is not None or service_name in _services:
+        return service
+
+    with _services_lock:
+        if service_name in _services:
+            return _services[service_name]
+        if factory_func is None:
+            factory_func = _factories.get(service_name)
         if factory_func is None:
             raise RuntimeError(
                 f"Service '{service_name}' not initialized and no factory provided"
@@ -62,6 +75,62 @@ def get_service(service_name: str, factory_func=None, *args, **kwargs) -> Any:
     return _services[service_name]
 
 
+def register_service(service_name: str, factory_func: Callable[[], Any]) -> None:
+    """
+    Register a factory so the service can be built by name on first use.
+
+    Args:
+        service_name: Name of the service
+        factory_func: Zero-argument function creating the service
+    """
+    _factories[service_name] = factory_func
+
+
+def warm_up_services(service_names: Iterable[str] | None = None) -> dict[str, bool]:
+    """
+    Construct registered services ahead of the first request.
+
+    Args:
+        service_names: Services to build (default: every registered service)
+
+    Returns:
+        Mapping of service name to whether it is now available
+    """
+    results = {}
+    for name in list(service_names if service_names is not None else _factories):
+        try:
+            get_service(name)
+            results[name] = True
+        except RuntimeError as e:
+            logger.warning(f"Warm-up of service '{name}' failed: {e}")
+            results[name] = False
+    return results
+
+
+class LazyService:
+    """
+    Module-level handle for a service that is built on first attribute access.
+
+    Lets modules keep exposing a singleton (``from x import service``) without
+    paying for its construction, or its imports, until it is actually used.
+    """
+
+    def __init__(self, service_name: str, factory_func: Callable[[], Any]):
+        self._service_name = service_name
+        register_service(service_name, factory_func)
+
+    def resolve(self) -> Any:
+        """Return the underlying service, constructing it if needed."""
+        return get_service(self._service_name)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        state = "ready" if self._service_name in _services else "deferred"
+        return f"<LazyService {self._service_name!r} ({state})>"
+
+
 def _create_llm_client_factory():
     """Factory function for LLM client factory."""
     from kortana.llm_clients.factory import LLMClientFactory
@@ -119,6 +188,8 @@ def _create_covenant_enforcer():
 
 def _create_scheduler():
     """Factory function for Background Scheduler."""
+    from apscheduler.schedulers.background import BackgroundScheduler
+
     return BackgroundScheduler()
 
 
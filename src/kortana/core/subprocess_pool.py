@@ -0,0 +1,473 @@
+"""
+Bounded Subprocess Pool for the Execution Engine
+
+Runs shell commands with:
+- A global cap on concurrently running commands, and a per-agent cap so one
+  agent cannot take every slot; queued commands start in arrival order as
+  soon as both caps allow
+- Streamed stdout/stderr, of which only the first and last
+  ``max_output_bytes / 2`` bytes are kept per stream
+- Each command in its own process group (session), so a timeout or
+  cancellation terminates the whole tree: SIGTERM, then SIGKILL after
+  ``kill_grace`` seconds
+- Per-command wall time, queue time and CPU time of the command and every
+  descendant it waited for (from ``wait4``, where available)
+
+Pipes are drained through the event loop on POSIX. The Windows Proactor loop
+cannot read the non-overlapped pipes ``subprocess.Popen`` creates, so there
+each pipe is read by its own thread instead.
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .optimization.performance_metrics import PerformanceMetrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT = 4
+DEFAULT_MAX_PER_AGENT = 2
+DEFAULT_MAX_OUTPUT_BYTES = 1024 * 1024
+DEFAULT_KILL_GRACE = 5.0
+
+_READ_CHUNK = 64 * 1024
+# Seconds to keep reading after the command ends or is killed; a detached
+# descendant may hold the pipes open indefinitely
+_READER_GRACE = 1.0
+_THREADED_PIPES = os.name == "nt"
+
+
+class CappedOutput:
+    """Keeps the head and tail of a byte stream, counting what was dropped."""
+
+    def __init__(self, limit: int):
+        self.head_limit = limit // 2
+        self.tail_limit = limit - self.head_limit
+        self.head = bytearray()
+        self.tail = bytearray()
+        self.total = 0
+
+    @property
+    def truncated(self) -> bool:
+        """Whether any bytes were dropped."""
+        return self.total > len(self.head) + len(self.tail)
+
+    def feed(self, chunk: bytes) -> None:
+        """Append a chunk, dropping bytes between the head and the tail."""
+        self.total += len(chunk)
+        room = self.head_limit - len(self.head)
+        if room > 0:
+            self.head += chunk[:room]
+            chunk = chunk[room:]
+        if chunk:
+            self.tail += chunk
+            excess = len(self.tail) - self.tail_limit
+            if excess > 0:
+                del self.tail[:excess]
+
+    def text(self) -> str:
+        """Decode the kept output, marking where bytes were dropped."""
+        if not self.truncated:
+            return (bytes(self.head) + bytes(self.tail)).decode(errors="replace")
+        dropped = self.total - len(self.head) - len(self.tail)
+        return (
+            self.head.decode(errors="replace")
+            + f"\n... [{dropped} bytes truncated] ...\n"
+            + self.tail.decode(errors="replace")
+        )
+
+
+@dataclass
+class ProcessMetrics:
+    """Resource use of one command."""
+
+    wall_time: float = 0.0
+    queue_time: float = 0.0
+    cpu_user: float | None = None
+    cpu_system: float | None = None
+    max_rss_kb: int | None = None
+    stdout_bytes: int = 0
+    stderr_bytes: int = 0
+
+    @property
+    def cpu_time(self) -> float | None:
+        """User plus system CPU seconds, if known."""
+        if self.cpu_user is None or self.cpu_system is None:
+            return None
+        return self.cpu_user + self.cpu_system
+
+
+@dataclass
+class ProcessOutcome:
+    """Result of a command run through the pool."""
+
+    return_code: int | None
+    stdout: str
+    stderr: str
+    timed_out: bool = False
+    stdout_truncated: bool = False
+    stderr_truncated: bool = False
+    metrics: ProcessMetrics = field(default_factory=ProcessMetrics)
+
+
+class _Waiter:
+    """A queued command waiting for a global and a per-agent slot."""
+
+    __slots__ = ("agent_id", "loop", "future")
+
+    def __init__(self, agent_id: str, loop: asyncio.AbstractEventLoop):
+        self.agent_id = agent_id
+        self.loop = loop
+        self.future: asyncio.Future = loop.create_future()
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(True)
+
+
+def _in_thread(func: Callable[..., Any], *args: Any) -> asyncio.Future:
+    """Run a blocking call in a dedicated daemon thread and return its future.
+
+    Used instead of ``asyncio.to_thread`` for calls that block for as long as
+    a command runs, which would otherwise tie up the shared default executor.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(result: Any, error: BaseException | None) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def target() -> None:
+        try:
+            result, error = func(*args), None
+        except BaseException as e:
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(settle, result, error)
+        except RuntimeError:
+            pass  # Loop closed; nobody is waiting
+
+    threading.Thread(target=target, daemon=True).start()
+    return future
+
+
+def _read_pipe(pipe: Any, emit: Callable[[bytes], None]) -> None:
+    """Read a pipe to EOF, passing each chunk to ``emit``."""
+    with pipe:
+        while chunk := pipe.read1(_READ_CHUNK):
+            emit(chunk)
+
+
+def _reap(process: subprocess.Popen) -> Any:
+    """Wait for ``process`` and return its resource usage, if the OS reports it."""
+    if hasattr(os, "wait4"):
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        return usage
+    process.wait()
+    return None
+
+
+class SubprocessPool:
+    """Runs shell commands under global and per-agent concurrency caps."""
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        max_per_agent: int = DEFAULT_MAX_PER_AGENT,
+        max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+        kill_grace: float = DEFAULT_KILL_GRACE,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_concurrent: Commands allowed to run at once overall
+            max_per_agent: Commands allowed to run at once per agent
+            max_output_bytes: Bytes kept per stream of each command
+            kill_grace: Seconds between SIGTERM and SIGKILL on timeout
+        """
+        if max_concurrent < 1 or max_per_agent < 1:
+            raise ValueError("Concurrency caps must be at least 1")
+        self.max_concurrent = max_concurrent
+        self.max_per_agent = max_per_agent
+        self.max_output_bytes = max_output_bytes
+        self.kill_grace = kill_grace
+        self._lock = threading.Lock()
+        self._running = 0
+        self._running_by_agent: dict[str, int] = {}
+        self._waiters: deque[_Waiter] = deque()
+        self.metrics = PerformanceMetrics("subprocess_pool")
+
+    async def run(
+        self,
+        command: str,
+        cwd: str | None = None,
+        timeout: float | None = None,
+        agent_id: str = "default",
+        env: dict[str, str] | None = None,
+        on_output: Callable[[str, bytes], None] | None = None,
+    ) -> ProcessOutcome:
+        """
+        Run a shell command once a slot is free.
+
+        Args:
+            command: Shell command line
+            cwd: Working directory
+            timeout: Seconds the command may run, not counting time queued
+            agent_id: Agent the per-agent cap is applied to
+            env: Environment for the command (default: inherited)
+            on_output: Called with ``("stdout" | "stderr", chunk)`` as output
+                arrives, before any truncation
+
+        Returns:
+            The command's outcome; ``return_code`` is None if it timed out
+        """
+        queued = time.monotonic()
+        await self._acquire(agent_id)
+        try:
+            started = time.monotonic()
+            outcome = await self._execute(command, cwd, timeout, env, on_output)
+            outcome.metrics.queue_time = started - queued
+            outcome.metrics.wall_time = time.monotonic() - started
+        finally:
+            self._release(agent_id)
+
+        self._record(outcome)
+        return outcome
+
+    def stats(self) -> dict[str, Any]:
+        """Return slot usage and per-command resource statistics."""
+        with self._lock:
+            return {
+                "running": self._running,
+                "queued": len(self._waiters),
+                "running_by_agent": dict(self._running_by_agent),
+                "max_concurrent": self.max_concurrent,
+                "max_per_agent": self.max_per_agent,
+                "completed": self.metrics.get_counter("completed"),
+                "timed_out": self.metrics.get_counter("timed_out"),
+                "truncated_outputs": self.metrics.get_counter("truncated_outputs"),
+                "wall_time": self.metrics.get_timer_stats("wall_time"),
+                "cpu_time": self.metrics.get_timer_stats("cpu_time"),
+                "queue_time": self.metrics.get_timer_stats("queue_time"),
+            }
+
+    async def _acquire(self, agent_id: str) -> None:
+        """Wait for a global and a per-agent slot."""
+        with self._lock:
+            if not self._waiters and self._has_slot(agent_id):
+                self._take(agent_id)
+                return
+            waiter = _Waiter(agent_id, asyncio.get_running_loop())
+            self._waiters.append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            # The slot was granted as we were cancelled; pass it on
+            self._release(agent_id)
+            raise
+
+    def _has_slot(self, agent_id: str) -> bool:
+        return (
+            self._running < self.max_concurrent
+            and self._running_by_agent.get(agent_id, 0) < self.max_per_agent
+        )
+
+    def _take(self, agent_id: str) -> None:
+        self._running += 1
+        self._running_by_agent[agent_id] = self._running_by_agent.get(agent_id, 0) + 1
+
+    def _release(self, agent_id: str) -> None:
+        """Free a slot and start the oldest waiters the caps now allow."""
+        with self._lock:
+            self._running -= 1
+            remaining = self._running_by_agent[agent_id] - 1
+            if remaining:
+                self._running_by_agent[agent_id] = remaining
+            else:
+                del self._running_by_agent[agent_id]
+
+            # Waiters of agents at their cap are skipped, not blocking others
+            for waiter in list(self._waiters):
+                if self._running >= self.max_concurrent:
+                    break
+                if not self._has_slot(waiter.agent_id):
+                    continue
+                self._waiters.remove(waiter)
+                if waiter.loop.is_closed():
+                    continue
+                self._take(waiter.agent_id)
+                waiter.loop.call_soon_threadsafe(_resolve, waiter.future)
+
+    async def _execute(
+        self,
+        command: str,
+        cwd: str | None,
+        timeout: float | None,
+        env: dict[str, str] | None,
+        on_output: Callable[[str, bytes], None] | None,
+    ) -> ProcessOutcome:
+        """Start the command in its own session and collect its output and usage."""
+        # Reaped with wait4 instead of asyncio's child watcher, which is what
+        # makes the CPU time of the command's whole tree available
+        process = subprocess.Popen(
+            command,
+            shell=True,
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        )
+        stdout = CappedOutput(self.max_output_bytes)
+        stderr = CappedOutput(self.max_output_bytes)
+        readers = [
+            asyncio.ensure_future(
+                self._drain(process.stdout, stdout, "stdout", on_output)
+            ),
+            asyncio.ensure_future(
+                self._drain(process.stderr, stderr, "stderr", on_output)
+            ),
+        ]
+        reaper = _in_thread(_reap, process)
+
+        try:
+            _, pending = await asyncio.wait([reaper, *readers], timeout=timeout)
+            timed_out = bool(pending)
+            if timed_out:
+                await self._terminate(process, reaper)
+        except asyncio.CancelledError:
+            await self._terminate(process, reaper)
+            raise
+        finally:
+            # Descendants killed with the group close the pipes; one that left
+            # the group (e.g. via setsid) may not, so stop waiting for it
+            _, stuck = await asyncio.wait(readers, timeout=_READER_GRACE)
+            for reader in stuck:
+                reader.cancel()
+            if stuck:
+                await asyncio.wait(stuck)
+
+        usage = None
+        if reaper.done() and not reaper.cancelled() and reaper.exception() is None:
+            usage = reaper.result()
+        metrics = ProcessMetrics(stdout_bytes=stdout.total, stderr_bytes=stderr.total)
+        if usage is not None:
+            metrics.cpu_user = usage.ru_utime
+            metrics.cpu_system = usage.ru_stime
+            metrics.max_rss_kb = usage.ru_maxrss
+        return ProcessOutcome(
+            return_code=None if timed_out else process.returncode,
+            stdout=stdout.text(),
+            stderr=stderr.text(),
+            timed_out=timed_out,
+            stdout_truncated=stdout.truncated,
+            stderr_truncated=stderr.truncated,
+            metrics=metrics,
+        )
+
+    async def _drain(
+        self,
+        pipe: Any,
+        output: CappedOutput,
+        name: str,
+        on_output: Callable[[str, bytes], None] | None,
+    ) -> None:
+        """Read a pipe to EOF into ``output`` without blocking the loop."""
+
+        def consume(chunk: bytes) -> None:
+            output.feed(chunk)
+            if on_output is not None:
+                try:
+                    on_output(name, chunk)
+                except Exception as e:
+                    logger.error(f"Output callback failed: {e}")
+
+        loop = asyncio.get_running_loop()
+        if _THREADED_PIPES:
+            # Chunks are handed to the loop in order, ahead of the thread's result
+            await _in_thread(
+                _read_pipe,
+                pipe,
+                lambda chunk: loop.call_soon_threadsafe(consume, chunk),
+            )
+            return
+
+        reader = asyncio.StreamReader(limit=_READ_CHUNK)
+        transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), pipe
+        )
+        try:
+            while chunk := await reader.read(_READ_CHUNK):
+                consume(chunk)
+        finally:
+            transport.close()
+
+    async def _terminate(
+        self, process: subprocess.Popen, reaper: asyncio.Future
+    ) -> None:
+        """Stop the command's process group: SIGTERM, then SIGKILL after the grace period."""
+        self._signal_group(process, signal.SIGTERM)
+        try:
+            await asyncio.wait_for(asyncio.shield(reaper), self.kill_grace)
+        except TimeoutError:
+            pass
+        finally:
+            # The shell may be gone while its children ignore SIGTERM
+            self._signal_group(process, getattr(signal, "SIGKILL", signal.SIGTERM))
+
+    @staticmethod
+    def _signal_group(process: subprocess.Popen, sig: int) -> None:
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(process.pid, sig)
+            elif process.returncode is None:
+                process.send_signal(sig)
+        except (ProcessLookupError, PermissionError):
+            pass  # Already exited
+
+    def _record(self, outcome: ProcessOutcome) -> None:
+        metrics = outcome.metrics
+        self.metrics.increment("completed")
+        if outcome.timed_out:
+            self.metrics.increment("timed_out")
+        if outcome.stdout_truncated or outcome.stderr_truncated:
+            self.metrics.increment("truncated_outputs")
+        self.metrics.record_time("wall_time", metrics.wall_time)
+        self.metrics.record_time("queue_time", metrics.queue_time)
+        if metrics.cpu_time is not None:
+            self.metrics.record_time("cpu_time", metrics.cpu_time)
+
+
+_default_pool: SubprocessPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_subprocess_pool() -> SubprocessPool:
+    """Return the process-wide pool shared by execution engines."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = SubprocessPool()
+        return _default_pool
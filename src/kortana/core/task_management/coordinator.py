@@ -1,60 +1,122 @@
 """
 Task Coordinator for Autonomous Operations
 Manages scheduling and execution of autonomous tasks.
+
+Scheduling is event-driven: each task keeps a count of unfinished
+dependencies and is released to a per-operation-type ready heap the moment
+its last parent completes. Failures and cancellations propagate to pending
+descendants by walking the dependents graph, so no work is spent rescanning
+tasks that cannot run yet.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import time
-from datetime import datetime, timedelta
+from collections import deque
+from datetime import datetime
 
 from ..execution_engine import ExecutionEngine, OperationResult
 from .models import Task, TaskResult, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+# Statuses a task can still leave without running
+_WAITING_STATUSES = (TaskStatus.PENDING, TaskStatus.SCHEDULED)
+
 
 class TaskCoordinator:
     """Coordinates execution of autonomous tasks"""
 
-    def __init__(self, execution_engine: ExecutionEngine):
+    def __init__(
+        self,
+        execution_engine: ExecutionEngine,
+        concurrency_limits: dict[str, int] | None = None,
+        default_concurrency: int = 4,
+        retry_delay: float = 5.0,
+    ):
+        """
+        Initialize the coordinator.
+
+        Args:
+            execution_engine: Engine used to run task operations
+            concurrency_limits: Maximum tasks running at once per operation
+                type (the task category value, e.g. ``"testing"``)
+            default_concurrency: Limit for operation types not listed
+            retry_delay: Seconds before a failed task is retried
+        """
         self.execution_engine = execution_engine
+        self.concurrency_limits = dict(concurrency_limits or {})
+        self.default_concurrency = default_concurrency
+        self.retry_delay = retry_delay
         self._tasks: dict[str, Task] = {}
         self._in_progress: set[str] = set()
-        self._schedules: dict[str, datetime] = {}
         self._task_locks: dict[str, asyncio.Lock] = {}
 
+        # Dependency graph: unfinished parent counts and parent -> children
+        self._unmet: dict[str, int] = {}
+        self._dependents: dict[str, set[str]] = {}
+
+        # Ready tasks per operation type, ordered by priority then arrival
+        self._ready: dict[str, list[tuple[int, int, str]]] = {}
+        self._running_by_type: dict[str, int] = {}
+        self._running: dict[str, asyncio.Task] = {}
+        self._retry_handles: dict[str, asyncio.TimerHandle] = {}
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+
     async def add_task(self, task: Task) -> str:
         """Add a new task to be executed."""
         self._tasks[task.id] = task
         self._task_locks[task.id] = asyncio.Lock()
 
-        # If task has dependencies, schedule after them
-        if task.dependencies:
-            await self._schedule_after_dependencies(task)
-        else:
-            self._schedules[task.id] = datetime.now()
+        unmet = 0
+        failed_parent = None
+        # Each parent is one edge, however often it is listed
+        for dep_id in dict.fromkeys(task.dependencies):
+            dep_task = self._tasks.get(dep_id)
+            if dep_task is not None and dep_task.status == TaskStatus.COMPLETED:
+                continue
+            if dep_task is not None and dep_task.status in (
+                TaskStatus.FAILED,
+                TaskStatus.CANCELLED,
+            ):
+                failed_parent = dep_id
+            # Unknown dependencies are waited on until they are added and finish
+            self._dependents.setdefault(dep_id, set()).add(task.id)
+            unmet += 1
+        self._unmet[task.id] = unmet
 
         logger.info(f"Added task {task.id} - {task.description}")
+        if failed_parent is not None:
+            self._cancel_descendants(failed_parent, [task.id])
+        elif unmet == 0 and task.status == TaskStatus.PENDING:
+            self._make_ready(task)
         return task.id
 
     async def cancel_task(self, task_id: str) -> bool:
-        """Cancel a pending or in-progress task."""
+        """
+        Cancel a pending or in-progress task.
+
+        Pending descendants of the task are cancelled too, in time
+        proportional to the size of the cancelled subtree.
+        """
         if task_id not in self._tasks:
             return False
 
         task = self._tasks[task_id]
-        async with self._task_locks[task_id]:
-            if task.status in (
-                TaskStatus.PENDING,
-                TaskStatus.SCHEDULED,
-                TaskStatus.IN_PROGRESS,
-            ):
-                task.status = TaskStatus.CANCELLED
-                if task_id in self._in_progress:
-                    self._in_progress.remove(task_id)
-                return True
-        return False
+        if task.status not in (*_WAITING_STATUSES, TaskStatus.IN_PROGRESS):
+            return False
+
+        task.status = TaskStatus.CANCELLED
+        self._forget_pending(task_id)
+        running = self._running.get(task_id)
+        if running is not None and running is not asyncio.current_task():
+            running.cancel()
+        self._in_progress.discard(task_id)
+        self._cancel_descendants(task_id)
+        return True
 
     async def get_task_status(self, task_id: str) -> TaskStatus | None:
         """Get current status of a task."""
@@ -64,51 +126,136 @@ class TaskCoordinator:
         """Get the result of a completed task."""
         return self._tasks[task_id].result if task_id in self._tasks else None
 
-    async def _schedule_after_dependencies(self, task: Task) -> None:
-        """Schedule a task to run after its dependencies complete."""
-        max_dep_time = datetime.now()
-        for dep_id in task.dependencies:
-            if dep_id in self._schedules:
-                if self._schedules[dep_id] > max_dep_time:
-                    max_dep_time = self._schedules[dep_id]
-            else:
-                # If dependency not scheduled, schedule it ASAP
-                self._schedules[dep_id] = datetime.now()
-
-        # Schedule this task after latest dependency
-        self._schedules[task.id] = max_dep_time + timedelta(seconds=1)
-
-    async def execute_pending_tasks(self) -> None:
-        """Execute all pending tasks that are ready and don't have incomplete dependencies."""
-        while True:
-            ready_tasks = []
-            now = datetime.now()
-
-            # Find tasks ready for execution
-            for task_id, scheduled_time in self._schedules.items():
-                if scheduled_time <= now:
-                    task = self._tasks[task_id]
-                    if task.status == TaskStatus.PENDING:
-                        if self._are_dependencies_met(task):
-                            ready_tasks.append(task)
-
-            # Execute ready tasks in parallel
-            if ready_tasks:
-                await asyncio.gather(
-                    *[self._execute_task(task) for task in ready_tasks]
+    async def execute_pending_tasks(self, until_idle: bool = False) -> None:
+        """
+        Run tasks as their dependencies complete.
+
+        Ready tasks are started in priority order, up to the concurrency limit
+        of their operation type; the loop sleeps until a task is released or
+        finishes instead of polling.
+
+        Args:
+            until_idle: Return once nothing is running, ready or awaiting a
+                retry, instead of waiting for new tasks forever
+        """
+        try:
+            while True:
+                self._wakeup.clear()
+                self._dispatch_ready()
+                if until_idle and not (
+                    self._running or self._retry_handles or any(self._ready.values())
+                ):
+                    return
+                await self._wakeup.wait()
+        except asyncio.CancelledError:
+            # The dispatcher is being torn down; stop the work it started
+            for running in list(self._running.values()):
+                running.cancel()
+            raise
+
+    def _operation_type(self, task: Task) -> str:
+        """Return the key used for per-operation-type concurrency limits."""
+        return task.category.value
+
+    def _make_ready(self, task: Task) -> None:
+        """Queue a task whose dependencies are all complete."""
+        op_type = self._operation_type(task)
+        heapq.heappush(
+            self._ready.setdefault(op_type, []),
+            (-task.priority.value, next(self._sequence), task.id),
+        )
+        self._wakeup.set()
+
+    def _dispatch_ready(self) -> None:
+        """Start ready tasks while their operation type has free capacity."""
+        for op_type, heap in self._ready.items():
+            limit = self.concurrency_limits.get(op_type, self.default_concurrency)
+            while heap and self._running_by_type.get(op_type, 0) < limit:
+                _, _, task_id = heapq.heappop(heap)
+                task = self._tasks[task_id]
+                if task.status != TaskStatus.PENDING or task_id in self._running:
+                    continue
+                task.status = TaskStatus.SCHEDULED
+                self._running_by_type[op_type] = (
+                    self._running_by_type.get(op_type, 0) + 1
                 )
+                self._running[task_id] = asyncio.create_task(
+                    self._run_and_release(task, op_type),
+                    name=f"task-{task_id}",
+                )
+
+    async def _run_and_release(self, task: Task, op_type: str) -> None:
+        """Run a dispatched task, then free its slot and release dependents."""
+        try:
+            await self._execute_task(task)
+        except asyncio.CancelledError:
+            if task.status != TaskStatus.CANCELLED:
+                raise
+        finally:
+            self._running.pop(task.id, None)
+            self._running_by_type[op_type] -= 1
+            self._wakeup.set()
+
+        if task.status == TaskStatus.COMPLETED:
+            self._release_dependents(task.id)
+        elif task.status == TaskStatus.FAILED:
+            self._cancel_descendants(task.id)
+        elif task.status == TaskStatus.PENDING:
+            self._schedule_retry(task)
+
+    def _release_dependents(self, task_id: str) -> None:
+        """Decrement the unmet count of each child; queue any that reach zero."""
+        for child_id in self._dependents.pop(task_id, ()):
+            remaining = self._unmet.get(child_id, 0) - 1
+            self._unmet[child_id] = remaining
+            child = self._tasks.get(child_id)
+            if remaining == 0 and child is not None:
+                if child.status == TaskStatus.PENDING:
+                    self._make_ready(child)
+
+    def _cancel_descendants(self, task_id: str, roots: list[str] | None = None) -> None:
+        """
+        Cancel every pending task that transitively depends on ``task_id``.
+
+        Args:
+            task_id: The failed or cancelled task
+            roots: Children to start from; defaults to all dependents
+        """
+        reason = f"Dependency {task_id} did not complete"
+        queue = deque(self._dependents.get(task_id, ()) if roots is None else roots)
+        while queue:
+            child_id = queue.popleft()
+            child = self._tasks.get(child_id)
+            if child is None or child.status not in _WAITING_STATUSES:
+                continue
+            child.status = TaskStatus.CANCELLED
+            child.result = TaskResult(
+                success=False, completion_time=datetime.now(), error=reason
+            )
+            self._forget_pending(child_id)
+            logger.info(f"Cancelled task {child_id}: {reason}")
+            queue.extend(self._dependents.get(child_id, ()))
+
+    def _forget_pending(self, task_id: str) -> None:
+        """Drop a pending retry for a task that will no longer run."""
+        handle = self._retry_handles.pop(task_id, None)
+        if handle is not None:
+            handle.cancel()
+            self._wakeup.set()
+
+    def _schedule_retry(self, task: Task) -> None:
+        """Re-queue a failed task after ``retry_delay`` seconds."""
+
+        def retry() -> None:
+            self._retry_handles.pop(task.id, None)
+            if task.status == TaskStatus.PENDING:
+                self._make_ready(task)
             else:
-                await asyncio.sleep(1)  # Wait before checking again
-
-    def _are_dependencies_met(self, task: Task) -> bool:
-        """Check if all dependencies of a task are completed successfully."""
-        for dep_id in task.dependencies:
-            if dep_id not in self._tasks:
-                return False
-            dep_task = self._tasks[dep_id]
-            if dep_task.status != TaskStatus.COMPLETED:
-                return False
-        return True
+                self._wakeup.set()
+
+        self._retry_handles[task.id] = asyncio.get_running_loop().call_later(
+            self.retry_delay, retry
+        )
 
     async def _execute_task(self, task: Task) -> None:
         """Execute a single task."""
@@ -117,26 +264,28 @@ class TaskCoordinator:
 
         async with self._task_locks[task.id]:
             try:
+                if task.status == TaskStatus.CANCELLED:
+                    return
                 self._in_progress.add(task.id)
                 task.status = TaskStatus.IN_PROGRESS
                 task.started_at = datetime.now()
 
                 # Execute any subtasks first
                 for subtask in task.subtasks:
+                    self._task_locks.setdefault(subtask.id, asyncio.Lock())
                     await self._execute_task(subtask)
 
                 # Execute the main task operation
                 result = await self._run_task_operation(task)
 
+                if task.status == TaskStatus.CANCELLED:
+                    return
                 if not result.success and task.retries < task.max_retries:
-                    # Retry failed task
+                    # Retry failed task; the dispatcher re-queues it later
                     task.retries += 1
                     logger.warning(
                         f"Task {task.id} failed, retrying ({task.retries}/{task.max_retries})"
                     )
-                    self._schedules[task.id] = datetime.now() + timedelta(
-                        seconds=5
-                    )  # Retry after 5s
                     task.status = TaskStatus.PENDING
                 else:
                     # Record final task result
@@ -164,7 +313,7 @@ class TaskCoordinator:
                 )
 
             finally:
-                self._in_progress.remove(task.id)
+                self._in_progress.discard(task.id)
 
     async def _run_task_operation(self, task: Task) -> OperationResult:
         """Execute the actual task operation using the execution engine."""
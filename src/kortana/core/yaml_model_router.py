@@ -9,7 +9,7 @@ import logging
 from dataclasses import dataclass
 from pathlib import Path
 
-import yaml
+from kortana.config.registry import config_registry
 
 logger = logging.getLogger(__name__)
 
@@ -39,36 +39,45 @@ class YamlModelRouter:
         self.models: dict[str, ModelInfo] = {}
         self.default_routing: dict[str, str] = {}
         self._load_config()
+        config_registry.subscribe(self.config_path, self._on_config_changed)
 
     def _load_config(self):
         """Load the models.yaml configuration file."""
         try:
-            with open(self.config_path) as f:
-                config = yaml.safe_load(f)
-
-            # Parse models
-            for model_data in config.get("models", []):
-                model_info = ModelInfo(
-                    id=model_data["id"],
-                    name=model_data["name"],
-                    provider=model_data["provider"],
-                    context_window=model_data["context_window"],
-                    cost_tier=model_data["cost_tier"],
-                    cost_per_1m_input=model_data.get("cost_per_1m_input", 0.0),
-                    cost_per_1m_output=model_data.get("cost_per_1m_output", 0.0),
-                    capabilities=model_data.get("capabilities", []),
-                )
-                self.models[model_info.id] = model_info
-
-            # Parse default routing
-            self.default_routing = config.get("default_routing", {})
-
-            logger.info(f"Loaded {len(self.models)} models from {self.config_path}")
-
+            self._apply_config(config_registry.load_yaml(self.config_path))
         except Exception as e:
             logger.error(f"Failed to load model configuration: {e}")
             raise
 
+    def _on_config_changed(self, path: str, config: dict) -> None:
+        """Rebuild the model tables after models.yaml changes."""
+        try:
+            self._apply_config(config)
+        except Exception as e:
+            logger.error(f"Keeping previous model configuration: {e}")
+
+    def _apply_config(self, config: dict) -> None:
+        """Build the model and routing tables from parsed configuration."""
+        models: dict[str, ModelInfo] = {}
+        for model_data in config.get("models", []):
+            model_info = ModelInfo(
+                id=model_data["id"],
+                name=model_data["name"],
+                provider=model_data["provider"],
+                context_window=model_data["context_window"],
+                cost_tier=model_data["cost_tier"],
+                cost_per_1m_input=model_data.get("cost_per_1m_input", 0.0),
+                cost_per_1m_output=model_data.get("cost_per_1m_output", 0.0),
+                capabilities=model_data.get("capabilities", []),
+            )
+            models[model_info.id] = model_info
+
+        # Swap complete tables so readers never see a partial reload
+        self.models = models
+        self.default_routing = config.get("default_routing", {})
+
+        logger.info(f"Loaded {len(self.models)} models from {self.config_path}")
+
     def get_model(self, model_id: str) -> ModelInfo | None:
         """Get model information by ID."""
         return self.models.get(model_id)
@@ -1,11 +1,11 @@
 """Factory for creating LLM clients based on configuration."""
 
-import json
 import logging
 import os
 from pathlib import Path  # Added import
 from typing import Any
 
+from kortana.config.registry import config_registry
 from kortana.config.schema import KortanaConfig
 
 from .base_client import BaseLLMClient
@@ -95,12 +95,15 @@ class LLMClientFactory:
 
         if absolute_config_path.exists():
             try:
-                with open(absolute_config_path, encoding="utf-8") as f:
-                    self.models_config = json.load(f)
+                # Shared, read-only copy; replaced in place when the file changes
+                self.models_config = config_registry.load_json(absolute_config_path)
+                config_registry.subscribe(
+                    absolute_config_path, self._on_models_config_changed
+                )
                 logger.info(
                     f"Successfully loaded models configuration from {absolute_config_path}"
                 )
-            except json.JSONDecodeError as e:
+            except ValueError as e:
                 logger.error(f"Failed to decode JSON from {absolute_config_path}: {e}")
             except Exception as e:
                 logger.error(
@@ -111,6 +114,11 @@ class LLMClientFactory:
                 f"Models configuration file not found at {absolute_config_path}. Using empty config."
             )
 
+    def _on_models_config_changed(self, path: str, models_config: dict[str, Any]) -> None:
+        """Pick up an edited models configuration without restarting."""
+        self.models_config = models_config
+        logger.info(f"Models configuration reloaded from {path}")
+
     def get_client(self, model_id: str) -> BaseLLMClient | None:
         """Get an LLM client for a specific model ID.
 
@@ -300,8 +308,9 @@ class LLMClientFactory:
         """Validate that essential models are properly configured."""
         # Load models from the enhanced configuration
         try:
-            with open(settings.paths.models_config_file_path) as f:
-                models_config = json.load(f)
+            models_config = config_registry.load_json(
+                settings.paths.models_config_file_path
+            )
         except Exception as e:
             logger.error(f"Failed to load models configuration: {e}")
             return False  # Essential models for core functionality (prioritizing free models)
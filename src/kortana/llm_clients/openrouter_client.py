@@ -5,6 +5,7 @@ that enables Kor'tana to use a wide range of language models through a unified i
 """
 
 import logging
+import time
 from typing import Any
 
 import httpx
@@ -50,11 +51,13 @@ class OpenRouterClient(BaseLLMClient):
         api_messages.extend(messages)
         try:
             logger.info(
-                f"sending request to openrouter. model: {self.model_name}, messages: {len(messages)} — the fire listens."
+                "sending request to openrouter. model: %s, messages: %d — the fire listens.",
+                self.model_name,
+                len(messages),
             )
-            # Add debug log for incoming messages
+            # Lazy args: the message dump is only rendered if DEBUG is enabled
             logger.debug(
-                f"OpenRouter generate_response received messages: {api_messages}"
+                "OpenRouter generate_response received messages: %s", api_messages
             )
             api_params = {
                 "model": self.model_name,
@@ -67,10 +70,14 @@ class OpenRouterClient(BaseLLMClient):
             # temperature, max_tokens from ChatEngine)
             api_params.update(kwargs)
 
+            started = time.perf_counter()
             completion = self.client.chat.completions.create(**api_params)
-            logger.info("openrouter response received. the ember glows steady.")
-            # Add debug log for raw response
-            logger.debug(f"Raw response from OpenRouter API: {completion}")
+            latency_ms = round((time.perf_counter() - started) * 1000, 1)
+            logger.info(
+                "openrouter response received. the ember glows steady.",
+                extra={"model": self.model_name, "latency_ms": latency_ms},
+            )
+            logger.debug("Raw response from OpenRouter API: %s", completion)
 
             # Extract content, usage, and potential tool calls from the
             # response
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 from contextlib import asynccontextmanager
 from typing import Any
@@ -13,8 +14,9 @@ from pydantic import BaseModel, Field
 from kortana.api.routers import core_router, goal_router
 from kortana.api.routers.conversation_router import router as conversation_router
 from kortana.brain import ChatEngine
-from kortana.config import load_kortana_config
+from kortana.config import config_registry, load_kortana_config
 from kortana.core.scheduler import get_scheduler_status, start_scheduler, stop_scheduler
+from kortana.core.services import LazyService, warm_up_services
 from kortana.modules.content_generation.router import router as content_router
 from kortana.modules.emotional_intelligence.router import (
     router as emotional_intelligence_router,
@@ -31,32 +33,39 @@ from kortana.voice.stt_service import STTConfig, STTService
 from kortana.voice.tts_service import TTSConfig, TTSService
 
 settings = load_kortana_config()
-chat_engine = ChatEngine(settings=settings)
 voice_session_manager = VoiceSessionManager()
-voice_orchestrator = VoiceChatOrchestrator(
-    chat_engine=chat_engine,
-    stt_service=STTService(
-        STTConfig(
-            max_audio_bytes=settings.voice.max_audio_bytes,
-            min_audio_seconds=settings.voice.min_audio_seconds,
-            provider=settings.voice.stt_provider,
-            fallback_provider=settings.voice.stt_fallback_provider,
-            openai_model=settings.voice.openai_stt_model,
-        )
-    ),
-    tts_service=TTSService(
-        TTSConfig(
-            provider=settings.voice.tts_provider,
-            fallback_provider=settings.voice.tts_fallback_provider,
-            voice_name=settings.voice.tts_voice_name,
-            rate=settings.voice.tts_rate,
-            volume=settings.voice.tts_volume,
-        )
-    ),
-    session_manager=voice_session_manager,
-    session_idle_seconds=settings.voice.session_idle_seconds,
-    max_active_sessions=settings.voice.max_active_sessions,
-)
+
+
+def _create_voice_orchestrator() -> VoiceChatOrchestrator:
+    return VoiceChatOrchestrator(
+        chat_engine=chat_engine.resolve(),
+        stt_service=STTService(
+            STTConfig(
+                max_audio_bytes=settings.voice.max_audio_bytes,
+                min_audio_seconds=settings.voice.min_audio_seconds,
+                provider=settings.voice.stt_provider,
+                fallback_provider=settings.voice.stt_fallback_provider,
+                openai_model=settings.voice.openai_stt_model,
+            )
+        ),
+        tts_service=TTSService(
+            TTSConfig(
+                provider=settings.voice.tts_provider,
+                fallback_provider=settings.voice.tts_fallback_provider,
+                voice_name=settings.voice.tts_voice_name,
+                rate=settings.voice.tts_rate,
+                volume=settings.voice.tts_volume,
+            )
+        ),
+        session_manager=voice_session_manager,
+        session_idle_seconds=settings.voice.session_idle_seconds,
+        max_active_sessions=settings.voice.max_active_sessions,
+    )
+
+
+# Built on first request (or at startup when api.warm_up_on_startup is set)
+chat_engine = LazyService("api_chat_engine", lambda: ChatEngine(settings=settings))
+voice_orchestrator = LazyService("voice_orchestrator", _create_voice_orchestrator)
 
 
 class VoiceChatRequest(BaseModel):
@@ -115,7 +124,14 @@ async def lifespan(app: FastAPI):
     print("INFO:     Starting Kor'tana's autonomous scheduler...")
     start_scheduler()
     print("INFO:     Kor'tana's autonomous scheduler started.")
+    if settings.api.warm_up_on_startup:
+        warmed = await asyncio.to_thread(warm_up_services)
+        print(f"INFO:     Warmed up services: {warmed}")
+    reload_interval = settings.development.config_reload_interval
+    if settings.development.auto_reload and reload_interval > 0:
+        config_registry.start_watching(reload_interval)
     yield
+    config_registry.stop_watching()
     print("INFO:     Stopping Kor'tana's autonomous scheduler...")
     stop_scheduler()
     print("INFO:     Kor'tana's autonomous scheduler stopped.")
@@ -3,12 +3,37 @@ Kortana Memory Package
 Memory management, storage, and retrieval systems
 """
 
-from .memory import MemoryManager as MemoryManagerAlt
-from .memory_manager import MemoryManager
-from .memory_store import MemoryStore
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .local_vector_store import LocalVectorStore
+    from .memory import MemoryManager as MemoryManagerAlt
+    from .memory_manager import MemoryManager
+    from .memory_store import MemoryStore
+
+# Exports are resolved on first access so that importing a light submodule
+# (e.g. kortana.memory.log_index) does not pull in numpy, Pinecone and config.
+_LAZY_EXPORTS = {
+    "LocalVectorStore": (".local_vector_store", "LocalVectorStore"),
+    "MemoryManager": (".memory_manager", "MemoryManager"),
+    "MemoryStore": (".memory_store", "MemoryStore"),
+    "MemoryManagerAlt": (".memory", "MemoryManager"),
+}
 
 __all__ = [
+    "LocalVectorStore",
     "MemoryManager",
     "MemoryStore",
     "MemoryManagerAlt",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
@@ -0,0 +1,322 @@
+"""
+Memory Layer Cache
+
+Byte-budgeted LRU cache with per-entry TTL shared by the memory services.
+Entries are evicted least-recently-used first whenever the entry count or the
+estimated byte size exceeds its budget, expire after their TTL, and can be
+invalidated by exact key or key prefix when the underlying memories change.
+"""
+
+import hashlib
+import logging
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Hashable
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Keys used for cached search results; see vector_cache_key / text_cache_key
+SEARCH_PREFIX = "search"
+
+
+def estimate_size(value: Any, _seen: set[int] | None = None) -> int:
+    """
+    Estimate the memory held by a cached value in bytes.
+
+    Walks containers and plain objects' ``__dict__``; SQLAlchemy instance
+    state is skipped so ORM objects are not charged for their session.
+
+    Args:
+        value: The value to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    seen = _seen if _seen is not None else set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value, 64)
+    if isinstance(value, str | bytes | bytearray | int | float | bool | None):
+        return size
+    if isinstance(value, np.ndarray):
+        return size + (0 if value.base is None else value.nbytes)
+    if isinstance(value, dict):
+        return size + sum(
+            estimate_size(k, seen) + estimate_size(v, seen) for k, v in value.items()
+        )
+    if isinstance(value, list | tuple | set | frozenset):
+        return size + sum(estimate_size(item, seen) for item in value)
+    attributes = getattr(value, "__dict__", None)
+    if isinstance(attributes, dict):
+        return size + sum(
+            estimate_size(v, seen)
+            for k, v in attributes.items()
+            if not k.startswith("_sa_")
+        )
+    return size
+
+
+def vector_cache_key(vector: list[float], *extra: Hashable, precision: int = 6) -> str:
+    """
+    Build a compact cache key for a query vector.
+
+    The vector is rounded to ``precision`` decimals (so keys match the old
+    formatted-string keys), packed as float32 bytes and hashed, giving a
+    fixed-size key instead of a multi-kilobyte string.
+
+    Args:
+        vector: Query embedding
+        *extra: Further key components, e.g. ``top_k``
+        precision: Decimal places kept before hashing
+
+    Returns:
+        Cache key string
+    """
+    quantized = np.round(np.asarray(vector, dtype=np.float64), precision)
+    digest = hashlib.blake2b(quantized.astype(np.float32).tobytes(), digest_size=16)
+    suffix = ":".join(str(part) for part in extra)
+    return f"{SEARCH_PREFIX}:{digest.hexdigest()}:{suffix}"
+
+
+def text_cache_key(text: str, *extra: Hashable) -> str:
+    """Build a compact cache key for a text query."""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16)
+    suffix = ":".join(str(part) for part in extra)
+    return f"{SEARCH_PREFIX}:{digest.hexdigest()}:{suffix}"
+
+
+class MemoryCache:
+    """LRU cache for frequently accessed memories, bounded by count and bytes."""
+
+    def __init__(
+        self,
+        max_size: int = 100,
+        max_bytes: int | None = 32 * 1024 * 1024,
+        ttl_seconds: float | None = 300,
+    ):
+        """Initialize the memory cache.
+
+        Args:
+            max_size: Maximum number of items to cache
+            max_bytes: Maximum estimated size of cached values (None = unbounded)
+            ttl_seconds: Default time-to-live of an entry (None = never expires)
+        """
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.cache: OrderedDict[Hashable, Any] = OrderedDict()
+        self.access_counts: dict[Hashable, int] = {}
+        self.last_accessed: dict[Hashable, datetime] = {}
+        self._expires_at: dict[Hashable, float] = {}
+        self._sizes: dict[Hashable, int] = {}
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._lock = threading.RLock()
+        self._sweeper: threading.Thread | None = None
+        self._stop_sweeper = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self.cache and not self._expired(key, time.monotonic())
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get an item from the cache.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached item or None if not found or expired
+        """
+        with self._lock:
+            if key in self.cache:
+                if self._expired(key, time.monotonic()):
+                    self._remove(key)
+                    self.expirations += 1
+                else:
+                    # Move to end (most recently used)
+                    self.cache.move_to_end(key)
+                    self.access_counts[key] = self.access_counts.get(key, 0) + 1
+                    self.last_accessed[key] = datetime.now()
+                    self.hits += 1
+                    return self.cache[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any, ttl_seconds: float | None = None) -> None:
+        """Add an item to the cache.
+
+        Values larger than the whole byte budget are not cached.
+
+        Args:
+            key: The cache key
+            value: The value to cache
+            ttl_seconds: Time-to-live for this entry (defaults to ttl_seconds)
+        """
+        size = estimate_size(value)
+        with self._lock:
+            if key in self.cache:
+                self._remove(key, keep_stats=True)
+            if self.max_bytes is not None and size > self.max_bytes:
+                logger.debug(f"Not caching {key!r}: {size} bytes exceeds budget")
+                return
+
+            self.cache[key] = value
+            self._sizes[key] = size
+            self.current_bytes += size
+            ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+            if ttl is not None:
+                self._expires_at[key] = time.monotonic() + ttl
+            self.access_counts[key] = self.access_counts.get(key, 0) + 1
+            self.last_accessed[key] = datetime.now()
+            self._enforce_budget()
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove one entry; returns True if it was cached."""
+        with self._lock:
+            if key not in self.cache:
+                return False
+            self._remove(key)
+            return True
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Remove all entries whose string key starts with ``prefix``.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = [k for k in self.cache if isinstance(k, str) and k.startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def purge_expired(self) -> int:
+        """Remove all expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [k for k, at in self._expires_at.items() if at <= now]
+            for key in expired:
+                self._remove(key)
+            self.expirations += len(expired)
+            return len(expired)
+
+    def clear(self) -> int:
+        """Clear the entire cache.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            count = len(self.cache)
+            self.cache.clear()
+            self.access_counts.clear()
+            self.last_accessed.clear()
+            self._expires_at.clear()
+            self._sizes.clear()
+            self.current_bytes = 0
+        logger.info("Cache cleared")
+        return count
+
+    def start_expiry_sweeper(self, interval_seconds: float = 60) -> None:
+        """Purge expired entries from a daemon thread every ``interval_seconds``.
+
+        The thread only holds a weak reference, so it exits once the cache is
+        garbage collected or ``stop_expiry_sweeper`` is called.
+        """
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+        self._stop_sweeper.clear()
+        self._sweeper = threading.Thread(
+            target=_sweep,
+            args=(weakref.ref(self), self._stop_sweeper, interval_seconds),
+            name="memory-cache-sweeper",
+            daemon=True,
+        )
+        self._sweeper.start()
+
+    def stop_expiry_sweeper(self) -> None:
+        """Stop the background expiry thread, if running."""
+        self._stop_sweeper.set()
+        if self._sweeper is not None:
+            self._sweeper.join(timeout=1)
+            self._sweeper = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self.cache),
+                "max_size": self.max_size,
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "total_accesses": sum(self.access_counts.values()),
+                "most_accessed": max(self.access_counts.items(), key=lambda x: x[1])
+                if self.access_counts
+                else None,
+            }
+
+    def _expired(self, key: Hashable, now: float) -> bool:
+        expires_at = self._expires_at.get(key)
+        return expires_at is not None and expires_at <= now
+
+    def _enforce_budget(self) -> None:
+        """Evict least recently used entries until within both budgets."""
+        while len(self.cache) > self.max_size or (
+            self.max_bytes is not None and self.current_bytes > self.max_bytes
+        ):
+            removed_key = next(iter(self.cache))
+            self._remove(removed_key)
+            self.evictions += 1
+            logger.debug(f"Evicted from cache: {removed_key!r}")
+
+    def _remove(self, key: Hashable, keep_stats: bool = False) -> None:
+        del self.cache[key]
+        self.current_bytes -= self._sizes.pop(key, 0)
+        self._expires_at.pop(key, None)
+        if not keep_stats:
+            self.access_counts.pop(key, None)
+            self.last_accessed.pop(key, None)
+
+
+def _sweep(
+    cache_ref: "weakref.ref[MemoryCache]", stop: threading.Event, interval: float
+) -> None:
+    while not stop.wait(interval):
+        cache = cache_ref()
+        if cache is None:
+            return
+        removed = cache.purge_expired()
+        if removed:
+            logger.debug(f"Expired {removed} cache entries")
+        del cache
@@ -3,28 +3,52 @@ Conversation Archive Manager
 
 This module handles archiving of conversation history for long-term storage.
 It manages conversation pruning, archival policies, and retrieval of archived conversations.
+
+Archives are stored as per-month, append-only segments::
+
+    <archive_dir>/<YYYY-MM>/conversations.seg   concatenated frames
+    <archive_dir>/<YYYY-MM>/conversations.idx   JSONL offset index
+
+Each frame holds one compact JSON archive record followed by a newline. When
+compression is enabled every frame is an independent gzip member, so a single
+conversation is read with one seek and one read, and a whole segment is still a
+valid multi-member gzip stream. Index lines are only appended after the frames
+they point to have been flushed and fsynced, so a crash can leave unreferenced
+bytes at the end of a segment but never a dangling index entry.
+
+Per-conversation ``<id>.json`` / ``<id>.json.gz`` files written by earlier
+versions are still readable and counted in the statistics.
 """
 
 import gzip
 import json
 import logging
 import os
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+SEGMENT_FILE_NAME = "conversations.seg"
+INDEX_FILE_NAME = "conversations.idx"
+
 
 def _parse_timestamp(timestamp: Any) -> datetime:
     """Parse a timestamp from string or datetime object.
-    
+
     Args:
         timestamp: Either a datetime object or an ISO format string
-        
+
     Returns:
         datetime object
-        
+
     Raises:
         ValueError: If timestamp cannot be parsed
     """
@@ -47,9 +71,70 @@ def _parse_timestamp(timestamp: Any) -> datetime:
         raise ValueError(f"Invalid timestamp type: {type(timestamp)}")
 
 
+def _encode_frame(record: dict[str, Any], compress: bool) -> tuple[bytes, int]:
+    """Serialize an archive record into a segment frame.
+
+    Args:
+        record: The archive record to serialize
+        compress: Whether to wrap the frame in its own gzip member
+
+    Returns:
+        Tuple of (frame bytes, uncompressed payload size)
+    """
+    payload = (
+        json.dumps(record, separators=(",", ":"), default=str) + "\n"
+    ).encode("utf-8")
+    if compress:
+        return gzip.compress(payload, compresslevel=6, mtime=0), len(payload)
+    return payload, len(payload)
+
+
+def _encode_records(
+    records: list[dict[str, Any]], compress: bool
+) -> list[tuple[bytes, int] | None]:
+    """Encode a batch of archive records; runs inside worker processes.
+
+    Args:
+        records: Archive records to serialize
+        compress: Whether to gzip each frame
+
+    Returns:
+        One (frame bytes, uncompressed size) per record, or None where encoding failed
+    """
+    frames: list[tuple[bytes, int] | None] = []
+    for record in records:
+        try:
+            frames.append(_encode_frame(record, compress))
+        except Exception:
+            frames.append(None)
+    return frames
+
+
+def _decode_frame(frame: bytes) -> dict[str, Any]:
+    """Decode a frame produced by :func:`_encode_frame`."""
+    if frame[:2] == b"\x1f\x8b":
+        frame = gzip.decompress(frame)
+    return json.loads(frame)
+
+
+@dataclass
+class PruneProgress:
+    """Progress report for one batch of a bulk prune.
+
+    Attributes:
+        processed: Total conversations examined so far
+        archived: Total conversations archived so far
+        remaining: Conversations from this batch that stay active
+    """
+
+    processed: int
+    archived: int
+    remaining: list[dict[str, Any]] = field(default_factory=list)
+
+
 class ConversationArchive:
     """Manager for archiving conversation history."""
-    
+
     def __init__(
         self,
         archive_dir: str,
@@ -58,7 +143,7 @@ class ConversationArchive:
         compress_archives: bool = True,
     ):
         """Initialize the conversation archive manager.
-        
+
         Args:
             archive_dir: Directory to store archived conversations
             max_active_conversations: Maximum number of active conversations before archiving
@@ -69,27 +154,31 @@ class ConversationArchive:
         self.max_active_conversations = max_active_conversations
         self.archive_after_days = archive_after_days
         self.compress_archives = compress_archives
-        
+
+        # year_month -> (index file size when loaded, conversation_id -> entry)
+        self._index_cache: dict[str, tuple[int, dict[str, dict[str, Any]]]] = {}
+        self._write_lock = threading.Lock()
+
         # Ensure archive directory exists
         self.archive_dir.mkdir(parents=True, exist_ok=True)
-        
+
         logger.info(
             f"ConversationArchive initialized: archive_dir={archive_dir}, "
             f"max_active={max_active_conversations}, archive_after={archive_after_days}d"
         )
-    
+
     def should_archive(self, conversation_timestamp: datetime) -> bool:
         """Check if a conversation should be archived based on age.
-        
+
         Args:
             conversation_timestamp: The timestamp of the conversation
-            
+
         Returns:
             True if the conversation should be archived
         """
         age = datetime.now() - conversation_timestamp
         return age > timedelta(days=self.archive_after_days)
-    
+
     def archive_conversation(
         self,
         conversation_id: str,
@@ -97,81 +186,229 @@ class ConversationArchive:
         metadata: dict[str, Any] | None = None,
     ) -> bool:
         """Archive a conversation.
-        
+
         Args:
             conversation_id: Unique identifier for the conversation
             conversation_data: The conversation data to archive
             metadata: Optional metadata about the conversation
-            
+
         Returns:
             True if archiving was successful
         """
+        archived = self.archive_conversations(
+            [(conversation_id, conversation_data, metadata)]
+        )
+        return archived == 1
+
+    def archive_conversations(
+        self,
+        conversations: Iterable[
+            tuple[str, dict[str, Any], dict[str, Any] | None]
+        ],
+    ) -> int:
+        """Archive many conversations with one write and fsync per month.
+
+        Args:
+            conversations: Iterable of (conversation_id, conversation_data, metadata)
+
+        Returns:
+            Number of conversations archived
+        """
+        return len(self._archive_batch(conversations))
+
+    def _archive_batch(
+        self,
+        conversations: Iterable[
+            tuple[str, dict[str, Any], dict[str, Any] | None]
+        ],
+    ) -> set[str]:
+        """Encode conversations, partition them by month and append each partition.
+
+        Args:
+            conversations: Iterable of (conversation_id, conversation_data, metadata)
+
+        Returns:
+            IDs of the conversations that were durably archived
+        """
+        partitions: dict[str, list[tuple[str, bytes, int]]] = {}
+        archived_at = datetime.now().isoformat()
+
+        for conversation_id, conversation_data, metadata in conversations:
+            try:
+                year_month, record = self._build_record(
+                    conversation_id, conversation_data, metadata, archived_at
+                )
+                frame, raw_size = _encode_frame(record, self.compress_archives)
+            except Exception as e:
+                logger.error(f"Failed to archive conversation {conversation_id}: {e}")
+                continue
+
+            partitions.setdefault(year_month, []).append(
+                (conversation_id, frame, raw_size)
+            )
+
+        return self._write_partitions(partitions)
+
+    @staticmethod
+    def _build_record(
+        conversation_id: str,
+        conversation_data: dict[str, Any],
+        metadata: dict[str, Any] | None,
+        archived_at: str,
+    ) -> tuple[str, dict[str, Any]]:
+        """Build the archive record for a conversation and pick its month segment.
+
+        Returns:
+            Tuple of (year_month, archive record)
+
+        Raises:
+            ValueError: If the conversation timestamp cannot be parsed
+        """
+        timestamp = _parse_timestamp(conversation_data.get("timestamp", datetime.now()))
+        record = {
+            "conversation_id": conversation_id,
+            "archived_at": archived_at,
+            "metadata": metadata or {},
+            "conversation": conversation_data,
+        }
+        return timestamp.strftime("%Y-%m"), record
+
+    def _write_partitions(
+        self, partitions: dict[str, list[tuple[str, bytes, int]]]
+    ) -> set[str]:
+        """Append each month partition in one pass.
+
+        Returns:
+            IDs of the conversations that were durably archived
+        """
+        archived_ids: set[str] = set()
+        for year_month, frames in partitions.items():
+            if self._append_frames(year_month, frames):
+                archived_ids.update(conversation_id for conversation_id, _, _ in frames)
+        return archived_ids
+
+    def _append_frames(
+        self, year_month: str, frames: list[tuple[str, bytes, int]]
+    ) -> int:
+        """Append encoded frames to a month segment and record them in its index.
+
+        Args:
+            year_month: Segment month (YYYY-MM)
+            frames: List of (conversation_id, frame bytes, uncompressed size)
+
+        Returns:
+            Number of frames written, 0 on failure
+        """
+        segment_dir = self.archive_dir / year_month
         try:
-            # Create a subdirectory for the year-month
-            timestamp = _parse_timestamp(
-                conversation_data.get("timestamp", datetime.now())
+            with self._write_lock:
+                segment_dir.mkdir(parents=True, exist_ok=True)
+                index_lines = []
+                with open(segment_dir / SEGMENT_FILE_NAME, "ab") as segment:
+                    offset = segment.tell()
+                    for conversation_id, frame, raw_size in frames:
+                        index_lines.append(
+                            json.dumps(
+                                {
+                                    "id": conversation_id,
+                                    "offset": offset,
+                                    "length": len(frame),
+                                    "size": raw_size,
+                                },
+                                separators=(",", ":"),
+                            )
+                        )
+                        offset += len(frame)
+                    segment.write(b"".join(frame for _, frame, _ in frames))
+                    segment.flush()
+                    os.fsync(segment.fileno())
+
+                with open(segment_dir / INDEX_FILE_NAME, "a", encoding="utf-8") as index:
+                    index.write("\n".join(index_lines) + "\n")
+                    index.flush()
+                    os.fsync(index.fileno())
+
+            logger.info(
+                f"Archived {len(frames)} conversations to segment {year_month}"
             )
-            
-            year_month = timestamp.strftime("%Y-%m")
-            archive_subdir = self.archive_dir / year_month
-            archive_subdir.mkdir(parents=True, exist_ok=True)
-            
-            # Prepare archive data
-            archive_data = {
-                "conversation_id": conversation_id,
-                "archived_at": datetime.now().isoformat(),
-                "metadata": metadata or {},
-                "conversation": conversation_data,
-            }
-            
-            # Determine file path
-            file_name = f"{conversation_id}.json"
-            if self.compress_archives:
-                file_name += ".gz"
-            
-            file_path = archive_subdir / file_name
-            
-            # Write the archive
-            if self.compress_archives:
-                with gzip.open(file_path, "wt", encoding="utf-8") as f:
-                    json.dump(archive_data, f, indent=2)
-            else:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(archive_data, f, indent=2)
-            
-            logger.info(f"Archived conversation {conversation_id} to {file_path}")
-            return True
-            
+            return len(frames)
+
         except Exception as e:
-            logger.error(f"Failed to archive conversation {conversation_id}: {e}")
-            return False
-    
+            logger.error(f"Failed to write archive segment {year_month}: {e}")
+            return 0
+
+    def _load_index(self, year_month: str) -> dict[str, dict[str, Any]]:
+        """Load the offset index for a month, reusing the cached copy if unchanged.
+
+        Args:
+            year_month: Segment month (YYYY-MM)
+
+        Returns:
+            Mapping of conversation_id to its latest index entry
+        """
+        index_path = self.archive_dir / year_month / INDEX_FILE_NAME
+        try:
+            index_size = index_path.stat().st_size
+        except FileNotFoundError:
+            return {}
+
+        cached = self._index_cache.get(year_month)
+        if cached is not None and cached[0] == index_size:
+            return cached[1]
+
+        entries: dict[str, dict[str, Any]] = {}
+        with open(index_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn trailing line from an interrupted append
+                    continue
+                entries[entry["id"]] = entry
+
+        self._index_cache[year_month] = (index_size, entries)
+        return entries
+
+    def _month_dirs(self, year_month: str | None = None) -> list[Path]:
+        """List month directories to search, preferring ``year_month`` first."""
+        dirs = []
+        if year_month:
+            dirs.append(self.archive_dir / year_month)
+        dirs.extend(
+            subdir
+            for subdir in sorted(self.archive_dir.iterdir())
+            if subdir.is_dir() and subdir.name != year_month
+        )
+        return dirs
+
     def retrieve_archived_conversation(
         self, conversation_id: str, year_month: str | None = None
     ) -> dict[str, Any] | None:
         """Retrieve an archived conversation.
-        
+
         Args:
             conversation_id: The conversation ID to retrieve
             year_month: Optional year-month string (YYYY-MM) to narrow search
-            
+
         Returns:
             The archived conversation data or None if not found
         """
         try:
-            # Search strategy: if year_month provided, search there first
-            search_dirs = []
-            if year_month:
-                search_dirs.append(self.archive_dir / year_month)
-            
-            # Also search all subdirectories
-            search_dirs.extend(self.archive_dir.iterdir())
-            
-            for subdir in search_dirs:
+            for subdir in self._month_dirs(year_month):
                 if not subdir.is_dir():
                     continue
-                
-                # Try both compressed and uncompressed
+
+                entry = self._load_index(subdir.name).get(conversation_id)
+                if entry is not None:
+                    with open(subdir / SEGMENT_FILE_NAME, "rb") as segment:
+                        segment.seek(entry["offset"])
+                        data = _decode_frame(segment.read(entry["length"]))
+                    logger.info(f"Retrieved archived conversation {conversation_id}")
+                    return data
+
+                # Fall back to the legacy one-file-per-conversation layout
                 for ext in [".json.gz", ".json"]:
                     file_path = subdir / f"{conversation_id}{ext}"
                     if file_path.exists():
@@ -179,92 +416,255 @@ class ConversationArchive:
                             with gzip.open(file_path, "rt", encoding="utf-8") as f:
                                 data = json.load(f)
                         else:
-                            with open(file_path, "r", encoding="utf-8") as f:
+                            with open(file_path, encoding="utf-8") as f:
                                 data = json.load(f)
-                        
+
                         logger.info(f"Retrieved archived conversation {conversation_id}")
                         return data
-            
+
             logger.warning(f"Archived conversation {conversation_id} not found")
             return None
-            
+
         except Exception as e:
             logger.error(f"Failed to retrieve archived conversation {conversation_id}: {e}")
             return None
-    
+
+    def iter_archived_month(self, year_month: str) -> Iterator[dict[str, Any]]:
+        """Stream every archived conversation of a month in write order.
+
+        The segment is read front to back, so this is a sequential scan suitable
+        for analytics jobs. If a conversation was archived more than once only
+        its latest copy is yielded.
+
+        Args:
+            year_month: Segment month (YYYY-MM)
+
+        Yields:
+            Archived conversation records
+        """
+        entries = sorted(
+            self._load_index(year_month).values(), key=lambda e: e["offset"]
+        )
+        if not entries:
+            return
+
+        with open(self.archive_dir / year_month / SEGMENT_FILE_NAME, "rb") as segment:
+            position = 0
+            for entry in entries:
+                if entry["offset"] != position:
+                    segment.seek(entry["offset"])
+                frame = segment.read(entry["length"])
+                position = entry["offset"] + entry["length"]
+                yield _decode_frame(frame)
+
+    def _archive_candidate(
+        self, conv: dict[str, Any]
+    ) -> tuple[str, dict[str, Any], dict[str, Any]] | None:
+        """Decide whether an active conversation entry is due for archiving.
+
+        Args:
+            conv: Active conversation entry
+
+        Returns:
+            (conversation_id, conversation_data, metadata) if it should be
+            archived, None if it stays active
+        """
+        timestamp_value = conv.get("timestamp")
+        if timestamp_value is None:
+            # If no valid timestamp, keep it active
+            return None
+
+        try:
+            timestamp = _parse_timestamp(timestamp_value)
+        except (ValueError, TypeError):
+            # If parsing fails, keep it active
+            return None
+
+        if not self.should_archive(timestamp):
+            return None
+
+        conv_id = conv.get("id", f"conv_{timestamp.isoformat()}")
+        metadata = {
+            "role": conv.get("role"),
+            "tags": conv.get("tags", []),
+            "original_timestamp": timestamp.isoformat(),
+        }
+        return conv_id, conv, metadata
+
     def prune_old_conversations(
         self, active_conversations: list[dict[str, Any]]
     ) -> tuple[list[dict[str, Any]], int]:
         """Prune old conversations by archiving them.
-        
+
         Args:
             active_conversations: List of active conversation entries
-            
+
         Returns:
             Tuple of (remaining active conversations, number archived)
         """
         try:
-            archived_count = 0
             remaining_conversations = []
-            
+            to_archive = []
+
             for conv in active_conversations:
-                timestamp_value = conv.get("timestamp")
-                if timestamp_value is None:
-                    # If no valid timestamp, keep it active
-                    remaining_conversations.append(conv)
-                    continue
-                
-                try:
-                    timestamp = _parse_timestamp(timestamp_value)
-                except (ValueError, TypeError):
-                    # If parsing fails, keep it active
+                candidate = self._archive_candidate(conv)
+                if candidate is None:
                     remaining_conversations.append(conv)
-                    continue
-                
-                if self.should_archive(timestamp):
-                    # Archive this conversation
-                    conv_id = conv.get("id", f"conv_{timestamp.isoformat()}")
-                    metadata = {
-                        "role": conv.get("role"),
-                        "tags": conv.get("tags", []),
-                        "original_timestamp": timestamp.isoformat(),
-                    }
-                    
-                    if self.archive_conversation(conv_id, conv, metadata):
-                        archived_count += 1
-                    else:
-                        # If archiving fails, keep it active
-                        remaining_conversations.append(conv)
                 else:
+                    to_archive.append(candidate)
+
+            archived_ids = self._archive_batch(to_archive) if to_archive else set()
+            archived_count = 0
+            for conv_id, conv, _ in to_archive:
+                if conv_id in archived_ids:
+                    archived_count += 1
+                else:
+                    # If archiving fails, keep it active
                     remaining_conversations.append(conv)
-            
+
             logger.info(
                 f"Pruned {archived_count} conversations, {len(remaining_conversations)} remain active"
             )
             return remaining_conversations, archived_count
-            
+
         except Exception as e:
             logger.error(f"Error during conversation pruning: {e}")
             return active_conversations, 0
-    
+
+    def prune_old_conversations_iter(
+        self,
+        active_conversations: Iterable[dict[str, Any]],
+        batch_size: int = 1000,
+        max_workers: int | None = None,
+    ) -> Iterator[PruneProgress]:
+        """Prune a stream of conversations, compressing batches in a process pool.
+
+        Input is consumed lazily in batches of ``batch_size``. Each batch is
+        encoded and compressed in a worker process, then written with one append
+        per month segment. At most ``2 * max_workers`` batches are in flight, so
+        memory stays bounded however many entries the input yields.
+
+        Args:
+            active_conversations: Iterable of active conversation entries
+            batch_size: Number of entries per batch
+            max_workers: Worker processes for compression (default: CPU count)
+
+        Yields:
+            A PruneProgress per batch, in input order, carrying the batch's
+            conversations that remain active
+        """
+        processed = 0
+        archived = 0
+        archived_at = datetime.now().isoformat()
+        in_flight: deque[tuple[int, list, list, Future]] = deque()
+
+        max_workers = max_workers or os.cpu_count() or 1
+        max_in_flight = 2 * max_workers
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            iterator = iter(active_conversations)
+
+            while batch := list(islice(iterator, batch_size)):
+                remaining = []
+                records = []
+                for conv in batch:
+                    candidate = self._archive_candidate(conv)
+                    if candidate is None:
+                        remaining.append(conv)
+                        continue
+                    try:
+                        year_month, record = self._build_record(*candidate, archived_at)
+                    except ValueError:
+                        remaining.append(conv)
+                        continue
+                    records.append((year_month, record))
+
+                future = executor.submit(
+                    _encode_records,
+                    [record for _, record in records],
+                    self.compress_archives,
+                )
+                in_flight.append((len(batch), remaining, records, future))
+
+                if len(in_flight) >= max_in_flight:
+                    processed, archived, progress = self._finish_prune_batch(
+                        processed, archived, *in_flight.popleft()
+                    )
+                    yield progress
+
+            while in_flight:
+                processed, archived, progress = self._finish_prune_batch(
+                    processed, archived, *in_flight.popleft()
+                )
+                yield progress
+
+        logger.info(f"Bulk prune archived {archived} of {processed} conversations")
+
+    def _finish_prune_batch(
+        self,
+        processed: int,
+        archived: int,
+        batch_size: int,
+        remaining: list[dict[str, Any]],
+        records: list[tuple[str, dict[str, Any]]],
+        future: Future,
+    ) -> tuple[int, int, PruneProgress]:
+        """Write a compressed batch and build its progress report."""
+        partitions: dict[str, list[tuple[str, bytes, int]]] = {}
+        try:
+            frames = future.result()
+        except Exception as e:
+            logger.error(f"Failed to compress archive batch: {e}")
+            frames = [None] * len(records)
+
+        for (year_month, record), encoded in zip(records, frames, strict=True):
+            if encoded is None:
+                continue
+            partitions.setdefault(year_month, []).append(
+                (record["conversation_id"], encoded[0], encoded[1])
+            )
+
+        archived_ids = self._write_partitions(partitions)
+        for _, record in records:
+            if record["conversation_id"] in archived_ids:
+                archived += 1
+            else:
+                # If archiving fails, keep it active
+                remaining.append(record["conversation"])
+
+        processed += batch_size
+        return processed, archived, PruneProgress(processed, archived, remaining)
+
     def get_archive_statistics(self) -> dict[str, Any]:
         """Get statistics about the conversation archive.
-        
+
         Returns:
             Dictionary with archive statistics
         """
         try:
             total_archives = 0
             total_size_bytes = 0
+            segment_bytes = 0
+            segment_raw_bytes = 0
             archives_by_month: dict[str, int] = {}
-            
+
             for subdir in self.archive_dir.iterdir():
                 if not subdir.is_dir():
                     continue
-                
-                month_count = 0
+
+                entries = self._load_index(subdir.name)
+                month_count = len(entries)
+                segment_path = subdir / SEGMENT_FILE_NAME
+                if entries and segment_path.exists():
+                    total_size_bytes += segment_path.stat().st_size
+                    segment_bytes += sum(e["length"] for e in entries.values())
+                    segment_raw_bytes += sum(e.get("size", e["length"]) for e in entries.values())
+
                 for file_path in subdir.iterdir():
-                    if file_path.is_file():
+                    if file_path.is_file() and file_path.name not in (
+                        SEGMENT_FILE_NAME,
+                        INDEX_FILE_NAME,
+                    ):
                         # Use suffixes for more reliable extension checking
                         # .suffixes returns ['.json'] for 'file.json' and ['.json', '.gz'] for 'file.json.gz'
                         suffixes = file_path.suffixes
@@ -272,17 +672,21 @@ class ConversationArchive:
                             total_archives += 1
                             month_count += 1
                             total_size_bytes += file_path.stat().st_size
-                
+
+                total_archives += len(entries)
                 if month_count > 0:
                     archives_by_month[subdir.name] = month_count
-            
+
             return {
                 "total_archived_conversations": total_archives,
                 "total_size_mb": round(total_size_bytes / (1024 * 1024), 2),
+                "compression_ratio": (
+                    round(segment_raw_bytes / segment_bytes, 2) if segment_bytes else None
+                ),
                 "archives_by_month": archives_by_month,
                 "archive_directory": str(self.archive_dir),
             }
-            
+
         except Exception as e:
             logger.error(f"Error getting archive statistics: {e}")
             return {
@@ -0,0 +1,446 @@
+"""
+Local Vector Store
+
+A MemoryStore implementation that keeps everything on local disk, so the
+memory stack can run offline and in tests without Pinecone or ChromaDB.
+
+A store directory holds:
+
+``vectors.f32``
+    Unit-normalized float32 embeddings, one fixed-width row per memory,
+    appended in order and read through ``numpy.memmap``.
+
+``memories.jsonl``
+    Append-only operation log (``add``, ``tag``, ``delete``) from which the
+    id -> row mapping, the memory metadata and the tag inverted index are
+    rebuilt on open.
+
+Search is an exact cosine-similarity scan over the memory-mapped matrix in
+fixed-size chunks, so memory use stays flat regardless of store size. A tag
+filter restricts the scan to the rows listed in the inverted index.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import uuid
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from .memory_store import MemoryStore
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w+")
+
+
+def hashing_embedder(dimension: int) -> Callable[[str], list[float]]:
+    """
+    Build a deterministic bag-of-words embedder using feature hashing.
+
+    It needs no model or network access, which makes it suitable for tests
+    and offline use; pass a real embedding function for semantic quality.
+
+    Args:
+        dimension: Size of the produced vectors
+
+    Returns:
+        Function mapping text to a vector of ``dimension`` floats
+    """
+
+    def embed(text: str) -> list[float]:
+        vector = np.zeros(dimension, dtype=np.float32)
+        for token in _TOKEN.findall(text.lower()):
+            digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest, "little")
+            vector[bucket % dimension] += 1.0 if bucket & (1 << 63) else -1.0
+        return vector.tolist()
+
+    return embed
+
+
+class LocalVectorStore(MemoryStore):
+    """MemoryStore backed by a memory-mapped embedding file and a JSONL log."""
+
+    VECTORS_FILE = "vectors.f32"
+    LOG_FILE = "memories.jsonl"
+
+    def __init__(
+        self,
+        directory: str,
+        dimension: int = 384,
+        embed: Callable[[str], list[float]] | None = None,
+        scan_chunk_rows: int = 65536,
+    ):
+        """
+        Open or create a local vector store.
+
+        Args:
+            directory: Directory holding the store files
+            dimension: Embedding dimension
+            embed: Function turning query and memory text into embeddings;
+                defaults to ``hashing_embedder(dimension)``
+            scan_chunk_rows: Rows scored per chunk during search
+        """
+        self.directory = directory
+        self.dimension = dimension
+        self.embed = embed or hashing_embedder(dimension)
+        self.scan_chunk_rows = scan_chunk_rows
+        self.vectors_path = os.path.join(directory, self.VECTORS_FILE)
+        self.log_path = os.path.join(directory, self.LOG_FILE)
+        self._row_bytes = dimension * np.dtype(np.float32).itemsize
+
+        self._lock = threading.RLock()
+        self._memories: dict[int, dict[str, Any]] = {}
+        self._rows_by_id: dict[str, int] = {}
+        self._tag_rows: dict[str, set[int]] = {}
+        # Row -> live flag, so scans can drop deleted rows without Python loops
+        self._live = np.zeros(0, dtype=bool)
+        self._matrix: np.memmap | None = None
+
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    # --- MemoryStore interface ---
+
+    def add_memory(self, memory: dict[str, Any]) -> None:
+        """
+        Add a memory entry to the store, replacing any entry with the same id.
+
+        Args:
+            memory: Memory dictionary with ``text`` (or ``content``) and
+                optionally ``id``, ``tags``, ``embedding`` and other metadata
+        """
+        self.add_memories([memory])
+
+    def add_memories(self, memories: Iterable[dict[str, Any]]) -> list[str]:
+        """
+        Add memory entries with one append per store file.
+
+        Args:
+            memories: Memory dictionaries, as for ``add_memory``
+
+        Returns:
+            Ids of the stored memories
+        """
+        prepared = []
+        vectors = []
+        for memory in memories:
+            record = {k: v for k, v in memory.items() if k != "embedding"}
+            record.setdefault("id", str(uuid.uuid4()))
+            record.setdefault("timestamp", datetime.now().isoformat())
+            record["tags"] = list(record.get("tags") or [])
+            embedding = memory.get("embedding")
+            if embedding is None or len(embedding) == 0:
+                embedding = self.embed(_memory_text(memory))
+            vectors.append(self._normalize(embedding))
+            prepared.append(record)
+        if not prepared:
+            return []
+
+        with self._lock:
+            first_row = self._drop_partial_row()
+            with open(self.vectors_path, "ab") as f:
+                f.write(np.stack(vectors).astype(np.float32).tobytes())
+            ops = [
+                {"op": "add", "row": first_row + i, "memory": record}
+                for i, record in enumerate(prepared)
+            ]
+            self._append_ops(ops)
+            for op in ops:
+                self._apply(op)
+        return [record["id"] for record in prepared]
+
+    def query_memories(
+        self, query: str, top_k: int = 5, tags: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Return the memories most similar to ``query``.
+
+        Args:
+            query: The text query to search for
+            top_k: Maximum number of results to return
+            tags: Only consider memories carrying at least one of these tags
+
+        Returns:
+            Memory dictionaries with a cosine ``score``, best match first
+        """
+        if top_k <= 0:
+            return []
+        return self.query_by_vector(self.embed(query), top_k=top_k, tags=tags)
+
+    def query_by_vector(
+        self, vector: list[float], top_k: int = 5, tags: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Return the memories most similar to an embedding.
+
+        Args:
+            vector: Query embedding
+            top_k: Maximum number of results to return
+            tags: Only consider memories carrying at least one of these tags
+
+        Returns:
+            Memory dictionaries with a cosine ``score``, best match first
+        """
+        query = self._normalize(vector)
+        with self._lock:
+            matrix = self._mapped_matrix()
+            if matrix is None or top_k <= 0:
+                return []
+            if tags:
+                rows = sorted(
+                    set().union(*(self._tag_rows.get(t, set()) for t in tags))
+                )
+                candidates = np.asarray(rows, dtype=np.int64)
+            else:
+                candidates = None
+            hits = self._scan(matrix, query, top_k, candidates)
+            return [
+                {
+                    **self._memories[row],
+                    "tags": list(self._memories[row]["tags"]),
+                    "score": score,
+                }
+                for row, score in hits
+            ]
+
+    def delete_memory(self, memory_id: str) -> None:
+        """
+        Delete a memory entry by its ID.
+
+        Args:
+            memory_id: The unique identifier of the memory to delete
+        """
+        with self._lock:
+            if memory_id not in self._rows_by_id:
+                logger.warning(f"Memory {memory_id} not found in local vector store")
+                return
+            op = {"op": "delete", "id": memory_id}
+            self._append_ops([op])
+            self._apply(op)
+
+    def tag_memory(self, memory_id: str, tags: list[str]) -> None:
+        """
+        Add tags to an existing memory entry.
+
+        Args:
+            memory_id: The unique identifier of the memory to tag
+            tags: The tags to add to the memory
+        """
+        with self._lock:
+            if memory_id not in self._rows_by_id:
+                logger.warning(f"Memory {memory_id} not found in local vector store")
+                return
+            op = {"op": "tag", "id": memory_id, "tags": list(tags)}
+            self._append_ops([op])
+            self._apply(op)
+
+    # --- Additional helpers ---
+
+    def get_memory(self, memory_id: str) -> dict[str, Any] | None:
+        """Return a stored memory by id, or None."""
+        with self._lock:
+            row = self._rows_by_id.get(memory_id)
+            if row is None:
+                return None
+            memory = self._memories[row]
+            return {**memory, "tags": list(memory["tags"])}
+
+    def count(self) -> int:
+        """Return the number of live memories."""
+        with self._lock:
+            return len(self._rows_by_id)
+
+    def compact(self) -> None:
+        """Rewrite the store files without deleted or replaced rows."""
+        with self._lock:
+            matrix = self._mapped_matrix()
+            live_rows = sorted(self._memories)
+            tmp_vectors = self.vectors_path + ".tmp"
+            tmp_log = self.log_path + ".tmp"
+            with (
+                open(tmp_vectors, "wb") as vectors,
+                open(tmp_log, "w", encoding="utf-8") as log,
+            ):
+                for new_row, row in enumerate(live_rows):
+                    vectors.write(np.ascontiguousarray(matrix[row]).tobytes())
+                    op = {"op": "add", "row": new_row, "memory": self._memories[row]}
+                    log.write(json.dumps(op, default=str) + "\n")
+            del matrix
+            self._matrix = None
+            os.replace(tmp_vectors, self.vectors_path)
+            os.replace(tmp_log, self.log_path)
+            self._load()
+
+    # --- Internals ---
+
+    def _normalize(self, vector: Iterable[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        if array.shape != (self.dimension,):
+            raise ValueError(
+                f"Expected an embedding of dimension {self.dimension}, got {array.shape}"
+            )
+        norm = float(np.linalg.norm(array))
+        return array / norm if norm else array
+
+    def _row_count(self) -> int:
+        try:
+            return os.path.getsize(self.vectors_path) // self._row_bytes
+        except FileNotFoundError:
+            return 0
+
+    def _drop_partial_row(self) -> int:
+        """
+        Truncate a trailing partial row left by an interrupted append.
+
+        Rows are located by offset, so appending after a partial row would
+        misalign every later vector.
+
+        Returns:
+            Number of complete rows
+        """
+        rows = self._row_count()
+        try:
+            size = os.path.getsize(self.vectors_path)
+        except FileNotFoundError:
+            return 0
+        if size != rows * self._row_bytes:
+            logger.warning(
+                f"Dropping {size - rows * self._row_bytes} trailing bytes "
+                f"of a partial row in {self.vectors_path}"
+            )
+            os.truncate(self.vectors_path, rows * self._row_bytes)
+        return rows
+
+    def _mapped_matrix(self) -> np.ndarray | None:
+        """Return the embedding matrix, remapping it if rows were appended."""
+        rows = self._row_count()
+        if rows == 0:
+            return None
+        if len(self._live) < rows:
+            self._grow_live(rows)
+        if self._matrix is None or self._matrix.shape[0] != rows:
+            self._matrix = np.memmap(
+                self.vectors_path,
+                dtype=np.float32,
+                mode="r",
+                shape=(rows, self.dimension),
+            )
+        return self._matrix
+
+    def _scan(
+        self,
+        matrix: np.ndarray,
+        query: np.ndarray,
+        top_k: int,
+        candidates: np.ndarray | None,
+    ) -> list[tuple[int, float]]:
+        """Score rows chunk by chunk, keeping the best ``top_k`` live rows."""
+        total = matrix.shape[0] if candidates is None else len(candidates)
+        best_rows = np.empty(0, dtype=np.int64)
+        best_scores = np.empty(0, dtype=np.float32)
+        for start in range(0, total, self.scan_chunk_rows):
+            stop = min(start + self.scan_chunk_rows, total)
+            if candidates is None:
+                rows = np.arange(start, stop)
+                scores = matrix[start:stop] @ query
+            else:
+                rows = candidates[start:stop]
+                scores = matrix[rows] @ query
+            live = self._live[rows]
+            rows, scores = rows[live], scores[live]
+            rows = np.concatenate([best_rows, rows])
+            scores = np.concatenate([best_scores, scores])
+            if len(scores) > top_k:
+                keep = np.argpartition(-scores, top_k - 1)[:top_k]
+                rows, scores = rows[keep], scores[keep]
+            best_rows, best_scores = rows, scores
+        # Best score first, older rows first among equal scores
+        order = np.lexsort((best_rows, -best_scores))
+        return [(int(best_rows[i]), float(best_scores[i])) for i in order]
+
+    def _append_ops(self, ops: list[dict[str, Any]]) -> None:
+        with open(self.log_path, "a", encoding="utf-8") as log:
+            log.write("".join(json.dumps(op, default=str) + "\n" for op in ops))
+
+    def _apply(self, op: dict[str, Any]) -> None:
+        """Apply one log operation to the in-memory indexes."""
+        if op["op"] == "add":
+            memory = op["memory"]
+            self._drop(memory["id"])
+            row = op["row"]
+            self._memories[row] = memory
+            self._rows_by_id[memory["id"]] = row
+            if row >= len(self._live):
+                self._grow_live(row + 1)
+            self._live[row] = True
+            for tag in memory["tags"]:
+                self._tag_rows.setdefault(tag, set()).add(row)
+        elif op["op"] == "delete":
+            self._drop(op["id"])
+        elif op["op"] == "tag":
+            row = self._rows_by_id.get(op["id"])
+            if row is None:
+                return
+            memory = self._memories[row]
+            for tag in op["tags"]:
+                if tag not in memory["tags"]:
+                    memory["tags"].append(tag)
+                    self._tag_rows.setdefault(tag, set()).add(row)
+
+    def _drop(self, memory_id: str) -> None:
+        row = self._rows_by_id.pop(memory_id, None)
+        if row is None:
+            return
+        memory = self._memories.pop(row)
+        self._live[row] = False
+        for tag in memory["tags"]:
+            rows = self._tag_rows.get(tag)
+            if rows is not None:
+                rows.discard(row)
+                if not rows:
+                    del self._tag_rows[tag]
+
+    def _grow_live(self, rows: int) -> None:
+        """Extend the live-row flags to cover at least ``rows`` rows."""
+        live = np.zeros(max(rows, 2 * len(self._live), 1024), dtype=bool)
+        live[: len(self._live)] = self._live
+        self._live = live
+
+    def _load(self) -> None:
+        """Rebuild the in-memory indexes by replaying the operation log."""
+        self._memories = {}
+        self._rows_by_id = {}
+        self._tag_rows = {}
+        self._live = np.zeros(0, dtype=bool)
+        rows = self._drop_partial_row()
+        if not os.path.exists(self.log_path):
+            return
+        with open(self.log_path, encoding="utf-8") as log:
+            for line_num, line in enumerate(log, 1):
+                if not line.strip():
+                    continue
+                try:
+                    op = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.error(f"Skipping corrupt line {line_num} in {self.log_path}")
+                    continue
+                if op.get("op") == "add" and op["row"] >= rows:
+                    # Log entry whose vector never reached disk
+                    continue
+                self._apply(op)
+        logger.info(
+            f"Loaded {len(self._rows_by_id)} memories from local vector store {self.directory}"
+        )
+
+
+def _memory_text(memory: dict[str, Any]) -> str:
+    """Return the text to embed for a memory dictionary."""
+    return str(memory.get("text") or memory.get("content") or "")
@@ -0,0 +1,355 @@
+"""
+Indexed JSONL Logs
+
+Append-only JSONL logs with sidecar indexes, so recent entries and tag lookups
+can be served without parsing the whole log.
+
+For a log ``heart_log.jsonl`` two sidecars are kept next to it:
+
+``heart_log.jsonl.idx``
+    Fixed-width binary records, one per log line: byte offset, byte length and
+    timestamp. Entry ``i`` lives at ``i * RECORD.size``, so the newest N
+    entries are found by reading the last N records.
+
+``heart_log.jsonl.tags``
+    Tab-separated lines of ``entry_number<TAB>tag<TAB>tag...`` for entries
+    that have tags. Loaded once into an in-memory inverted index and then
+    extended incrementally.
+
+Sidecars are rebuilt or caught up automatically when the log was written by
+something that does not maintain them (older code, manual edits), so they are
+always safe to delete.
+"""
+
+import json
+import logging
+import os
+import struct
+import threading
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# offset (u64), length (u32), timestamp as POSIX seconds (f64)
+RECORD = struct.Struct("<QId")
+
+# Decoding str with a shared decoder skips json.loads' per-call encoding sniffing
+_decode = json.JSONDecoder().decode
+
+
+def _entry_timestamp(entry: dict[str, Any]) -> float:
+    """Return an entry's timestamp as POSIX seconds, 0.0 if absent or invalid."""
+    value = entry.get("timestamp")
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return 0.0
+    return 0.0
+
+
+def _entry_tags(entry: dict[str, Any]) -> list[str]:
+    """Return an entry's tags."""
+    tags = entry.get("tags")
+    return [tag for tag in tags if isinstance(tag, str)] if isinstance(tags, list) else []
+
+
+def _tag_line(position: int, tags: list[str]) -> str:
+    """Format a tag sidecar line; tags containing tabs or newlines are not indexed."""
+    usable = [tag for tag in tags if "\t" not in tag and "\n" not in tag]
+    return "\t".join([str(position), *usable]) + "\n"
+
+
+class IndexedJsonlLog:
+    """Append-only JSONL log with offset, timestamp and tag sidecar indexes."""
+
+    def __init__(
+        self,
+        path: str,
+        tags_of: Callable[[dict[str, Any]], list[str]] = _entry_tags,
+    ):
+        """
+        Initialize the indexed log.
+
+        Args:
+            path: Path of the JSONL log.
+            tags_of: Function returning the index keys of an entry.
+        """
+        self.path = path
+        self.index_path = f"{path}.idx"
+        self.tags_path = f"{path}.tags"
+        self.tags_of = tags_of
+
+        self._lock = threading.RLock()
+        self._tag_positions: dict[str, list[int]] = {}
+        self._tags_loaded_bytes = 0
+
+    def append(self, entry: dict[str, Any]) -> None:
+        """Append an entry to the log and its indexes."""
+        self.append_many([entry])
+
+    def append_many(self, entries: list[dict[str, Any]]) -> None:
+        """Append entries to the log and its indexes with one write per file."""
+        if not entries:
+            return
+
+        with self._lock:
+            self._sync()
+            lines = [(json.dumps(entry) + "\n").encode("utf-8") for entry in entries]
+            with open(self.path, "ab") as log:
+                offset = log.tell()
+                log.write(b"".join(lines))
+
+            first = self._count()
+            records = []
+            tag_lines = []
+            for i, (entry, line) in enumerate(zip(entries, lines, strict=True)):
+                records.append(RECORD.pack(offset, len(line), _entry_timestamp(entry)))
+                offset += len(line)
+                tags = self.tags_of(entry)
+                if tags:
+                    tag_lines.append(_tag_line(first + i, tags))
+
+            with open(self.index_path, "ab") as index:
+                index.write(b"".join(records))
+            if tag_lines:
+                self._write_tag_lines(tag_lines)
+
+    def count(self) -> int:
+        """Return the number of indexed entries."""
+        with self._lock:
+            self._sync()
+            return self._count()
+
+    def latest(self, limit: int, tag: str | None = None) -> list[dict[str, Any]]:
+        """
+        Return the newest entries, newest first.
+
+        Args:
+            limit: Maximum number of entries to return.
+            tag: Only return entries carrying this tag.
+
+        Returns:
+            List of decoded entries.
+        """
+        if limit <= 0:
+            return []
+
+        with self._lock:
+            self._sync()
+            if tag is None:
+                total = self._count()
+                positions = range(total - 1, max(total - limit, 0) - 1, -1)
+            else:
+                self._load_tags()
+                positions = self._tag_positions.get(tag, [])[-limit:][::-1]
+            return self._read_entries(positions)
+
+    def since(self, cutoff: datetime, limit: int | None = None) -> list[dict[str, Any]]:
+        """Return entries with a timestamp at or after ``cutoff``, newest first."""
+        threshold = cutoff.timestamp()
+        with self._lock:
+            self._sync()
+            positions: list[int] = []
+            if not self._count():
+                return []
+            with open(self.index_path, "rb") as index:
+                for position in range(self._count() - 1, -1, -1):
+                    index.seek(position * RECORD.size)
+                    _, _, timestamp = RECORD.unpack(index.read(RECORD.size))
+                    if timestamp < threshold:
+                        break
+                    positions.append(position)
+                    if limit is not None and len(positions) >= limit:
+                        break
+            return self._read_entries(positions)
+
+    def iter_batches(
+        self, tag: str | None = None, start: int = 0, batch_size: int = 1000
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Yield entries oldest first, in lists of up to ``batch_size``.
+
+        Args:
+            tag: Only yield entries carrying this tag.
+            start: Number of (matching) entries to skip.
+            batch_size: Maximum number of entries per yielded list.
+
+        Yields:
+            Lists of decoded entries.
+        """
+        with self._lock:
+            self._sync()
+            if tag is None:
+                positions: list[int] | range = range(start, self._count())
+            else:
+                self._load_tags()
+                positions = self._tag_positions.get(tag, [])[start:]
+
+        for i in range(0, len(positions), batch_size):
+            yield self._read_entries(positions[i : i + batch_size])
+
+    def tags(self) -> dict[str, int]:
+        """Return the number of entries per tag."""
+        with self._lock:
+            self._sync()
+            self._load_tags()
+            return {tag: len(positions) for tag, positions in self._tag_positions.items()}
+
+    def _count(self) -> int:
+        try:
+            return os.path.getsize(self.index_path) // RECORD.size
+        except FileNotFoundError:
+            return 0
+
+    def _read_records(self, positions: list[int] | range) -> list[tuple[int, int]]:
+        """Read (offset, length) for the given entry positions."""
+        records = []
+        with open(self.index_path, "rb") as index:
+            for position in positions:
+                index.seek(position * RECORD.size)
+                offset, length, _ = RECORD.unpack(index.read(RECORD.size))
+                records.append((offset, length))
+        return records
+
+    def _read_entries(self, positions: list[int] | range) -> list[dict[str, Any]]:
+        """Decode the log entries at the given positions, in the given order."""
+        if not positions:
+            return []
+        if isinstance(positions, range) and positions.step == 1:
+            return self._read_span(positions)
+        entries = []
+        with open(self.path, "rb") as log:
+            for offset, length in self._read_records(positions):
+                log.seek(offset)
+                entries.append(_decode(log.read(length).decode("utf-8")))
+        return entries
+
+    def _read_span(self, positions: range) -> list[dict[str, Any]]:
+        """Decode consecutive entries with one read of the index and the log."""
+        with open(self.index_path, "rb") as index:
+            index.seek(positions.start * RECORD.size)
+            data = index.read(len(positions) * RECORD.size)
+        records = list(RECORD.iter_unpack(data))
+        start = records[0][0]
+        end = records[-1][0] + records[-1][1]
+        with open(self.path, "rb") as log:
+            log.seek(start)
+            block = log.read(end - start)
+        return [
+            _decode(block[offset - start : offset - start + length].decode("utf-8"))
+            for offset, length, _ in records
+        ]
+
+    def _sync(self) -> None:
+        """Bring the sidecars in line with the log before reading or appending."""
+        try:
+            log_size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            log_size = 0
+
+        count = self._count()
+        indexed_end = 0
+        rewritten = False
+        if count:
+            offset, length = self._read_records([count - 1])[0]
+            indexed_end = offset + length
+            if indexed_end <= log_size:
+                # Cheap check that the last indexed line is still where the
+                # index says it is, catching logs rewritten in place
+                with open(self.path, "rb") as log:
+                    log.seek(offset)
+                    line = log.read(length)
+                rewritten = not (line.lstrip().startswith(b"{") and line.endswith(b"\n"))
+
+        if rewritten or indexed_end > log_size or (
+            os.path.exists(self.index_path)
+            and os.path.getsize(self.index_path) % RECORD.size
+        ):
+            # Log was truncated or replaced, or the index is torn: start over
+            logger.info(f"Rebuilding index for {self.path}")
+            self._reset()
+            indexed_end = 0
+            count = 0
+
+        if log_size > indexed_end:
+            self._index_tail(indexed_end, count)
+
+    def _reset(self) -> None:
+        for path in (self.index_path, self.tags_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self._tag_positions = {}
+        self._tags_loaded_bytes = 0
+
+    def _index_tail(self, start: int, first: int) -> None:
+        """Index log lines from byte ``start`` onwards that have no index records."""
+        records = []
+        tag_lines = []
+        with open(self.path, "rb") as log:
+            log.seek(start)
+            offset = start
+            for line in log:
+                length = len(line)
+                if not line.endswith(b"\n"):
+                    # Incomplete trailing line from an in-progress write
+                    break
+                if line.strip():
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(
+                            f"Skipping undecodable line at byte {offset} of {self.path}"
+                        )
+                        entry = None
+                    if isinstance(entry, dict):
+                        position = first + len(records)
+                        records.append(
+                            RECORD.pack(offset, length, _entry_timestamp(entry))
+                        )
+                        tags = self.tags_of(entry)
+                        if tags:
+                            tag_lines.append(_tag_line(position, tags))
+                offset += length
+
+        if records:
+            with open(self.index_path, "ab") as index:
+                index.write(b"".join(records))
+        if tag_lines:
+            self._write_tag_lines(tag_lines)
+
+    def _write_tag_lines(self, tag_lines: list[str]) -> None:
+        """Append tag sidecar lines, keeping the in-memory index current if loaded."""
+        data = "".join(tag_lines).encode("utf-8")
+        with open(self.tags_path, "ab") as tags_file:
+            start = tags_file.tell()
+            tags_file.write(data)
+        if self._tags_loaded_bytes == start:
+            self._apply_tag_lines(data)
+            self._tags_loaded_bytes += len(data)
+
+    def _load_tags(self) -> None:
+        """Load tag sidecar lines written since the last load."""
+        try:
+            size = os.path.getsize(self.tags_path)
+        except FileNotFoundError:
+            return
+        if size < self._tags_loaded_bytes:
+            self._tag_positions = {}
+            self._tags_loaded_bytes = 0
+        if size == self._tags_loaded_bytes:
+            return
+        with open(self.tags_path, "rb") as tags_file:
+            tags_file.seek(self._tags_loaded_bytes)
+            data = tags_file.read(size - self._tags_loaded_bytes)
+        self._apply_tag_lines(data)
+        self._tags_loaded_bytes = size
+
+    def _apply_tag_lines(self, data: bytes) -> None:
+        tag_positions = self._tag_positions
+        for line in data.decode("utf-8").splitlines():
+            position, *tags = line.split("\t")
+            for tag in tags:
+                tag_positions.setdefault(tag, []).append(int(position))
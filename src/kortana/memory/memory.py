@@ -13,6 +13,8 @@ from typing import Any
 
 from kortana.config.schema import KortanaConfig
 
+from .log_index import IndexedJsonlLog
+
 logger = logging.getLogger(__name__)
 
 
@@ -94,6 +96,9 @@ class MemoryManager:
     """
     Memory manager for Kor'tana using JSON logs.
     Handles heart.log, soul.index.jsonl, and lit.log.jsonl.
+
+    Each log is an IndexedJsonlLog, so recent reads seek straight to the newest
+    entries and pattern/ritual filters use the tag index instead of a scan.
     """
 
     def __init__(self, settings: KortanaConfig):
@@ -127,6 +132,10 @@ class MemoryManager:
         ]:
             os.makedirs(os.path.dirname(path), exist_ok=True)
 
+        self.heart_log = IndexedJsonlLog(self.heart_log_path)
+        self.soul_index = IndexedJsonlLog(self.soul_index_path)
+        self.lit_log = IndexedJsonlLog(self.lit_log_path)
+
     def add_heart_memory(self, text: str, tags: list[str] | None = None) -> bool:
         """
         Add a memory to the heart log.
@@ -141,8 +150,7 @@ class MemoryManager:
         try:
             entry = MemoryEntry(text=text, tags=tags or ["heart"], source="heart")
 
-            with open(self.heart_log_path, "a") as f:
-                f.write(json.dumps(entry.to_dict()) + "\n")
+            self.heart_log.append(entry.to_dict())
 
             logger.info(f"Added heart memory: {text[:50]}...")
             return True
@@ -171,8 +179,7 @@ class MemoryManager:
                 source="soul",
             )
 
-            with open(self.soul_index_path, "a") as f:
-                f.write(json.dumps(entry.to_dict()) + "\n")
+            self.soul_index.append(entry.to_dict())
 
             logger.info(f"Added soul memory for pattern '{pattern}': {text[:50]}...")
             return True
@@ -199,8 +206,7 @@ class MemoryManager:
                 text=text, tags=(tags or []) + ["lit", f"ritual:{ritual}"], source="lit"
             )
 
-            with open(self.lit_log_path, "a") as f:
-                f.write(json.dumps(entry.to_dict()) + "\n")
+            self.lit_log.append(entry.to_dict())
 
             logger.info(f"Added lit memory for ritual '{ritual}': {text[:50]}...")
             return True
@@ -210,24 +216,16 @@ class MemoryManager:
 
     def get_heart_memories(self, limit: int = 10) -> list[dict[str, Any]]:
         """
-        Get memories from the heart log.
+        Get the most recent memories from the heart log.
 
         Args:
             limit: Maximum number of memories to return.
 
         Returns:
-            List of memory entries.
+            List of memory entries, newest first.
         """
         try:
-            memories = []
-            if os.path.exists(self.heart_log_path):
-                with open(self.heart_log_path) as f:
-                    for line in f:
-                        if line.strip():
-                            memories.append(json.loads(line))
-                            if len(memories) >= limit:
-                                break
-            return memories
+            return self.heart_log.latest(limit)
         except Exception as e:
             logger.error(f"Failed to get heart memories: {e}")
             return []
@@ -236,29 +234,18 @@ class MemoryManager:
         self, pattern: str | None = None, limit: int = 10
     ) -> list[dict[str, Any]]:
         """
-        Get memories from the soul index.
+        Get the most recent memories from the soul index.
 
         Args:
             pattern: Optional pattern to filter by.
             limit: Maximum number of memories to return.
 
         Returns:
-            List of memory entries.
+            List of memory entries, newest first.
         """
         try:
-            memories = []
-            if os.path.exists(self.soul_index_path):
-                with open(self.soul_index_path) as f:
-                    for line in f:
-                        if line.strip():
-                            entry = json.loads(line)
-                            if pattern is None or f"pattern:{pattern}" in entry.get(
-                                "tags", []
-                            ):
-                                memories.append(entry)
-                                if len(memories) >= limit:
-                                    break
-            return memories
+            tag = f"pattern:{pattern}" if pattern is not None else None
+            return self.soul_index.latest(limit, tag=tag)
         except Exception as e:
             logger.error(f"Failed to get soul memories: {e}")
             return []
@@ -267,29 +254,18 @@ class MemoryManager:
         self, ritual: str | None = None, limit: int = 10
     ) -> list[dict[str, Any]]:
         """
-        Get memories from the lit log.
+        Get the most recent memories from the lit log.
 
         Args:
             ritual: Optional ritual to filter by.
             limit: Maximum number of memories to return.
 
         Returns:
-            List of memory entries.
+            List of memory entries, newest first.
         """
         try:
-            memories = []
-            if os.path.exists(self.lit_log_path):
-                with open(self.lit_log_path) as f:
-                    for line in f:
-                        if line.strip():
-                            entry = json.loads(line)
-                            if ritual is None or f"ritual:{ritual}" in entry.get(
-                                "tags", []
-                            ):
-                                memories.append(entry)
-                                if len(memories) >= limit:
-                                    break
-            return memories
+            tag = f"ritual:{ritual}" if ritual is not None else None
+            return self.lit_log.latest(limit, tag=tag)
         except Exception as e:
             logger.error(f"Failed to get lit memories: {e}")
             return []
@@ -8,8 +8,9 @@ Enhanced with caching layer for performance optimization.
 import json
 import logging
 import os
-from collections import OrderedDict
-from datetime import datetime
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import Any
 
@@ -28,6 +29,7 @@ except ImportError:
 
 from kortana.config.schema import KortanaConfig
 
+from .cache import SEARCH_PREFIX, MemoryCache, vector_cache_key
 from .memory import MemoryEntry
 
 logger = logging.getLogger(__name__)
@@ -48,84 +50,149 @@ def _cached_embedding_lookup(text_hash: int) -> list[float] | None:
     return None
 
 
-class MemoryCache:
-    """LRU cache for frequently accessed memories."""
+def _vector_record(memory_entry: MemoryEntry) -> tuple[str, list[float], dict[str, Any]]:
+    """Build the Pinecone (id, values, metadata) tuple for a memory entry."""
+    metadata = {
+        "text": memory_entry.text,
+        "timestamp": str(memory_entry.timestamp),
+        "tags": memory_entry.tags,
+        "source": memory_entry.source,
+    }
+    return memory_entry.id, memory_entry.embedding, metadata
 
-    def __init__(self, max_size: int = 100):
-        """Initialize the memory cache.
 
-        Args:
-            max_size: Maximum number of items to cache
-        """
-        self.max_size = max_size
-        self.cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
-        self.access_counts: dict[str, int] = {}
-        self.last_accessed: dict[str, datetime] = {}
+class BufferedVectorWriter:
+    """Accumulates memory entries and writes them to Pinecone in batches.
 
-    def get(self, key: str) -> dict[str, Any] | None:
-        """Get an item from the cache.
+    Each flush splits the buffer into upsert requests of ``batch_size``
+    vectors, sends up to ``max_parallel`` of them concurrently, and retries
+    failed or partially applied requests with exponential backoff. Entries
+    whose upsert succeeded are then appended to the memory journal with a
+    single write. Upserts are idempotent by vector id, so retrying a whole
+    request is safe.
 
-        Args:
-            key: The cache key
+    ``written`` and ``failed`` count entries that did or did not reach the
+    vector index (the journal, when Pinecone is disabled). A journal write
+    that fails after a successful upsert is counted in ``journal_failed``
+    only, so callers do not retry vectors that are already stored.
+    """
 
-        Returns:
-            The cached item or None if not found
-        """
-        if key in self.cache:
-            # Move to end (most recently used)
-            self.cache.move_to_end(key)
-            self.access_counts[key] = self.access_counts.get(key, 0) + 1
-            self.last_accessed[key] = datetime.now()
-            logger.debug(f"Cache hit for key: {key}")
-            return self.cache[key]
-        logger.debug(f"Cache miss for key: {key}")
-        return None
-
-    def put(self, key: str, value: dict[str, Any]) -> None:
-        """Add an item to the cache.
+    def __init__(
+        self,
+        manager: "MemoryManager",
+        batch_size: int = 100,
+        max_parallel: int = 4,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+    ):
+        """Initialize the writer.
 
         Args:
-            key: The cache key
-            value: The value to cache
+            manager: Memory manager providing the index, namespace and journal
+            batch_size: Vectors per upsert request
+            max_parallel: Maximum concurrent upsert requests
+            max_retries: Retries per request after the first attempt
+            retry_backoff: Initial delay in seconds between retries, doubled each time
         """
-        if key in self.cache:
-            # Update existing item and move to end
-            self.cache.move_to_end(key)
-        else:
-            # Add new item
-            if len(self.cache) >= self.max_size:
-                # Remove least recently used item
-                removed_key, _ = self.cache.popitem(last=False)
-                self.access_counts.pop(removed_key, None)
-                self.last_accessed.pop(removed_key, None)
-                logger.debug(f"Evicted from cache: {removed_key}")
-
-        self.cache[key] = value
-        self.access_counts[key] = self.access_counts.get(key, 0) + 1
-        self.last_accessed[key] = datetime.now()
-        logger.debug(f"Cached item with key: {key}")
-
-    def clear(self) -> None:
-        """Clear the entire cache."""
-        self.cache.clear()
-        self.access_counts.clear()
-        self.last_accessed.clear()
-        logger.info("Cache cleared")
-
-    def get_stats(self) -> dict[str, Any]:
-        """Get cache statistics.
+        self.manager = manager
+        self.batch_size = max(1, batch_size)
+        self.max_parallel = max(1, max_parallel)
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = retry_backoff
+        self.buffer: list[MemoryEntry] = []
+        self.written = 0
+        self.failed = 0
+        self.journal_failed = 0
+
+    def add(self, memory_entry: MemoryEntry) -> None:
+        """Buffer an entry, flushing once enough for every parallel request is queued."""
+        self.buffer.append(memory_entry)
+        if len(self.buffer) >= self.batch_size * self.max_parallel:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all buffered entries.
 
         Returns:
-            Dictionary with cache statistics
+            Number of entries written in this flush
         """
-        return {
-            "size": len(self.cache),
-            "max_size": self.max_size,
-            "total_accesses": sum(self.access_counts.values()),
-            "most_accessed": max(self.access_counts.items(), key=lambda x: x[1])
-            if self.access_counts
-            else None,
-        }
+        if not self.buffer:
+            return 0
+        entries, self.buffer = self.buffer, []
+
+        use_pinecone = self.manager.pinecone_enabled and self.manager.index is not None
+        if use_pinecone:
+            chunks = [
+                entries[i : i + self.batch_size]
+                for i in range(0, len(entries), self.batch_size)
+            ]
+            if len(chunks) == 1:
+                results = [self._upsert_chunk(chunks[0])]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.max_parallel, len(chunks))
+                ) as executor:
+                    results = list(executor.map(self._upsert_chunk, chunks))
+            stored = [
+                entry
+                for chunk, ok in zip(chunks, results, strict=True)
+                if ok
+                for entry in chunk
+            ]
+        else:
+            stored = entries
+
+        if stored and not self.manager._add_many_to_journal(stored):
+            if use_pinecone:
+                # The vectors are in the index; only the local journal copy is missing
+                self.journal_failed += len(stored)
+                logger.error(f"{len(stored)} upserted memories were not journaled")
+            else:
+                stored = []
+        self.written += len(stored)
+        self.failed += len(entries) - len(stored)
+        return len(stored)
+
+    def _upsert_chunk(self, chunk: list[MemoryEntry]) -> bool:
+        """Upsert one request's worth of vectors, retrying on failure."""
+        vectors = [_vector_record(entry) for entry in chunk]
+        delay = self.retry_backoff
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.manager.index.upsert(
+                    vectors, namespace=self.manager.pinecone_namespace
+                )
+                upserted = _upserted_count(response)
+                if upserted is None or upserted >= len(vectors):
+                    return True
+                logger.warning(
+                    f"Pinecone upserted {upserted}/{len(vectors)} vectors "
+                    f"(attempt {attempt + 1})"
+                )
+            except Exception as e:
+                logger.warning(f"Pinecone upsert failed (attempt {attempt + 1}): {e}")
+            if attempt < self.max_retries:
+                time.sleep(delay)
+                delay *= 2
+        logger.error(
+            f"Giving up on {len(vectors)} vectors after {self.max_retries + 1} attempts"
+        )
+        return False
+
+    def __enter__(self) -> "BufferedVectorWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
+
+
+def _upserted_count(response: Any) -> int | None:
+    """Read ``upserted_count`` from an upsert response, None if unavailable."""
+    if isinstance(response, dict):
+        count = response.get("upserted_count")
+    else:
+        count = getattr(response, "upserted_count", None)
+    return count if isinstance(count, int) else None
 
 
 class MemoryManager:
@@ -143,9 +210,21 @@ class MemoryManager:
 
     def __init__(self, settings: KortanaConfig, cache_size: int = 100):
         self.settings = settings
+        memory_settings = getattr(settings, "memory", None)
 
         # Initialize memory cache
-        self.memory_cache = MemoryCache(max_size=cache_size)
+        self.memory_cache = MemoryCache(
+            max_size=cache_size,
+            max_bytes=getattr(memory_settings, "cache_max_bytes", 32 * 1024 * 1024),
+            ttl_seconds=getattr(memory_settings, "cache_ttl_seconds", 300),
+        )
+        sweep_interval = getattr(memory_settings, "cache_sweep_interval", 60)
+        if sweep_interval:
+            self.memory_cache.start_expiry_sweeper(sweep_interval)
+
+        self.upsert_batch_size = getattr(memory_settings, "upsert_batch_size", 100)
+        self.upsert_max_parallel = getattr(memory_settings, "upsert_max_parallel", 4)
+        self.upsert_max_retries = getattr(memory_settings, "upsert_max_retries", 3)
 
         logger.info(f"MemoryManager received settings of type: {type(settings)}")
         try:
@@ -184,7 +263,6 @@ class MemoryManager:
         for path_to_ensure in paths_to_ensure:
             os.makedirs(os.path.dirname(path_to_ensure), exist_ok=True)
 
-        memory_settings = getattr(settings, "memory", None)
         if not memory_settings:
             logger.warning(
                 "settings.memory not found. Pinecone will be disabled. Check KortanaConfig initialization."
@@ -298,18 +376,10 @@ class MemoryManager:
 
         try:
             # Add to Pinecone
-            vector_id = memory_entry.id
-            vector = memory_entry.embedding
-            metadata = {
-                "text": memory_entry.text,
-                "timestamp": str(memory_entry.timestamp),
-                "tags": memory_entry.tags,
-                "source": memory_entry.source,
-            }
-
             self.index.upsert(
-                [(vector_id, vector, metadata)], namespace=self.pinecone_namespace
+                [_vector_record(memory_entry)], namespace=self.pinecone_namespace
             )
+            self.invalidate_search_cache()
 
             # Also add to journal for backup
             self._add_to_journal(memory_entry)
@@ -319,6 +389,56 @@ class MemoryManager:
             logger.error(f"Failed to add memory to Pinecone: {e}")
             return False
 
+    def add_memories(
+        self, memory_entries: Iterable[MemoryEntry], batch_size: int | None = None
+    ) -> int:
+        """
+        Add many memory entries with batched, parallel upserts.
+
+        Entries are streamed through a BufferedVectorWriter, so the iterable
+        can be larger than memory.
+
+        Args:
+            memory_entries: The memory entries to add.
+            batch_size: Vectors per upsert request (defaults to upsert_batch_size).
+
+        Returns:
+            Number of entries stored.
+        """
+        if not self.pinecone_enabled:
+            logger.warning(
+                "Pinecone not enabled. Memories will only be saved to journal."
+            )
+        with self.vector_writer(batch_size) as writer:
+            for memory_entry in memory_entries:
+                writer.add(memory_entry)
+        if writer.written:
+            self.invalidate_search_cache()
+        if writer.failed:
+            logger.error(f"Failed to store {writer.failed} memories")
+        if writer.journal_failed:
+            logger.error(
+                f"Stored {writer.journal_failed} memories that are missing from the journal"
+            )
+        return writer.written
+
+    def vector_writer(self, batch_size: int | None = None) -> BufferedVectorWriter:
+        """
+        Create a buffered writer using this manager's upsert settings.
+
+        Args:
+            batch_size: Vectors per upsert request (defaults to upsert_batch_size).
+
+        Returns:
+            A BufferedVectorWriter; use it as a context manager to flush on exit.
+        """
+        return BufferedVectorWriter(
+            self,
+            batch_size=batch_size or self.upsert_batch_size,
+            max_parallel=self.upsert_max_parallel,
+            max_retries=self.upsert_max_retries,
+        )
+
     def search_memory(
         self, query_vector: list[float], top_k: int = 5
     ) -> list[dict[str, Any]]:
@@ -335,10 +455,8 @@ class MemoryManager:
             logger.warning("Pinecone is not enabled or index is not initialized.")
             return []
 
-        # Create a deterministic cache key from the query vector
-        # Use string representation of the entire vector to avoid collisions
-        vector_str = ",".join(f"{v:.6f}" for v in query_vector)
-        cache_key = f"search_{vector_str}_{top_k}"
+        # Fixed-size key: hash of the vector quantized to six decimals
+        cache_key = vector_cache_key(query_vector, top_k)
 
         # Check cache first
         cached_result = self.memory_cache.get(cache_key)
@@ -395,6 +513,20 @@ class MemoryManager:
             logger.error(f"Failed to add memory to journal: {e}")
             return False
 
+    def _add_many_to_journal(self, memory_entries: list[MemoryEntry]) -> bool:
+        """Append memory entries to the journal file with a single write."""
+        try:
+            lines = "".join(
+                json.dumps(memory_entry.to_dict()) + "\n"
+                for memory_entry in memory_entries
+            )
+            with open(self.memory_journal_path, "a") as f:
+                f.write(lines)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to add memories to journal: {e}")
+            return False
+
     def get_cache_stats(self) -> dict[str, Any]:
         """Get statistics about the memory cache.
 
@@ -403,6 +535,14 @@ class MemoryManager:
         """
         return self.memory_cache.get_stats()
 
+    def invalidate_search_cache(self) -> int:
+        """Drop cached search results after memories were added or changed.
+
+        Returns:
+            Number of cached searches removed
+        """
+        return self.memory_cache.invalidate_prefix(SEARCH_PREFIX)
+
     def clear_cache(self) -> None:
         """Clear the memory cache."""
         self.memory_cache.clear()
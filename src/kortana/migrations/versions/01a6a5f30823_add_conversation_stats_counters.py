@@ -0,0 +1,133 @@
+"""add_conversation_stats_counters
+
+Revision ID: 01a6a5f30823
+Revises: b6acb507eca8
+Create Date: 2026-10-19 00:04:18.772930
+
+Adds the per-role and response-time counters behind conversation stats and
+fills them from message rows and, for archived conversations, from the
+compressed archive payloads.
+"""
+
+import gzip
+import json
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "01a6a5f30823"
+down_revision: str | None = "b6acb507eca8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COUNTERS = [
+    ("user_message_count", sa.Integer(), "0"),
+    ("assistant_message_count", sa.Integer(), "0"),
+    ("response_time_total_ms", sa.Float(), "0"),
+    ("response_time_samples", sa.Integer(), "0"),
+]
+
+conversations = sa.table(
+    "conversations",
+    sa.column("id", sa.Integer()),
+    sa.column("user_message_count", sa.Integer()),
+    sa.column("assistant_message_count", sa.Integer()),
+    sa.column("response_time_total_ms", sa.Float()),
+    sa.column("response_time_samples", sa.Integer()),
+)
+messages = sa.table(
+    "conversation_messages",
+    sa.column("conversation_id", sa.Integer()),
+    sa.column("role", sa.String()),
+    sa.column("extra_info", sa.JSON()),
+)
+archives = sa.table(
+    "conversation_message_archives",
+    sa.column("conversation_id", sa.Integer()),
+    sa.column("payload", sa.LargeBinary()),
+)
+
+
+def _has_column(table: str, column: str) -> bool:
+    columns = sa.inspect(op.get_bind()).get_columns(table)
+    return any(c["name"] == column for c in columns)
+
+
+def _backfill(bind: sa.engine.Connection) -> None:
+    """Compute every conversation's counters from its messages."""
+    counters: dict[int, list[float]] = {}
+
+    def add(conversation_id: int, user: int, assistant: int, total: float, n: int):
+        current = counters.setdefault(conversation_id, [0, 0, 0.0, 0])
+        for i, value in enumerate((user, assistant, total, n)):
+            current[i] += value
+
+    response_time = messages.c.extra_info["response_time_ms"].as_float()
+    rows = bind.execute(
+        sa.select(
+            messages.c.conversation_id,
+            sa.func.sum(sa.case((messages.c.role == "user", 1), else_=0)),
+            sa.func.sum(sa.case((messages.c.role == "assistant", 1), else_=0)),
+            sa.func.coalesce(sa.func.sum(response_time), 0.0),
+            sa.func.count(response_time),
+        ).group_by(messages.c.conversation_id)
+    )
+    for row in rows:
+        add(*row)
+
+    for conversation_id, payload in bind.execute(sa.select(archives)):
+        for item in json.loads(gzip.decompress(payload)):
+            value = (item.get("extra_info") or {}).get("response_time_ms")
+            timed = isinstance(value, int | float)
+            add(
+                conversation_id,
+                item.get("role") == "user",
+                item.get("role") == "assistant",
+                value if timed else 0.0,
+                timed,
+            )
+
+    for conversation_id, (user, assistant, total, samples) in counters.items():
+        bind.execute(
+            conversations.update()
+            .where(conversations.c.id == conversation_id)
+            .values(
+                user_message_count=user,
+                assistant_message_count=assistant,
+                response_time_total_ms=total,
+                response_time_samples=samples,
+            )
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    tables = sa.inspect(bind).get_table_names()
+    # Databases without conversation tables get them, complete, from create_all
+    if "conversations" not in tables or _has_column(
+        "conversations", "user_message_count"
+    ):
+        return
+
+    for name, type_, default in COUNTERS:
+        op.add_column(
+            "conversations",
+            sa.Column(name, type_, nullable=False, server_default=default),
+        )
+    _backfill(bind)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if "conversations" not in sa.inspect(bind).get_table_names():
+        return
+    present = [name for name, _, _ in COUNTERS if _has_column("conversations", name)]
+    if present:
+        with op.batch_alter_table("conversations") as batch_op:
+            for name in present:
+                batch_op.drop_column(name)
@@ -0,0 +1,89 @@
+"""add_conversation_message_archives
+
+Revision ID: 3495905fdcf4
+Revises: daae8c594417
+Create Date: 2026-10-18 23:40:12.118204
+
+Conversations archived before this revision keep their message rows; run
+``ConversationHistoryService.backfill_archived_messages`` to move them into
+archive storage.
+"""
+
+import gzip
+import json
+from collections.abc import Sequence
+from datetime import datetime
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3495905fdcf4"
+down_revision: str | None = "daae8c594417"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    tables = sa.inspect(op.get_bind()).get_table_names()
+    # Databases without conversation tables get them, complete, from create_all
+    if "conversations" not in tables or "conversation_message_archives" in tables:
+        return
+    op.create_table(
+        "conversation_message_archives",
+        sa.Column("conversation_id", sa.Integer(), nullable=False),
+        sa.Column("codec", sa.String(length=20), nullable=False),
+        sa.Column("message_count", sa.Integer(), nullable=False),
+        sa.Column("uncompressed_size", sa.Integer(), nullable=False),
+        sa.Column("payload", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["conversation_id"], ["conversations.id"]),
+        sa.PrimaryKeyConstraint("conversation_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema, moving archived messages back into the message table."""
+    bind = op.get_bind()
+    if "conversation_message_archives" not in sa.inspect(bind).get_table_names():
+        return
+
+    archives = sa.table(
+        "conversation_message_archives",
+        sa.column("conversation_id", sa.Integer()),
+        sa.column("payload", sa.LargeBinary()),
+    )
+    messages = sa.table(
+        "conversation_messages",
+        sa.column("conversation_id", sa.Integer()),
+        sa.column("role", sa.String()),
+        sa.column("content", sa.Text()),
+        sa.column("extra_info", sa.JSON(none_as_null=True)),
+        sa.column("created_at", sa.DateTime(timezone=True)),
+    )
+    for conversation_id, payload in bind.execute(sa.select(archives)).all():
+        # New IDs: rows added after archiving may have reused the old ones
+        rows = [
+            {
+                "conversation_id": conversation_id,
+                "role": item["role"],
+                "content": item["content"],
+                "extra_info": item.get("extra_info"),
+                "created_at": (
+                    datetime.fromisoformat(item["created_at"])
+                    if item.get("created_at")
+                    else None
+                ),
+            }
+            for item in json.loads(gzip.decompress(payload))
+        ]
+        if rows:
+            op.bulk_insert(messages, rows)
+    op.drop_table("conversation_message_archives")
@@ -0,0 +1,83 @@
+"""add_conversation_search_index
+
+Revision ID: b6acb507eca8
+Revises: 3495905fdcf4
+Create Date: 2026-10-18 23:52:40.503117
+
+Adds the denormalized ``conversations.message_count`` column and the
+full-text index over ``conversation_messages.content`` (FTS5 on SQLite, a
+generated tsvector column with a GIN index on PostgreSQL), and fills both
+from the existing rows.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+FTS_TABLE = "conversation_messages_fts"
+
+# revision identifiers, used by Alembic.
+revision: str = "b6acb507eca8"
+down_revision: str | None = "3495905fdcf4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    columns = sa.inspect(op.get_bind()).get_columns(table)
+    return any(c["name"] == column for c in columns)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    tables = sa.inspect(bind).get_table_names()
+    # Databases without conversation tables get them, complete, from create_all
+    if "conversations" not in tables or _has_column("conversations", "message_count"):
+        return
+
+    op.add_column(
+        "conversations",
+        sa.Column("message_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    # Archived conversations keep their messages in the archive table
+    op.execute(
+        """
+        UPDATE conversations SET message_count = (
+            SELECT COUNT(*) FROM conversation_messages m
+            WHERE m.conversation_id = conversations.id
+        ) + COALESCE((
+            SELECT a.message_count FROM conversation_message_archives a
+            WHERE a.conversation_id = conversations.id
+        ), 0)
+        """
+    )
+    # Imported here so listing revisions does not need the package importable
+    from kortana.modules.conversation_history.search_index import (
+        install_search_index,
+    )
+
+    install_search_index(bind)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if "conversations" not in sa.inspect(bind).get_table_names():
+        return
+
+    if bind.dialect.name == "sqlite":
+        for suffix in ("ai", "ad", "au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}")
+        op.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    elif bind.dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_conversation_messages_content_tsv")
+        op.execute(
+            "ALTER TABLE conversation_messages DROP COLUMN IF EXISTS content_tsv"
+        )
+
+    if _has_column("conversations", "message_count"):
+        with op.batch_alter_table("conversations") as batch_op:
+            batch_op.drop_column("message_count")
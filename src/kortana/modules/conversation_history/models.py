@@ -2,13 +2,27 @@
 
 import enum
 
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    JSON,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    event,
+)
 from sqlalchemy import Enum as SQLAlchemyEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from kortana.services.database import Base
 
+from .search_index import SEARCH_INDEX_DDL
+
 
 class ConversationStatus(enum.Enum):
     ACTIVE = "active"
@@ -37,6 +51,18 @@ class Conversation(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
     archived_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    # Denormalized counters, maintained by add_message
+    message_count = Column(Integer, nullable=False, default=0, server_default="0")
+    user_message_count = Column(Integer, nullable=False, default=0, server_default="0")
+    assistant_message_count = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    response_time_total_ms = Column(
+        Float, nullable=False, default=0.0, server_default="0"
+    )
+    response_time_samples = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     # Relationship to messages
     messages = relationship(
@@ -46,6 +72,14 @@ class Conversation(Base):
         order_by="ConversationMessage.created_at",
     )
 
+    # Compressed messages of an archived conversation
+    message_archive = relationship(
+        "ConversationMessageArchive",
+        back_populates="conversation",
+        uselist=False,
+        cascade="all, delete-orphan",
+    )
+
     def __repr__(self):
         return f"<Conversation(id={self.id}, user_id='{self.user_id}', status='{self.status.value}')>"
 
@@ -70,3 +104,39 @@ class ConversationMessage(Base):
 
     def __repr__(self):
         return f"<ConversationMessage(id={self.id}, conversation_id={self.conversation_id}, role='{self.role}')>"
+
+
+# Full-text index over message content, created alongside the table
+for _dialect, _statements in SEARCH_INDEX_DDL.items():
+    for _statement in _statements:
+        event.listen(
+            ConversationMessage.__table__,
+            "after_create",
+            DDL(_statement).execute_if(dialect=_dialect),
+        )
+
+
+class ConversationMessageArchive(Base):
+    """Compressed message payload of an archived conversation.
+
+    Archiving moves a conversation's rows out of ``conversation_messages`` into a
+    single compressed BLOB here, so the hot message table only holds active data.
+    """
+
+    __tablename__ = "conversation_message_archives"
+    __table_args__ = {"extend_existing": True}
+
+    conversation_id = Column(
+        Integer, ForeignKey("conversations.id"), primary_key=True
+    )
+    codec = Column(String(20), nullable=False, default="gzip")
+    message_count = Column(Integer, nullable=False, default=0)
+    uncompressed_size = Column(Integer, nullable=False, default=0)
+    payload = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationship to conversation
+    conversation = relationship("Conversation", back_populates="message_archive")
+
+    def __repr__(self):
+        return f"<ConversationMessageArchive(conversation_id={self.conversation_id}, messages={self.message_count})>"
@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field
 
 from .models import ConversationStatus
 
@@ -18,7 +18,10 @@ class ConversationMessageResponse(BaseModel):
     conversation_id: int
     role: str
     content: str
-    metadata: dict[str, Any] | None
+    # Stored as extra_info: the ORM's own ``metadata`` is the table MetaData
+    metadata: dict[str, Any] | None = Field(
+        None, validation_alias=AliasChoices("extra_info", "metadata")
+    )
     created_at: datetime
 
     class Config:
@@ -42,7 +45,10 @@ class ConversationResponse(BaseModel):
     user_id: str
     title: str | None
     status: ConversationStatus
-    metadata: dict[str, Any] | None
+    # Stored as extra_info: the ORM's own ``metadata`` is the table MetaData
+    metadata: dict[str, Any] | None = Field(
+        None, validation_alias=AliasChoices("extra_info", "metadata")
+    )
     created_at: datetime
     updated_at: datetime
     archived_at: datetime | None
@@ -64,3 +70,11 @@ class ConversationSearchFilters(BaseModel):
     min_length: int | None = Field(None, ge=0, description="Minimum number of messages")
     max_length: int | None = Field(None, ge=0, description="Maximum number of messages")
     status: ConversationStatus | None = None
+
+
+class ConversationSearchHit(BaseModel):
+    conversation_id: int
+    message_id: int
+    role: str
+    snippet: str = Field(..., description="Matching excerpt with terms wrapped in [ ]")
+    rank: float = Field(..., description="Relevance rank, lower is better")
@@ -0,0 +1,194 @@
+"""Full-text search index for conversation messages.
+
+SQLite databases get an external-content FTS5 table kept in sync with
+``conversation_messages`` by triggers; PostgreSQL gets a generated ``tsvector``
+column with a GIN index. Both are maintained by the database itself, so every
+insert done by ``add_message`` (and every delete done by archiving) updates the
+index without extra round-trips. Other dialects fall back to a LIKE scan.
+"""
+
+from typing import Any
+
+from sqlalchemy import Float, Integer, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.selectable import Subquery
+
+FTS_TABLE = "conversation_messages_fts"
+
+SEARCH_INDEX_DDL: dict[str, list[str]] = {
+    "sqlite": [
+        f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+            content,
+            content='conversation_messages',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )""",
+        f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai
+        AFTER INSERT ON conversation_messages BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, content) VALUES (new.id, new.content);
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad
+        AFTER DELETE ON conversation_messages BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, content)
+            VALUES ('delete', old.id, old.content);
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au
+        AFTER UPDATE OF content ON conversation_messages BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, content)
+            VALUES ('delete', old.id, old.content);
+            INSERT INTO {FTS_TABLE}(rowid, content) VALUES (new.id, new.content);
+        END""",
+    ],
+    "postgresql": [
+        """ALTER TABLE conversation_messages ADD COLUMN IF NOT EXISTS content_tsv tsvector
+        GENERATED ALWAYS AS (to_tsvector('english', content)) STORED""",
+        """CREATE INDEX IF NOT EXISTS ix_conversation_messages_content_tsv
+        ON conversation_messages USING GIN (content_tsv)""",
+    ],
+}
+
+# Per-conversation best match; "rank" is lower-is-better on every backend
+_CONVERSATION_MATCHES = {
+    "sqlite": f"""
+        SELECT m.conversation_id AS conversation_id, MIN(hits.score) AS rank
+        FROM (
+            -- FTS5's hidden rank column is bm25(); calling bm25() directly is
+            -- not allowed once SQLite flattens this into the aggregate
+            SELECT rowid, rank AS score
+            FROM {FTS_TABLE}
+            WHERE {FTS_TABLE} MATCH :query
+        ) AS hits
+        JOIN conversation_messages m ON m.id = hits.rowid
+        GROUP BY m.conversation_id
+    """,
+    "postgresql": """
+        SELECT m.conversation_id AS conversation_id,
+               MIN(-ts_rank(m.content_tsv, q)) AS rank
+        FROM conversation_messages m, to_tsquery('english', :query) q
+        WHERE m.content_tsv @@ q
+        GROUP BY m.conversation_id
+    """,
+    "default": """
+        SELECT conversation_id, 0.0 AS rank
+        FROM conversation_messages
+        WHERE lower(content) LIKE lower(:query)
+        GROUP BY conversation_id
+    """,
+}
+
+_MESSAGE_HITS = {
+    "sqlite": f"""
+        SELECT m.conversation_id, m.id AS message_id, m.role,
+               snippet({FTS_TABLE}, 0, '[', ']', '...', 16) AS snippet,
+               bm25({FTS_TABLE}) AS rank
+        FROM {FTS_TABLE}
+        JOIN conversation_messages m ON m.id = {FTS_TABLE}.rowid
+        JOIN conversations c ON c.id = m.conversation_id
+        WHERE {FTS_TABLE} MATCH :query
+          AND (:user_id IS NULL OR c.user_id = :user_id)
+        ORDER BY rank
+        LIMIT :limit
+    """,
+    "postgresql": """
+        SELECT m.conversation_id, m.id AS message_id, m.role,
+               ts_headline('english', m.content, q,
+                           'StartSel=[, StopSel=], MaxWords=16, MinWords=4') AS snippet,
+               -ts_rank(m.content_tsv, q) AS rank
+        FROM conversation_messages m
+        JOIN conversations c ON c.id = m.conversation_id,
+             to_tsquery('english', :query) q
+        WHERE m.content_tsv @@ q
+          AND (CAST(:user_id AS VARCHAR) IS NULL OR c.user_id = :user_id)
+        ORDER BY rank
+        LIMIT :limit
+    """,
+    "default": """
+        SELECT m.conversation_id, m.id AS message_id, m.role,
+               substr(m.content, 1, 200) AS snippet, 0.0 AS rank
+        FROM conversation_messages m
+        JOIN conversations c ON c.id = m.conversation_id
+        WHERE lower(m.content) LIKE lower(:query)
+          AND (:user_id IS NULL OR c.user_id = :user_id)
+        ORDER BY m.created_at DESC
+        LIMIT :limit
+    """,
+}
+
+
+def _dialect(db: Session) -> str:
+    """Return the search backend key for the session's database."""
+    name = getattr(getattr(db.get_bind(), "dialect", None), "name", None)
+    return name if name in SEARCH_INDEX_DDL else "default"
+
+
+def has_terms(keyword: str | None) -> bool:
+    """Whether ``keyword`` contains anything to search for."""
+    return bool(keyword and keyword.split())
+
+
+def _query_param(dialect: str, keyword: str) -> str:
+    """Translate a user keyword into the backend's query syntax.
+
+    Every term matches as a prefix, so partial words ("hel") still find
+    messages as they did with the former substring scan.
+    """
+    terms = keyword.split()
+    if dialect == "sqlite":
+        # Quote every term so user input can never be parsed as FTS5 syntax
+        return " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+    if dialect == "postgresql":
+        return " & ".join(
+            "'" + term.replace("\\", "\\\\").replace("'", "''") + "':*"
+            for term in terms
+        )
+    return f"%{keyword}%"
+
+
+def conversation_matches(db: Session, keyword: str) -> Subquery:
+    """Subquery of (conversation_id, rank) for conversations matching ``keyword``.
+
+    Each conversation appears once, with the rank of its best matching message.
+    Callers should skip the filter when ``keyword`` has no terms (see
+    ``has_terms``); an empty full-text query is an error on SQLite.
+    """
+    dialect = _dialect(db)
+    return (
+        text(_CONVERSATION_MATCHES[dialect])
+        .bindparams(query=_query_param(dialect, keyword))
+        .columns(conversation_id=Integer, rank=Float)
+        .subquery("keyword_matches")
+    )
+
+
+def search_messages(
+    db: Session, keyword: str, user_id: str | None = None, limit: int = 20
+) -> list[dict[str, Any]]:
+    """Return the best matching messages for ``keyword`` with highlighted snippets."""
+    if not has_terms(keyword):
+        return []
+    dialect = _dialect(db)
+    rows = db.execute(
+        text(_MESSAGE_HITS[dialect]),
+        {
+            "query": _query_param(dialect, keyword),
+            "user_id": user_id,
+            "limit": limit,
+        },
+    )
+    return [dict(row._mapping) for row in rows]
+
+
+def install_search_index(connection: Connection) -> None:
+    """Create the search index on an existing database and index current rows.
+
+    ``Base.metadata.create_all`` installs the index for new databases; this is
+    for databases whose ``conversation_messages`` table predates it.
+    """
+    dialect = connection.dialect.name
+    for statement in SEARCH_INDEX_DDL.get(dialect, []):
+        connection.execute(text(statement))
+    if dialect == "sqlite":
+        connection.execute(
+            text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        )
@@ -4,10 +4,11 @@ import json
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import and_, func, or_
+from sqlalchemy import case, func, inspect, update
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from . import models, schemas
+from . import models, schemas, search_index
 
 
 class ConversationHistoryService:
@@ -35,14 +36,46 @@ class ConversationHistoryService:
         if not conversation:
             raise ValueError(f"Conversation {conversation_id} not found")
 
+        # ``metadata`` is stored as extra_info: on the ORM class it names the
+        # table MetaData, so passing it through would never reach a column
         db_message = models.ConversationMessage(
-            conversation_id=conversation_id, **message_create.model_dump()
+            conversation_id=conversation_id,
+            extra_info=message_create.metadata,
+            **message_create.model_dump(exclude={"metadata"}),
         )
         self.db.add(db_message)
+        self._increment_counters(conversation, message_create)
         self.db.commit()
         self.db.refresh(db_message)
         return db_message
 
+    @staticmethod
+    def _increment_counters(
+        conversation: models.Conversation,
+        message_create: schemas.ConversationMessageCreate,
+    ) -> None:
+        """Update the conversation's stats counters for a new message.
+
+        Counters are assigned as SQL expressions so concurrent writers
+        increment the stored value rather than overwrite it.
+        """
+        conversation.message_count = models.Conversation.message_count + 1
+        if message_create.role == "user":
+            conversation.user_message_count = models.Conversation.user_message_count + 1
+        elif message_create.role == "assistant":
+            conversation.assistant_message_count = (
+                models.Conversation.assistant_message_count + 1
+            )
+
+        response_time = (message_create.metadata or {}).get("response_time_ms")
+        if isinstance(response_time, int | float):
+            conversation.response_time_total_ms = (
+                models.Conversation.response_time_total_ms + response_time
+            )
+            conversation.response_time_samples = (
+                models.Conversation.response_time_samples + 1
+            )
+
     def get_conversation_by_id(
         self, conversation_id: int, include_messages: bool = False
     ) -> models.Conversation | None:
@@ -52,9 +85,20 @@ class ConversationHistoryService:
         )
 
         if include_messages:
-            query = query.options(joinedload(models.Conversation.messages))
+            query = query.options(
+                joinedload(models.Conversation.messages),
+                joinedload(models.Conversation.message_archive),
+            )
 
-        return query.first()
+        conversation = query.first()
+        if (
+            include_messages
+            and conversation is not None
+            and conversation.status == models.ConversationStatus.ARCHIVED
+            and conversation.message_archive is not None
+        ):
+            self._attach_archived_messages(conversation)
+        return conversation
 
     def get_user_conversations(
         self, user_id: str, skip: int = 0, limit: int = 100
@@ -98,82 +142,147 @@ class ConversationHistoryService:
         if filters.status:
             query = query.filter(models.Conversation.status == filters.status)
 
-        # Apply keyword search in messages
-        if filters.keyword:
-            query = query.join(models.ConversationMessage).filter(
-                models.ConversationMessage.content.ilike(f"%{filters.keyword}%")
+        # Apply keyword search through the full-text index
+        keyword = filters.keyword if search_index.has_terms(filters.keyword) else None
+        if keyword:
+            matches = search_index.conversation_matches(self.db, keyword)
+            query = query.join(
+                matches, models.Conversation.id == matches.c.conversation_id
             )
 
         # Apply length filters (message count)
-        if filters.min_length is not None or filters.max_length is not None:
-            # Add subquery to count messages
-            message_count = (
-                self.db.query(
-                    models.ConversationMessage.conversation_id,
-                    func.count(models.ConversationMessage.id).label("msg_count"),
-                )
-                .group_by(models.ConversationMessage.conversation_id)
-                .subquery()
-            )
+        if filters.min_length is not None:
+            query = query.filter(models.Conversation.message_count >= filters.min_length)
+        if filters.max_length is not None:
+            query = query.filter(models.Conversation.message_count <= filters.max_length)
 
-            query = query.outerjoin(
-                message_count, models.Conversation.id == message_count.c.conversation_id
-            )
+        # Order by relevance (for keyword searches), then most recent
+        if keyword:
+            query = query.order_by(matches.c.rank, models.Conversation.updated_at.desc())
+        else:
+            query = query.order_by(models.Conversation.updated_at.desc())
 
-            if filters.min_length is not None:
-                query = query.filter(
-                    or_(
-                        message_count.c.msg_count >= filters.min_length,
-                        message_count.c.msg_count.is_(None),
-                    )
-                )
-            if filters.max_length is not None:
-                query = query.filter(
-                    or_(
-                        message_count.c.msg_count <= filters.max_length,
-                        message_count.c.msg_count.is_(None),
-                    )
-                )
+        return query.offset(skip).limit(limit).all()
 
-        # Order by most recent and apply pagination
-        return (
-            query.order_by(models.Conversation.updated_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+    def search_messages(
+        self, keyword: str, user_id: str | None = None, limit: int = 20
+    ) -> list[dict[str, Any]]:
+        """Ranked full-text search over messages, with highlighted snippets."""
+        return search_index.search_messages(self.db, keyword, user_id=user_id, limit=limit)
 
     def archive_conversation(self, conversation_id: int) -> models.Conversation | None:
-        """Archive a conversation for long-term storage."""
+        """Archive a conversation for long-term storage.
+
+        The conversation's messages are compressed into a single
+        ``conversation_message_archives`` row and deleted from
+        ``conversation_messages`` in the same transaction. Archiving again
+        folds messages added since into the existing archive.
+        """
         conversation = self.get_conversation_by_id(conversation_id, include_messages=True)
         if not conversation:
             return None
 
+        self._move_messages_to_archive(conversation)
+
         # Update status and timestamp
         conversation.status = models.ConversationStatus.ARCHIVED
         conversation.archived_at = datetime.utcnow()
 
-        # Optionally compress old messages in metadata for storage optimization
-        if conversation.messages:
-            # Store compressed message data
-            message_data = [
-                {
-                    "role": msg.role,
-                    "content": msg.content,
-                    "created_at": msg.created_at.isoformat(),
-                }
-                for msg in conversation.messages
-            ]
-            compressed = gzip.compress(json.dumps(message_data).encode("utf-8"))
-            if not conversation.metadata:
-                conversation.metadata = {}
-            conversation.metadata["compressed_messages"] = compressed.hex()
-            conversation.metadata["compression_date"] = datetime.utcnow().isoformat()
-
         self.db.commit()
         self.db.refresh(conversation)
+        self._attach_archived_messages(conversation)
         return conversation
 
+    def backfill_archived_messages(self, batch_size: int = 100) -> int:
+        """Move messages of already-archived conversations into archive storage.
+
+        Handles conversations archived before messages were moved out of the hot
+        table. Each batch is committed separately.
+
+        Returns:
+            Number of conversations backfilled
+        """
+        backfilled = 0
+        while True:
+            batch = (
+                self.db.query(models.Conversation)
+                .filter(
+                    models.Conversation.status == models.ConversationStatus.ARCHIVED,
+                    ~models.Conversation.message_archive.has(),
+                )
+                .order_by(models.Conversation.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not batch:
+                return backfilled
+
+            for conversation in batch:
+                self._move_messages_to_archive(conversation)
+            self.db.commit()
+            backfilled += len(batch)
+
+    def _move_messages_to_archive(self, conversation: models.Conversation) -> None:
+        """Compress a conversation's messages into its archive row and delete them.
+
+        ``conversation.messages`` must already include any archived messages
+        (see ``_attach_archived_messages``), as the archive is rewritten whole.
+        """
+        message_data = [
+            {
+                "id": msg.id,
+                "role": msg.role,
+                "content": msg.content,
+                "extra_info": msg.extra_info,
+                "created_at": msg.created_at.isoformat() if msg.created_at else None,
+            }
+            for msg in conversation.messages
+        ]
+        raw = json.dumps(message_data).encode("utf-8")
+
+        archive = conversation.message_archive
+        if archive is None:
+            archive = conversation.message_archive = models.ConversationMessageArchive()
+        archive.codec = "gzip"
+        archive.message_count = len(message_data)
+        archive.uncompressed_size = len(raw)
+        archive.payload = gzip.compress(raw)
+        self.db.query(models.ConversationMessage).filter(
+            models.ConversationMessage.conversation_id == conversation.id
+        ).delete()
+
+    def _attach_archived_messages(self, conversation: models.Conversation) -> None:
+        """Populate ``conversation.messages`` from its compressed archive.
+
+        The restored messages are transient objects set as the collection's
+        committed value, so they are readable like loaded rows but are never
+        flushed back to ``conversation_messages``. Messages added after the
+        conversation was archived are still rows there and follow them.
+        """
+        archive = conversation.message_archive
+        if archive is None:
+            return
+        # Skips messages restored by an earlier call, which are transient
+        added_since = [m for m in conversation.messages if inspect(m).persistent]
+
+        message_data = json.loads(gzip.decompress(archive.payload))
+        messages = [
+            models.ConversationMessage(
+                id=item.get("id"),
+                conversation_id=conversation.id,
+                role=item["role"],
+                content=item["content"],
+                extra_info=item.get("extra_info"),
+                created_at=(
+                    datetime.fromisoformat(item["created_at"])
+                    if item.get("created_at")
+                    else None
+                ),
+            )
+            for item in message_data
+        ]
+        set_committed_value(conversation, "messages", messages + added_since)
+
     def delete_conversation(self, conversation_id: int) -> bool:
         """Delete a conversation (soft delete)."""
         conversation = self.get_conversation_by_id(conversation_id)
@@ -185,33 +294,131 @@ class ConversationHistoryService:
         return True
 
     def get_conversation_stats(self, conversation_id: int) -> dict[str, Any]:
-        """Get statistics for a conversation."""
-        conversation = self.get_conversation_by_id(conversation_id, include_messages=True)
+        """Get statistics for a conversation from its stored counters."""
+        conversation = self.get_conversation_by_id(conversation_id)
         if not conversation:
             return {}
+        return self._stats_from_counters(conversation)
 
-        messages = conversation.messages
-        total_messages = len(messages)
-        user_messages = sum(1 for msg in messages if msg.role == "user")
-        assistant_messages = sum(1 for msg in messages if msg.role == "assistant")
-
-        # Calculate average response time if metadata available
-        avg_response_time = None
-        response_times = [
-            msg.metadata.get("response_time_ms")
-            for msg in messages
-            if msg.metadata and "response_time_ms" in msg.metadata
-        ]
-        if response_times:
-            avg_response_time = sum(response_times) / len(response_times)
+    def get_conversations_stats(
+        self,
+        conversation_ids: list[int] | None = None,
+        user_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Get per-conversation stats and totals for many conversations.
+
+        Only conversation rows are read, so the cost is one row per
+        conversation regardless of how many messages each holds.
+        """
+        query = self.db.query(models.Conversation)
+        if conversation_ids is not None:
+            query = query.filter(models.Conversation.id.in_(conversation_ids))
+        if user_id is not None:
+            query = query.filter(models.Conversation.user_id == user_id)
+
+        rows = query.order_by(models.Conversation.id).all()
+        conversations = [self._stats_from_counters(conversation) for conversation in rows]
+        response_time_total = sum(c.response_time_total_ms or 0.0 for c in rows)
+        response_time_samples = sum(c.response_time_samples or 0 for c in rows)
+
+        return {
+            "conversations": conversations,
+            "totals": {
+                "conversation_count": len(conversations),
+                "total_messages": sum(c["total_messages"] for c in conversations),
+                "user_messages": sum(c["user_messages"] for c in conversations),
+                "assistant_messages": sum(
+                    c["assistant_messages"] for c in conversations
+                ),
+                "average_response_time_ms": (
+                    response_time_total / response_time_samples
+                    if response_time_samples
+                    else None
+                ),
+            },
+        }
+
+    def refresh_conversation_counters(self) -> int:
+        """Recompute stats counters from message rows with one aggregate query.
+
+        Backfills conversations whose messages predate the counters. For an
+        archived conversation that has gained messages since, the archived
+        messages are counted from its archive on top of the rows. Archived
+        conversations with no message rows keep their stored counters.
+
+        Returns:
+            Number of conversations updated
+        """
+        message = models.ConversationMessage
+        response_time = message.extra_info["response_time_ms"].as_float()
+        rows = (
+            self.db.query(
+                message.conversation_id,
+                func.count(message.id),
+                func.sum(case((message.role == "user", 1), else_=0)),
+                func.sum(case((message.role == "assistant", 1), else_=0)),
+                func.coalesce(func.sum(response_time), 0.0),
+                func.count(response_time),
+            )
+            .group_by(message.conversation_id)
+            .all()
+        )
+        if not rows:
+            return 0
+        counters = {row[0]: list(row[1:]) for row in rows}
+
+        archives = self.db.query(models.ConversationMessageArchive).filter(
+            models.ConversationMessageArchive.conversation_id.in_(
+                self.db.query(message.conversation_id).distinct()
+            )
+        )
+        for archive in archives:
+            current = counters[archive.conversation_id]
+            for item in json.loads(gzip.decompress(archive.payload)):
+                value = (item.get("extra_info") or {}).get("response_time_ms")
+                timed = isinstance(value, int | float)
+                current[0] += 1
+                current[1] += item.get("role") == "user"
+                current[2] += item.get("role") == "assistant"
+                current[3] += value if timed else 0.0
+                current[4] += timed
+
+        self.db.execute(
+            update(models.Conversation),
+            [
+                {
+                    "id": conversation_id,
+                    "message_count": total,
+                    "user_message_count": user,
+                    "assistant_message_count": assistant,
+                    "response_time_total_ms": response_total,
+                    "response_time_samples": response_samples,
+                }
+                for conversation_id, (
+                    total,
+                    user,
+                    assistant,
+                    response_total,
+                    response_samples,
+                ) in counters.items()
+            ],
+        )
+        self.db.commit()
+        return len(counters)
 
+    @staticmethod
+    def _stats_from_counters(conversation: models.Conversation) -> dict[str, Any]:
+        """Build the stats payload from a conversation's counter columns."""
+        samples = conversation.response_time_samples or 0
         return {
-            "conversation_id": conversation_id,
-            "total_messages": total_messages,
-            "user_messages": user_messages,
-            "assistant_messages": assistant_messages,
+            "conversation_id": conversation.id,
+            "total_messages": conversation.message_count or 0,
+            "user_messages": conversation.user_message_count or 0,
+            "assistant_messages": conversation.assistant_message_count or 0,
             "created_at": conversation.created_at,
             "updated_at": conversation.updated_at,
             "status": conversation.status.value,
-            "average_response_time_ms": avg_response_time,
+            "average_response_time_ms": (
+                conversation.response_time_total_ms / samples if samples else None
+            ),
         }
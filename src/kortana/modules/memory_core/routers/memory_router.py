@@ -1,9 +1,10 @@
 # src/kortana/modules/memory_core/routers/memory_router.py
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ....services.database import get_db_sync  # Adjust path as needed
+from ....services.database import get_async_db  # Adjust path as needed
 
 # Assuming these are in the parent directory of this routers module
 from .. import schemas, services
@@ -14,27 +15,47 @@ router = APIRouter(
 )
 
 
+# MemoryCoreService is synchronous; its calls run via AsyncSession.run_sync and
+# results are serialized inside that call so no lazy load happens on the loop.
+
+
 @router.post("/", response_model=schemas.CoreMemoryDisplay)
-def create_memory_endpoint(
-    memory: schemas.CoreMemoryCreate, db: Session = Depends(get_db_sync)
+async def create_memory_endpoint(
+    memory: schemas.CoreMemoryCreate, db: AsyncSession = Depends(get_async_db)
 ):
-    service = services.MemoryCoreService(db=db)
-    return service.create_memory(memory_create=memory)
+    # The embedding call can block on the network, so keep it off the event loop
+    embedding = await run_in_threadpool(services.MemoryCoreService.embed_memory, memory)
+
+    def create(session):
+        service = services.MemoryCoreService(db=session)
+        db_memory = service.create_memory(memory_create=memory, embedding=embedding)
+        return schemas.CoreMemoryDisplay.model_validate(db_memory)
+
+    return await db.run_sync(create)
 
 
 @router.get("/", response_model=list[schemas.CoreMemoryDisplay])
-def read_memories_endpoint(
-    skip: int = 0, limit: int = 100, db: Session = Depends(get_db_sync)
+async def read_memories_endpoint(
+    skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_db)
 ):
-    service = services.MemoryCoreService(db=db)
-    memories = service.get_all_memories(skip=skip, limit=limit)
-    return memories
+    def read(session):
+        service = services.MemoryCoreService(db=session)
+        memories = service.get_all_memories(skip=skip, limit=limit)
+        return [schemas.CoreMemoryDisplay.model_validate(m) for m in memories]
+
+    return await db.run_sync(read)
 
 
 @router.get("/{memory_id}", response_model=schemas.CoreMemoryDisplay)
-def read_memory_endpoint(memory_id: int, db: Session = Depends(get_db_sync)):
-    service = services.MemoryCoreService(db=db)
-    db_memory = service.get_memory_by_id(memory_id=memory_id)
+async def read_memory_endpoint(memory_id: int, db: AsyncSession = Depends(get_async_db)):
+    def read(session):
+        service = services.MemoryCoreService(db=session)
+        db_memory = service.get_memory_by_id(memory_id=memory_id)
+        if db_memory is None:
+            return None
+        return schemas.CoreMemoryDisplay.model_validate(db_memory)
+
+    db_memory = await db.run_sync(read)
     if db_memory is None:
         raise HTTPException(status_code=404, detail="Memory not found")
     return db_memory
@@ -1,11 +1,10 @@
-import hashlib
 import time
-from functools import lru_cache
 from typing import Any
 
 import numpy as np
 from sqlalchemy.orm import Session, joinedload
 
+from kortana.memory.cache import SEARCH_PREFIX, MemoryCache, text_cache_key
 from kortana.services.embedding_service import embedding_service
 
 from . import models, schemas
@@ -23,36 +22,48 @@ def cosine_similarity(v1, v2):
     return np.dot(v1, v2) / (norm_v1 * norm_v2)
 
 
-# Smart cache for frequently accessed queries
-@lru_cache(maxsize=256)
-def _cached_query_hash(query: str) -> str:
-    """Generate a hash for a query to use as cache key."""
-    return hashlib.md5(query.encode()).hexdigest()
-
-
 class MemoryCoreService:
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        cache_max_bytes: int = 16 * 1024 * 1024,
+        cache_ttl: int = 300,
+    ):
         self.db = db
-        # Cache for frequently accessed memories (memory_id -> (memory, timestamp))
-        self._memory_cache: dict[int, tuple[models.CoreMemory, float]] = {}
-        # Cache for search results (query_hash -> (results, timestamp))
-        self._search_cache: dict[str, tuple[list[dict], float]] = {}
         # Cache expiry in seconds (5 minutes)
-        self._cache_ttl = 300
+        self._cache_ttl = cache_ttl
+        # Frequently accessed memories (memory_id -> memory) and search results
+        # (query key -> results), each bounded by entry count and bytes
+        self._memory_cache = MemoryCache(
+            max_size=1000, max_bytes=cache_max_bytes // 2, ttl_seconds=cache_ttl
+        )
+        self._search_cache = MemoryCache(
+            max_size=256, max_bytes=cache_max_bytes // 2, ttl_seconds=cache_ttl
+        )
 
-    def create_memory(
-        self, memory_create: schemas.CoreMemoryCreate
-    ) -> models.CoreMemory:
-        """
-        Creates a new memory, generates its embedding, and stores it.
-        """
-        # Generate embedding for the memory's content
+    @staticmethod
+    def embed_memory(memory_create: schemas.CoreMemoryCreate) -> list[float] | None:
+        """Generate the embedding stored with a new memory."""
         text_to_embed = memory_create.content
         if memory_create.title:
             # Combining title and content can create a richer embedding
             text_to_embed = f"{memory_create.title}\n\n{memory_create.content}"
+        return embedding_service.get_embedding_for_text(text_to_embed)
 
-        generated_embedding = embedding_service.get_embedding_for_text(text_to_embed)
+    def create_memory(
+        self,
+        memory_create: schemas.CoreMemoryCreate,
+        embedding: list[float] | None = None,
+    ) -> models.CoreMemory:
+        """
+        Creates a new memory, generates its embedding, and stores it.
+
+        Callers that already computed the embedding (e.g. off the event loop
+        via ``embed_memory``) can pass it in to skip the embedding call.
+        """
+        generated_embedding = (
+            embedding if embedding is not None else self.embed_memory(memory_create)
+        )
 
         db_memory_data = memory_create.model_dump(exclude={"sentiments"})
         db_memory = models.CoreMemory(
@@ -71,6 +82,8 @@ class MemoryCoreService:
         self.db.add(db_memory)
         self.db.commit()
         self.db.refresh(db_memory)
+        # A new memory can change the results of any cached search
+        self._search_cache.invalidate_prefix(SEARCH_PREFIX)
         return db_memory
 
     def get_memory_by_id(self, memory_id: int, use_cache: bool = True) -> models.CoreMemory | None:
@@ -83,14 +96,11 @@ class MemoryCoreService:
             use_cache: Whether to use the cache (default: True)
         """
         # Check cache first if enabled
-        if use_cache and memory_id in self._memory_cache:
-            cached_memory, cache_time = self._memory_cache[memory_id]
-            if time.time() - cache_time < self._cache_ttl:
+        if use_cache:
+            cached_memory = self._memory_cache.get(memory_id)
+            if cached_memory is not None:
                 return cached_memory
-            else:
-                # Cache expired, remove it
-                del self._memory_cache[memory_id]
-        
+
         memory = (
             self.db.query(models.CoreMemory)
             .options(joinedload(models.CoreMemory.sentiments))
@@ -100,7 +110,7 @@ class MemoryCoreService:
         
         # Store in cache
         if memory and use_cache:
-            self._memory_cache[memory_id] = (memory, time.time())
+            self._memory_cache.put(memory_id, memory)
         
         return memory
 
@@ -133,6 +143,8 @@ class MemoryCoreService:
             setattr(db_memory, key, value)
         self.db.commit()
         self.db.refresh(db_memory)
+        self._memory_cache.put(memory_id, db_memory)
+        self._search_cache.invalidate_prefix(SEARCH_PREFIX)
         return db_memory
 
     def delete_memory(self, memory_id: int) -> models.CoreMemory | None:
@@ -148,6 +160,8 @@ class MemoryCoreService:
             return None
         self.db.delete(db_memory)
         self.db.commit()
+        self._memory_cache.delete(memory_id)
+        self._search_cache.invalidate_prefix(SEARCH_PREFIX)
         return db_memory
 
     def search_memories_semantic(
@@ -165,17 +179,14 @@ class MemoryCoreService:
             List of memory results with scores and relevance metadata
         """
         # Generate cache key
-        cache_key = f"{_cached_query_hash(query)}_{top_k}"
-        
+        cache_key = text_cache_key(query, top_k)
+
         # Check cache first if enabled
-        if use_cache and cache_key in self._search_cache:
-            cached_results, cache_time = self._search_cache[cache_key]
-            if time.time() - cache_time < self._cache_ttl:
+        if use_cache:
+            cached_results = self._search_cache.get(cache_key)
+            if cached_results is not None:
                 return cached_results
-            else:
-                # Cache expired, remove it
-                del self._search_cache[cache_key]
-        
+
         print(f"Performing semantic search for query: '{query}' (top_k={top_k})")
         start_time = time.time()
         
@@ -224,14 +235,19 @@ class MemoryCoreService:
         
         # Cache results if enabled
         if use_cache:
-            self._search_cache[cache_key] = (sorted_memories, time.time())
+            self._search_cache.put(cache_key, sorted_memories)
         
         return sorted_memories
     
     def clear_cache(self) -> dict[str, int]:
         """Clear all cached data and return counts."""
-        memory_count = len(self._memory_cache)
-        search_count = len(self._search_cache)
-        self._memory_cache.clear()
-        self._search_cache.clear()
+        memory_count = self._memory_cache.clear()
+        search_count = self._search_cache.clear()
         return {"memories_cleared": memory_count, "searches_cleared": search_count}
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Return statistics for the memory and search caches."""
+        return {
+            "memories": self._memory_cache.get_stats(),
+            "searches": self._search_cache.get_stats(),
+        }
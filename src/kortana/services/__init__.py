@@ -24,7 +24,7 @@ from ..core.services import (
     initialize_services,
     reset_services,
 )
-from .database import get_db, get_db_sync
+from .database import get_async_db, get_db, get_db_sync
 
 # Explicitly define what's exported
 __all__ = [
@@ -54,6 +54,7 @@ __all__ = [
     # Chat engine
     "get_chat_engine",
     # Database
+    "get_async_db",
     "get_db",
     "get_db_sync",
 ]
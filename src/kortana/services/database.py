@@ -1,12 +1,78 @@
-from sqlalchemy import create_engine
+import logging
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from kortana.config.settings import settings
 
-sync_engine = create_engine(settings.ALEMBIC_DATABASE_URL, echo=True)
+slow_query_logger = logging.getLogger("kortana.sql.slow")
+
+
+def _engine_options(url: str) -> dict[str, Any]:
+    """Engine keyword arguments from settings; SQLite keeps its default pools."""
+    options: dict[str, Any] = {"echo": settings.DB_ECHO}
+    if make_url(url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_pre_ping=True,
+        )
+    return options
+
+
+def install_slow_query_logger(engine: Engine, threshold_ms: float) -> None:
+    """Log statements on ``engine`` that take at least ``threshold_ms``."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _log_if_slow(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - context._query_started) * 1000
+        if elapsed_ms >= threshold_ms:
+            slow_query_logger.warning(
+                f"Slow query ({elapsed_ms:.1f} ms): {' '.join(statement.split())[:500]}"
+            )
+
+
+sync_engine = create_engine(
+    settings.ALEMBIC_DATABASE_URL, **_engine_options(settings.ALEMBIC_DATABASE_URL)
+)
+install_slow_query_logger(sync_engine, settings.DB_SLOW_QUERY_MS)
 SyncSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
 Base = declarative_base()
 
+# The async engine is created on first use so importing this module does not
+# require the asyncio driver (aiosqlite/asyncpg) to be installed.
+_async_engine: AsyncEngine | None = None
+AsyncSessionLocal = async_sessionmaker(
+    class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+
+def get_async_engine() -> AsyncEngine:
+    """Return the shared async engine, creating it on first use."""
+    global _async_engine
+    if _async_engine is None:
+        url = settings.ASYNC_DATABASE_URL
+        _async_engine = create_async_engine(url, **_engine_options(url))
+        install_slow_query_logger(_async_engine.sync_engine, settings.DB_SLOW_QUERY_MS)
+        AsyncSessionLocal.configure(bind=_async_engine)
+    return _async_engine
+
 
 def get_db_sync():
     db = SyncSessionLocal()
@@ -22,3 +88,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        yield db
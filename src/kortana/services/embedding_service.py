@@ -1,6 +1,5 @@
-from langchain_openai import OpenAIEmbeddings
-
 from kortana.config.settings import settings
+from kortana.core.services import LazyService
 
 
 class EmbeddingService:
@@ -10,6 +9,9 @@ class EmbeddingService:
                 "OPENAI_API_KEY must be set in the environment to use EmbeddingService."
             )
 
+        # Imported here: langchain/openai add over a second to import time
+        from langchain_openai import OpenAIEmbeddings
+
         # Choose your model. "text-embedding-3-small" is cost-effective and performs well.
         self.client = OpenAIEmbeddings(
             model="text-embedding-3-small", openai_api_key=settings.OPENAI_API_KEY
@@ -31,8 +33,9 @@ class EmbeddingService:
         return self.client.embed_documents(non_empty_texts)
 
 
-# Singleton instance for easy access across the application
-embedding_service = EmbeddingService()
+# Singleton for easy access across the application; the client (and the
+# OPENAI_API_KEY check) is only created on first use
+embedding_service = LazyService("embedding_service", EmbeddingService)
 
 # Example for direct testing
 if __name__ == "__main__":
@@ -41,6 +41,12 @@ from .performance import (
     cached_async,
     timed_execution,
 )
+from .structured_logging import (
+    configure_logging,
+    get_log_context,
+    log_context,
+    shutdown_logging,
+)
 from .text_analysis import (
     analyze_sentiment,
     count_tokens,
@@ -106,6 +112,11 @@ __all__ = [
     "TTLCache",
     "cached_async",
     "timed_execution",
+    # Logging
+    "configure_logging",
+    "get_log_context",
+    "log_context",
+    "shutdown_logging",
     # Errors
     "ConfigurationError",
     "ErrorContext",
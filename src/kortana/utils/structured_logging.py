@@ -0,0 +1,263 @@
+"""
+Structured Logging for Kor'tana
+
+Implements:
+- Request-scoped log context (session id, model, latency) via contextvars
+- Sampling of high-volume debug events
+- JSON or plain-text formatting
+- A non-blocking QueueHandler/QueueListener pipeline so stream and file
+  writes happen on a background thread instead of the request thread
+
+Hot paths should use lazy %-style arguments (``logger.debug("x: %s", big)``)
+so nothing is formatted for records that are filtered out.
+"""
+
+import atexit
+import contextvars
+import itertools
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from typing import Any
+
+# Fields bound for the current request; copied onto every record it emits
+_log_context: contextvars.ContextVar[dict[str, Any] | None] = contextvars.ContextVar(
+    "kortana_log_context", default=None
+)
+
+# Attributes every LogRecord has; anything else was passed via ``extra``
+_RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__
+) | {"message", "asctime", "context"}
+
+_listener: logging.handlers.QueueListener | None = None
+_queue_handler: logging.handlers.QueueHandler | None = None
+_configure_lock = threading.Lock()
+
+
+@contextmanager
+def log_context(**fields: Any) -> Iterator[dict[str, Any]]:
+    """
+    Bind fields to every log record emitted inside the block.
+
+    Contexts nest; inner values override outer ones. The yielded dict may be
+    updated in place, e.g. to add a latency once it is known.
+
+    Args:
+        **fields: Context fields such as ``session_id`` or ``model``
+    """
+    bound = {**(_log_context.get() or {}), **fields}
+    token = _log_context.set(bound)
+    try:
+        yield bound
+    finally:
+        _log_context.reset(token)
+
+
+def get_log_context() -> dict[str, Any]:
+    """Return a copy of the fields bound to the current context."""
+    return dict(_log_context.get() or {})
+
+
+class ContextFilter(logging.Filter):
+    """Attach the current log context to records as ``record.context``."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _log_context.get()
+        record.context = dict(context) if context else {}
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep one in ``1 / rate`` records at or below ``max_level``.
+
+    Sampling is per call site (logger name, file and line) rather than per
+    message, since f-string messages differ on every call; a noisy debug
+    statement cannot crowd out a rare one. Records above ``max_level``
+    always pass.
+    """
+
+    def __init__(self, rate: float = 1.0, max_level: int = logging.DEBUG):
+        super().__init__()
+        if not 0 <= rate <= 1:
+            raise ValueError("Sampling rate must be between 0 and 1")
+        self.rate = rate
+        self.max_level = max_level
+        self._every = round(1 / rate) if rate > 0 else 0
+        self._counters: dict[tuple[str, str, int], Iterator[int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or self._every == 1:
+            return True
+        if self._every == 0:
+            return False
+        key = (record.name, record.pathname, record.lineno)
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters.setdefault(key, itertools.count())
+        return next(counter) % self._every == 0
+
+
+class StructuredFormatter(logging.Formatter):
+    """Render records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "context", None) or {})
+        entry.update(
+            (key, value)
+            for key, value in record.__dict__.items()
+            if key not in _RECORD_ATTRIBUTES
+        )
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that renders the message without copying the record."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stdlib version runs a Formatter and copies the record so other
+        # handlers see the original; this handler is the root's only one.
+        # Args are merged here because they may be mutated after the call.
+        record.message = record.getMessage()
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+_exception_formatter = logging.Formatter()
+
+
+class ContextTextFormatter(logging.Formatter):
+    """Plain-text formatter that appends bound context as ``key=value`` pairs."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        context = getattr(record, "context", None)
+        if context:
+            text += " [" + " ".join(f"{k}={v}" for k, v in context.items()) + "]"
+        return text
+
+
+def configure_logging(
+    level: str | int = "INFO",
+    fmt: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    structured: bool = False,
+    debug_sample_rate: float = 1.0,
+    log_file: str | None = None,
+    console: bool = True,
+) -> logging.handlers.QueueListener:
+    """
+    Route all root logging through a queue drained by a background thread.
+
+    Replaces the root logger's handlers, so it is safe to call after
+    ``logging.basicConfig``; calling it again reconfigures the pipeline.
+
+    Args:
+        level: Root log level
+        fmt: Format string for plain-text output
+        structured: Emit JSON lines instead of plain text
+        debug_sample_rate: Fraction of DEBUG records to keep (per call site)
+        log_file: Optional file to write alongside the console
+        console: Whether to write to stderr
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener, _queue_handler
+
+    formatter: logging.Formatter = (
+        StructuredFormatter() if structured else ContextTextFormatter(fmt)
+    )
+    handlers: list[logging.Handler] = []
+    if console:
+        handlers.append(logging.StreamHandler())
+    if log_file:
+        os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+        handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Filters on the queue handler run on the calling thread, which is where
+    # the request's contextvars are visible and where sampling saves work.
+    queue_handler = _QueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(SamplingFilter(debug_sample_rate))
+    queue_handler.addFilter(ContextFilter())
+    listener = logging.handlers.QueueListener(
+        queue_handler.queue, *handlers, respect_handler_level=True
+    )
+
+    with _configure_lock:
+        shutdown_logging()
+        root = logging.getLogger()
+        for existing in list(root.handlers):
+            root.removeHandler(existing)
+        root.addHandler(queue_handler)
+        root.setLevel(level)
+        listener.start()
+        _listener, _queue_handler = listener, queue_handler
+    return listener
+
+
+
+def configure_logging_from_config(
+    config: Any, logs_dir: str | None = None, level: str | None = None
+) -> logging.handlers.QueueListener:
+    """
+    Configure logging from a ``LoggingConfig`` section.
+
+    Args:
+        config: The ``logging`` section of KortanaConfig
+        logs_dir: Directory for ``kortana.log`` when file logging is enabled
+        level: Overrides ``config.level`` (e.g. DEBUG for ``--debug``)
+
+    Returns:
+        The running QueueListener
+    """
+    log_file = None
+    if config.file_enabled and logs_dir:
+        log_file = os.path.join(logs_dir, "kortana.log")
+    return configure_logging(
+        level=level or config.level,
+        fmt=config.format,
+        structured=config.structured,
+        debug_sample_rate=config.debug_sample_rate,
+        log_file=log_file,
+        console=config.console_enabled,
+    )
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background listener, if running."""
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+
+# The listener thread is a daemon; flush whatever is still queued at exit
+atexit.register(shutdown_logging)
@@ -11,10 +11,12 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 from kortana.main import app
-from kortana.services.database import Base, get_db_sync
+from kortana.services.database import Base, get_async_db, get_db_sync
 
 # Test database setup
 SQLALCHEMY_DATABASE_URL_TEST = "sqlite:///./test_kortana_comprehensive.db"
@@ -32,6 +34,19 @@ engine_test = create_engine(
     SQLALCHEMY_DATABASE_URL_TEST, connect_args={"check_same_thread": False}
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine_test)
+# Async routers share the same database file; NullPool because each TestClient
+# request may run on a different event loop
+async_engine_test = create_async_engine(
+    "sqlite+aiosqlite:///./test_kortana_comprehensive.db", poolclass=NullPool
+)
+AsyncTestingSessionLocal = async_sessionmaker(
+    async_engine_test, autoflush=False, expire_on_commit=False
+)
+
+
+async def override_get_async_db():
+    async with AsyncTestingSessionLocal() as session:
+        yield session
 
 
 @pytest.fixture(scope="function")
@@ -50,11 +65,13 @@ def test_db():
 def client(test_db):
     """Create a test client with database override."""
     app.dependency_overrides[get_db_sync] = lambda: test_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     Base.metadata.create_all(bind=engine_test)
     yield TestClient(app)
     Base.metadata.drop_all(bind=engine_test)
     if get_db_sync in app.dependency_overrides:
         del app.dependency_overrides[get_db_sync]
+    app.dependency_overrides.pop(get_async_db, None)
 
 
 # =============================================================================
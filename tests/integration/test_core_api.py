@@ -3,11 +3,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from kortana.main import app  # Your FastAPI app
 from kortana.modules.memory_core import models as memory_models
-from kortana.services.database import Base, get_db_sync
+from kortana.services.database import Base, get_async_db, get_db_sync
 from kortana.services.embedding_service import embedding_service
 
 # Use a separate in-memory SQLite database for testing API endpoints
@@ -16,6 +18,19 @@ engine_test = create_engine(
     SQLALCHEMY_DATABASE_URL_TEST, connect_args={"check_same_thread": False}
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine_test)
+# Async routers share the same database file; NullPool because each TestClient
+# request may run on a different event loop
+async_engine_test = create_async_engine(
+    "sqlite+aiosqlite:///./test_kortana_core_api.db", poolclass=NullPool
+)
+AsyncTestingSessionLocal = async_sessionmaker(
+    async_engine_test, autoflush=False, expire_on_commit=False
+)
+
+
+async def override_get_async_db():
+    async with AsyncTestingSessionLocal() as session:
+        yield session
 
 
 # Override the dependency to use the test database
@@ -33,12 +48,14 @@ def override_get_db_sync_test():
 @pytest.fixture(scope="function")
 def client(override_get_db_sync_test):
     app.dependency_overrides[get_db_sync] = lambda: override_get_db_sync_test
+    app.dependency_overrides[get_async_db] = override_get_async_db
     Base.metadata.create_all(bind=engine_test)
     yield TestClient(app)
     Base.metadata.drop_all(bind=engine_test)
     # Ensure the override is removed after the test to avoid interference
     if get_db_sync in app.dependency_overrides:
         del app.dependency_overrides[get_db_sync]
+    app.dependency_overrides.pop(get_async_db, None)
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,64 @@
+"""
+Tests for incremental code-health linting
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from kortana.core.code_health import IncrementalLinter, find_ruff_command
+
+pytestmark = pytest.mark.skipif(
+    find_ruff_command() is None, reason="Ruff is not installed"
+)
+
+
+class TestIncrementalLinter:
+    """Test cases for delta reporting across cycles."""
+
+    def test_only_changed_files_are_relinted(self, tmp_path):
+        """Test that findings carry over and each cycle reports only the delta."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (tmp_path / "ruff.toml").write_text('[lint]\nselect = ["F401"]\n')
+        (src / "a.py").write_text("import os\n")
+        (src / "b.py").write_text("import sys\n")
+        linter = IncrementalLinter(str(tmp_path))
+
+        async def cycles():
+            first = await linter.check()
+            unchanged = await linter.check()
+            (src / "a.py").write_text("import os\n\nprint(os.sep)\n")
+            os.remove(src / "b.py")
+            (src / "c.py").write_text("import json\n")
+            edited = await linter.check()
+            return first, unchanged, edited
+
+        first, unchanged, edited = asyncio.run(cycles())
+
+        assert (first.total, len(first.new), first.files_linted) == (2, 2, 2)
+        assert (unchanged.total, unchanged.new, unchanged.files_linted) == (2, [], 0)
+        assert edited.files_linted == 2
+        assert [f["message"] for f in edited.new] == ["`json` imported but unused"]
+        assert sorted(f["code"] for f in edited.resolved) == ["F401", "F401"]
+        assert edited.total == 1
+
+    def test_config_change_relints_everything(self, tmp_path):
+        """Test that editing the Ruff config invalidates stored findings."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.py").write_text("import os\nx == 1\n")
+        config = tmp_path / "ruff.toml"
+        config.write_text('[lint]\nselect = ["F401"]\n')
+        linter = IncrementalLinter(str(tmp_path))
+
+        async def cycles():
+            before = await linter.check()
+            config.write_text('[lint]\nselect = ["F401", "B015"]\n')
+            return before, await linter.check()
+
+        before, after = asyncio.run(cycles())
+
+        assert before.total == 1
+        assert after.files_linted == 1
+        assert [f["code"] for f in after.new] == ["B015"]
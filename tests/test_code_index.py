@@ -0,0 +1,126 @@
+"""
+Tests for the persistent trigram index behind codebase search
+"""
+
+import asyncio
+import os
+
+from kortana.core.code_index import TrigramIndex, required_literals
+from kortana.core.execution_engine import ExecutionEngine
+
+PATTERNS = ["*.py", "*.md"]
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+class TestRequiredLiterals:
+    """Test cases for narrowing regex queries."""
+
+    def test_extracts_unconditional_runs(self):
+        """Test that only literals every match must contain are returned."""
+        assert required_literals(r"def _cancel_\w+") == ["def _cancel_"]
+        assert required_literals(r"foo(bar|baz)+qux") == ["foo", "qux"]
+        assert required_literals(r"(?:class)?\s*ab") == []
+
+    def test_case_insensitive_letters_break_runs(self):
+        """Test that ``i`` and ``s`` are dropped under IGNORECASE ("İ", "ſ")."""
+        assert required_literals(r"(?i)notice") == ["not"]
+        assert required_literals(r"notice") == ["notice"]
+
+
+class TestTrigramIndex:
+    """Test cases for incremental indexing and candidate selection."""
+
+    def test_candidates_are_narrowed_and_refreshed(self, tmp_path):
+        """Test that only files holding the query are returned, even after edits."""
+        root = tmp_path / "repo"
+        a = _write(root / "a.py", "class GoalStore:\n    pass\n")
+        b = _write(root / "docs" / "b.md", "Nothing to see here\n")
+        _write(root / "__pycache__" / "c.py", "class GoalStore: ...\n")
+        index = TrigramIndex([str(root)])
+
+        assert index.refresh(PATTERNS) == 2
+        assert index.candidates(["goalstore"], PATTERNS) == [a]
+        assert index.refresh(PATTERNS) == 0
+
+        _write(root / "docs" / "b.md", "See GoalStore for details\n")
+        os.remove(a)
+        assert index.refresh(PATTERNS) == 2
+        assert index.candidates(["GoalStore"], PATTERNS) == [b]
+
+    def test_update_file_does_not_rely_on_mtime(self, tmp_path):
+        """Test that a reported write is indexed even if size and mtime match."""
+        path = _write(tmp_path / "a.py", "alpha = 1\n")
+        index = TrigramIndex([str(tmp_path)])
+        index.refresh(PATTERNS)
+        stat = os.stat(path)
+
+        _write(tmp_path / "a.py", "gamma = 1\n")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert index.refresh(PATTERNS) == 0
+        index.update_file(path)
+
+        assert index.candidates(["gamma"], PATTERNS) == [path]
+        assert index.candidates(["alpha"], PATTERNS) == []
+
+    def test_persisted_index_is_reused(self, tmp_path):
+        """Test that a reloaded index only re-reads files changed meanwhile."""
+        root = tmp_path / "repo"
+        paths = [_write(root / f"m{i}.py", f"value_{i} = {i}\n") for i in range(3)]
+        index = TrigramIndex([str(root)], index_dir=str(tmp_path / "idx"))
+        index.refresh(PATTERNS)
+        index.save()
+
+        _write(root / "m1.py", "renamed_value = 1\n")
+        reloaded = TrigramIndex([str(root)], index_dir=str(tmp_path / "idx"))
+
+        assert len(reloaded) == 3
+        assert reloaded.refresh(PATTERNS) == 1
+        assert reloaded.candidates(["value_2"], PATTERNS) == [paths[2]]
+        assert reloaded.candidates(["renamed_value"], PATTERNS) == [paths[1]]
+
+
+class TestSearchCodebase:
+    """Test cases for ExecutionEngine.search_codebase on the index."""
+
+    def test_literal_and_regex_search_follow_writes(self, tmp_path):
+        """Test result format and that engine writes are visible to the next search."""
+        root = tmp_path / "repo"
+        path = _write(root / "pkg" / "mod.py", "import os\n\ndef load_goals():\n")
+        engine = ExecutionEngine(
+            [str(root)], [], search_index_dir=str(tmp_path / "idx")
+        )
+
+        async def run():
+            literal = await engine.search_codebase("LOAD_GOALS")
+            await engine.write_to_file(path, "def load_goals():\ndef save_goals():\n")
+            regex = await engine.search_codebase(r"def \w+_goals\(", regex=True)
+            return literal, regex
+
+        literal, regex = asyncio.run(run())
+
+        assert literal.success
+        [hit] = literal.data["results"]
+        assert hit["line_number"] == 3
+        assert hit["matched_line"] == "def load_goals():"
+        assert hit["relative_path"] == os.path.join("pkg", "mod.py")
+        assert [r["line_number"] for r in regex.data["results"]] == [1, 2]
+
+    def test_none_index_dir_keeps_index_in_memory(self, tmp_path, monkeypatch):
+        """Test that an explicit None disables persistence instead of using the cache."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        root = tmp_path / "repo"
+        _write(root / "mod.py", "VALUE = 1\n")
+        engine = ExecutionEngine([str(root)], [], search_index_dir=None)
+
+        result = asyncio.run(engine.search_codebase("VALUE"))
+
+        assert result.success and len(result.data["results"]) == 1
+        assert engine.search_index.index_dir is None
+        assert not (tmp_path / "cache").exists()
+        default = ExecutionEngine([str(root)], [])
+        assert default.search_index_dir.startswith(str(tmp_path / "cache"))
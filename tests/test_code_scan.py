@@ -0,0 +1,86 @@
+"""
+Tests for incremental, process-parallel AST scanning
+"""
+
+import asyncio
+
+from kortana.core.code_scan import IncrementalAstScanner, analyze_source
+from kortana.core.execution_engine import ExecutionEngine
+
+SOURCE = b'''
+def documented():
+    """Has one."""
+
+def _private():
+    pass
+
+async def fetch():
+    pass
+'''
+
+
+class TestAnalyzeSource:
+    """Test cases for single-file analysis."""
+
+    def test_rules_follow_engine_semantics(self):
+        """Test that each rule keeps the checks of the method that uses it."""
+        findings = analyze_source(
+            SOURCE, "m.py", ("missing_docstring", "missing_docstrings")
+        )
+
+        assert findings["missing_docstring"] == [("_private", 5)]
+        assert findings["missing_docstrings"] == [("fetch", 8)]
+        assert analyze_source(b"def f(:\n", "m.py", ())["syntax_error"][0] == 1
+
+
+class TestIncrementalAstScanner:
+    """Test cases for caching and fan-out."""
+
+    def test_only_changed_files_are_reparsed(self, tmp_path):
+        """Test that repeat scans reuse findings keyed by content hash."""
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"m{i}.py"
+            path.write_bytes(SOURCE + f"# {i}\n".encode())
+            paths.append(str(path))
+        scanner = IncrementalAstScanner(max_workers=2, min_parallel=1)
+
+        first = scanner.scan(paths, ["missing_docstring"])
+        # Parsed in the process pool
+        assert scanner.last_scan == {"files": 4, "analyzed": 4}
+        assert first[paths[3]]["missing_docstring"] == [("_private", 5)]
+
+        (tmp_path / "m2.py").write_bytes(b"def g():\n    pass\n")
+        second = scanner.scan(paths, ["missing_docstring"])
+
+        assert scanner.last_scan == {"files": 4, "analyzed": 1}
+        assert second[paths[2]]["missing_docstring"] == [("g", 1)]
+        assert second[paths[0]] == first[paths[0]]
+
+
+class TestScanCodebaseForIssues:
+    """Test cases for the engine entry point."""
+
+    def test_reports_issues_without_reparsing(self, tmp_path):
+        """Test issue format and that an unchanged tree is served from cache."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "mod.py").write_bytes(SOURCE)
+        (tmp_path / "pkg" / "broken.py").write_text("def f(:\n")
+        engine = ExecutionEngine([str(tmp_path)], [], search_index_dir=None)
+
+        async def scan():
+            return await engine.scan_codebase_for_issues(
+                str(tmp_path), ["missing_docstring"]
+            )
+
+        result = asyncio.run(scan())
+        again = asyncio.run(scan())
+
+        issues = sorted(result.data, key=lambda issue: issue["relative_path"])
+        assert [(i["relative_path"], i["issue_type"]) for i in issues] == [
+            ("pkg/broken.py", "syntax_error"),
+            ("pkg/mod.py", "missing_docstring"),
+        ]
+        assert issues[1]["function_name"] == "_private"
+        assert again.data == result.data
+        assert engine.ast_scanner.last_scan["analyzed"] == 0
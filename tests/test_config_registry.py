@@ -0,0 +1,109 @@
+"""
+Tests for the shared configuration file registry
+"""
+
+import gc
+import json
+import os
+
+import pytest
+
+from kortana.config import registry as registry_module
+from kortana.config.registry import ConfigRegistry
+
+
+def _write(path, data, mtime_offset=0):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    # Bump the mtime explicitly; coarse filesystem clocks may not tick between writes
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset))
+
+
+class TestConfigRegistry:
+    """Test cases for ConfigRegistry."""
+
+    @pytest.fixture
+    def registry(self):
+        registry = ConfigRegistry()
+        yield registry
+        registry.stop_watching()
+
+    @pytest.fixture
+    def persona_file(self, tmp_path):
+        path = tmp_path / "persona.json"
+        _write(path, {"name": "Kor'tana", "traits": ["loyal"]})
+        return path
+
+    def test_parses_once_while_unchanged(self, registry, persona_file, monkeypatch):
+        """Test that repeated loads reuse the parsed data."""
+        calls = []
+        parse_json = registry_module.PARSERS["json"]
+
+        def counting_parse(text):
+            calls.append(text)
+            return parse_json(text)
+
+        monkeypatch.setitem(registry_module.PARSERS, "json", counting_parse)
+
+        first = registry.load_json(persona_file)
+        assert registry.load_json(str(persona_file)) is first
+        assert len(calls) == 1
+
+    def test_data_is_read_only(self, registry, persona_file):
+        """Test that shared data cannot be mutated by one consumer."""
+        data = registry.load_json(persona_file)
+
+        with pytest.raises(TypeError):
+            data["name"] = "other"
+        with pytest.raises(TypeError):
+            data["traits"].append("reckless")
+        assert json.loads(json.dumps(data)) == {"name": "Kor'tana", "traits": ["loyal"]}
+
+    def test_reload_notifies_subscribers(self, registry, persona_file):
+        """Test that a changed file is re-parsed and subscribers are told."""
+        registry.load_json(persona_file)
+        seen = []
+        registry.subscribe(persona_file, lambda path, data: seen.append(data["name"]))
+
+        assert registry.check_for_changes() == []
+        _write(persona_file, {"name": "Kor'tana v2"}, mtime_offset=1_000_000)
+
+        assert registry.check_for_changes() == [str(persona_file)]
+        assert seen == ["Kor'tana v2"]
+        assert registry.load_json(persona_file)["name"] == "Kor'tana v2"
+
+    def test_keeps_last_good_copy_on_invalid_file(self, registry, persona_file):
+        """Test that a half-written file does not replace valid data."""
+        registry.load_json(persona_file)
+        persona_file.write_text("{not json", encoding="utf-8")
+
+        assert registry.check_for_changes() == []
+        assert registry.load_json(persona_file)["name"] == "Kor'tana"
+
+    def test_invalid_file_on_first_load_raises(self, registry, tmp_path):
+        """Test that parse errors surface as ValueError before any good copy exists."""
+        path = tmp_path / "broken.yaml"
+        path.write_text("key: [unclosed", encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            registry.load_yaml(path)
+        with pytest.raises(FileNotFoundError):
+            registry.load_yaml(tmp_path / "missing.yaml")
+
+    def test_bound_method_subscribers_are_weak(self, registry, persona_file):
+        """Test that subscribing does not keep the owning service alive."""
+        seen = []
+
+        class Service:
+            def on_change(self, path, data):
+                seen.append(data["name"])
+
+        service = Service()
+        registry.load_json(persona_file)
+        registry.subscribe(persona_file, service.on_change)
+        del service
+        gc.collect()
+
+        _write(persona_file, {"name": "changed"}, mtime_offset=1_000_000)
+        registry.check_for_changes()
+        assert seen == []
@@ -7,7 +7,11 @@ import gzip
 import pytest
 from datetime import datetime, timedelta
 from pathlib import Path
-from kortana.memory.conversation_archive import ConversationArchive
+from kortana.memory.conversation_archive import (
+    INDEX_FILE_NAME,
+    SEGMENT_FILE_NAME,
+    ConversationArchive,
+)
 
 
 class TestConversationArchive:
@@ -67,14 +71,15 @@ class TestConversationArchive:
         
         assert result is True
         
-        # Verify the file was created
+        # Verify the segment was created
         year_month = datetime.now().strftime("%Y-%m")
-        archive_path = archive_manager.archive_dir / year_month / f"{conversation_id}.json.gz"
-        assert archive_path.exists()
+        segment_path = archive_manager.archive_dir / year_month / SEGMENT_FILE_NAME
+        assert segment_path.exists()
+        assert (archive_manager.archive_dir / year_month / INDEX_FILE_NAME).exists()
         
-        # Verify the content
-        with gzip.open(archive_path, "rt", encoding="utf-8") as f:
-            archived_data = json.load(f)
+        # Verify the content (a segment is a valid multi-member gzip stream)
+        with gzip.open(segment_path, "rt", encoding="utf-8") as f:
+            archived_data = json.loads(f.readline())
         
         assert archived_data["conversation_id"] == conversation_id
         assert "archived_at" in archived_data
@@ -97,10 +102,11 @@ class TestConversationArchive:
         result = archive_manager.archive_conversation(conversation_id, conversation_data)
         assert result is True
         
-        # Verify the file was created (uncompressed)
+        # Verify the segment was written uncompressed (plain JSON lines)
         year_month = datetime.now().strftime("%Y-%m")
-        archive_path = archive_manager.archive_dir / year_month / f"{conversation_id}.json"
-        assert archive_path.exists()
+        segment_path = archive_manager.archive_dir / year_month / SEGMENT_FILE_NAME
+        archived_data = json.loads(segment_path.read_text(encoding="utf-8"))
+        assert archived_data["conversation_id"] == conversation_id
     
     def test_retrieve_archived_conversation(self, archive_manager):
         """Test retrieving an archived conversation."""
@@ -146,6 +152,78 @@ class TestConversationArchive:
         assert len(remaining) == 2
         assert all(conv["id"].startswith("recent") for conv in remaining)
     
+    def test_prune_old_conversations_iter(self, archive_manager):
+        """Test bulk pruning from a generator with per-batch progress."""
+        old_timestamp = (datetime.now() - timedelta(days=30)).isoformat()
+        recent_timestamp = (datetime.now() - timedelta(days=2)).isoformat()
+        
+        def conversations():
+            for i in range(25):
+                timestamp = old_timestamp if i % 2 == 0 else recent_timestamp
+                yield {"id": f"bulk_conv_{i}", "timestamp": timestamp}
+            yield {"id": "no_timestamp"}
+        
+        progress = list(
+            archive_manager.prune_old_conversations_iter(
+                conversations(), batch_size=10, max_workers=2
+            )
+        )
+        
+        assert [p.processed for p in progress] == [10, 20, 26]
+        assert progress[-1].archived == 13
+        remaining = [conv["id"] for p in progress for conv in p.remaining]
+        assert len(remaining) == 13
+        assert "no_timestamp" in remaining
+        assert archive_manager.retrieve_archived_conversation("bulk_conv_24") is not None
+    
+    def test_segment_retrieval_by_offset(self, archive_manager):
+        """Test that many conversations share one segment and are read by offset."""
+        timestamp = (datetime.now() - timedelta(days=40)).isoformat()
+        archived = archive_manager.archive_conversations(
+            [
+                (f"seg_conv_{i}", {"timestamp": timestamp, "content": f"Content {i}"}, None)
+                for i in range(20)
+            ]
+        )
+        assert archived == 20
+        
+        year_month = timestamp[:7]
+        month_dir = archive_manager.archive_dir / year_month
+        assert sorted(p.name for p in month_dir.iterdir()) == [
+            INDEX_FILE_NAME,
+            SEGMENT_FILE_NAME,
+        ]
+        
+        retrieved = archive_manager.retrieve_archived_conversation("seg_conv_13")
+        assert retrieved["conversation"]["content"] == "Content 13"
+    
+    def test_iter_archived_month(self, archive_manager):
+        """Test streaming a whole month sequentially."""
+        timestamp = (datetime.now() - timedelta(days=40)).isoformat()
+        for i in range(5):
+            archive_manager.archive_conversation(
+                f"stream_conv_{i}", {"timestamp": timestamp, "content": str(i)}
+            )
+        
+        records = list(archive_manager.iter_archived_month(timestamp[:7]))
+        
+        assert [r["conversation_id"] for r in records] == [
+            f"stream_conv_{i}" for i in range(5)
+        ]
+        assert list(archive_manager.iter_archived_month("1999-01")) == []
+    
+    def test_retrieve_legacy_file_archive(self, archive_manager):
+        """Test that per-conversation files from the old layout are still readable."""
+        legacy_dir = archive_manager.archive_dir / "2024-01"
+        legacy_dir.mkdir()
+        with gzip.open(legacy_dir / "legacy_conv.json.gz", "wt", encoding="utf-8") as f:
+            json.dump({"conversation_id": "legacy_conv", "conversation": {}}, f)
+        
+        retrieved = archive_manager.retrieve_archived_conversation("legacy_conv")
+        
+        assert retrieved["conversation_id"] == "legacy_conv"
+        assert archive_manager.get_archive_statistics()["total_archived_conversations"] == 1
+    
     def test_archive_statistics(self, archive_manager):
         """Test getting archive statistics."""
         # Archive some conversations
@@ -161,6 +239,7 @@ class TestConversationArchive:
         
         assert stats["total_archived_conversations"] == 3
         assert "total_size_mb" in stats
+        assert stats["compression_ratio"] is not None
         assert "archives_by_month" in stats
         assert len(stats["archives_by_month"]) > 0
     
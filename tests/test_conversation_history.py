@@ -2,7 +2,8 @@
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock
-from sqlalchemy.orm import Session
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
 
 from kortana.modules.conversation_history import models, schemas, services
 
@@ -128,29 +129,6 @@ class TestConversationHistoryService:
         
         assert mock_query.join.called
     
-    def test_archive_conversation(self, service, mock_db):
-        """Test archiving a conversation with compression."""
-        # Setup mock conversation with messages
-        mock_message = Mock(spec=models.ConversationMessage)
-        mock_message.role = "user"
-        mock_message.content = "Test message"
-        mock_message.created_at = datetime.now()
-        
-        mock_conversation = Mock(spec=models.Conversation)
-        mock_conversation.id = 1
-        mock_conversation.messages = [mock_message]
-        mock_conversation.metadata = {}
-        
-        mock_db.query.return_value.filter.return_value.options.return_value.first.return_value = mock_conversation
-        mock_db.commit = Mock()
-        mock_db.refresh = Mock()
-        
-        result = service.archive_conversation(1)
-        
-        assert result is not None
-        assert result.status == models.ConversationStatus.ARCHIVED
-        assert "compressed_messages" in result.metadata
-    
     def test_delete_conversation(self, service, mock_db):
         """Test soft deleting a conversation."""
         mock_conversation = Mock(spec=models.Conversation)
@@ -165,23 +143,19 @@ class TestConversationHistoryService:
         assert mock_conversation.status == models.ConversationStatus.DELETED
     
     def test_get_conversation_stats(self, service, mock_db):
-        """Test getting conversation statistics."""
-        # Setup mock messages
-        messages = []
-        for i, role in enumerate(["user", "assistant", "user"]):
-            msg = Mock(spec=models.ConversationMessage)
-            msg.role = role
-            msg.metadata = {"response_time_ms": 100 + i * 10}
-            messages.append(msg)
-        
+        """Test getting conversation statistics from the counter columns."""
         mock_conversation = Mock(spec=models.Conversation)
         mock_conversation.id = 1
-        mock_conversation.messages = messages
+        mock_conversation.message_count = 3
+        mock_conversation.user_message_count = 2
+        mock_conversation.assistant_message_count = 1
+        mock_conversation.response_time_total_ms = 330.0
+        mock_conversation.response_time_samples = 3
         mock_conversation.created_at = datetime.now()
         mock_conversation.updated_at = datetime.now()
         mock_conversation.status = models.ConversationStatus.ACTIVE
         
-        mock_db.query.return_value.filter.return_value.options.return_value.first.return_value = mock_conversation
+        mock_db.query.return_value.filter.return_value.first.return_value = mock_conversation
         
         stats = service.get_conversation_stats(1)
         
@@ -189,4 +163,275 @@ class TestConversationHistoryService:
         assert stats["total_messages"] == 3
         assert stats["user_messages"] == 2
         assert stats["assistant_messages"] == 1
-        assert stats["average_response_time_ms"] is not None
+        assert stats["average_response_time_ms"] == 110.0
+        assert not mock_db.query.return_value.filter.return_value.options.called
+
+
+@pytest.fixture
+def db():
+    """Create an in-memory SQLite database with the conversation tables."""
+    engine = create_engine("sqlite:///:memory:")
+    tables = [
+        models.Conversation.__table__,
+        models.ConversationMessage.__table__,
+        models.ConversationMessageArchive.__table__,
+    ]
+    models.Conversation.metadata.create_all(engine, tables=tables)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+class TestConversationArchiveStorage:
+    """Test archived message storage against a real SQLite database."""
+    
+    @pytest.fixture
+    def conversation(self, db):
+        """Create a conversation with a few messages."""
+        conversation = models.Conversation(user_id="test_user", title="Archive me")
+        db.add(conversation)
+        db.flush()
+        for role, content in [("user", "Hello"), ("assistant", "Hi there!"), ("user", "Bye")]:
+            db.add(
+                models.ConversationMessage(
+                    conversation_id=conversation.id, role=role, content=content
+                )
+            )
+        db.commit()
+        return conversation
+    
+    def test_archive_moves_messages_out_of_hot_table(self, db, conversation):
+        """Test archiving compresses messages into a BLOB and deletes the rows."""
+        service = services.ConversationHistoryService(db)
+        
+        result = service.archive_conversation(conversation.id)
+        
+        assert result.status == models.ConversationStatus.ARCHIVED
+        assert db.query(models.ConversationMessage).count() == 0
+        archive = db.get(models.ConversationMessageArchive, conversation.id)
+        assert archive.message_count == 3
+        assert isinstance(archive.payload, bytes)
+        assert [m.content for m in result.messages] == ["Hello", "Hi there!", "Bye"]
+    
+    def test_get_archived_conversation_decompresses_messages(self, db, conversation):
+        """Test archived messages are returned transparently."""
+        service = services.ConversationHistoryService(db)
+        service.archive_conversation(conversation.id)
+        db.expire_all()
+        
+        loaded = service.get_conversation_by_id(conversation.id, include_messages=True)
+        
+        assert [m.role for m in loaded.messages] == ["user", "assistant", "user"]
+        assert all(m.created_at is not None for m in loaded.messages)
+        db.commit()
+        assert db.query(models.ConversationMessage).count() == 0
+    
+    def test_messages_added_after_archiving(self, db, conversation):
+        """Test later messages are returned after the archived ones and can be folded in."""
+        service = services.ConversationHistoryService(db)
+        service.archive_conversation(conversation.id)
+        service.add_message(
+            conversation.id,
+            schemas.ConversationMessageCreate(role="user", content="Back again"),
+        )
+        db.expire_all()
+        
+        loaded = service.get_conversation_by_id(conversation.id, include_messages=True)
+        assert [m.content for m in loaded.messages][-2:] == ["Bye", "Back again"]
+        
+        service.archive_conversation(conversation.id)
+        db.expire_all()
+        
+        assert db.query(models.ConversationMessage).count() == 0
+        assert db.get(models.ConversationMessageArchive, conversation.id).message_count == 4
+        loaded = service.get_conversation_by_id(conversation.id, include_messages=True)
+        assert len(loaded.messages) == 4
+    
+    def test_backfill_archived_messages(self, db, conversation):
+        """Test the backfill job moves messages of previously archived conversations."""
+        conversation.status = models.ConversationStatus.ARCHIVED
+        db.commit()
+        service = services.ConversationHistoryService(db)
+        
+        assert service.backfill_archived_messages(batch_size=1) == 1
+        assert service.backfill_archived_messages() == 0
+        assert db.query(models.ConversationMessage).count() == 0
+        loaded = service.get_conversation_by_id(conversation.id, include_messages=True)
+        assert len(loaded.messages) == 3
+
+
+class TestConversationSearchIndex:
+    """Test full-text search and the denormalized message count on SQLite."""
+    
+    @pytest.fixture
+    def service(self, db):
+        """Create a service with a few conversations."""
+        service = services.ConversationHistoryService(db)
+        contents = {
+            "alice": ["How do I sort a list in Python?", "Python sorting uses Timsort"],
+            "bob": ["What is the weather today?"],
+            "carol": ["Python python python everywhere"],
+        }
+        for user_id, messages in contents.items():
+            conversation = service.create_conversation(
+                schemas.ConversationCreate(user_id=user_id, title=user_id)
+            )
+            for content in messages:
+                service.add_message(
+                    conversation.id,
+                    schemas.ConversationMessageCreate(role="user", content=content),
+                )
+        return service
+    
+    def test_add_message_increments_message_count(self, service, db):
+        """Test message_count is maintained on the conversation row."""
+        counts = {c.user_id: c.message_count for c in db.query(models.Conversation)}
+        assert counts == {"alice": 2, "bob": 1, "carol": 1}
+    
+    def test_keyword_search_is_ranked_and_distinct(self, service):
+        """Test keyword search returns each conversation once, best match first."""
+        results = service.search_conversations(
+            schemas.ConversationSearchFilters(keyword="python")
+        )
+        
+        assert [c.user_id for c in results] == ["carol", "alice"]
+    
+    def test_keyword_search_with_length_filter(self, service):
+        """Test message-count filters use the denormalized column."""
+        results = service.search_conversations(
+            schemas.ConversationSearchFilters(keyword="python", min_length=2)
+        )
+        
+        assert [c.user_id for c in results] == ["alice"]
+    
+    def test_search_messages_returns_snippets(self, service):
+        """Test message search highlights matches and honours the user filter."""
+        hits = service.search_messages("sorting", user_id="alice")
+        
+        assert len(hits) == 1
+        assert "[sorting]" in hits[0]["snippet"]
+        assert service.search_messages("sorting", user_id="bob") == []
+    
+    def test_partial_words_match_as_prefixes(self, service):
+        """Test a partial word still finds messages, as the substring search did."""
+        results = service.search_conversations(
+            schemas.ConversationSearchFilters(keyword="pyth")
+        )
+        
+        assert [c.user_id for c in results] == ["carol", "alice"]
+        assert len(service.search_messages("weath")) == 1
+    
+    def test_blank_keyword_is_ignored(self, service):
+        """Test a whitespace-only keyword applies no filter instead of failing."""
+        results = service.search_conversations(
+            schemas.ConversationSearchFilters(keyword="   ")
+        )
+        
+        assert len(results) == 3
+        assert service.search_messages("  ") == []
+    
+    def test_archived_messages_leave_the_index(self, service, db):
+        """Test archiving removes messages from the full-text index."""
+        alice = db.query(models.Conversation).filter_by(user_id="alice").one()
+        service.archive_conversation(alice.id)
+        
+        hits = service.search_messages("python")
+        
+        assert {hit["conversation_id"] for hit in hits} == {
+            db.query(models.Conversation).filter_by(user_id="carol").one().id
+        }
+
+
+class TestConversationStatsCounters:
+    """Test incrementally maintained stats counters on SQLite."""
+    
+    @pytest.fixture
+    def service(self, db):
+        """Create a service with two conversations."""
+        service = services.ConversationHistoryService(db)
+        for user_id, response_times in [("alice", [100, 200]), ("bob", [300])]:
+            conversation = service.create_conversation(
+                schemas.ConversationCreate(user_id=user_id)
+            )
+            service.add_message(
+                conversation.id,
+                schemas.ConversationMessageCreate(role="user", content="question"),
+            )
+            for response_time in response_times:
+                service.add_message(
+                    conversation.id,
+                    schemas.ConversationMessageCreate(
+                        role="assistant",
+                        content="answer",
+                        metadata={"response_time_ms": response_time},
+                    ),
+                )
+        return service
+    
+    def test_counters_survive_archiving(self, service, db):
+        """Test stats come from counters, so archived conversations keep them."""
+        alice = db.query(models.Conversation).filter_by(user_id="alice").one()
+        service.archive_conversation(alice.id)
+        
+        stats = service.get_conversation_stats(alice.id)
+        
+        assert stats["total_messages"] == 3
+        assert stats["user_messages"] == 1
+        assert stats["assistant_messages"] == 2
+        assert stats["average_response_time_ms"] == 150.0
+    
+    def test_multi_conversation_stats(self, service):
+        """Test the dashboard stats aggregate several conversations."""
+        stats = service.get_conversations_stats(user_id="alice")
+        assert stats["totals"]["conversation_count"] == 1
+        
+        stats = service.get_conversations_stats(conversation_ids=[1, 2])
+        
+        assert [c["conversation_id"] for c in stats["conversations"]] == [1, 2]
+        assert stats["totals"]["total_messages"] == 5
+        assert stats["totals"]["assistant_messages"] == 3
+        assert stats["totals"]["average_response_time_ms"] == 200.0
+    
+    def test_refresh_conversation_counters(self, service, db):
+        """Test counters can be rebuilt from message rows in one aggregate query."""
+        db.query(models.Conversation).update({"message_count": 0, "user_message_count": 0})
+        db.commit()
+        
+        assert service.refresh_conversation_counters() == 2
+        
+        counts = {c.user_id: (c.message_count, c.user_message_count) for c in db.query(models.Conversation)}
+        assert counts == {"alice": (3, 1), "bob": (2, 1)}
+    
+    def test_refresh_keeps_response_times(self, service, db):
+        """Test message metadata is stored, so a refresh keeps the response-time average."""
+        before = service.get_conversations_stats()["totals"]["average_response_time_ms"]
+        
+        service.refresh_conversation_counters()
+        db.expire_all()
+        
+        assert before == 200.0
+        assert service.get_conversation_stats(1)["average_response_time_ms"] == 150.0
+        stats = service.get_conversations_stats()
+        assert stats["totals"]["average_response_time_ms"] == 200.0
+        message = db.query(models.ConversationMessage).filter_by(role="assistant").first()
+        assert message.extra_info == {"response_time_ms": 100}
+    
+    def test_refresh_counts_archived_messages(self, service, db):
+        """Test a refresh after archiving adds new rows to the archived totals."""
+        alice = db.query(models.Conversation).filter_by(user_id="alice").one()
+        service.archive_conversation(alice.id)
+        service.add_message(
+            alice.id,
+            schemas.ConversationMessageCreate(
+                role="assistant", content="later", metadata={"response_time_ms": 600}
+            ),
+        )
+        
+        service.refresh_conversation_counters()
+        db.expire_all()
+        
+        stats = service.get_conversation_stats(alice.id)
+        assert stats["total_messages"] == 4
+        assert stats["user_messages"] == 1
+        assert stats["assistant_messages"] == 3
+        assert stats["average_response_time_ms"] == 300.0
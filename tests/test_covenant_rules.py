@@ -0,0 +1,124 @@
+"""
+Tests for compiled covenant rules and streamed enforcement
+"""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from kortana.core.covenant import CovenantEnforcer
+from kortana.core.covenant_rules import CompiledCovenantRules
+
+BOUNDARIES = ["Share private information", "Pretend to be a human"]
+PATTERNS = [r"\bpassword\s*=", r"(\w+) \1 \1"]
+COVENANT_FILE = Path(__file__).resolve().parents[1] / "covenant.yaml"
+
+
+class TestCompiledCovenantRules:
+    """Test cases for the single-pass rule matcher."""
+
+    @pytest.fixture
+    def rules(self):
+        return CompiledCovenantRules(boundaries=BOUNDARIES, patterns=PATTERNS)
+
+    def test_matches_like_rule_by_rule_checks(self, rules):
+        """Test that literals, regexes and backreference patterns all match."""
+        assert rules.first_violation("Happy to help!") is None
+        assert rules.first_violation("I will SHARE PRIVATE INFORMATION").source == (
+            "Share private information"
+        )
+        assert rules.first_violation("set password = hunter2").kind == "pattern"
+        assert rules.first_violation("no no no").source == r"(\w+) \1 \1"
+
+    def test_violations_lists_every_rule(self, rules):
+        """Test that all violated rules are reported in rule order."""
+        text = "pretend to be a human and share private information; password="
+
+        assert [r.source for r in rules.violations(text)] == [
+            r"\bpassword\s*=",
+            "Share private information",
+            "Pretend to be a human",
+        ]
+
+    def test_invalid_pattern_is_skipped(self):
+        """Test that one broken pattern does not disable the others."""
+        rules = CompiledCovenantRules(boundaries=["forbidden"], patterns=["(unclosed"])
+
+        assert len(rules) == 1
+        assert rules.first_violation("this is forbidden").source == "forbidden"
+
+    def test_shipped_patterns_share_one_matcher(self):
+        """Test that the covenant's (?i)-prefixed patterns are joined, not run one by one."""
+        patterns = yaml.safe_load(COVENANT_FILE.read_text())["forbidden_content"]
+        rules = CompiledCovenantRules(patterns=patterns)
+
+        assert len(rules._joinable) == len(patterns)
+        assert rules._standalone == []
+        assert rules.first_violation("Happy to follow the safety rules") is None
+        assert rules.first_violation("Please BYPASS SAFETY now").source == patterns[2]
+        assert rules.first_violation("Plan the attack").source == patterns[3]
+
+
+class TestCovenantStreamGuard:
+    """Test cases for chunked enforcement."""
+
+    def test_releases_compliant_text_incrementally(self):
+        """Test that all text is released and only a short tail is held back."""
+        guard = CompiledCovenantRules(boundaries=BOUNDARIES).stream()
+        chunks = ["Kor'tana is ", "here to listen ", "and to support you."]
+
+        released = [guard.feed(chunk) for chunk in chunks]
+
+        # The longest boundary is 25 characters, so 24 are held back
+        assert released[:2] == ["", "Kor"]
+        assert "".join(released) + guard.close() == "".join(chunks)
+        assert guard.compliant
+
+    def test_catches_violation_split_across_chunks(self):
+        """Test that a boundary spanning chunks is withheld and reported."""
+        guard = CompiledCovenantRules(boundaries=BOUNDARIES).stream()
+
+        out = guard.feed("Sure, I can pretend to ")
+        out += guard.feed("be a human for you.")
+        out += guard.close()
+
+        assert not guard.compliant
+        assert guard.violation.source == "Pretend to be a human"
+        assert "pretend" not in out.lower()
+
+    def test_patterns_see_released_text(self):
+        """Test that word boundaries consider text already released."""
+        rules = CompiledCovenantRules(patterns=[r"\bkill\b"])
+        guard = rules.stream(pattern_window=4)
+
+        out = "".join(guard.feed(c) for c in "I have a skill for this.") + guard.close()
+
+        assert rules.first_violation("I have a skill for this.") is None
+        assert guard.compliant
+        assert out == "I have a skill for this."
+
+
+class TestCovenantEnforcerRules:
+    """Test cases for CovenantEnforcer using the compiled rules."""
+
+    def test_enforce_and_reassigned_rules(self):
+        """Test enforce messages and that new rules are recompiled."""
+        enforcer = CovenantEnforcer()
+        enforcer.rules = {
+            "forbidden_content": PATTERNS,
+            "boundaries": {"do_not": BOUNDARIES},
+        }
+
+        assert enforcer.enforce("All good here")[0]
+        assert enforcer.enforce("password=1") == (
+            False,
+            r"Message violates covenant rule: \bpassword\s*=",
+        )
+        assert enforcer.enforce("Let me pretend to be a human") == (
+            False,
+            "Message violates boundary: Pretend to be a human",
+        )
+
+        enforcer.rules = {}
+        assert enforcer.enforce("password=1")[0]
@@ -2,6 +2,7 @@
 Tests for Kor'tana's Goal Framework components.
 """
 
+import asyncio
 import uuid
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock
@@ -11,6 +12,8 @@ import pytest
 from kortana.core.goals import Goal, GoalStatus, GoalType
 from kortana.core.goals.covenant import GoalCovenantValidator
 from kortana.core.goals.manager import GoalManager
+from kortana.core.goals.prioritizer import GoalPrioritizer
+from kortana.core.goals.store import GoalStore
 
 
 @pytest.fixture
@@ -150,6 +153,206 @@ class TestGoalManager:
         assert len(children) == 1
         assert children[0].id == child.id
 
+    @pytest.mark.asyncio
+    async def test_reload_from_store(self, memory_manager, covenant_enforcer, tmp_path):
+        """Test that goals survive a restart without memory searches"""
+        path = str(tmp_path / "goals.jsonl")
+        manager = GoalManager(memory_manager, covenant_enforcer, store=GoalStore(path))
+        parent = await manager.create_goal(
+            type=GoalType.INTEGRATION, description="Parent"
+        )
+        child = await manager.create_goal(
+            type=GoalType.DEVELOPMENT,
+            description="Child",
+            parent_id=parent.id,
+            priority=5,
+        )
+        child.update_status(GoalStatus.IN_PROGRESS)
+        await manager.update_goal(child)
+
+        reloaded = GoalManager(memory_manager, covenant_enforcer, store=GoalStore(path))
+
+        restored = await reloaded.get_goal(child.id)
+        assert restored.status == GoalStatus.IN_PROGRESS
+        assert restored.parent_goal_id == parent.id
+        assert [g.id for g in await reloaded.get_child_goals(parent.id)] == [child.id]
+        assert [g.id for g in await reloaded.get_top_goals(1)] == [child.id]
+        memory_manager.search_entries.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_goals_validates_concurrently(
+        self, goal_manager, covenant_enforcer
+    ):
+        """Test that a batch validates in parallel and reuses alignment scores"""
+        in_flight = []
+        peak = []
+
+        async def slow_alignment(text):
+            in_flight.append(text)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.05)
+            in_flight.remove(text)
+            return {"wisdom": 0.8, "compassion": 0.7, "truth": 0.9}
+
+        covenant_enforcer.evaluate_sacred_alignment.side_effect = slow_alignment
+        candidates = [
+            {"type": GoalType.MAINTENANCE, "description": f"Fix module {i % 10}."}
+            for i in range(30)
+        ]
+        candidates.append(
+            {"type": GoalType.MAINTENANCE, "description": "  fix MODULE 3 "}
+        )
+
+        start = asyncio.get_running_loop().time()
+        goals = await goal_manager.create_goals(candidates, max_concurrency=5)
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert [g.description for g in goals] == [c["description"] for c in candidates]
+        assert all(g.covenant_approval for g in goals)
+        assert covenant_enforcer.evaluate_sacred_alignment.await_count == 10
+        assert max(peak) <= 5
+        assert elapsed < 0.5
+        assert goals[-1].truth_score == 0.9
+
+    @pytest.mark.asyncio
+    async def test_create_goals_isolates_failures(
+        self, goal_manager, covenant_enforcer
+    ):
+        """Test that one failing validation does not reject the whole batch"""
+
+        async def validate(action_type, context):
+            if "bad" in context["description"]:
+                raise RuntimeError("validator down")
+            return True, "ok"
+
+        covenant_enforcer.validate_action.side_effect = validate
+        goals = await goal_manager.create_goals(
+            [
+                {"type": GoalType.LEARNING, "description": "good goal"},
+                {"type": GoalType.LEARNING, "description": "bad goal"},
+            ]
+        )
+
+        assert goals[0].id in goal_manager.active_goals
+        assert goals[1].status == GoalStatus.FAILED
+        assert "validator down" in goals[1].covenant_feedback
+
+
+class TestGoalStore:
+    """Tests for the indexed GoalStore"""
+
+    def test_indexes_follow_updates(self):
+        """Test that queries reflect status changes and deletions"""
+        store = GoalStore()
+        goals = [
+            Goal(
+                type=GoalType.DEVELOPMENT if i % 2 else GoalType.LEARNING,
+                description=str(i),
+            )
+            for i in range(6)
+        ]
+        store.put_many(goals)
+
+        goals[1].update_status(GoalStatus.BLOCKED)
+        store.put(goals[1])
+        store.remove(goals[3].id)
+
+        assert store.query(status=GoalStatus.BLOCKED) == [goals[1]]
+        assert store.query(status=GoalStatus.PENDING, type=GoalType.DEVELOPMENT) == [
+            goals[5]
+        ]
+        assert len(store.query(type=GoalType.LEARNING)) == 3
+        assert len(store) == 5
+
+    def test_query_checks_current_fields(self):
+        """Test that a goal changed in place is not listed under its old status"""
+        store = GoalStore()
+        goal = Goal(type=GoalType.DEVELOPMENT, description="In place")
+        store.put(goal)
+
+        goal.update_status(GoalStatus.BLOCKED)
+
+        assert store.query(status=GoalStatus.PENDING) == []
+        store.put(goal)
+        assert store.query(status=GoalStatus.BLOCKED) == [goal]
+
+    def test_compaction_keeps_latest_state(self, tmp_path):
+        """Test that a compacted log reloads to the same goals"""
+        path = tmp_path / "goals.jsonl"
+        store = GoalStore(str(path))
+        goal = Goal(
+            type=GoalType.MAINTENANCE, description="Compact me", metadata={"k": 1}
+        )
+        for progress in (0.1, 0.5, 0.9):
+            goal.update_progress(progress)
+            store.put(goal)
+
+        store.compact()
+        reloaded = GoalStore(str(path))
+
+        assert len(path.read_text().splitlines()) == 1
+        assert reloaded.get(goal.id).progress == 0.9
+        assert reloaded.get(goal.id).metadata == {"k": 1}
+
+
+class TestGoalPrioritizer:
+    """Tests for incremental prioritization"""
+
+    def test_top_goals_tracks_changes(self):
+        """Test that the heap re-ranks updated goals and drops finished ones"""
+        prioritizer = GoalPrioritizer()
+        goals = [
+            Goal(type=GoalType.DEVELOPMENT, description=str(i), priority=i % 5 + 1)
+            for i in range(50)
+        ]
+        for goal in goals:
+            prioritizer.update_goal(goal)
+
+        expected = asyncio.run(prioritizer.prioritize_goals(goals))[:3]
+        assert prioritizer.top_goals(3) == expected
+
+        expected[0].update_status(GoalStatus.COMPLETED)
+        prioritizer.update_goal(expected[0])
+        goals[0].priority = 5
+        goals[0].update_progress(0.95)
+        prioritizer.update_goal(goals[0])
+
+        assert prioritizer.top_goals(1) == [goals[0]]
+        assert expected[0] not in prioritizer.top_goals(50)
+        assert len(prioritizer.top_goals(100)) == 49
+
+    def test_unchanged_goals_are_not_rescored(self, monkeypatch):
+        """Test that scores are cached until a scoring input changes"""
+        prioritizer = GoalPrioritizer()
+        goal = Goal(type=GoalType.COVENANT, description="Cached")
+        calls = []
+        calculate = prioritizer._calculate_goal_score
+        monkeypatch.setattr(
+            prioritizer,
+            "_calculate_goal_score",
+            lambda g, now=None: calls.append(g) or calculate(g, now),
+        )
+
+        for _ in range(3):
+            asyncio.run(prioritizer.prioritize_goals([goal]))
+        goal.add_blocker("waiting on review")
+        asyncio.run(prioritizer.prioritize_goals([goal]))
+
+        assert len(calls) == 2
+
+    def test_score_cache_is_bounded(self):
+        """Test that untracked and finished goals do not accumulate in the cache"""
+        prioritizer = GoalPrioritizer(score_cache_size=10)
+        goals = [Goal(type=GoalType.LEARNING, description=str(i)) for i in range(25)]
+
+        asyncio.run(prioritizer.prioritize_goals(goals))
+        assert len(prioritizer._score_cache) == 10
+
+        for goal in goals[-10:]:
+            goal.update_status(GoalStatus.COMPLETED)
+        asyncio.run(prioritizer.prioritize_goals(goals[-10:]))
+        assert len(prioritizer._score_cache) == 0
+
 
 class TestGoalCovenantValidator:
     """Tests for the GoalCovenantValidator"""
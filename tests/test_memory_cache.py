@@ -4,6 +4,8 @@ Tests for memory caching functionality
 
 import pytest
 from datetime import datetime
+from unittest.mock import patch
+from kortana.memory.cache import text_cache_key, vector_cache_key
 from kortana.memory.memory_manager import MemoryCache
 
 
@@ -117,3 +119,61 @@ class TestMemoryCache:
         retrieved = cache.get("key1")
         assert retrieved["data"] == "value1_updated"
         assert len(cache.cache) == 1  # Should not duplicate
+
+    def test_cache_byte_budget(self):
+        """Test that eviction keeps the estimated size within max_bytes."""
+        cache = MemoryCache(max_size=1000, max_bytes=20_000)
+
+        for i in range(50):
+            cache.put(f"key{i}", {"text": "x" * 1000})
+
+        stats = cache.get_stats()
+        assert stats["bytes"] <= 20_000
+        assert stats["evictions"] > 0
+        assert cache.get("key49") is not None
+        assert cache.get("key0") is None
+
+        # A value larger than the whole budget is not cached at all
+        cache.put("huge", {"text": "x" * 50_000})
+        assert cache.get("huge") is None
+
+    def test_cache_ttl_and_sweep(self):
+        """Test that entries expire on access and via purge_expired."""
+        cache = MemoryCache(ttl_seconds=10)
+        with patch("kortana.memory.cache.time.monotonic", return_value=1000.0):
+            cache.put("key1", {"data": "value1"})
+            cache.put("key2", {"data": "value2"}, ttl_seconds=100)
+
+        with patch("kortana.memory.cache.time.monotonic", return_value=1011.0):
+            assert cache.get("key1") is None
+            cache.put("key3", {"data": "value3"}, ttl_seconds=1)
+        with patch("kortana.memory.cache.time.monotonic", return_value=1020.0):
+            assert cache.purge_expired() == 1
+            assert "key2" in cache
+
+        stats = cache.get_stats()
+        assert stats["expirations"] == 2
+        assert stats["size"] == 1
+
+    def test_cache_invalidate_prefix(self):
+        """Test prefix invalidation of search entries."""
+        cache = MemoryCache()
+        cache.put(vector_cache_key([0.1, 0.2], 5), [{"id": "a"}])
+        cache.put(text_cache_key("query", 5), [{"id": "b"}])
+        cache.put(7, {"id": "memory"})
+
+        assert cache.invalidate_prefix("search") == 2
+        assert len(cache) == 1
+        assert cache.delete(7) is True
+        assert cache.get_stats()["bytes"] == 0
+
+    def test_vector_cache_key_is_compact(self):
+        """Test that vector keys are short and match on six-decimal rounding."""
+        vector = [0.123456789] * 1536
+
+        key = vector_cache_key(vector, 5)
+
+        assert len(key) < 64
+        assert key == vector_cache_key([0.1234568] * 1536, 5)
+        assert key != vector_cache_key(vector, 10)
+        assert key != vector_cache_key([0.1234] * 1536, 5)
@@ -3,6 +3,7 @@ import pytest
 from unittest.mock import Mock, patch
 from sqlalchemy.orm import Session
 
+from kortana.memory.cache import MemoryCache
 from kortana.modules.memory_core import models, schemas, services
 
 
@@ -23,9 +24,10 @@ class TestMemoryCaching:
         """Test that cache is initialized correctly."""
         assert hasattr(memory_service, "_memory_cache")
         assert hasattr(memory_service, "_search_cache")
-        assert isinstance(memory_service._memory_cache, dict)
-        assert isinstance(memory_service._search_cache, dict)
+        assert isinstance(memory_service._memory_cache, MemoryCache)
+        assert isinstance(memory_service._search_cache, MemoryCache)
         assert memory_service._cache_ttl == 300
+        assert memory_service._memory_cache.ttl_seconds == 300
     
     def test_get_memory_by_id_with_cache(self, memory_service, mock_db):
         """Test retrieving memory from cache."""
@@ -62,9 +64,9 @@ class TestMemoryCaching:
     def test_clear_cache(self, memory_service):
         """Test clearing the cache."""
         # Add some items to cache
-        memory_service._memory_cache[1] = (Mock(), 0)
-        memory_service._memory_cache[2] = (Mock(), 0)
-        memory_service._search_cache["test"] = ([], 0)
+        memory_service._memory_cache.put(1, Mock())
+        memory_service._memory_cache.put(2, Mock())
+        memory_service._search_cache.put("test", [])
         
         result = memory_service.clear_cache()
         
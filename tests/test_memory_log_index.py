@@ -0,0 +1,111 @@
+"""
+Tests for indexed JSONL memory logs
+"""
+
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from kortana.memory.log_index import IndexedJsonlLog
+from kortana.memory.memory import MemoryManager
+
+
+def _entry(i, tags=None, timestamp=None):
+    return {
+        "id": f"entry-{i}",
+        "text": f"memory {i}",
+        "tags": tags or [],
+        "timestamp": (timestamp or datetime.now()).isoformat(),
+    }
+
+
+class TestIndexedJsonlLog:
+    """Test cases for IndexedJsonlLog."""
+
+    @pytest.fixture
+    def log(self, tmp_path):
+        """Create an empty indexed log."""
+        return IndexedJsonlLog(str(tmp_path / "heart_log.jsonl"))
+
+    def test_latest_returns_newest_first(self, log):
+        """Test that recent reads return the newest entries."""
+        log.append_many([_entry(i) for i in range(50)])
+        log.append(_entry(50))
+
+        latest = log.latest(3)
+
+        assert [e["id"] for e in latest] == ["entry-50", "entry-49", "entry-48"]
+        assert log.count() == 51
+        assert log.latest(0) == []
+
+    def test_tag_lookup(self, log):
+        """Test that tag queries only return matching entries."""
+        for i in range(30):
+            log.append(_entry(i, tags=["soul", f"pattern:{'even' if i % 2 == 0 else 'odd'}"]))
+
+        latest = log.latest(2, tag="pattern:odd")
+
+        assert [e["id"] for e in latest] == ["entry-29", "entry-27"]
+        assert log.latest(5, tag="pattern:missing") == []
+        assert log.tags() == {"soul": 30, "pattern:even": 15, "pattern:odd": 15}
+
+    def test_existing_log_is_indexed_on_first_read(self, tmp_path):
+        """Test that logs written without sidecars are caught up automatically."""
+        path = tmp_path / "lit_log.jsonl"
+        with open(path, "w") as f:
+            for i in range(5):
+                f.write(json.dumps(_entry(i, tags=["ritual:dawn"])) + "\n")
+            f.write("\n")
+
+        log = IndexedJsonlLog(str(path))
+        assert [e["id"] for e in log.latest(2, tag="ritual:dawn")] == ["entry-4", "entry-3"]
+
+        # Lines appended by another writer are picked up as well
+        with open(path, "a") as f:
+            f.write(json.dumps(_entry(5, tags=["ritual:dawn"])) + "\n")
+        assert log.latest(1, tag="ritual:dawn")[0]["id"] == "entry-5"
+
+    def test_truncated_log_rebuilds_index(self, log):
+        """Test that replacing the log invalidates the sidecars."""
+        log.append_many([_entry(i, tags=["old"]) for i in range(10)])
+        with open(log.path, "w") as f:
+            f.write(json.dumps(_entry(99, tags=["new"])) + "\n")
+
+        assert [e["id"] for e in log.latest(10)] == ["entry-99"]
+        assert log.tags() == {"new": 1}
+
+    def test_since(self, log):
+        """Test reading entries newer than a cutoff."""
+        now = datetime.now()
+        log.append_many(
+            [_entry(i, timestamp=now - timedelta(days=10 - i)) for i in range(10)]
+        )
+
+        recent = log.since(now - timedelta(days=2, hours=1))
+
+        assert [e["id"] for e in recent] == ["entry-9", "entry-8"]
+        assert IndexedJsonlLog(log.path + ".empty").since(now) == []
+
+
+def test_memory_manager_reads_recent_memories(tmp_path, monkeypatch):
+    """Test that MemoryManager recent reads return the newest entries."""
+    monkeypatch.setenv("KORTANA_USER_NAME", "tester")
+    paths = SimpleNamespace(
+        heart_log_path=str(tmp_path / "heart.jsonl"),
+        soul_index_path=str(tmp_path / "soul.jsonl"),
+        lit_log_path=str(tmp_path / "lit.jsonl"),
+        project_memory_file_path=str(tmp_path / "project.jsonl"),
+    )
+    manager = MemoryManager(SimpleNamespace(paths=paths))
+
+    for i in range(5):
+        manager.add_heart_memory(f"heart {i}")
+        manager.add_soul_memory(f"soul {i}", pattern="growth" if i % 2 else "rest")
+        manager.add_lit_memory(f"lit {i}", ritual="dawn")
+
+    assert [m["text"] for m in manager.get_heart_memories(limit=2)] == ["heart 4", "heart 3"]
+    assert [m["text"] for m in manager.get_soul_memories("growth")] == ["soul 3", "soul 1"]
+    assert len(manager.get_lit_memories("dawn", limit=10)) == 5
+    assert (tmp_path / "heart_tester.jsonl.idx").exists()
@@ -2,8 +2,10 @@
 Tests for optimization module inspired by RebelBrowser/Chromium.
 """
 
+import asyncio
 import sys
 import os
+import threading
 import time
 import unittest
 from unittest.mock import MagicMock
@@ -18,10 +20,12 @@ from src.kortana.core.optimization.memory_optimizer import (
     MemoryPool,
 )
 from src.kortana.core.optimization.resource_manager import (
+    PoolExhaustedError,
     ResourceManager,
     ResourcePool,
 )
 from src.kortana.core.optimization.performance_metrics import (
+    LogHistogram,
     PerformanceMetrics,
     MetricsCollector,
     Timer,
@@ -30,7 +34,9 @@ from src.kortana.core.optimization.priority_queue import (
     PriorityQueue,
     Priority,
     DecisionQueue,
+    SchedulerBusyError,
     TaskProcessor,
+    WorkStealingScheduler,
 )
 
 
@@ -142,11 +148,18 @@ class TestResourceManager(unittest.TestCase):
 
         pool = ResourcePool("test", factory=factory, min_size=1, max_size=3)
 
-        resources = [pool.acquire() for _ in range(5)]
+        resources = [pool.acquire() for _ in range(3)]
+
+        # Beyond max_size, acquirers wait and then fail instead of oversubscribing
+        with self.assertRaises(PoolExhaustedError):
+            pool.acquire(timeout=0.05)
+
+        pool.release(resources[0])
+        self.assertIs(pool.acquire(timeout=0.05), resources[0])
 
         stats = pool.get_stats()
-        # Should create temporary resources beyond max
-        self.assertGreaterEqual(stats["total_created"], 3)
+        self.assertEqual(stats["total_created"], 3)
+        self.assertEqual(stats["timeouts"], 1)
 
     def test_resource_cleanup(self):
         """Test resource cleanup function."""
@@ -159,17 +172,107 @@ class TestResourceManager(unittest.TestCase):
             cleanup_called.append(resource)
 
         pool = ResourcePool(
-            "test", factory=factory, cleanup=cleanup, min_size=1, max_size=2
+            "test", factory=factory, cleanup=cleanup, min_size=1, max_size=2, timeout=0
+        )
+
+        resources = [pool.acquire() for _ in range(2)]
+        for resource in resources:
+            pool.release(resource)
+
+        # Idle resources past the timeout are cleaned up down to min_size
+        self.assertEqual(pool.cleanup_idle(), 1)
+        self.assertEqual(len(cleanup_called), 1)
+        self.assertEqual(pool.get_stats()["available"], 1)
+
+    def test_resource_pool_is_lazy(self):
+        """Test that no resources are created before first use or warm-up."""
+        created = []
+        pool = ResourcePool("test", factory=lambda: created.append(1) or {}, min_size=3)
+
+        self.assertEqual(created, [])
+        self.assertEqual(pool.warm_up(), 3)
+        self.assertEqual(pool.get_stats()["available"], 3)
+
+    def test_resource_pool_health_check(self):
+        """Test that unhealthy idle resources are replaced."""
+        pool = ResourcePool(
+            "test",
+            factory=lambda: {"healthy": True},
+            min_size=1,
+            max_size=2,
+            health_check=lambda resource: resource["healthy"],
         )
 
         resource = pool.acquire()
+        resource["healthy"] = False
         pool.release(resource)
 
-        # Acquire more than max to trigger cleanup
-        for _ in range(5):
-            pool.acquire()
+        self.assertEqual(pool.cleanup_idle(), 1)
+        with pool.borrow() as replacement:
+            self.assertTrue(replacement["healthy"])
+        stats = pool.get_stats()
+        self.assertEqual((stats["total_created"], stats["destroyed"]), (2, 1))
+
+    def test_resource_pool_async_waiters(self):
+        """Test that async acquirers wait for releases without exceeding max_size."""
+        pool = ResourcePool("test", factory=dict, min_size=0, max_size=2)
+        in_use = []
+        peak = []
+
+        async def worker():
+            async with pool.borrow_async(timeout=5) as resource:
+                in_use.append(resource)
+                peak.append(len(in_use))
+                await asyncio.sleep(0.01)
+                in_use.remove(resource)
+
+        async def run():
+            await asyncio.gather(*(worker() for _ in range(10)))
+
+        asyncio.run(run())
+        stats = pool.get_stats()
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(stats["total_created"], 2)
+        self.assertEqual(stats["wait_time"]["count"], 10)
+        self.assertGreater(stats["wait_time"]["max"], 0)
+
+    def test_resource_pool_release_after_close(self):
+        """Test that resources in use at close are cleaned up when released."""
+        cleaned = []
+        pool = ResourcePool("test", factory=dict, cleanup=cleaned.append, min_size=0)
+        resource = pool.acquire()
+
+        pool.close()
+        pool.release(resource)
+
+        self.assertEqual(cleaned, [resource])
+        stats = pool.get_stats()
+        self.assertEqual((stats["available"], stats["size"]), (0, 0))
+
+    def test_resource_pool_cancelled_async_create(self):
+        """Test that a cancelled acquirer does not leak the resource being created."""
+        created = threading.Event()
 
-        self.assertGreater(len(cleanup_called), 0)
+        def slow_factory():
+            time.sleep(0.1)
+            created.set()
+            return {}
+
+        pool = ResourcePool("test", factory=slow_factory, min_size=0, max_size=1)
+
+        async def run():
+            task = asyncio.ensure_future(pool.acquire_async())
+            await asyncio.sleep(0.02)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            await asyncio.sleep(0.2)
+            return await pool.acquire_async(timeout=1)
+
+        resource = asyncio.run(run())
+        self.assertTrue(created.is_set())
+        self.assertEqual(resource, {})
+        self.assertEqual(pool.get_stats()["total_created"], 1)
 
     def test_resource_manager(self):
         """Test resource manager coordination."""
@@ -213,6 +316,68 @@ class TestPerformanceMetrics(unittest.TestCase):
         self.assertAlmostEqual(stats["max"], 0.3, places=6)
         self.assertAlmostEqual(stats["avg"], 0.2, places=6)
 
+    def test_timer_percentiles(self):
+        """Test timer percentiles stay within the histogram's relative error."""
+        metrics = PerformanceMetrics("test")
+
+        for ms in range(1, 10001):
+            metrics.record_time("operation", ms / 1000)
+
+        stats = metrics.get_timer_stats("operation")
+        for name, expected in (("p50", 5.0), ("p90", 9.0), ("p99", 9.9), ("p999", 9.99)):
+            self.assertAlmostEqual(stats[name], expected, delta=expected * 0.011)
+        self.assertEqual(stats["count"], 10000)
+        self.assertEqual(stats["max"], 10.0)
+
+    def test_timer_memory_is_bounded(self):
+        """Test that recording does not grow memory with the sample count."""
+        histogram = LogHistogram(relative_error=0.01, min_value=1e-6, max_value=86400)
+
+        for i in range(100000):
+            histogram.record((i % 5000 + 1) * 1e-4)
+        histogram.record(1e9)
+        histogram.record(1e-12)
+
+        self.assertLess(len(histogram.buckets), 1300)
+        self.assertEqual(histogram.count, 100002)
+
+    def test_timer_windows(self):
+        """Test that windowed stats only include recent slots."""
+        now = [0.0]
+        metrics = PerformanceMetrics(
+            "test", window_seconds=300, slot_seconds=10, clock=lambda: now[0]
+        )
+
+        metrics.record_time("operation", 1.0)
+        now[0] = 250.0
+        metrics.record_time("operation", 2.0)
+        now[0] = 400.0
+        metrics.record_time("operation", 3.0)
+
+        windows = metrics.get_timer_windows("operation")
+        self.assertEqual(windows["1m"]["count"], 1)
+        self.assertEqual(windows["5m"]["count"], 2)
+        self.assertEqual(windows["all"]["count"], 3)
+        self.assertAlmostEqual(windows["5m"]["min"], 2.0)
+
+    def test_timer_concurrent_recording(self):
+        """Test that recordings from many threads are merged on read."""
+        import threading
+
+        metrics = PerformanceMetrics("test", stripes=4)
+
+        def record():
+            for _ in range(1000):
+                metrics.record_time("operation", 0.01)
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(metrics.get_timer_stats("operation")["count"], 8000)
+
     def test_gauge_metrics(self):
         """Test gauge metrics."""
         metrics = PerformanceMetrics("test")
@@ -337,6 +502,123 @@ class TestPriorityQueue(unittest.TestCase):
         self.assertEqual(stats["total_enqueued"], 2)
 
 
+class TestWorkStealingScheduler(unittest.TestCase):
+    """Test the asyncio work-stealing scheduler."""
+
+    def test_strict_priority_order(self):
+        """Test that a tolerance of 0 runs the most urgent work first."""
+        order = []
+        scheduler = WorkStealingScheduler(num_workers=1, priority_tolerance=0)
+        for name, priority in (
+            ("low", Priority.LOW),
+            ("critical", Priority.CRITICAL),
+            ("normal", Priority.NORMAL),
+        ):
+            scheduler.submit(order.append, priority, name, name)
+
+        async def run():
+            await scheduler.start()
+            await scheduler.join()
+            await scheduler.stop()
+
+        asyncio.run(run())
+        self.assertEqual(order, ["critical", "normal", "low"])
+
+    def test_backpressure_rejects_when_full(self):
+        """Test that submissions beyond max_pending fail immediately."""
+        scheduler = WorkStealingScheduler(num_workers=1, max_pending=2)
+        scheduler.submit(lambda: None)
+        scheduler.submit(lambda: None)
+
+        with self.assertRaises(SchedulerBusyError):
+            scheduler.submit(lambda: None)
+        self.assertEqual(scheduler.get_stats()["rejected"], 1)
+
+    def test_idle_workers_steal_short_tasks(self):
+        """Test that short tasks are not stuck behind a long one."""
+        finished = []
+
+        async def task(name, duration):
+            await asyncio.sleep(duration)
+            finished.append(name)
+
+        scheduler = WorkStealingScheduler(num_workers=2)
+        scheduler.submit(task, Priority.NORMAL, None, "long", 0.2)
+        for i in range(6):
+            scheduler.submit(task, Priority.NORMAL, None, f"short{i}", 0.01)
+
+        async def run():
+            await scheduler.start()
+            await scheduler.join()
+            await scheduler.stop()
+
+        asyncio.run(run())
+        self.assertEqual(finished[-1], "long")
+        self.assertGreater(scheduler.get_stats()["steals"], 0)
+
+    def test_submit_from_other_threads(self):
+        """Test thread-safe submission and failure accounting."""
+        results = []
+
+        def fail():
+            raise ValueError("bad decision")
+
+        async def run():
+            scheduler = WorkStealingScheduler(num_workers=3)
+            await scheduler.start()
+
+            def submit_many():
+                for i in range(50):
+                    scheduler.submit(results.append, Priority.NORMAL, None, i)
+                scheduler.submit(fail)
+
+            threads = [threading.Thread(target=submit_many) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            await scheduler.join()
+            await scheduler.stop()
+            return scheduler.get_stats()
+
+        stats = asyncio.run(run())
+        self.assertEqual(len(results), 200)
+        self.assertEqual((stats["completed"], stats["failed"]), (200, 4))
+        self.assertEqual(stats["pending"], 0)
+
+    def test_join_before_start(self):
+        """Test that a join issued before start waits for the queued work."""
+        results = []
+        scheduler = WorkStealingScheduler(num_workers=1)
+        scheduler.submit(results.append, Priority.NORMAL, None, "done")
+
+        async def run():
+            joiner = asyncio.ensure_future(scheduler.join())
+            await asyncio.sleep(0)
+            await scheduler.start()
+            await asyncio.wait_for(joiner, timeout=1)
+            await scheduler.stop()
+
+        asyncio.run(run())
+        self.assertEqual(results, ["done"])
+
+    def test_stop_without_drain_wakes_joiners(self):
+        """Test that dropping queued work releases anyone waiting in join."""
+        scheduler = WorkStealingScheduler(num_workers=1)
+        for _ in range(3):
+            scheduler.submit(lambda: None)
+
+        async def run():
+            joiner = asyncio.ensure_future(scheduler.join())
+            await asyncio.sleep(0)
+            await scheduler.stop(drain=False)
+            await asyncio.wait_for(joiner, timeout=1)
+
+        asyncio.run(run())
+        stats = scheduler.get_stats()
+        self.assertEqual((stats["pending"], stats["completed"]), (0, 0))
+
+
 class TestIntegration(unittest.TestCase):
     """Integration tests for optimization features."""
 
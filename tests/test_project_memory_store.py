@@ -0,0 +1,106 @@
+"""
+Tests for the type-indexed project memory store
+"""
+
+import json
+
+import pytest
+
+from kortana.core import memory
+
+
+def _entry(i, memory_type):
+    return {
+        "type": memory_type,
+        "timestamp": f"2024-01-01T00:00:{i % 60:02d}+00:00",
+        "content": f"{memory_type} {i}",
+    }
+
+
+@pytest.fixture
+def memory_path(tmp_path, monkeypatch):
+    """Point the project memory functions at a temporary file."""
+    path = tmp_path / "project_memory.jsonl"
+    monkeypatch.setattr(memory, "PROJECT_MEMORY_PATH", str(path))
+    return path
+
+
+class TestProjectMemoryStore:
+    """Test cases for ProjectMemoryStore and the module-level helpers."""
+
+    def test_reads_by_type(self, memory_path):
+        """Test type filtering and recency order of the module functions."""
+        for i in range(10):
+            memory.save_memory(_entry(i, "decision" if i % 3 else "implementation_note"))
+
+        decisions = memory.get_memory_by_type("decision")
+        notes = memory.get_recent_memories_by_type("implementation_note", limit=2)
+
+        assert [d["content"] for d in decisions] == [
+            f"decision {i}" for i in range(10) if i % 3
+        ]
+        assert [n["content"] for n in notes] == ["implementation_note 6", "implementation_note 9"]
+        assert memory.get_memory_by_type("context_summary") == []
+        assert len(memory.load_memory()) == 10
+
+    def test_cache_follows_appends_and_rewrites(self, memory_path):
+        """Test that cached reads pick up new entries and replaced files."""
+        store = memory.get_project_memory_store()
+        store.append([_entry(i, "decision") for i in range(5)])
+        assert len(store.entries("decision")) == 5
+
+        # Returned entries are copies, so callers cannot corrupt the cache
+        store.entries("decision")[0]["content"] = "changed"
+        assert store.entries("decision")[0]["content"] == "decision 0"
+
+        memory.save_decision("appended")
+        assert store.entries("decision")[-1]["content"] == "appended"
+        assert store.recent("decision", 1)[0]["content"] == "appended"
+
+        with open(memory_path, "w") as f:
+            f.write(json.dumps(_entry(0, "project_insight")) + "\n")
+        assert store.entries("decision") == []
+        assert store.type_counts() == {"project_insight": 1}
+
+    def test_rewrite_to_a_larger_file_is_reread(self, memory_path):
+        """Test that a file rewritten in place and grown is not read as an append."""
+        store = memory.get_project_memory_store()
+        store.append([_entry(i, "decision") for i in range(3)])
+        assert len(store.entries("decision")) == 3
+
+        with open(memory_path, "w") as f:
+            for i in range(5):
+                f.write(json.dumps(_entry(i, "decision") | {"content": f"new {i}"}) + "\n")
+
+        assert [e["content"] for e in store.entries("decision")] == [
+            f"new {i}" for i in range(5)
+        ]
+
+    def test_recent_cache_is_bounded(self, memory_path):
+        """Test that per-limit recent results do not accumulate without bound."""
+        store = memory.ProjectMemoryStore(str(memory_path), recent_cache_size=3)
+        store.append([_entry(i, "decision") for i in range(10)])
+
+        for limit in range(1, 10):
+            assert len(store.recent("decision", limit)) == limit
+
+        assert list(store._recent) == [("decision", 7), ("decision", 8), ("decision", 9)]
+
+    def test_missing_file(self, memory_path):
+        """Test that reads on a missing memory file return nothing."""
+        assert memory.load_memory() == []
+        assert memory.get_recent_memories_by_type("decision") == []
+        assert list(memory.iter_memory_batches()) == []
+
+    def test_iter_memory_batches(self, memory_path):
+        """Test streaming entries in batches."""
+        memory.get_project_memory_store().append(
+            [_entry(i, "decision" if i % 2 else "context_summary") for i in range(25)]
+        )
+
+        batches = list(memory.iter_memory_batches(batch_size=10))
+        summaries = list(memory.iter_memory_batches("context_summary", batch_size=10))
+
+        assert [len(b) for b in batches] == [10, 10, 5]
+        assert [len(b) for b in summaries] == [10, 3]
+        assert summaries[0][0]["content"] == "context_summary 0"
@@ -0,0 +1,109 @@
+"""
+Startup benchmarks and lazy service container tests
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from kortana.core import services
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+# Cumulative import budgets in seconds, well below the 2s+ the API took when
+# embeddings were built at import. Wall-clock limits depend on the machine,
+# so they are only checked when KORTANA_STARTUP_BENCHMARK is set.
+IMPORT_BUDGETS = {"kortana.cli.main": 1.0, "kortana.main": 2.0}
+RUN_BENCHMARKS = bool(os.getenv("KORTANA_STARTUP_BENCHMARK"))
+# Heavy dependencies that must only load on first use
+DEFERRED_MODULES = ("langchain_openai", "openai", "psutil", "kortana.agents")
+
+
+def _import_profile(module: str) -> dict[str, float]:
+    """Import ``module`` in a fresh interpreter; return cumulative seconds per module."""
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    env.pop("OPENAI_API_KEY", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            profile[name.strip()] = int(cumulative) / 1_000_000
+    return profile
+
+
+class TestStartupTime:
+    """Import-time checks for the API and CLI entry points."""
+
+    @pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS))
+    def test_entry_point_defers_heavy_imports(self, module):
+        """Test that importing an entry point loads none of the heavy dependencies."""
+        profile = _import_profile(module)
+
+        assert module in profile
+        assert [m for m in DEFERRED_MODULES if m in profile] == []
+
+    @pytest.mark.skipif(
+        not RUN_BENCHMARKS, reason="set KORTANA_STARTUP_BENCHMARK=1 to run"
+    )
+    @pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS))
+    def test_entry_point_import_budget(self, module):
+        """Test that entry points import within their time budget."""
+        profile = _import_profile(module)
+
+        assert profile[module] < IMPORT_BUDGETS[module]
+
+
+class TestLazyServices:
+    """Test cases for the lazy service container."""
+
+    @pytest.fixture(autouse=True)
+    def clean_registry(self, monkeypatch):
+        monkeypatch.setattr(services, "_services", {})
+        monkeypatch.setattr(services, "_factories", {})
+
+    def test_lazy_service_builds_once_on_first_use(self):
+        """Test that a LazyService defers construction until accessed."""
+        calls = []
+
+        class Widget:
+            def __init__(self):
+                calls.append(1)
+
+            def ping(self):
+                return "pong"
+
+        widget = services.LazyService("widget", Widget)
+        assert calls == []
+        assert "deferred" in repr(widget)
+
+        assert widget.ping() == "pong"
+        assert widget.ping() == "pong"
+        assert calls == [1]
+        assert isinstance(widget.resolve(), Widget)
+
+    def test_warm_up_services_reports_failures(self):
+        """Test that warm-up builds registered services and survives failures."""
+
+        def broken():
+            raise ValueError("missing key")
+
+        services.register_service("ok", dict)
+        services.register_service("broken", broken)
+
+        assert services.warm_up_services() == {"ok": True, "broken": False}
+        assert services.get_service("ok") == {}
+        assert services.warm_up_services(["ok"]) == {"ok": True}
@@ -0,0 +1,140 @@
+"""
+Tests for the structured, queue-backed logging pipeline
+"""
+
+import json
+import logging
+
+import pytest
+
+from kortana.utils import structured_logging
+from kortana.utils.structured_logging import (
+    SamplingFilter,
+    StructuredFormatter,
+    configure_logging,
+    get_log_context,
+    log_context,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    shutdown_logging()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def _record(msg="event %s", level=logging.DEBUG, name="kortana.test", lineno=1):
+    return logging.LogRecord(name, level, __file__, lineno, msg, ("x",), None)
+
+
+class TestLogContext:
+    """Test cases for request-scoped log context."""
+
+    def test_nested_contexts_merge_and_reset(self):
+        """Test that inner fields override outer ones and unwind on exit."""
+        with log_context(session_id="s1", model="a") as outer:
+            with log_context(model="b"):
+                assert get_log_context() == {"session_id": "s1", "model": "b"}
+            outer["latency_ms"] = 12
+            assert get_log_context()["latency_ms"] == 12
+        assert get_log_context() == {}
+
+
+class TestSamplingFilter:
+    """Test cases for debug sampling."""
+
+    def test_keeps_one_in_n_per_call_site(self):
+        """Test that each call site is sampled independently."""
+        sampler = SamplingFilter(rate=0.25)
+
+        kept_a = sum(sampler.filter(_record("a %s", lineno=1)) for _ in range(100))
+        kept_b = sum(sampler.filter(_record("b %s", lineno=2)) for _ in range(4))
+
+        assert (kept_a, kept_b) == (25, 1)
+
+    def test_samples_interpolated_messages(self):
+        """Test that f-string messages from one call site share a counter."""
+        sampler = SamplingFilter(rate=0.01)
+        kept = []
+        logger = logging.getLogger("kortana.test.sampling")
+        handler = logging.Handler()
+        handler.emit = kept.append
+        handler.addFilter(sampler)
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        try:
+            for i in range(1000):
+                logger.debug(f"processed item {i}")
+        finally:
+            logger.removeHandler(handler)
+            logger.setLevel(logging.NOTSET)
+
+        assert len(kept) == 10
+        assert len(sampler._counters) == 1
+
+    def test_higher_levels_always_pass(self):
+        """Test that INFO and above are never sampled out."""
+        sampler = SamplingFilter(rate=0.0)
+
+        assert not sampler.filter(_record())
+        assert sampler.filter(_record(level=logging.WARNING))
+
+    def test_rejects_invalid_rate(self):
+        """Test that rates outside [0, 1] are rejected."""
+        with pytest.raises(ValueError):
+            SamplingFilter(rate=2)
+
+
+class TestStructuredLogging:
+    """Test cases for formatting and the queue pipeline."""
+
+    def test_formatter_includes_context_and_extra(self):
+        """Test that JSON output carries bound context and ``extra`` fields."""
+        record = _record(level=logging.INFO)
+        record.context = {"session_id": "s1"}
+        record.latency_ms = 5.0
+
+        entry = json.loads(StructuredFormatter().format(record))
+
+        assert entry["message"] == "event x"
+        assert entry["session_id"] == "s1"
+        assert entry["latency_ms"] == 5.0
+        assert "args" not in entry
+
+    def test_pipeline_writes_from_background_thread(
+        self, tmp_path, restore_root_logger
+    ):
+        """Test that queued records keep the caller's context and are flushed."""
+        log_file = tmp_path / "kortana.log"
+        configure_logging(
+            level="DEBUG",
+            structured=True,
+            debug_sample_rate=0.5,
+            log_file=str(log_file),
+            console=False,
+        )
+        logger = logging.getLogger("kortana.test.pipeline")
+
+        with log_context(session_id="s1", model="m"):
+            for i in range(4):
+                logger.debug("noisy %d", i)
+            try:
+                raise RuntimeError("boom")
+            except RuntimeError:
+                logger.exception("failed", extra={"latency_ms": 3})
+        shutdown_logging()
+
+        entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert [e["message"] for e in entries] == ["noisy 0", "noisy 2", "failed"]
+        assert all(e["session_id"] == "s1" and e["model"] == "m" for e in entries)
+        assert entries[-1]["latency_ms"] == 3
+        assert "RuntimeError: boom" in entries[-1]["exception"]
+        assert structured_logging._listener is None
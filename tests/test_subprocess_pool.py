@@ -0,0 +1,154 @@
+"""
+Tests for the bounded subprocess pool behind ExecutionEngine shell commands
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+from kortana.core import subprocess_pool
+from kortana.core.execution_engine import ExecutionEngine
+from kortana.core.subprocess_pool import CappedOutput, SubprocessPool
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "killpg"), reason="process groups are POSIX-only"
+)
+
+
+class TestCappedOutput:
+    """Test cases for head-and-tail output capping."""
+
+    def test_keeps_head_and_tail(self):
+        """Test that the middle of a long stream is dropped and marked."""
+        output = CappedOutput(8)
+        for chunk in (b"abc", b"defgh", b"ijkl"):
+            output.feed(chunk)
+
+        assert output.truncated
+        assert output.total == 12
+        assert output.text() == "abcd\n... [4 bytes truncated] ...\nijkl"
+
+
+class TestSubprocessPool:
+    """Test cases for caps, timeouts and metrics."""
+
+    def test_global_and_per_agent_caps(self):
+        """Test that neither cap is exceeded and a capped agent does not block others."""
+        pool = SubprocessPool(max_concurrent=2, max_per_agent=1)
+        peaks = {"running": 0}
+
+        async def run(agent_id):
+            task = asyncio.ensure_future(pool.run("sleep 0.2", agent_id=agent_id))
+            await asyncio.sleep(0)
+            return await task
+
+        async def watch():
+            while True:
+                stats = pool.stats()
+                peaks["running"] = max(peaks["running"], stats["running"])
+                assert all(n <= 1 for n in stats["running_by_agent"].values())
+                await asyncio.sleep(0.01)
+
+        async def main():
+            watcher = asyncio.ensure_future(watch())
+            started = time.monotonic()
+            outcomes = await asyncio.gather(run("a"), run("a"), run("b"))
+            watcher.cancel()
+            return time.monotonic() - started, outcomes
+
+        elapsed, outcomes = asyncio.run(main())
+
+        assert peaks["running"] == 2
+        # "b" runs beside the first "a"; the second "a" waits for its agent
+        assert 0.35 < elapsed < 1.0
+        assert [o.return_code for o in outcomes] == [0, 0, 0]
+        assert outcomes[1].metrics.queue_time > 0.15
+
+    def test_timeout_kills_the_process_group(self, tmp_path):
+        """Test that a timed-out command's background children are killed too."""
+        marker = tmp_path / "survived"
+        pool = SubprocessPool(kill_grace=0.5)
+        command = f"(sleep 1 && touch {marker}) & sleep 30"
+
+        outcome = asyncio.run(pool.run(command, timeout=0.2))
+        time.sleep(1.2)
+
+        assert outcome.timed_out
+        assert outcome.return_code is None
+        assert not marker.exists()
+        assert pool.stats()["timed_out"] == 1
+
+    def test_detached_child_holding_pipes_does_not_hang(self):
+        """Test that a descendant outside the process group cannot block the result."""
+        pool = SubprocessPool(kill_grace=0.5)
+
+        started = time.monotonic()
+        outcome = asyncio.run(pool.run("setsid sleep 3 & echo hi", timeout=0.3))
+
+        assert time.monotonic() - started < 2.5
+        assert outcome.timed_out
+        assert outcome.stdout == "hi\n"
+
+    def test_threaded_pipe_readers(self, monkeypatch):
+        """Test the reader-thread path used where the loop cannot read pipes."""
+        monkeypatch.setattr(subprocess_pool, "_THREADED_PIPES", True)
+        pool = SubprocessPool()
+        seen = []
+
+        outcome = asyncio.run(
+            pool.run(
+                "echo out; echo err >&2",
+                on_output=lambda name, chunk: seen.append(name),
+            )
+        )
+
+        assert (outcome.return_code, outcome.stdout, outcome.stderr) == (
+            0,
+            "out\n",
+            "err\n",
+        )
+        assert sorted(seen) == ["stderr", "stdout"]
+
+    def test_streams_are_capped_and_cpu_is_measured(self):
+        """Test output capping, streaming callbacks and CPU metrics of children."""
+        pool = SubprocessPool(max_output_bytes=1000)
+        seen = []
+        script = "sum(range(3_000_000)); print('x' * 100_000)"
+        command = f'{sys.executable} -c "{script}"'
+
+        outcome = asyncio.run(
+            pool.run(command, on_output=lambda name, chunk: seen.append(len(chunk)))
+        )
+
+        assert outcome.return_code == 0
+        assert outcome.stdout_truncated
+        assert len(outcome.stdout) < 1100
+        assert sum(seen) == outcome.metrics.stdout_bytes == 100_001
+        assert outcome.metrics.cpu_time > 0
+
+
+class TestExecuteShellCommand:
+    """Test cases for the engine entry point."""
+
+    def test_reports_output_and_metrics(self, tmp_path):
+        """Test that results keep their fields and gain truncation and metrics."""
+        engine = ExecutionEngine(
+            [str(tmp_path)], [], search_index_dir=None, subprocess_pool=SubprocessPool()
+        )
+
+        async def run():
+            ok = await engine.execute_shell_command("echo hi", str(tmp_path))
+            failed = await engine.execute_shell_command("echo no >&2; exit 3")
+            slow = await engine.execute_shell_command("sleep 5", timeout=0.2)
+            return ok, failed, slow
+
+        ok, failed, slow = asyncio.run(run())
+
+        assert ok.success and ok.data["stdout"] == "hi\n"
+        assert ok.data["metrics"]["wall_time"] > 0
+        assert not failed.success and failed.data["return_code"] == 3
+        assert failed.error == "Command failed: no\n"
+        assert not slow.success and slow.error == "Command timed out after 0.2 seconds"
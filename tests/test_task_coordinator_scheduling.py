@@ -0,0 +1,180 @@
+"""
+Tests for event-driven dependency scheduling in TaskCoordinator
+"""
+
+import asyncio
+import time
+
+from kortana.core.execution_engine import OperationResult
+from kortana.core.task_management.coordinator import TaskCoordinator
+from kortana.core.task_management.models import (
+    Task,
+    TaskCategory,
+    TaskContext,
+    TaskPriority,
+    TaskStatus,
+)
+
+
+class FakeEngine:
+    """Execution engine stub that records task ids and concurrency."""
+
+    def __init__(self, delay=0.0, failing=()):
+        self.delay = delay
+        self.failing = set(failing)
+        self.started: list[str] = []
+        self.active = 0
+        self.peak = 0
+
+    async def execute_shell_command(self, command, working_dir=None):
+        task_id = command.rsplit(" ", 1)[-1]
+        self.started.append(task_id)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if task_id in self.failing:
+            return OperationResult(success=False, error="boom")
+        return OperationResult(success=True, data=task_id)
+
+
+def _task(
+    task_id, dependencies=(), category=TaskCategory.SYSTEM, priority=TaskPriority.MEDIUM
+):
+    return Task(
+        id=task_id,
+        category=category,
+        description=task_id,
+        priority=priority,
+        dependencies=list(dependencies),
+        context=TaskContext(workspace_root="/tmp"),
+        max_retries=0,
+    )
+
+
+class TestTaskCoordinatorScheduling:
+    """Test cases for in-degree based release, limits and cancellation."""
+
+    def test_chain_runs_without_polling_delay(self):
+        """Test that each level starts as soon as its parent completes."""
+
+        async def run():
+            engine = FakeEngine()
+            coordinator = TaskCoordinator(engine)
+            for i in range(5):
+                await coordinator.add_task(_task(f"t{i}", [f"t{i - 1}"] if i else []))
+            start = time.perf_counter()
+            await coordinator.execute_pending_tasks(until_idle=True)
+            return engine, coordinator, time.perf_counter() - start
+
+        engine, coordinator, elapsed = asyncio.run(run())
+
+        assert engine.started == ["t0", "t1", "t2", "t3", "t4"]
+        assert all(
+            t.status == TaskStatus.COMPLETED for t in coordinator._tasks.values()
+        )
+        assert elapsed < 0.5
+
+    def test_dependency_added_after_child(self):
+        """Test that a child waits for a dependency that is added later."""
+
+        async def run():
+            engine = FakeEngine()
+            coordinator = TaskCoordinator(engine)
+            await coordinator.add_task(_task("child", ["parent"]))
+            await coordinator.add_task(_task("parent"))
+            await coordinator.execute_pending_tasks(until_idle=True)
+            return engine
+
+        assert asyncio.run(run()).started == ["parent", "child"]
+
+    def test_duplicate_dependency_is_counted_once(self):
+        """Test that listing a parent twice still releases the child."""
+
+        async def run():
+            engine = FakeEngine()
+            coordinator = TaskCoordinator(engine)
+            await coordinator.add_task(_task("parent"))
+            await coordinator.add_task(_task("child", ["parent", "parent"]))
+            await coordinator.execute_pending_tasks(until_idle=True)
+            return engine
+
+        assert asyncio.run(run()).started == ["parent", "child"]
+
+    def test_concurrency_limit_per_operation_type(self):
+        """Test that a wide DAG is bounded per operation type, highest priority first."""
+
+        async def run():
+            engine = FakeEngine(delay=0.01)
+            coordinator = TaskCoordinator(
+                engine, concurrency_limits={"testing": 2}, default_concurrency=10
+            )
+            for i in range(6):
+                await coordinator.add_task(
+                    _task(f"low{i}", category=TaskCategory.TESTING)
+                )
+            await coordinator.add_task(
+                _task(
+                    "urgent",
+                    category=TaskCategory.TESTING,
+                    priority=TaskPriority.CRITICAL,
+                )
+            )
+            await coordinator.execute_pending_tasks(until_idle=True)
+            return engine
+
+        engine = asyncio.run(run())
+
+        assert engine.peak == 2
+        assert engine.started[0] == "urgent"
+        assert len(engine.started) == 7
+
+    def test_failure_and_cancel_propagate_to_descendants(self):
+        """Test that pending descendants are cancelled and siblings still run."""
+
+        async def run():
+            engine = FakeEngine(failing={"a"})
+            coordinator = TaskCoordinator(engine)
+            await coordinator.add_task(_task("a"))
+            await coordinator.add_task(_task("a1", ["a"]))
+            await coordinator.add_task(_task("a2", ["a1"]))
+            await coordinator.add_task(_task("b"))
+            await coordinator.add_task(_task("b1", ["b"]))
+            await coordinator.add_task(_task("b2", ["b1", "b"]))
+            assert await coordinator.cancel_task("b1")
+            await coordinator.execute_pending_tasks(until_idle=True)
+            return engine, coordinator
+
+        engine, coordinator = asyncio.run(run())
+        statuses = {tid: t.status for tid, t in coordinator._tasks.items()}
+
+        assert sorted(engine.started) == ["a", "b"]
+        assert statuses == {
+            "a": TaskStatus.FAILED,
+            "a1": TaskStatus.CANCELLED,
+            "a2": TaskStatus.CANCELLED,
+            "b": TaskStatus.COMPLETED,
+            "b1": TaskStatus.CANCELLED,
+            "b2": TaskStatus.CANCELLED,
+        }
+        assert "Dependency a" in coordinator._tasks["a1"].result.error
+
+    def test_retry_is_requeued_after_delay(self):
+        """Test that a failed task is retried by timer, not by rescanning."""
+
+        async def run():
+            engine = FakeEngine(failing={"flaky"})
+            coordinator = TaskCoordinator(engine, retry_delay=0.01)
+            task = _task("flaky")
+            task.max_retries = 2
+            await coordinator.add_task(task)
+            await coordinator.execute_pending_tasks(until_idle=True)
+            return engine, task
+
+        engine, task = asyncio.run(run())
+
+        assert engine.started == ["flaky"] * 3
+        assert task.status == TaskStatus.FAILED
+        assert task.retries == 2
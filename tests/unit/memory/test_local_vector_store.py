@@ -0,0 +1,147 @@
+"""
+Unit tests for the LocalVectorStore MemoryStore backend.
+"""
+
+import pytest
+
+from kortana.memory.local_vector_store import LocalVectorStore, hashing_embedder
+from kortana.memory.memory_store import MemoryStore
+
+
+class TestLocalVectorStore:
+    """Test cases for LocalVectorStore."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Create a small store with a handful of memories."""
+        store = LocalVectorStore(str(tmp_path / "vectors"), dimension=64)
+        store.add_memories(
+            [
+                {
+                    "id": "garden",
+                    "text": "we planted tomatoes in the garden",
+                    "tags": ["home"],
+                },
+                {
+                    "id": "deploy",
+                    "text": "the deploy pipeline failed on staging",
+                    "tags": ["work"],
+                },
+                {
+                    "id": "rollback",
+                    "text": "rolled back the staging deploy",
+                    "tags": ["work", "ops"],
+                },
+                {
+                    "id": "recipe",
+                    "text": "tomato soup recipe with basil",
+                    "tags": ["home"],
+                },
+            ]
+        )
+        return store
+
+    def test_implements_memory_store(self, store):
+        """Test that the store satisfies the MemoryStore interface."""
+        assert isinstance(store, MemoryStore)
+        assert store.count() == 4
+
+    def test_query_ranks_by_similarity(self, store):
+        """Test that the closest memory is returned first with a score."""
+        results = store.query_memories("staging deploy failed", top_k=2)
+
+        assert [r["id"] for r in results] == ["deploy", "rollback"]
+        assert results[0]["score"] >= results[1]["score"]
+        assert "embedding" not in results[0]
+
+    def test_tag_filter_and_tagging(self, store):
+        """Test that tags restrict results and tag_memory updates the index."""
+        assert {
+            r["id"] for r in store.query_memories("tomato", top_k=5, tags=["home"])
+        } == {
+            "garden",
+            "recipe",
+        }
+        assert store.query_memories("tomato", tags=["missing"]) == []
+
+        store.tag_memory("recipe", ["ops"])
+
+        ops = store.query_memories("anything", top_k=5, tags=["ops"])
+        assert {r["id"] for r in ops} == {"rollback", "recipe"}
+        assert store.get_memory("recipe")["tags"] == ["home", "ops"]
+
+    def test_delete_and_replace(self, store):
+        """Test that deleted and replaced memories drop out of results."""
+        store.delete_memory("deploy")
+        store.add_memory(
+            {"id": "garden", "text": "the deploy went fine", "tags": ["work"]}
+        )
+
+        results = store.query_memories("deploy", top_k=10)
+
+        assert "deploy" not in {r["id"] for r in results}
+        assert store.get_memory("garden")["tags"] == ["work"]
+        assert store.count() == 3
+        assert (
+            store.query_memories("garden", top_k=10, tags=["home"])[0]["id"] == "recipe"
+        )
+
+    def test_reopen_and_compact(self, store, tmp_path):
+        """Test that state survives reopening and compaction."""
+        store.delete_memory("garden")
+        store.tag_memory("deploy", ["incident"])
+
+        reopened = LocalVectorStore(store.directory, dimension=64)
+        assert reopened.count() == 3
+        assert reopened.get_memory("deploy")["tags"] == ["work", "incident"]
+
+        reopened.compact()
+        assert reopened.count() == 3
+        assert (
+            reopened.query_memories("staging deploy failed", top_k=1)[0]["id"]
+            == "deploy"
+        )
+        assert LocalVectorStore(store.directory, dimension=64).count() == 3
+
+    def test_partial_row_is_dropped_before_appending(self, store):
+        """Test that a torn vector write does not misalign later rows."""
+        with open(store.vectors_path, "ab") as f:
+            f.write(b"\x00" * 10)
+
+        reopened = LocalVectorStore(store.directory, dimension=64)
+        reopened.add_memory({"id": "late", "text": "a brand new memory"})
+        with open(store.vectors_path, "ab") as f:
+            f.write(b"\x00" * 10)
+        reopened.add_memory({"id": "later", "text": "another fresh one"})
+
+        for memory_id, text in (
+            ("late", "a brand new memory"),
+            ("later", "another fresh one"),
+        ):
+            best = reopened.query_memories(text, top_k=1)[0]
+            assert best["id"] == memory_id
+            assert best["score"] == pytest.approx(1.0)
+        assert reopened.count() == 6
+
+    def test_chunked_scan_matches_single_pass(self, tmp_path):
+        """Test that chunk boundaries do not change the top results."""
+        embed = hashing_embedder(32)
+        memories = [
+            {"id": f"m{i}", "text": f"note {i} about topic {i % 7}"} for i in range(200)
+        ]
+        chunked = LocalVectorStore(
+            str(tmp_path / "a"), dimension=32, scan_chunk_rows=16
+        )
+        single = LocalVectorStore(str(tmp_path / "b"), dimension=32)
+        chunked.add_memories(memories)
+        single.add_memories(memories)
+
+        query = embed("topic 3")
+        assert [r["score"] for r in chunked.query_by_vector(query, top_k=10)] == [
+            r["score"] for r in single.query_by_vector(query, top_k=10)
+        ]
+
+    def test_rejects_wrong_dimension(self, store):
+        """Test that embeddings of the wrong size are rejected."""
+        with pytest.raises(ValueError):
+            store.add_memory({"text": "x", "embedding": [1.0, 2.0]})
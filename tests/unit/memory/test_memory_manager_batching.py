@@ -0,0 +1,120 @@
+"""
+Unit tests for batched Pinecone writes in memory_manager.py.
+"""
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from kortana.memory.memory import MemoryEntry
+from kortana.memory.memory_manager import BufferedVectorWriter, MemoryManager
+
+
+class FakeIndex:
+    """Pinecone index stand-in recording upsert requests."""
+
+    def __init__(self, fail_first=0, partial_first=0):
+        self.requests = []
+        self.vectors = {}
+        self.fail_first = fail_first
+        self.partial_first = partial_first
+        self._lock = threading.Lock()
+
+    def upsert(self, vectors, namespace=None):
+        with self._lock:
+            self.requests.append(len(vectors))
+            if self.fail_first:
+                self.fail_first -= 1
+                raise ConnectionError("transient")
+            if self.partial_first:
+                self.partial_first -= 1
+                return {"upserted_count": len(vectors) - 1}
+            for vector_id, values, metadata in vectors:
+                self.vectors[vector_id] = (values, metadata)
+            return {"upserted_count": len(vectors)}
+
+
+def _entries(count):
+    return [
+        MemoryEntry(text=f"memory {i}", embedding=[float(i), 1.0], id=f"m-{i}")
+        for i in range(count)
+    ]
+
+
+class TestBatchedUpserts:
+    """Test cases for MemoryManager.add_memories and BufferedVectorWriter."""
+
+    @pytest.fixture
+    def manager(self, tmp_path, monkeypatch):
+        """Create a MemoryManager backed by a fake Pinecone index."""
+        monkeypatch.setenv("KORTANA_USER_NAME", "tester")
+        manager = MemoryManager(SimpleNamespace(data_dir=str(tmp_path)))
+        manager.index = FakeIndex()
+        manager.pinecone_enabled = True
+        manager.pinecone_namespace = "kortana_user_tester"
+        return manager
+
+    def _journal_ids(self, manager):
+        with open(manager.memory_journal_path) as f:
+            return [json.loads(line)["id"] for line in f]
+
+    def test_add_memories_batches_upserts(self, manager):
+        """Test that bulk adds use full-size requests and one journal write per flush."""
+        written = manager.add_memories(_entries(250), batch_size=100)
+
+        assert written == 250
+        assert sorted(manager.index.requests) == [50, 100, 100]
+        assert len(manager.index.vectors) == 250
+        assert self._journal_ids(manager) == [f"m-{i}" for i in range(250)]
+
+    def test_retries_failed_and_partial_requests(self, manager):
+        """Test that transient errors and partial upserts are retried."""
+        manager.index = FakeIndex(fail_first=1, partial_first=1)
+        writer = BufferedVectorWriter(manager, batch_size=10, retry_backoff=0)
+
+        with writer:
+            for entry in _entries(10):
+                writer.add(entry)
+
+        assert writer.written == 10
+        assert manager.index.requests == [10, 10, 10]
+        assert len(manager.index.vectors) == 10
+
+    def test_exhausted_retries_skip_journal(self, manager):
+        """Test that entries whose upsert never succeeds are not journaled."""
+        manager.index = FakeIndex(fail_first=2)
+        writer = BufferedVectorWriter(
+            manager, batch_size=5, max_parallel=1, max_retries=1, retry_backoff=0
+        )
+
+        with writer:
+            for entry in _entries(10):
+                writer.add(entry)
+
+        assert (writer.written, writer.failed) == (5, 5)
+        assert self._journal_ids(manager) == [f"m-{i}" for i in range(5, 10)]
+
+    def test_journal_failure_after_upsert(self, manager, monkeypatch):
+        """Test that a failed journal write does not mark upserted entries failed."""
+        monkeypatch.setattr(manager, "_add_many_to_journal", lambda entries: False)
+        writer = BufferedVectorWriter(manager, batch_size=5)
+
+        with writer:
+            for entry in _entries(5):
+                writer.add(entry)
+
+        assert (writer.written, writer.failed, writer.journal_failed) == (5, 0, 5)
+        assert len(manager.index.vectors) == 5
+
+        manager.pinecone_enabled = False
+        assert manager.add_memories(_entries(3)) == 0
+
+    def test_journal_only_without_pinecone(self, manager):
+        """Test that bulk adds still reach the journal when Pinecone is disabled."""
+        manager.pinecone_enabled = False
+
+        assert manager.add_memories(_entries(3)) == 3
+        assert manager.index.requests == []
+        assert self._journal_ids(manager) == ["m-0", "m-1", "m-2"]
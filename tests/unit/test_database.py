@@ -0,0 +1,59 @@
+"""
+Unit tests for the database engine helpers in kortana.services.database.
+"""
+
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from kortana.config.settings import AppSettings
+from kortana.services.database import install_slow_query_logger
+
+
+class TestDatabaseHelpers:
+    """Test cases for the async URL mapping and slow-query logging."""
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("sqlite:///./kortana.db", "sqlite+aiosqlite:///./kortana.db"),
+            ("postgresql://u:p@db/k", "postgresql+asyncpg://u:p@db/k"),
+            ("postgresql+psycopg2://u:p@db/k", "postgresql+asyncpg://u:p@db/k"),
+            ("postgresql+asyncpg://u:p@db/k", "postgresql+asyncpg://u:p@db/k"),
+        ],
+    )
+    def test_async_database_url(self, url, expected):
+        """Test that sync URLs are mapped to their asyncio drivers."""
+        assert AppSettings(MEMORY_DB_URL=url).ASYNC_DATABASE_URL == expected
+
+    def test_slow_query_logger_threshold(self, caplog):
+        """Test that only statements over the threshold are logged."""
+        fast = create_engine("sqlite://")
+        slow = create_engine("sqlite://")
+        install_slow_query_logger(fast, threshold_ms=60_000)
+        install_slow_query_logger(slow, threshold_ms=0)
+
+        with caplog.at_level(logging.WARNING, logger="kortana.sql.slow"):
+            with fast.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            with slow.connect() as conn:
+                conn.execute(text("SELECT   2"))
+
+        assert [r.getMessage().split(": ", 1)[1] for r in caplog.records] == [
+            "SELECT 2"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_slow_query_logger_on_async_engine(self, caplog):
+        """Test that the listener also fires for async engine statements."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        install_slow_query_logger(engine.sync_engine, threshold_ms=0)
+
+        with caplog.at_level(logging.WARNING, logger="kortana.sql.slow"):
+            async with async_sessionmaker(engine)() as session:
+                assert (await session.execute(text("SELECT 3"))).scalar() == 3
+        await engine.dispose()
+
+        assert any("SELECT 3" in r.getMessage() for r in caplog.records)